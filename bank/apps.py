@@ -1,6 +1,3 @@
-import os
-import sys
-
 from django.apps import AppConfig
 
 
@@ -16,36 +13,32 @@ class BankConfig(AppConfig):
     verbose_name = 'Банки'
 
     def ready(self):
-        """Описание метода ready.
-
-        Выполняет прикладную операцию текущего модуля.
-
-        Возвращает:
-            Any: Тип результата определяется вызывающим кодом.
-        """
-        if (
-            os.environ.get('DISABLE_KEY_RATE_SCHEDULER') == '1'
-            or 'pytest' in sys.modules
-        ):
-            return
-
-        disabled_commands = {
-            'makemigrations',
-            'migrate',
-            'collectstatic',
-            'check',
-            'test',
-            'shell',
-            'dbshell',
-            'showmigrations',
-            'createsuperuser',
-        }
-        if any(command in sys.argv for command in disabled_commands):
-            return
-
-        if 'runserver' in sys.argv and os.environ.get('RUN_MAIN') != 'true':
-            return
-
-        from .scheduler import start_key_rate_scheduler
-
-        start_key_rate_scheduler()
+        """Подключает запоминание ряда ключевых ставок на время запроса."""
+        from django.core.signals import request_finished, request_started
+        from django.db.models.signals import post_delete, post_save
+
+        from .key_rate_series import (
+            finish_key_rate_request,
+            forget_key_rate_request_series,
+            start_key_rate_request,
+        )
+        from .models import KeyRate
+
+        request_started.connect(
+            start_key_rate_request,
+            dispatch_uid='bank.start_key_rate_request',
+        )
+        request_finished.connect(
+            finish_key_rate_request,
+            dispatch_uid='bank.finish_key_rate_request',
+        )
+        post_save.connect(
+            forget_key_rate_request_series,
+            sender=KeyRate,
+            dispatch_uid='bank.forget_key_rate_request_series.save',
+        )
+        post_delete.connect(
+            forget_key_rate_request_series,
+            sender=KeyRate,
+            dispatch_uid='bank.forget_key_rate_request_series.delete',
+        )
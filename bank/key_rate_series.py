@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import threading
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+
+from django.db.models import Count, Max
+
+from .models import KeyRate
+
+# Ставки хранятся в сотых долях процента: у поля key_rate два знака.
+KEY_RATE_SCALE = 2
+
+_series_lock = threading.Lock()
+_series = None
+# Ряд, уже проверенный в текущем HTTP-запросе потока.
+_request_state = threading.local()
+
+
+@dataclass(frozen=True)
+class KeyRateSeries:
+    """Отсортированный ряд ключевых ставок в памяти процесса.
+
+    Даты заседаний хранятся порядковыми номерами дней, ставки - целыми
+    сотыми долями процента; оба массива упорядочены по дате заседания.
+    """
+
+    generation: tuple
+    meeting_days: array
+    key_rates: array
+
+    def __len__(self):
+        """Возвращает количество заседаний в ряду."""
+        return len(self.meeting_days)
+
+    def latest(self) -> Decimal | None:
+        """Возвращает ставку последнего заседания или None."""
+        if not self.key_rates:
+            return None
+        return _to_decimal(self.key_rates[-1])
+
+    def as_of(self, on_date: date) -> Decimal | None:
+        """Возвращает ставку, действующую на дату, или None."""
+        index = bisect_right(self.meeting_days, on_date.toordinal())
+        if not index:
+            return None
+        return _to_decimal(self.key_rates[index - 1])
+
+
+def get_key_rate_generation() -> tuple:
+    """Возвращает текущее поколение ряда ключевых ставок.
+
+    Поколение выводится из самой таблицы: число строк и последняя дата
+    изменения. Любой процесс видит правку сразу после ее фиксации, а
+    незафиксированная правка не видна никому, кроме ее транзакции.
+    """
+    state = KeyRate.objects.aggregate(
+        rate_count=Count('pk'),
+        last_updated_at=Max('updated_at'),
+    )
+    return state['rate_count'], state['last_updated_at']
+
+
+def get_key_rate_series() -> KeyRateSeries:
+    """Возвращает ряд ключевых ставок текущего поколения.
+
+    Внутри HTTP-запроса поколение проверяется один раз, и все
+    обращения запроса получают тот же ряд. Ряд перечитывается из
+    базы, только если поколение изменилось с момента последней
+    загрузки в этом процессе.
+    """
+    global _series
+
+    request_series = getattr(_request_state, 'series', None)
+    if request_series is not None:
+        return request_series
+
+    series = _series
+    if series is None or series.generation != get_key_rate_generation():
+        with _series_lock:
+            # Загрузка вычисляет поколение по тем же строкам, поэтому
+            # первому обращению процесса хватает одного запроса.
+            _series = _load_key_rate_series()
+            series = _series
+
+    if getattr(_request_state, 'is_active', False):
+        _request_state.series = series
+    return series
+
+
+def start_key_rate_request(**kwargs) -> None:
+    """Начинает запоминание ряда ключевых ставок на время запроса."""
+    _request_state.is_active = True
+    _request_state.series = None
+
+
+def finish_key_rate_request(**kwargs) -> None:
+    """Завершает запоминание ряда ключевых ставок запросом."""
+    _request_state.is_active = False
+    _request_state.series = None
+
+
+def forget_key_rate_request_series(**kwargs) -> None:
+    """Сбрасывает ряд, запомненный запросом, после правки ставок.
+
+    Следующее обращение того же запроса снова проверит поколение.
+    """
+    _request_state.series = None
+
+
+def get_latest_key_rate(default: Decimal | None = None) -> Decimal | None:
+    """Возвращает ставку последнего заседания или ``default``."""
+    rate = get_key_rate_series().latest()
+    return default if rate is None else rate
+
+
+def get_key_rate_as_of(
+    on_date: date,
+    default: Decimal | None = None,
+) -> Decimal | None:
+    """Возвращает ставку, действующую на дату, или ``default``."""
+    rate = get_key_rate_series().as_of(on_date)
+    return default if rate is None else rate
+
+
+def _load_key_rate_series() -> KeyRateSeries:
+    """Загружает ключевые ставки из базы одним запросом.
+
+    Читаются все строки: поколение считается по ним так же, как в
+    ``get_key_rate_generation``, а в ряд попадают только активные.
+    """
+    meeting_days = array('l')
+    key_rates = array('l')
+    rate_count = 0
+    last_updated_at = None
+    rows = KeyRate.objects.order_by('meeting_date').values_list(
+        'meeting_date',
+        'key_rate',
+        'is_active',
+        'updated_at',
+    )
+    for meeting_date, key_rate, is_active, updated_at in rows:
+        rate_count += 1
+        if last_updated_at is None or updated_at > last_updated_at:
+            last_updated_at = updated_at
+        if not is_active:
+            continue
+        meeting_days.append(meeting_date.toordinal())
+        key_rates.append(int(key_rate.scaleb(KEY_RATE_SCALE)))
+    return KeyRateSeries(
+        generation=(rate_count, last_updated_at),
+        meeting_days=meeting_days,
+        key_rates=key_rates,
+    )
+
+
+def _to_decimal(value: int) -> Decimal:
+    """Переводит ставку из сотых долей процента в Decimal."""
+    return Decimal(value).scaleb(-KEY_RATE_SCALE)
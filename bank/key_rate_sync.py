@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from decimal import Decimal, InvalidOperation
 from typing import Iterable
 from urllib.parse import urlencode
@@ -11,6 +11,9 @@ from urllib.request import Request, urlopen
 from django.db import transaction
 from django.utils import timezone
 
+from mortgage.apps import clear_form_data_cache
+
+from .key_rate_series import forget_key_rate_request_series
 from .models import KeyRate
 
 logger = logging.getLogger(__name__)
@@ -19,6 +22,10 @@ CBR_KEY_RATE_URL = 'https://www.cbr.ru/hd_base/keyrate/'
 CBR_DATE_FORMAT = '%d.%m.%Y'
 CBR_START_DATE = date(2013, 9, 17)
 CBR_TIMEOUT_SECONDS = 30
+# ЦБ РФ может уточнить последние строки таблицы, поэтому инкрементальная
+# загрузка начинается немного раньше последней сохраненной даты.
+KEY_RATE_SYNC_OVERLAP_DAYS = 14
+KEY_RATE_BULK_BATCH_SIZE = 500
 
 ROW_PATTERN = re.compile(
     r'<tr>\s*<td>\s*(\d{2}\.\d{2}\.\d{4})\s*</td>\s*<td>\s*([\d\s,]+)\s*</td>\s*</tr>',
@@ -122,23 +129,24 @@ def _parse_daily_rates(raw_html: str) -> list[tuple[date, Decimal]]:
 
 def _extract_meeting_rates(
     daily_rates: Iterable[tuple[date, Decimal]],
+    previous_rate: Decimal | None = None,
 ) -> list[tuple[date, Decimal]]:
-    """Описание метода _extract_meeting_rates.
-
-    Выполняет прикладную операцию текущего модуля.
+    """Выделяет даты изменения ставки из дневного ряда.
 
     Аргументы:
-        daily_rates: Входной параметр, влияющий на работу метода.
+        daily_rates: Дневные ставки от новых к старым.
+        previous_rate: Ставка, действовавшая до начала ряда. Первая
+            строка ряда с той же ставкой не считается заседанием.
 
     Возвращает:
-        Any: Тип результата определяется вызывающим кодом.
+        list[tuple[date, Decimal]]: Даты и ставки от новых к старым.
     """
     rates = list(daily_rates)
     if not rates:
         return []
 
     meeting_rates: list[tuple[date, Decimal]] = []
-    last_rate: Decimal | None = None
+    last_rate = previous_rate
 
     for meeting_date, key_rate in reversed(rates):
         if last_rate is None or key_rate != last_rate:
@@ -149,22 +157,60 @@ def _extract_meeting_rates(
     return meeting_rates
 
 
+def _get_incremental_start_date() -> date | None:
+    """Возвращает начало инкрементальной загрузки.
+
+    Возвращает:
+        date | None: Последняя сохраненная дата заседания минус окно
+        перекрытия или None, если ставки еще не загружались.
+    """
+    latest_meeting_date = KeyRate.objects.order_by(
+        '-meeting_date'
+    ).values_list('meeting_date', flat=True).first()
+    if latest_meeting_date is None:
+        return None
+    return max(
+        latest_meeting_date - timedelta(days=KEY_RATE_SYNC_OVERLAP_DAYS),
+        CBR_START_DATE,
+    )
+
+
+def _get_rate_in_effect(on_date: date) -> Decimal | None:
+    """Возвращает сохраненную ставку, действующую на дату."""
+    return KeyRate.objects.filter(meeting_date__lte=on_date).order_by(
+        '-meeting_date'
+    ).values_list('key_rate', flat=True).first()
+
+
 @transaction.atomic
 def sync_key_rates(
-    from_date: date | None = None, to_date: date | None = None
+    from_date: date | None = None,
+    to_date: date | None = None,
+    full_history: bool = False,
 ) -> dict[str, int]:
-    """Описание метода sync_key_rates.
+    """Загружает ключевую ставку ЦБ РФ и сохраняет изменения.
 
-    Выполняет прикладную операцию текущего модуля.
+    По умолчанию загрузка инкрементальная: с последней сохраненной даты
+    заседания минус ``KEY_RATE_SYNC_OVERLAP_DAYS``. Вся история
+    с ``CBR_START_DATE`` загружается, только если передан
+    ``full_history`` или ставок еще нет. Новые и измененные строки
+    записываются одним ``bulk_create`` с обновлением при конфликте.
 
     Аргументы:
-        from_date: Входной параметр, влияющий на работу метода.
-        to_date: Входной параметр, влияющий на работу метода.
+        from_date: Явное начало периода загрузки.
+        to_date: Конец периода загрузки, по умолчанию сегодня.
+        full_history: Загрузить всю историю ставок.
 
     Возвращает:
-        Any: Тип результата определяется вызывающим кодом.
+        dict[str, int]: Количество созданных, обновленных
+        и обработанных заседаний.
     """
-    sync_from = from_date or CBR_START_DATE
+    sync_from = from_date
+    is_incremental = False
+    if sync_from is None and not full_history:
+        sync_from = _get_incremental_start_date()
+        is_incremental = sync_from is not None
+    sync_from = sync_from or CBR_START_DATE
     sync_to = to_date or timezone.localdate()
 
     if sync_from > sync_to:
@@ -174,34 +220,53 @@ def sync_key_rates(
 
     raw_html = _download_cbr_payload(from_date=sync_from, to_date=sync_to)
     daily_rates = _parse_daily_rates(raw_html)
-    meeting_rates = _extract_meeting_rates(daily_rates)
+    previous_rate = None
+    if is_incremental:
+        # Первая строка окна - не заседание, а продолжение ставки,
+        # действовавшей на эту дату.
+        previous_rate = _get_rate_in_effect(
+            min(meeting_date for meeting_date, _ in daily_rates)
+        )
+    meeting_rates = _extract_meeting_rates(
+        daily_rates,
+        previous_rate=previous_rate,
+    )
 
-    existing_by_date = {
-        item.meeting_date: item.key_rate
-        for item in KeyRate.objects.filter(
+    existing_by_date = dict(
+        KeyRate.objects.filter(
             meeting_date__in=[
                 meeting_date for meeting_date, _ in meeting_rates
             ]
-        )
-    }
+        ).values_list('meeting_date', 'key_rate')
+    )
 
     created = 0
     updated = 0
+    changed_rates = []
 
     for meeting_date, key_rate in meeting_rates:
         stored_rate = existing_by_date.get(meeting_date)
         if stored_rate is None:
-            KeyRate.objects.create(
-                meeting_date=meeting_date, key_rate=key_rate
-            )
             created += 1
+        elif stored_rate != key_rate:
+            updated += 1
+        else:
             continue
+        changed_rates.append(
+            KeyRate(meeting_date=meeting_date, key_rate=key_rate)
+        )
 
-        if stored_rate != key_rate:
-            KeyRate.objects.filter(meeting_date=meeting_date).update(
-                key_rate=key_rate
-            )
-            updated += 1
+    KeyRate.objects.bulk_create(
+        changed_rates,
+        batch_size=KEY_RATE_BULK_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=['meeting_date'],
+        update_fields=['key_rate', 'updated_at'],
+    )
+    if changed_rates:
+        # bulk_create не отправляет post_save: кеши сбрасываются явно.
+        clear_form_data_cache()
+        forget_key_rate_request_series()
 
     return {
         'created': created,
@@ -31,6 +31,14 @@ class Command(BaseCommand):
                 'без загрузки новых банков из ЦБ РФ.'
             ),
         )
+        parser.add_argument(
+            '--force-refresh',
+            action='store_true',
+            help=(
+                'Заново загрузить и разобрать все страницы Banki.ru, '
+                'не используя кеш страниц.'
+            ),
+        )
 
     def handle(self, *args, **options):
         """Run bank mortgage offer synchronization."""
@@ -39,6 +47,7 @@ class Command(BaseCommand):
                 source_url=options.get('source_url'),
                 cbr_source_url=options.get('cbr_source_url'),
                 update_bank_registry=not options.get('programs_only'),
+                force_refresh=options.get('force_refresh'),
             )
         except BankMortgageSyncError as error:
             raise CommandError(str(error)) from error
@@ -48,7 +57,13 @@ class Command(BaseCommand):
                 'Синхронизация завершена: '
                 f'создано={result["created"]}, '
                 f'обновлено={result["updated"]}, '
-                f'обработано={result["processed"]}.',
+                f'обработано={result["processed"]}, '
+                f'страниц Banki.ru обработано={result["pages_processed"]}, '
+                f'пропущено без изменений={result["pages_skipped"]}; '
+                'программ банков создано='
+                f'{result["bank_programs_created"]}, '
+                f'изменено={result["bank_programs_updated"]}, '
+                f'без изменений={result["bank_programs_unchanged"]}.',
             )
         )
         for warning in result.get('warnings', []):
@@ -12,6 +12,14 @@ class Command(BaseCommand):
 
     help = 'Загружает и обновляет ключевую ставку ЦБ РФ.'
 
+    def add_arguments(self, parser):
+        """Register key rate sync options."""
+        parser.add_argument(
+            '--full-history',
+            action='store_true',
+            help='Загрузить всю историю ставок вместо последних заседаний.',
+        )
+
     def handle(self, *args, **options):
         """Описание метода handle.
 
@@ -25,7 +33,9 @@ class Command(BaseCommand):
             Any: Тип результата определяется вызывающим кодом.
         """
         try:
-            result = sync_key_rates()
+            result = sync_key_rates(
+                full_history=options.get('full_history', False)
+            )
             created_count = result['created']
             updated_count = result['updated']
             processed_count = result['processed']
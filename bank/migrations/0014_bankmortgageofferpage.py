@@ -0,0 +1,32 @@
+# Generated by Django 6.0.4 on 2026-10-18 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bank', '0013_alter_bank_created_at_alter_bank_is_active_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BankMortgageOfferPage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_url', models.URLField(max_length=1000, unique=True, verbose_name='URL страницы')),
+                ('etag', models.CharField(blank=True, default='', max_length=255, verbose_name='ETag')),
+                ('last_modified', models.CharField(blank=True, default='', max_length=64, verbose_name='Last-Modified')),
+                ('content_hash', models.CharField(blank=True, default='', max_length=64, verbose_name='Хеш содержимого')),
+                ('next_page_url', models.URLField(blank=True, default='', max_length=1000, verbose_name='URL следующей страницы')),
+                ('offers', models.JSONField(blank=True, default=list, verbose_name='Разобранные предложения')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Дата изменения')),
+            ],
+            options={
+                'verbose_name': 'Страница ипотечных предложений',
+                'verbose_name_plural': 'Страницы ипотечных предложений',
+                'db_table': 'bank_mortgage_offer_page',
+                'ordering': ['source_url'],
+            },
+        ),
+    ]
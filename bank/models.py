@@ -267,3 +267,63 @@ class KeyRate(BaseModel):
     def __str__(self):
         """Возвращает дату и размер ключевой ставки."""
         return f'{self.meeting_date}: {self.key_rate}%'
+
+
+class BankMortgageOfferPage(models.Model):
+    """Кеш страницы ипотечных предложений внешнего источника.
+
+    Хранит валидаторы HTTP-кеша и хеш тела страницы, а также
+    разобранные предложения и ссылку на следующую страницу, чтобы
+    неизмененные страницы не разбирались повторно.
+    """
+
+    source_url = models.URLField(
+        max_length=1000,
+        unique=True,
+        verbose_name='URL страницы',
+    )
+    etag = models.CharField(
+        max_length=255,
+        blank=True,
+        default='',
+        verbose_name='ETag',
+    )
+    last_modified = models.CharField(
+        max_length=64,
+        blank=True,
+        default='',
+        verbose_name='Last-Modified',
+    )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default='',
+        verbose_name='Хеш содержимого',
+    )
+    next_page_url = models.URLField(
+        max_length=1000,
+        blank=True,
+        default='',
+        verbose_name='URL следующей страницы',
+    )
+    offers = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name='Разобранные предложения',
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Дата изменения',
+    )
+
+    class Meta:
+        """Метаданные таблицы кеша страниц предложений."""
+
+        db_table = 'bank_mortgage_offer_page'
+        verbose_name = 'Страница ипотечных предложений'
+        verbose_name_plural = 'Страницы ипотечных предложений'
+        ordering = ['source_url']
+
+    def __str__(self):
+        """Возвращает URL страницы."""
+        return self.source_url
@@ -1,20 +1,34 @@
 from __future__ import annotations
 
 import csv
+import hashlib
 import html
 import io
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
 from html.parser import HTMLParser
+from http import HTTPStatus
+from urllib.error import HTTPError
 from urllib.parse import parse_qs, urljoin, urlparse
 from urllib.request import Request, urlopen
 
 from django.conf import settings
 from django.db import transaction
+from django.utils import timezone
 
-from .models import Bank, BankProgram, MortgageProgram, MortgageProgramAlias
+from mortgage.apps import clear_form_data_cache
+
+from .models import (
+    Bank,
+    BankMortgageOfferPage,
+    BankProgram,
+    MortgageProgram,
+    MortgageProgramAlias,
+)
 from .program_matching import normalize_mortgage_program_match_name
 
 logger = logging.getLogger(__name__)
@@ -63,9 +77,23 @@ GOOGLE_SHEET_MORTGAGE_PROGRAM_SOURCES = (
 BANKI_TIMEOUT_SECONDS = 30
 DOMRF_TIMEOUT_SECONDS = 30
 BANKI_MAX_PAGES = 20
+SYNC_FETCH_MAX_WORKERS = 8
+SYNC_FETCH_HOST_CONCURRENCY = 2
+BANK_PROGRAM_SYNC_BATCH_SIZE = 500
+BANK_PROGRAM_SYNC_FIELDS = (
+    'interest_rate',
+    'minimum_initial_payment_percent',
+    'maximum_loan_term_years',
+)
 DOMRF_REFERENCE_SOURCE_NAME = 'спроси.дом.рф'
 FEDERAL_REFERENCE_SOURCE_NAME = 'федеральный справочник программ'
 BANK_NAME_MAX_LENGTH = Bank._meta.get_field('name').max_length
+PAGE_ETAG_MAX_LENGTH = BankMortgageOfferPage._meta.get_field(
+    'etag'
+).max_length
+PAGE_LAST_MODIFIED_MAX_LENGTH = BankMortgageOfferPage._meta.get_field(
+    'last_modified'
+).max_length
 RATE_LABEL = 'Ставка'
 INITIAL_PAYMENT_LABEL = 'Первоначальный взнос'
 TERM_LABEL = 'Срок'
@@ -161,6 +189,20 @@ class BankMortgageOffer:
     logo_url: str = ''
 
 
+@dataclass(frozen=True)
+class BankiMortgagePage:
+    """Offers of one Banki.ru page and whether the page has changed.
+
+    ``previous_offers`` holds the offers cached for a changed page before
+    it was parsed again, so pairs that left the page are reconciled too.
+    """
+
+    source_url: str
+    offers: tuple
+    is_changed: bool
+    previous_offers: tuple = ()
+
+
 def _extract_image_source(attrs_dict):
     """Return the best image source URL from regular and lazy attributes."""
     for attribute_name in ('src', 'data-src', 'data-lazy-src'):
@@ -776,6 +818,40 @@ def parse_google_sheet_mortgage_offers(
     return offers
 
 
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def _get_host_semaphore(source_url):
+    """Return the semaphore limiting parallel requests to one host."""
+    host = urlparse(source_url).netloc.lower()
+    with _host_semaphores_lock:
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(
+                getattr(
+                    settings,
+                    'BANK_MORTGAGE_SYNC_HOST_CONCURRENCY',
+                    SYNC_FETCH_HOST_CONCURRENCY,
+                )
+            )
+            _host_semaphores[host] = semaphore
+    return semaphore
+
+
+def _read_url(request, timeout, on_response=None):
+    """Read a decoded response body within the per-host request limit.
+
+    ``on_response`` is called with the open response before its body
+    is read, so callers can keep response headers.
+    """
+    with _get_host_semaphore(request.full_url):
+        with urlopen(request, timeout=timeout) as response:
+            if on_response is not None:
+                on_response(response)
+            return response.read().decode('utf-8', errors='ignore')
+
+
 def _download_payload(source_url):
     """Download an HTML page from an external source."""
     request = Request(
@@ -786,8 +862,7 @@ def _download_payload(source_url):
             ),
         },
     )
-    with urlopen(request, timeout=BANKI_TIMEOUT_SECONDS) as response:
-        return response.read().decode('utf-8', errors='ignore')
+    return _read_url(request, BANKI_TIMEOUT_SECONDS)
 
 
 def _download_cbr_bank_list_payload(source_url):
@@ -795,9 +870,43 @@ def _download_cbr_bank_list_payload(source_url):
     return _download_payload(source_url)
 
 
-def _download_banki_mortgage_payload(source_url):
-    """Download a mortgage offers page from the configured source."""
-    return _download_payload(source_url)
+def _download_banki_mortgage_payload(source_url, cached_page=None):
+    """Download a mortgage offers page from the configured source.
+
+    When ``cached_page`` holds a processed copy of the page, the request
+    is conditional and ``None`` is returned if the server answers
+    304 Not Modified. Validators of a fresh response are stored on
+    ``cached_page``.
+    """
+    headers = {
+        'User-Agent': (
+            'Mozilla/5.0 (compatible; real-estate-investing/1.0)'
+        ),
+    }
+    has_cached_copy = cached_page is not None and cached_page.content_hash
+    if has_cached_copy and cached_page.etag:
+        headers['If-None-Match'] = cached_page.etag
+    if has_cached_copy and cached_page.last_modified:
+        headers['If-Modified-Since'] = cached_page.last_modified
+
+    def store_validators(response):
+        cached_page.etag = (response.headers.get('ETag') or '')[
+            :PAGE_ETAG_MAX_LENGTH
+        ]
+        cached_page.last_modified = (
+            response.headers.get('Last-Modified') or ''
+        )[:PAGE_LAST_MODIFIED_MAX_LENGTH]
+
+    try:
+        return _read_url(
+            Request(source_url, headers=headers),
+            BANKI_TIMEOUT_SECONDS,
+            on_response=store_validators if cached_page is not None else None,
+        )
+    except HTTPError as error:
+        if has_cached_copy and error.code == HTTPStatus.NOT_MODIFIED:
+            return None
+        raise
 
 
 def _download_google_sheet_mortgage_payload(source_url):
@@ -815,8 +924,7 @@ def _download_reference_mortgage_programs_payload(source_url):
             ),
         },
     )
-    with urlopen(request, timeout=DOMRF_TIMEOUT_SECONDS) as response:
-        return response.read().decode('utf-8', errors='ignore')
+    return _read_url(request, DOMRF_TIMEOUT_SECONDS)
 
 
 def _get_page_number(source_url):
@@ -853,26 +961,64 @@ def _extract_next_page_url(raw_html, current_url):
     return min(candidates, key=lambda item: item[0])[1]
 
 
-def _download_banki_mortgage_payloads(source_url, sync_warnings=None):
-    """Download all available paginated Banki.ru mortgage offer pages."""
+def _download_banki_mortgage_pages(
+    executor,
+    source_url,
+    sync_warnings=None,
+    force_refresh=False,
+):
+    """Download paginated Banki.ru pages and parse only changed ones.
+
+    Pages linked in the cache from a previous run are requested in
+    parallel right away; pagination is then followed by the fresh next
+    page links. Pages answered with 304 Not Modified or with the same
+    body hash as the cached copy reuse offers parsed on a previous run.
+    """
     maximum_pages = getattr(
         settings,
         'BANK_MORTGAGE_OFFERS_MAX_PAGES',
         BANKI_MAX_PAGES,
     )
-    payloads = []
+    cached_pages = {
+        cached_page.source_url: cached_page
+        for cached_page in BankMortgageOfferPage.objects.all()
+    }
+    if force_refresh:
+        for cached_page in cached_pages.values():
+            cached_page.content_hash = ''
+    page_futures = {}
+
+    def submit_page(page_url):
+        if page_url not in page_futures:
+            cached_page = cached_pages.setdefault(
+                page_url,
+                BankMortgageOfferPage(source_url=page_url),
+            )
+            page_futures[page_url] = executor.submit(
+                _fetch_banki_mortgage_page,
+                cached_page,
+            )
+        return page_futures[page_url]
+
+    for page_url in _get_cached_banki_page_urls(
+        source_url,
+        cached_pages,
+        maximum_pages,
+    ):
+        submit_page(page_url)
+
+    pages = []
     visited_urls = set()
     current_url = source_url
-
     for _ in range(maximum_pages):
         if current_url in visited_urls:
             break
 
         visited_urls.add(current_url)
         try:
-            raw_html = _download_banki_mortgage_payload(current_url)
+            page, parse_warning = submit_page(current_url).result()
         except OSError as error:
-            if payloads:
+            if pages:
                 message = (
                     f'Не загружена страница Banki.ru {current_url}: {error}'
                 )
@@ -889,24 +1035,154 @@ def _download_banki_mortgage_payloads(source_url, sync_warnings=None):
                 error,
             )
             break
-        payloads.append((current_url, raw_html))
 
-        next_url = _extract_next_page_url(raw_html, current_url)
-        if next_url is None:
+        cached_page = cached_pages[current_url]
+        if page.is_changed:
+            cached_page.save()
+        else:
+            cached_page.save(
+                update_fields=['etag', 'last_modified', 'updated_at']
+            )
+        if parse_warning and sync_warnings is not None:
+            sync_warnings.append(parse_warning)
+        pages.append(page)
+
+        if not cached_page.next_page_url:
+            break
+        current_url = cached_page.next_page_url
+
+    for page_future in page_futures.values():
+        page_future.cancel()
+    return pages
+
+
+def _get_cached_banki_page_urls(source_url, cached_pages, maximum_pages):
+    """Return page URLs of the pagination chain known from the cache."""
+    page_urls = []
+    page_url = source_url
+    while page_url and page_url not in page_urls:
+        if len(page_urls) >= maximum_pages:
             break
-        current_url = next_url
+        page_urls.append(page_url)
+        cached_page = cached_pages.get(page_url)
+        page_url = cached_page.next_page_url if cached_page else ''
+    return page_urls
+
+
+def _fetch_banki_mortgage_page(cached_page):
+    """Download and parse one Banki.ru page without database access.
+
+    Returns:
+        tuple[BankiMortgagePage, str]: Page offers and a parse warning
+        or an empty string.
+    """
+    raw_html = _download_banki_mortgage_payload(
+        cached_page.source_url,
+        cached_page,
+    )
+    return _process_banki_mortgage_page(cached_page, raw_html)
+
+
+def _process_banki_mortgage_page(cached_page, raw_html):
+    """Parse a downloaded Banki.ru page unless its cached copy is current.
+
+    Updates ``cached_page`` in place; saving it is left to the caller.
+    """
+    content_hash = ''
+    if raw_html is not None:
+        content_hash = hashlib.sha256(raw_html.encode('utf-8')).hexdigest()
+
+    if raw_html is None or content_hash == cached_page.content_hash:
+        page = BankiMortgagePage(
+            source_url=cached_page.source_url,
+            offers=tuple(
+                _deserialize_mortgage_offer(offer_data)
+                for offer_data in cached_page.offers
+            ),
+            is_changed=False,
+        )
+        return page, ''
+
+    parse_warning = ''
+    cached_page.next_page_url = (
+        _extract_next_page_url(raw_html, cached_page.source_url) or ''
+    )
+    try:
+        offers = parse_banki_mortgage_offers(
+            raw_html,
+            source_url=cached_page.source_url,
+        )
+    except BankMortgageSyncError as error:
+        parse_warning = (
+            'Страница Banki.ru не обработана '
+            f'({cached_page.source_url}): {error}'
+        )
+        logger.warning(
+            'Could not parse mortgage offers from %s: %s',
+            cached_page.source_url,
+            error,
+        )
+        # Пустой хеш заставит разобрать страницу заново при следующем
+        # запуске, даже если сервер вернет ту же версию.
+        offers = []
+        content_hash = ''
+
+    previous_offers = tuple(
+        _deserialize_mortgage_offer(offer_data)
+        for offer_data in cached_page.offers
+    )
+    cached_page.content_hash = content_hash
+    cached_page.offers = [_serialize_mortgage_offer(offer) for offer in offers]
+    page = BankiMortgagePage(
+        source_url=cached_page.source_url,
+        offers=tuple(offers),
+        is_changed=True,
+        previous_offers=previous_offers,
+    )
+    return page, parse_warning
 
-    return payloads
+
+def _serialize_mortgage_offer(offer):
+    """Return a JSON-compatible dict for a parsed mortgage offer."""
+    return {
+        'bank_name': offer.bank_name,
+        'program_name': offer.program_name,
+        'interest_rate': str(offer.interest_rate),
+        'minimum_initial_payment_percent': str(
+            offer.minimum_initial_payment_percent
+        ),
+        'maximum_loan_term_years': offer.maximum_loan_term_years,
+        'logo_url': offer.logo_url,
+    }
+
+
+def _deserialize_mortgage_offer(offer_data):
+    """Restore a mortgage offer saved in the Banki.ru page cache."""
+    return BankMortgageOffer(
+        bank_name=offer_data['bank_name'],
+        program_name=offer_data['program_name'],
+        interest_rate=Decimal(offer_data['interest_rate']),
+        minimum_initial_payment_percent=Decimal(
+            offer_data['minimum_initial_payment_percent']
+        ),
+        maximum_loan_term_years=offer_data.get('maximum_loan_term_years'),
+        logo_url=offer_data.get('logo_url', ''),
+    )
+
+
+def _get_offer_match_key(offer):
+    """Return the bank and program key used to deduplicate offers."""
+    return (
+        _normalize_bank_match_name(offer.bank_name),
+        _normalize_program_match_name(offer.program_name),
+    )
 
 
 def _select_best_program_offers(offers):
     """Select the best offer per bank and mortgage program."""
     best_offers = {}
     for offer in offers:
-        key = (
-            _normalize_bank_match_name(offer.bank_name),
-            _normalize_program_match_name(offer.program_name),
-        )
+        key = _get_offer_match_key(offer)
         stored_offer = best_offers.get(key)
         if (
             stored_offer is None
@@ -975,46 +1251,110 @@ def _ensure_mortgage_program_alias(
     return True
 
 
-def _get_or_create_mapped_mortgage_program(
-    program_name,
-    program_lookup,
-    source='',
-):
-    """Return a canonical mortgage program for a source program name."""
-    program_key = _normalize_program_match_name(program_name)
-    mortgage_program = program_lookup.get(program_key)
-    if mortgage_program is None:
-        mortgage_program, _ = MortgageProgram.objects.get_or_create(
-            name=program_name,
-            defaults={
-                'condition': 'Программа импортирована из внешнего источника.',
-                'is_preferential': _is_preferential_program(program_name),
-            },
+def _map_offer_mortgage_programs(program_names, program_lookup, source=''):
+    """Return canonical mortgage programs for source program names.
+
+    Missing programs and aliases are created with bulk queries; the
+    existing aliases are loaded once for all names.
+    """
+    program_names = list(dict.fromkeys(program_names))
+    new_programs = {}
+    for program_name in program_names:
+        program_key = _normalize_program_match_name(program_name)
+        if program_key in program_lookup:
+            continue
+        new_programs.setdefault(program_key or program_name, program_name)
+
+    if new_programs:
+        existing_programs = MortgageProgram.objects.in_bulk(
+            new_programs.values(),
+            field_name='name',
+        )
+        MortgageProgram.objects.bulk_create(
+            [
+                MortgageProgram(
+                    name=program_name,
+                    condition=(
+                        'Программа импортирована из внешнего источника.'
+                    ),
+                    is_preferential=_is_preferential_program(program_name),
+                )
+                for program_name in new_programs.values()
+                if program_name not in existing_programs
+            ],
+            batch_size=BANK_PROGRAM_SYNC_BATCH_SIZE,
         )
+        programs_by_name = MortgageProgram.objects.in_bulk(
+            new_programs.values(),
+            field_name='name',
+        )
+    else:
+        programs_by_name = {}
+
+    mapped_programs = {}
+    for program_name in program_names:
+        program_key = _normalize_program_match_name(program_name)
+        if program_key in program_lookup:
+            mapped_programs[program_name] = program_lookup[program_key]
+            continue
+        mortgage_program = programs_by_name[
+            new_programs[program_key or program_name]
+        ]
         if program_key:
             program_lookup[program_key] = mortgage_program
+        mapped_programs[program_name] = mortgage_program
 
-    _ensure_mortgage_program_alias(
-        mortgage_program,
-        program_name,
-        source=source,
-    )
-    return mortgage_program
+    _sync_mortgage_program_aliases(mapped_programs, source=source)
+    return mapped_programs
 
 
-def _remove_legacy_bank_program_link(bank, canonical_program, source_name):
-    """Remove a bank-program link created under a duplicate program name."""
-    legacy_program = MortgageProgram.objects.filter(name=source_name).exclude(
-        pk=canonical_program.pk
-    ).first()
-    if legacy_program is None:
-        return False
+def _sync_mortgage_program_aliases(mapped_programs, source=''):
+    """Create missing aliases and fill empty alias sources in bulk."""
+    alias_names = {}
+    for source_name in mapped_programs:
+        normalized_name = _normalize_program_match_name(source_name)
+        if normalized_name:
+            alias_names.setdefault(normalized_name, source_name)
+
+    existing_aliases = MortgageProgramAlias.objects.in_bulk(
+        alias_names,
+        field_name='normalized_name',
+    )
+    new_aliases = []
+    changed_aliases = []
+    now = timezone.now()
+    for normalized_name, source_name in alias_names.items():
+        mortgage_program = mapped_programs[source_name]
+        alias = existing_aliases.get(normalized_name)
+        if alias is None:
+            # bulk_create не вызывает save(), поэтому ключ сопоставления
+            # заполняется здесь.
+            new_aliases.append(
+                MortgageProgramAlias(
+                    mortgage_program=mortgage_program,
+                    source_name=source_name,
+                    normalized_name=normalized_name,
+                    source=source,
+                )
+            )
+        elif (
+            alias.mortgage_program_id == mortgage_program.pk
+            and source
+            and not alias.source
+        ):
+            alias.source = source
+            alias.updated_at = now
+            changed_aliases.append(alias)
 
-    deleted_count, _ = BankProgram.objects.filter(
-        bank=bank,
-        mortgage_program=legacy_program,
-    ).delete()
-    return bool(deleted_count)
+    MortgageProgramAlias.objects.bulk_create(
+        new_aliases,
+        batch_size=BANK_PROGRAM_SYNC_BATCH_SIZE,
+    )
+    MortgageProgramAlias.objects.bulk_update(
+        changed_aliases,
+        ['source', 'updated_at'],
+        batch_size=BANK_PROGRAM_SYNC_BATCH_SIZE,
+    )
 
 
 def _sync_reference_mortgage_programs(
@@ -1091,11 +1431,15 @@ def _sync_mortgage_offers_to_bank_programs(
     program_lookup,
     source='',
 ):
-    """Synchronize normalized offers to BankProgram rows."""
-    updated = 0
-    processed = 0
+    """Synchronize normalized offers to BankProgram rows.
+
+    Existing bank programs, aliases and duplicate program names are
+    loaded once; the difference is computed in memory and written with
+    chunked bulk queries. Rows whose values did not change are counted
+    as unchanged and are not written.
+    """
+    matched_offers = []
     skipped = 0
-
     for offer in offers:
         bank = _find_matching_bank(offer.bank_name, bank_lookup)
         if bank is None:
@@ -1105,48 +1449,147 @@ def _sync_mortgage_offers_to_bank_programs(
                 offer.bank_name,
             )
             continue
+        matched_offers.append((bank, offer))
+
+    if not matched_offers:
+        return {
+            'created': 0,
+            'updated': 0,
+            'unchanged': 0,
+            'processed': 0,
+            'skipped': skipped,
+        }
 
+    now = timezone.now()
+    changed_banks = {}
+    for bank, offer in matched_offers:
         if offer.logo_url and bank.logo_url != offer.logo_url:
             bank.logo_url = offer.logo_url
-            bank.save(update_fields=['logo_url', 'updated_at'])
-            updated += 1
+            bank.updated_at = now
+            changed_banks[bank.pk] = bank
 
-        mortgage_program = _get_or_create_mapped_mortgage_program(
-            offer.program_name,
+    with transaction.atomic():
+        mapped_programs = _map_offer_mortgage_programs(
+            (offer.program_name for _, offer in matched_offers),
             program_lookup,
             source=source,
         )
-        if _remove_legacy_bank_program_link(
-            bank,
-            mortgage_program,
-            offer.program_name,
-        ):
-            updated += 1
-
-        bank_program_defaults = {
-            'interest_rate': offer.interest_rate,
-            'minimum_initial_payment_percent': (
-                offer.minimum_initial_payment_percent
-            ),
+        legacy_programs = MortgageProgram.objects.in_bulk(
+            mapped_programs,
+            field_name='name',
+        )
+        existing_bank_programs = {
+            (bank_program.bank_id, bank_program.mortgage_program_id): (
+                bank_program
+            )
+            for bank_program in BankProgram.objects.filter(
+                bank_id__in={bank.pk for bank, _ in matched_offers}
+            )
         }
-        if offer.maximum_loan_term_years is not None:
-            bank_program_defaults['maximum_loan_term_years'] = (
-                offer.maximum_loan_term_years
+
+        bank_program_values = {}
+        legacy_keys = set()
+        for bank, offer in matched_offers:
+            mortgage_program = mapped_programs[offer.program_name]
+            legacy_program = legacy_programs.get(offer.program_name)
+            if (
+                legacy_program is not None
+                and legacy_program.pk != mortgage_program.pk
+            ):
+                legacy_keys.add((bank.pk, legacy_program.pk))
+
+            values = {
+                'interest_rate': offer.interest_rate,
+                'minimum_initial_payment_percent': (
+                    offer.minimum_initial_payment_percent
+                ),
+            }
+            if offer.maximum_loan_term_years is not None:
+                values['maximum_loan_term_years'] = (
+                    offer.maximum_loan_term_years
+                )
+            bank_program_values[(bank, mortgage_program)] = values
+
+        new_bank_programs = []
+        changed_bank_programs = []
+        unchanged = 0
+        for (bank, mortgage_program), values in bank_program_values.items():
+            bank_program = existing_bank_programs.get(
+                (bank.pk, mortgage_program.pk)
             )
+            if bank_program is None:
+                new_bank_programs.append(
+                    BankProgram(
+                        bank=bank,
+                        mortgage_program=mortgage_program,
+                        **values,
+                    )
+                )
+                continue
 
-        bank_program, was_created = BankProgram.objects.update_or_create(
-            bank=bank,
-            mortgage_program=mortgage_program,
-            defaults=bank_program_defaults,
+            changed = False
+            for field_name, value in values.items():
+                if getattr(bank_program, field_name) != value:
+                    setattr(bank_program, field_name, value)
+                    changed = True
+            if changed:
+                bank_program.updated_at = now
+                changed_bank_programs.append(bank_program)
+            else:
+                unchanged += 1
+
+        # Ссылка на дубль программы удаляется, только если эта же пара
+        # банк-программа не обновляется другим предложением пакета.
+        target_keys = {
+            (bank.pk, mortgage_program.pk)
+            for bank, mortgage_program in bank_program_values
+        }
+        legacy_bank_program_ids = [
+            existing_bank_programs[key].pk
+            for key in legacy_keys - target_keys
+            if key in existing_bank_programs
+        ]
+        if legacy_bank_program_ids:
+            BankProgram.objects.filter(
+                pk__in=legacy_bank_program_ids
+            ).delete()
+
+        Bank.objects.bulk_update(
+            changed_banks.values(),
+            ['logo_url', 'updated_at'],
+            batch_size=BANK_PROGRAM_SYNC_BATCH_SIZE,
         )
-        if not was_created:
-            updated += 1
-        logger.debug('Synced bank program %s', bank_program.pk)
-        processed += 1
+        BankProgram.objects.bulk_create(
+            new_bank_programs,
+            batch_size=BANK_PROGRAM_SYNC_BATCH_SIZE,
+        )
+        BankProgram.objects.bulk_update(
+            changed_bank_programs,
+            [*BANK_PROGRAM_SYNC_FIELDS, 'updated_at'],
+            batch_size=BANK_PROGRAM_SYNC_BATCH_SIZE,
+        )
+
+    if any(
+        (
+            changed_banks,
+            legacy_bank_program_ids,
+            new_bank_programs,
+            changed_bank_programs,
+        )
+    ):
+        # Массовые запросы не отправляют post_save, поэтому кеш данных
+        # форм ипотеки сбрасывается явно.
+        clear_form_data_cache()
 
     return {
-        'updated': updated,
-        'processed': processed,
+        'created': len(new_bank_programs),
+        'updated': (
+            len(changed_banks)
+            + len(legacy_bank_program_ids)
+            + len(changed_bank_programs)
+        ),
+        'unchanged': unchanged,
+        'processed': len(matched_offers),
         'skipped': skipped,
     }
 
@@ -1237,28 +1680,101 @@ def _download_google_sheet_mortgage_offers(source):
     )
 
 
+def _fetch_cbr_bank_records(source_url):
+    """Download and parse the Bank of Russia bank registry."""
+    return parse_cbr_bank_records(_download_cbr_bank_list_payload(source_url))
+
+
+def _fetch_reference_mortgage_programs(source_url):
+    """Download and parse the reference mortgage program catalog."""
+    return parse_reference_mortgage_programs(
+        _download_reference_mortgage_programs_payload(source_url)
+    )
+
+
 @transaction.atomic
 def sync_bank_mortgage_offers(
     source_url=None,
     cbr_source_url=None,
     google_sheet_sources=None,
     update_bank_registry=True,
+    force_refresh=False,
 ):
-    """Synchronize CBR banks and Banki.ru mortgage program conditions."""
+    """Synchronize CBR banks and Banki.ru mortgage program conditions.
+
+    All sources are downloaded and parsed in a thread pool with a limit
+    of parallel requests per host; database changes are applied in the
+    calling thread in a fixed order. Banki.ru pages are requested
+    conditionally and unchanged pages are neither parsed nor reconciled
+    again unless ``force_refresh`` is set.
+    """
     resolved_source_url = (
         source_url
         or getattr(settings, 'BANK_MORTGAGE_OFFERS_URL', BANKI_MORTGAGE_URL)
     )
-    sync_warnings = []
-    if update_bank_registry:
-        resolved_cbr_source_url = (
-            cbr_source_url
-            or getattr(settings, 'BANK_LIST_SOURCE_URL', CBR_BANKS_URL)
+    resolved_cbr_source_url = (
+        cbr_source_url
+        or getattr(settings, 'BANK_LIST_SOURCE_URL', CBR_BANKS_URL)
+    )
+    resolved_reference_program_source_url = (
+        getattr(
+            settings,
+            'BANK_MORTGAGE_REFERENCE_PROGRAM_SOURCE_URL',
+            DOMRF_REFERENCE_MORTGAGE_PROGRAMS_URL,
         )
-        try:
-            cbr_records = parse_cbr_bank_records(
-                _download_cbr_bank_list_payload(resolved_cbr_source_url)
+    )
+    resolved_google_sheet_sources = (
+        google_sheet_sources
+        if google_sheet_sources is not None
+        else getattr(
+            settings,
+            'BANK_MORTGAGE_GOOGLE_SHEET_SOURCES',
+            GOOGLE_SHEET_MORTGAGE_PROGRAM_SOURCES,
+        )
+    )
+
+    with ThreadPoolExecutor(
+        max_workers=getattr(
+            settings,
+            'BANK_MORTGAGE_SYNC_MAX_WORKERS',
+            SYNC_FETCH_MAX_WORKERS,
+        )
+    ) as executor:
+        cbr_future = None
+        if update_bank_registry:
+            cbr_future = executor.submit(
+                _fetch_cbr_bank_records,
+                resolved_cbr_source_url,
+            )
+        reference_future = None
+        if resolved_reference_program_source_url:
+            reference_future = executor.submit(
+                _fetch_reference_mortgage_programs,
+                resolved_reference_program_source_url,
             )
+        google_sheet_futures = [
+            executor.submit(
+                _download_google_sheet_mortgage_offers,
+                google_sheet_source,
+            )
+            for google_sheet_source in resolved_google_sheet_sources
+        ]
+        banki_warnings = []
+        banki_pages = _download_banki_mortgage_pages(
+            executor,
+            resolved_source_url,
+            sync_warnings=banki_warnings,
+            force_refresh=force_refresh,
+        )
+
+    sync_warnings = []
+    cbr_records = []
+    created = 0
+    updated = 0
+    banks = None
+    if cbr_future is not None:
+        try:
+            cbr_records = cbr_future.result()
             created, updated, banks = _sync_cbr_banks(cbr_records)
         except (BankMortgageSyncError, OSError, ValueError) as error:
             sync_warnings.append(
@@ -1268,40 +1784,20 @@ def sync_bank_mortgage_offers(
             cbr_records = []
             created = 0
             updated = 0
-            banks = list(Bank.objects.filter(is_active=True))
-    else:
-        cbr_records = []
-        created = 0
-        updated = 0
+    if banks is None:
         banks = list(Bank.objects.filter(is_active=True))
 
     bank_lookup = _build_bank_lookup(banks)
     program_lookup = _build_mortgage_program_lookup()
-    reference_result = {
-        'created': 0,
-        'updated': 0,
-        'aliases_created': 0,
-        'processed': 0,
-    }
     reference_records = []
     reference_source_name = DOMRF_REFERENCE_SOURCE_NAME
-    resolved_reference_program_source_url = (
-        getattr(
-            settings,
-            'BANK_MORTGAGE_REFERENCE_PROGRAM_SOURCE_URL',
-            DOMRF_REFERENCE_MORTGAGE_PROGRAMS_URL,
-        )
-    )
-    if resolved_reference_program_source_url:
+    if reference_future is not None:
         try:
-            reference_records = parse_reference_mortgage_programs(
-                _download_reference_mortgage_programs_payload(
-                    resolved_reference_program_source_url
-                )
-            )
+            reference_records = reference_future.result()
         except (BankMortgageSyncError, OSError, ValueError) as error:
             sync_warnings.append(
-                f'Эталонный источник ипотечных программ не обработан: {error}'
+                'Эталонный источник ипотечных программ не обработан: '
+                f'{error}'
             )
             logger.warning(
                 'Could not parse reference mortgage program source: %s',
@@ -1316,45 +1812,33 @@ def sync_bank_mortgage_offers(
         program_lookup,
         source_name=reference_source_name,
     )
-    resolved_google_sheet_sources = (
-        google_sheet_sources
-        if google_sheet_sources is not None
-        else getattr(
-            settings,
-            'BANK_MORTGAGE_GOOGLE_SHEET_SOURCES',
-            GOOGLE_SHEET_MORTGAGE_PROGRAM_SOURCES,
-        )
-    )
-
-    all_offers = []
-    banki_payloads = _download_banki_mortgage_payloads(
-        resolved_source_url,
-        sync_warnings=sync_warnings,
-    )
-    for page_url, raw_html in banki_payloads:
-        try:
-            all_offers.extend(
-                parse_banki_mortgage_offers(
-                    raw_html,
-                    source_url=page_url,
-                )
-            )
-        except BankMortgageSyncError as error:
-            sync_warnings.append(
-                f'Страница Banki.ru не обработана ({page_url}): {error}'
-            )
-            logger.warning(
-                'Could not parse mortgage offers from %s: %s',
-                page_url,
-                error,
-            )
 
-    if banki_payloads and not all_offers:
+    sync_warnings.extend(banki_warnings)
+    all_offers = [offer for page in banki_pages for offer in page.offers]
+    if banki_pages and not all_offers:
         sync_warnings.append(
             'Banki.ru не дал пригодных ипотечных предложений.'
         )
 
     offers = _select_best_program_offers(all_offers)
+    if not force_refresh and not created:
+        # Сверяются только пары банк-программа с измененных страниц:
+        # лучшее предложение по паре выбирается среди всех страниц.
+        # Новые банки ЦБ РФ могут сопоставиться с предложениями
+        # неизмененных страниц, поэтому тогда сверяется все. Пары, ушедшие
+        # с измененной страницы, тоже сверяются: их лучшим предложением
+        # может стать предложение с неизмененной страницы.
+        changed_offer_keys = {
+            _get_offer_match_key(offer)
+            for page in banki_pages
+            if page.is_changed
+            for offer in (*page.previous_offers, *page.offers)
+        }
+        offers = [
+            offer
+            for offer in offers
+            if _get_offer_match_key(offer) in changed_offer_keys
+        ]
     banki_result = _sync_mortgage_offers_to_bank_programs(
         offers,
         bank_lookup,
@@ -1364,11 +1848,9 @@ def sync_bank_mortgage_offers(
     updated += banki_result['updated']
 
     google_sheet_offers = []
-    for google_sheet_source in resolved_google_sheet_sources:
+    for google_sheet_future in google_sheet_futures:
         try:
-            google_sheet_offers.extend(
-                _download_google_sheet_mortgage_offers(google_sheet_source)
-            )
+            google_sheet_offers.extend(google_sheet_future.result())
         except (BankMortgageSyncError, OSError, ValueError) as error:
             sync_warnings.append(
                 f'Google Sheets источник не обработан: {error}'
@@ -1401,6 +1883,17 @@ def sync_bank_mortgage_offers(
             reference_result['aliases_created']
         ),
         'google_sheet_offers_processed': len(google_sheet_offers),
+        'pages_processed': sum(page.is_changed for page in banki_pages),
+        'pages_skipped': sum(not page.is_changed for page in banki_pages),
         'skipped': banki_result['skipped'] + google_sheet_result['skipped'],
+        'bank_programs_created': (
+            banki_result['created'] + google_sheet_result['created']
+        ),
+        'bank_programs_updated': (
+            banki_result['updated'] + google_sheet_result['updated']
+        ),
+        'bank_programs_unchanged': (
+            banki_result['unchanged'] + google_sheet_result['unchanged']
+        ),
         'warnings': sync_warnings,
     }
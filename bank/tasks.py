@@ -0,0 +1,113 @@
+"""Background jobs of the bank application."""
+
+from jobs.registry import BackgroundJobError, register_job
+from jobs.scheduler import register_schedule
+
+from .key_rate_sync import KeyRateSyncError, sync_key_rates
+from .models import KeyRate
+from .mortgage_offer_sync import (
+    BankMortgageSyncError,
+    sync_bank_mortgage_offers,
+)
+
+BANK_MORTGAGE_SYNC_JOB = 'bank.sync_mortgage_offers'
+KEY_RATE_SYNC_JOB = 'bank.sync_key_rates'
+KEY_RATE_SYNC_CRON = '0 15 * * *'
+BANK_MORTGAGE_SYNC_CRON = '30 3 * * *'
+
+
+def get_bank_mortgage_sync_label(update_bank_registry):
+    """Return the user-facing name of a bank mortgage sync."""
+    if update_bank_registry:
+        return 'Обновление данных банков'
+    return 'Обновление ипотечных программ банков'
+
+
+def format_bank_mortgage_sync_message(result, update_bank_registry):
+    """Return a summary message of a finished bank mortgage sync."""
+    return (
+        f'{get_bank_mortgage_sync_label(update_bank_registry)} завершено: '
+        f'создано={result["created"]}, '
+        f'обновлено={result["updated"]}, '
+        f'обработано={result["processed"]}, '
+        'эталонных программ='
+        f'{result.get("reference_programs_processed", 0)}, '
+        'алиасов программ='
+        f'{result.get("reference_program_aliases_created", 0)}.'
+    )
+
+
+@register_job(BANK_MORTGAGE_SYNC_JOB, 'Обновление банков')
+def run_bank_mortgage_sync_job(job):
+    """Synchronize bank mortgage offers in a background job."""
+    update_bank_registry = job.payload.get('update_bank_registry', True)
+    job.report_progress(
+        0,
+        total=1,
+        message='Загрузка данных банков и ипотечных программ',
+    )
+    try:
+        result = sync_bank_mortgage_offers(
+            update_bank_registry=update_bank_registry
+        )
+    except BankMortgageSyncError as error:
+        sync_label = (
+            'данные банков'
+            if update_bank_registry
+            else 'ипотечные программы банков'
+        )
+        raise BackgroundJobError(
+            f'Не удалось обновить {sync_label}: {error}'
+        ) from error
+
+    return {
+        'message': format_bank_mortgage_sync_message(
+            result,
+            update_bank_registry,
+        ),
+        'warnings': result.get('warnings', []),
+        'created': result['created'],
+        'updated': result['updated'],
+        'processed': result['processed'],
+    }
+
+
+@register_job(KEY_RATE_SYNC_JOB, 'Обновление ключевой ставки')
+def run_key_rate_sync_job(job):
+    """Synchronize CBR key rates in a background job."""
+    try:
+        result = sync_key_rates()
+    except KeyRateSyncError as error:
+        raise BackgroundJobError(
+            f'Не удалось обновить данные ключевой ставки: {error}'
+        ) from error
+
+    return {
+        'message': (
+            'Обновление данных ключевой ставки завершено: '
+            f'создано={result["created"]}, '
+            f'обновлено={result["updated"]}, '
+            f'обработано={result["processed"]}.'
+        ),
+        'created': result['created'],
+        'updated': result['updated'],
+        'processed': result['processed'],
+    }
+
+
+def key_rates_are_missing():
+    """Return whether the key rate table has not been loaded yet."""
+    return not KeyRate.objects.exists()
+
+
+register_schedule(
+    'bank.key_rates',
+    KEY_RATE_SYNC_JOB,
+    KEY_RATE_SYNC_CRON,
+    run_on_start=key_rates_are_missing,
+)
+register_schedule(
+    'bank.mortgage_offers',
+    BANK_MORTGAGE_SYNC_JOB,
+    BANK_MORTGAGE_SYNC_CRON,
+)
@@ -1,13 +1,19 @@
 from datetime import date, timedelta
 from decimal import Decimal
-from unittest.mock import patch
+from threading import Barrier
+from unittest.mock import MagicMock, patch
+from urllib.error import HTTPError
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.contrib.messages import get_messages
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from jobs.models import BackgroundJob
+from jobs.queue import run_pending_jobs
 from location.models import Region
 from users.roles import (
     APPLICATION_ADMINISTRATOR_GROUP_NAME,
@@ -15,9 +21,26 @@ from users.roles import (
 )
 
 from .forms import BankForm
-from .key_rate_sync import KeyRateSyncError
+from .key_rate_series import (
+    finish_key_rate_request,
+    get_key_rate_as_of,
+    get_key_rate_generation,
+    get_key_rate_series,
+    get_latest_key_rate,
+    start_key_rate_request,
+)
+from .key_rate_sync import (
+    CBR_START_DATE,
+    KEY_RATE_SYNC_OVERLAP_DAYS,
+    KeyRateSyncError,
+    sync_key_rates,
+)
 from .mortgage_offer_sync import (
+    _download_banki_mortgage_payload,
     _normalize_bank_match_name,
+    _sync_mortgage_offers_to_bank_programs,
+    BankMortgageOffer,
+    BankMortgageSyncError,
     FEDERAL_REFERENCE_MORTGAGE_PROGRAM_NAMES,
     FEDERAL_REFERENCE_SOURCE_NAME,
     normalize_bank_name_for_storage,
@@ -29,12 +52,14 @@ from .mortgage_offer_sync import (
 )
 from .models import (
     Bank,
+    BankMortgageOfferPage,
     BankProgram,
     KeyRate,
     MortgageProgram,
     MortgageProgramAlias,
     MortgageProgramRegionalCreditLimit,
 )
+from .tasks import BANK_MORTGAGE_SYNC_JOB
 
 
 def test_bank_model_verbose_names():
@@ -850,17 +875,16 @@ class BankProgramCatalogTests(TestCase):
 
     def test_moderator_cannot_run_bank_sync(self):
         """Checks external bank sync requires administrator role."""
-        with patch('bank.views.sync_bank_mortgage_offers') as sync_mock:
-            response = self.client.post(
-                reverse('bank:catalog'),
-                {
-                    'action': 'sync_bank_mortgage_offers',
-                    'model': 'bank',
-                },
-            )
+        response = self.client.post(
+            reverse('bank:catalog'),
+            {
+                'action': 'sync_bank_mortgage_offers',
+                'model': 'bank',
+            },
+        )
 
         self.assertEqual(response.status_code, 403)
-        sync_mock.assert_not_called()
+        self.assertFalse(BackgroundJob.objects.exists())
 
 
 class BankMortgageOfferSyncTests(TestCase):
@@ -1092,7 +1116,7 @@ class BankMortgageOfferSyncTests(TestCase):
 
     def test_sync_bank_mortgage_offers_creates_banks_and_program_links(self):
         """Checks synchronization loads CBR banks and Banki.ru programs."""
-        def fake_download(source_url):
+        def fake_download(source_url, cached_page=None):
             if 'page=2' in source_url:
                 return SAMPLE_BANKI_MORTGAGE_SECOND_PAGE_HTML
             return SAMPLE_BANKI_MORTGAGE_HTML
@@ -1137,6 +1161,294 @@ class BankMortgageOfferSyncTests(TestCase):
             ).exists()
         )
 
+    def test_sync_bank_mortgage_offers_skips_unchanged_banki_pages(self):
+        """Checks unchanged Banki.ru pages are not parsed or reconciled."""
+        second_page_html = SAMPLE_BANKI_MORTGAGE_SECOND_PAGE_HTML
+
+        def fake_download(source_url, cached_page=None):
+            if 'page=2' in source_url:
+                return second_page_html
+            return SAMPLE_BANKI_MORTGAGE_HTML
+
+        sync_options = {
+            'source_url': 'https://www.banki.ru/products/hypothec/',
+            'cbr_source_url': (
+                'https://www.cbr.ru/banking_sector/credit/FullCoList/'
+            ),
+            'google_sheet_sources': (),
+        }
+        with patch(
+            'bank.mortgage_offer_sync._download_cbr_bank_list_payload',
+            return_value=SAMPLE_CBR_BANK_LIST_HTML,
+        ), patch(
+            'bank.mortgage_offer_sync._download_banki_mortgage_payload',
+            side_effect=fake_download,
+        ):
+            first_result = sync_bank_mortgage_offers(**sync_options)
+            BankProgram.objects.filter(bank__name='Банк ВТБ').update(
+                interest_rate=Decimal('1.00')
+            )
+            with patch(
+                'bank.mortgage_offer_sync.parse_banki_mortgage_offers'
+            ) as parse_mock:
+                unchanged_result = sync_bank_mortgage_offers(**sync_options)
+            second_page_html = SAMPLE_BANKI_MORTGAGE_SECOND_PAGE_HTML.replace(
+                '21.5%',
+                '20.5%',
+            )
+            changed_result = sync_bank_mortgage_offers(**sync_options)
+
+        self.assertEqual(first_result['pages_processed'], 2)
+        self.assertEqual(first_result['pages_skipped'], 0)
+        parse_mock.assert_not_called()
+        self.assertEqual(unchanged_result['pages_processed'], 0)
+        self.assertEqual(unchanged_result['pages_skipped'], 2)
+        self.assertEqual(unchanged_result['processed'], 0)
+        self.assertEqual(changed_result['pages_processed'], 1)
+        self.assertEqual(changed_result['pages_skipped'], 1)
+        self.assertEqual(changed_result['processed'], 1)
+        self.assertFalse(
+            BankProgram.objects.filter(bank__name='Банк ВТБ').exclude(
+                interest_rate=Decimal('1.00')
+            ).exists()
+        )
+        self.assertTrue(
+            BankProgram.objects.filter(
+                bank__name='Газпромбанк',
+                interest_rate=Decimal('20.5'),
+            ).exists()
+        )
+        self.assertEqual(
+            BankMortgageOfferPage.objects.get(
+                source_url='https://www.banki.ru/products/hypothec/'
+            ).next_page_url,
+            'https://www.banki.ru/products/hypothec/?page=2',
+        )
+
+    def test_sync_bank_mortgage_offers_reconciles_offers_left_changed_page(
+        self,
+    ):
+        """Checks a pair leaving a changed page falls back to other pages."""
+        first_page_html = SAMPLE_BANKI_MORTGAGE_HTML.replace(
+            '<a href=',
+            '''<article>
+      <h2>Газпромбанк</h2>
+      <div>Ипотека на квартиру</div>
+      <div>Подробнее</div>
+      <div>Ставка</div>
+      <div>22.5%</div>
+      <div>Первоначальный взнос</div>
+      <div>от 30%</div>
+    </article>
+    <a href=''',
+        )
+        second_page_html = SAMPLE_BANKI_MORTGAGE_SECOND_PAGE_HTML
+
+        def fake_download(source_url, cached_page=None):
+            if 'page=2' in source_url:
+                return second_page_html
+            return first_page_html
+
+        sync_options = {
+            'source_url': 'https://www.banki.ru/products/hypothec/',
+            'cbr_source_url': (
+                'https://www.cbr.ru/banking_sector/credit/FullCoList/'
+            ),
+            'google_sheet_sources': (),
+        }
+        with patch(
+            'bank.mortgage_offer_sync._download_cbr_bank_list_payload',
+            return_value=SAMPLE_CBR_BANK_LIST_HTML,
+        ), patch(
+            'bank.mortgage_offer_sync._download_banki_mortgage_payload',
+            side_effect=fake_download,
+        ):
+            sync_bank_mortgage_offers(**sync_options)
+            first_rate = BankProgram.objects.get(
+                bank__name='Газпромбанк'
+            ).interest_rate
+            second_page_html = SAMPLE_BANKI_MORTGAGE_SECOND_PAGE_HTML.replace(
+                'Газпромбанк',
+                'Альфа-Банк',
+            )
+            changed_result = sync_bank_mortgage_offers(**sync_options)
+
+        self.assertEqual(first_rate, Decimal('21.5'))
+        self.assertEqual(changed_result['pages_processed'], 1)
+        self.assertEqual(
+            BankProgram.objects.get(bank__name='Газпромбанк').interest_rate,
+            Decimal('22.5'),
+        )
+
+    def test_sync_bank_mortgage_offers_reports_unchanged_bank_programs(self):
+        """Checks a repeated sync reconciles rows without rewriting them."""
+        sync_options = {
+            'source_url': 'https://www.banki.ru/products/hypothec/',
+            'cbr_source_url': (
+                'https://www.cbr.ru/banking_sector/credit/FullCoList/'
+            ),
+            'google_sheet_sources': (),
+            'force_refresh': True,
+        }
+        with patch(
+            'bank.mortgage_offer_sync._download_cbr_bank_list_payload',
+            return_value=SAMPLE_CBR_BANK_LIST_HTML,
+        ), patch(
+            'bank.mortgage_offer_sync._download_banki_mortgage_payload',
+            return_value=SAMPLE_BANKI_MORTGAGE_SECOND_PAGE_HTML,
+        ):
+            first_result = sync_bank_mortgage_offers(**sync_options)
+            BankProgram.objects.update(interest_rate=Decimal('1.00'))
+            changed_result = sync_bank_mortgage_offers(**sync_options)
+            unchanged_result = sync_bank_mortgage_offers(**sync_options)
+
+        self.assertGreater(first_result['bank_programs_created'], 0)
+        self.assertEqual(first_result['bank_programs_unchanged'], 0)
+        self.assertEqual(changed_result['bank_programs_created'], 0)
+        self.assertEqual(
+            changed_result['bank_programs_updated'],
+            first_result['bank_programs_created'],
+        )
+        self.assertEqual(unchanged_result['bank_programs_created'], 0)
+        self.assertEqual(unchanged_result['bank_programs_updated'], 0)
+        self.assertEqual(
+            unchanged_result['bank_programs_unchanged'],
+            first_result['bank_programs_created'],
+        )
+        self.assertFalse(
+            BankProgram.objects.filter(interest_rate=Decimal('1.00')).exists()
+        )
+
+    def test_bank_program_reconciliation_query_count_does_not_grow(self):
+        """Checks offers are reconciled with a fixed number of queries."""
+        banks = [
+            Bank.objects.create(name=f'Банк {index}') for index in range(6)
+        ]
+        bank_lookup = {
+            _normalize_bank_match_name(bank.name): bank for bank in banks
+        }
+
+        def build_offers(bank_count):
+            return [
+                BankMortgageOffer(
+                    bank_name=bank.name,
+                    program_name=f'Программа {program_index}',
+                    interest_rate=Decimal('10.50'),
+                    minimum_initial_payment_percent=Decimal('20.00'),
+                )
+                for bank in banks[:bank_count]
+                for program_index in range(3)
+            ]
+
+        def count_queries(offers):
+            with CaptureQueriesContext(connection) as queries:
+                result = _sync_mortgage_offers_to_bank_programs(
+                    offers,
+                    bank_lookup,
+                    {},
+                )
+            return len(queries), result
+
+        small_queries, small_result = count_queries(build_offers(2))
+        MortgageProgramAlias.objects.all().delete()
+        BankProgram.objects.all().delete()
+        MortgageProgram.objects.all().delete()
+        large_queries, large_result = count_queries(build_offers(6))
+        repeated_queries, repeated_result = count_queries(build_offers(6))
+
+        self.assertEqual(small_result['created'], 6)
+        self.assertEqual(large_result['created'], 18)
+        self.assertEqual(small_queries, large_queries)
+        self.assertEqual(repeated_result['created'], 0)
+        self.assertEqual(repeated_result['updated'], 0)
+        self.assertEqual(repeated_result['unchanged'], 18)
+        self.assertLess(repeated_queries, large_queries)
+
+    def test_sync_bank_mortgage_offers_downloads_sources_in_parallel(self):
+        """Checks CBR, reference, Banki.ru and sheet sources overlap."""
+        barrier = Barrier(4, timeout=5)
+
+        def wait_for_sources(payload):
+            def download(*args, **kwargs):
+                barrier.wait()
+                return payload
+            return download
+
+        self.reference_program_download_mock.side_effect = wait_for_sources(
+            SAMPLE_REFERENCE_MORTGAGE_PROGRAMS_HTML
+        )
+        with patch(
+            'bank.mortgage_offer_sync._download_cbr_bank_list_payload',
+            side_effect=wait_for_sources(SAMPLE_CBR_BANK_LIST_HTML),
+        ), patch(
+            'bank.mortgage_offer_sync._download_banki_mortgage_payload',
+            side_effect=wait_for_sources(
+                SAMPLE_BANKI_MORTGAGE_SECOND_PAGE_HTML
+            ),
+        ), patch(
+            'bank.mortgage_offer_sync._download_google_sheet_mortgage_payload',
+            side_effect=wait_for_sources(SAMPLE_GOOGLE_FAMILY_MORTGAGE_CSV),
+        ):
+            result = sync_bank_mortgage_offers(
+                source_url='https://www.banki.ru/products/hypothec/',
+                cbr_source_url='https://www.cbr.ru/banking_sector/credit/FullCoList/',
+                google_sheet_sources=(
+                    {
+                        'program_name': 'Семейная ипотека',
+                        'source_url': 'https://example.test/family.csv',
+                        'bank_column_index': 2,
+                        'rate_column_index': 6,
+                        'initial_payment_column_index': 7,
+                    },
+                ),
+            )
+
+        self.assertEqual(result['warnings'], [])
+        self.assertEqual(result['banks_processed'], 5)
+        self.assertEqual(result['pages_processed'], 1)
+        self.assertEqual(result['google_sheet_offers_processed'], 2)
+
+    def test_banki_page_download_uses_conditional_request(self):
+        """Checks cached page validators are sent and 304 is reported."""
+        source_url = 'https://www.banki.ru/products/hypothec/'
+        cached_page = BankMortgageOfferPage(
+            source_url=source_url,
+            etag='"v1"',
+            last_modified='Thu, 01 Oct 2026 10:00:00 GMT',
+            content_hash='0' * 64,
+        )
+
+        with patch(
+            'bank.mortgage_offer_sync.urlopen',
+            side_effect=HTTPError(source_url, 304, 'Not Modified', {}, None),
+        ) as urlopen_mock:
+            raw_html = _download_banki_mortgage_payload(
+                source_url,
+                cached_page,
+            )
+
+        self.assertIsNone(raw_html)
+        request = urlopen_mock.call_args.args[0]
+        self.assertEqual(request.get_header('If-none-match'), '"v1"')
+        self.assertEqual(
+            request.get_header('If-modified-since'),
+            'Thu, 01 Oct 2026 10:00:00 GMT',
+        )
+
+        new_page = BankMortgageOfferPage(source_url=source_url)
+        response = MagicMock()
+        response.headers = {'ETag': '"v2"'}
+        response.read.return_value = b'<html></html>'
+        with patch('bank.mortgage_offer_sync.urlopen') as urlopen_mock:
+            urlopen_mock.return_value.__enter__.return_value = response
+            raw_html = _download_banki_mortgage_payload(source_url, new_page)
+
+        self.assertEqual(raw_html, '<html></html>')
+        request = urlopen_mock.call_args.args[0]
+        self.assertIsNone(request.get_header('If-none-match'))
+        self.assertEqual(new_page.etag, '"v2"')
+        self.assertEqual(new_page.last_modified, '')
+
     def test_sync_bank_mortgage_offers_skips_unknown_banki_banks(self):
         """Checks Banki.ru offers are not added when absent from CBR list."""
         cbr_html = SAMPLE_CBR_BANK_LIST_HTML.replace(
@@ -1382,12 +1694,9 @@ class BankMortgageOfferSyncTests(TestCase):
         self.assertContains(response, 'src="https://img.example/alpha.svg"')
         self.assertContains(response, '>Alpha Bank</span>')
 
-    def test_bank_catalog_sync_button_runs_mortgage_offer_sync(self):
-        """Checks bank catalog update button runs mortgage offer sync."""
-        with patch(
-            'bank.views.sync_bank_mortgage_offers',
-            return_value={'created': 1, 'updated': 2, 'processed': 3},
-        ) as sync_mock:
+    def test_bank_catalog_sync_button_queues_mortgage_offer_sync(self):
+        """Checks bank catalog update button queues mortgage offer sync."""
+        with patch('bank.tasks.sync_bank_mortgage_offers') as sync_mock:
             response = self.client.post(
                 reverse('bank:catalog'),
                 {
@@ -1397,15 +1706,40 @@ class BankMortgageOfferSyncTests(TestCase):
             )
 
         self.assertRedirects(response, f'{reverse("bank:catalog")}?model=bank')
-        sync_mock.assert_called_once_with(update_bank_registry=True)
+        sync_mock.assert_not_called()
+        job = BackgroundJob.objects.get()
+        self.assertEqual(job.job_type, BANK_MORTGAGE_SYNC_JOB)
+        self.assertEqual(job.status, BackgroundJob.Status.QUEUED)
+        self.assertEqual(job.payload, {'update_bank_registry': True})
         messages = [
             str(message)
             for message in get_messages(response.wsgi_request)
         ]
         self.assertEqual(len(messages), 1)
-        self.assertIn('создано=1', messages[0])
-        self.assertIn('обновлено=2', messages[0])
-        self.assertIn('обработано=3', messages[0])
+        self.assertIn('поставлено в очередь', messages[0])
+        self.assertIn(f'№{job.pk}', messages[0])
+
+    def test_bank_mortgage_sync_job_stores_summary(self):
+        """Checks the worker runs a queued sync and stores its summary."""
+        self.client.post(
+            reverse('bank:catalog'),
+            {
+                'action': 'sync_bank_mortgage_offers',
+                'model': 'bank',
+            },
+        )
+        with patch(
+            'bank.tasks.sync_bank_mortgage_offers',
+            return_value={'created': 1, 'updated': 2, 'processed': 3},
+        ) as sync_mock:
+            self.assertEqual(run_pending_jobs(), 1)
+
+        sync_mock.assert_called_once_with(update_bank_registry=True)
+        job = BackgroundJob.objects.get()
+        self.assertEqual(job.status, BackgroundJob.Status.SUCCEEDED)
+        self.assertIn('создано=1', job.result['message'])
+        self.assertIn('обновлено=2', job.result['message'])
+        self.assertIn('обработано=3', job.result['message'])
 
     def test_bank_catalog_program_sync_button_runs_program_only_sync(self):
         """Checks bank catalog has program-only sync action."""
@@ -1417,34 +1751,38 @@ class BankMortgageOfferSyncTests(TestCase):
         )
         self.assertContains(response, 'Обновить ипотечные программы')
 
+        response = self.client.post(
+            reverse('bank:catalog'),
+            {
+                'action': 'sync_existing_bank_mortgage_offers',
+                'model': 'bank',
+            },
+        )
         with patch(
-            'bank.views.sync_bank_mortgage_offers',
+            'bank.tasks.sync_bank_mortgage_offers',
             return_value={'created': 0, 'updated': 2, 'processed': 3},
         ) as sync_mock:
-            response = self.client.post(
-                reverse('bank:catalog'),
-                {
-                    'action': 'sync_existing_bank_mortgage_offers',
-                    'model': 'bank',
-                },
-            )
+            run_pending_jobs()
 
         self.assertRedirects(response, f'{reverse("bank:catalog")}?model=bank')
         sync_mock.assert_called_once_with(update_bank_registry=False)
-        messages = [
-            str(message)
-            for message in get_messages(response.wsgi_request)
-        ]
-        self.assertEqual(len(messages), 1)
+        job = BackgroundJob.objects.get()
         self.assertIn(
             'Обновление ипотечных программ банков завершено',
-            messages[0],
+            job.result['message'],
         )
 
-    def test_bank_catalog_program_sync_shows_warning_messages(self):
-        """Checks program-only sync warnings are rendered instead of 500."""
+    def test_bank_catalog_program_sync_job_keeps_warnings(self):
+        """Checks program-only sync warnings are stored in the job result."""
+        self.client.post(
+            reverse('bank:catalog'),
+            {
+                'action': 'sync_existing_bank_mortgage_offers',
+                'model': 'bank',
+            },
+        )
         with patch(
-            'bank.views.sync_bank_mortgage_offers',
+            'bank.tasks.sync_bank_mortgage_offers',
             return_value={
                 'created': 0,
                 'updated': 0,
@@ -1454,32 +1792,37 @@ class BankMortgageOfferSyncTests(TestCase):
                 'warnings': ['Banki.ru не обработан'],
             },
         ):
-            response = self.client.post(
-                reverse('bank:catalog'),
-                {
-                    'action': 'sync_existing_bank_mortgage_offers',
-                    'model': 'bank',
-                },
-            )
+            run_pending_jobs()
 
-        self.assertRedirects(response, f'{reverse("bank:catalog")}?model=bank')
-        messages = [
-            str(message)
-            for message in get_messages(response.wsgi_request)
-        ]
-        self.assertEqual(len(messages), 2)
-        self.assertIn(
-            'Обновление ипотечных программ банков завершено',
-            messages[0],
+        job = BackgroundJob.objects.get()
+        self.assertEqual(job.status, BackgroundJob.Status.SUCCEEDED)
+        self.assertEqual(job.result['warnings'], ['Banki.ru не обработан'])
+
+    def test_bank_mortgage_sync_job_reports_sync_errors(self):
+        """Checks a failed sync marks the job failed with its message."""
+        self.client.post(
+            reverse('bank:catalog'),
+            {
+                'action': 'sync_bank_mortgage_offers',
+                'model': 'bank',
+            },
+        )
+        with patch(
+            'bank.tasks.sync_bank_mortgage_offers',
+            side_effect=BankMortgageSyncError('источник недоступен'),
+        ):
+            run_pending_jobs()
+
+        job = BackgroundJob.objects.get()
+        self.assertEqual(job.status, BackgroundJob.Status.FAILED)
+        self.assertEqual(
+            job.error,
+            'Не удалось обновить данные банков: источник недоступен',
         )
-        self.assertIn('Banki.ru не обработан', messages[1])
 
     def test_bank_catalog_sync_message_is_rendered_once(self):
         """Checks bank sync message is not duplicated in the rendered page."""
-        with patch(
-            'bank.views.sync_bank_mortgage_offers',
-            return_value={'created': 1, 'updated': 2, 'processed': 3},
-        ):
+        with patch('bank.tasks.sync_bank_mortgage_offers'):
             response = self.client.post(
                 reverse('bank:catalog'),
                 {
@@ -1498,6 +1841,238 @@ class BankMortgageOfferSyncTests(TestCase):
         )
 
 
+def build_cbr_key_rate_html(rate_periods, to_date):
+    """Build a CBR daily key rate table for rate periods."""
+    rows = []
+    for index, (start_date, key_rate) in enumerate(rate_periods):
+        end_date = (
+            rate_periods[index + 1][0] - timedelta(days=1)
+            if index + 1 < len(rate_periods)
+            else to_date
+        )
+        current_date = start_date
+        while current_date <= end_date:
+            rows.append(
+                f'<tr><td>{current_date:%d.%m.%Y}</td>'
+                f'<td>{key_rate}</td></tr>'
+            )
+            current_date += timedelta(days=1)
+    return '<table>' + ''.join(reversed(rows)) + '</table>'
+
+
+class KeyRateSyncTests(TestCase):
+    """Checks incremental and full key rate synchronization."""
+
+    def setUp(self):
+        """Store two known key rate meetings."""
+        KeyRate.objects.create(
+            meeting_date=date(2026, 6, 6),
+            key_rate=Decimal('20.00'),
+        )
+        KeyRate.objects.create(
+            meeting_date=date(2026, 7, 25),
+            key_rate=Decimal('18.00'),
+        )
+        self.to_date = date(2026, 8, 10)
+        self.rate_periods = [
+            (date(2026, 6, 6), '20,00'),
+            (date(2026, 7, 25), '18,00'),
+        ]
+
+    def sync(self, **kwargs):
+        """Run key rate sync against the stubbed CBR table."""
+        requested_periods = []
+
+        def download(from_date, to_date):
+            requested_periods.append((from_date, to_date))
+            periods = [
+                (max(start_date, from_date), key_rate)
+                for index, (start_date, key_rate) in enumerate(
+                    self.rate_periods
+                )
+                if index + 1 == len(self.rate_periods)
+                or self.rate_periods[index + 1][0] > from_date
+            ]
+            return build_cbr_key_rate_html(periods, to_date)
+
+        with patch(
+            'bank.key_rate_sync._download_cbr_payload',
+            side_effect=download,
+        ):
+            result = sync_key_rates(to_date=self.to_date, **kwargs)
+        return result, requested_periods
+
+    def test_incremental_sync_starts_before_latest_meeting(self):
+        """Checks the default sync downloads only the overlap window."""
+        result, requested_periods = self.sync()
+
+        self.assertEqual(
+            requested_periods,
+            [
+                (
+                    date(2026, 7, 25)
+                    - timedelta(days=KEY_RATE_SYNC_OVERLAP_DAYS),
+                    self.to_date,
+                )
+            ],
+        )
+        self.assertEqual(
+            result,
+            {'created': 0, 'updated': 0, 'processed': 1},
+        )
+        self.assertEqual(KeyRate.objects.count(), 2)
+
+    def test_incremental_sync_saves_new_and_revised_meetings(self):
+        """Checks new meetings are created and revised rates updated."""
+        self.rate_periods = [
+            (date(2026, 6, 6), '20,00'),
+            (date(2026, 7, 25), '18,50'),
+            (date(2026, 8, 5), '17,00'),
+        ]
+
+        result, _ = self.sync()
+
+        self.assertEqual(
+            result,
+            {'created': 1, 'updated': 1, 'processed': 2},
+        )
+        self.assertEqual(
+            list(
+                KeyRate.objects.order_by('meeting_date').values_list(
+                    'meeting_date',
+                    'key_rate',
+                )
+            ),
+            [
+                (date(2026, 6, 6), Decimal('20.00')),
+                (date(2026, 7, 25), Decimal('18.50')),
+                (date(2026, 8, 5), Decimal('17.00')),
+            ],
+        )
+
+    def test_full_history_sync_downloads_from_first_cbr_date(self):
+        """Checks full history mode runs only when requested."""
+        self.rate_periods = [
+            (CBR_START_DATE, '7,00'),
+            (date(2026, 6, 6), '20,00'),
+            (date(2026, 7, 25), '18,00'),
+        ]
+
+        result, requested_periods = self.sync(full_history=True)
+
+        self.assertEqual(
+            requested_periods,
+            [(CBR_START_DATE, self.to_date)],
+        )
+        self.assertEqual(
+            result,
+            {'created': 1, 'updated': 0, 'processed': 3},
+        )
+        self.assertTrue(
+            KeyRate.objects.filter(meeting_date=CBR_START_DATE).exists()
+        )
+
+
+class KeyRateSeriesTests(TestCase):
+    """Checks the in-process key rate series."""
+
+    def setUp(self):
+        """Store key rate meetings and drop a previously loaded series."""
+        KeyRate.objects.create(
+            meeting_date=date(2026, 3, 20),
+            key_rate=Decimal('21.00'),
+        )
+        KeyRate.objects.create(
+            meeting_date=date(2026, 6, 6),
+            key_rate=Decimal('20.00'),
+        )
+        KeyRate.objects.create(
+            meeting_date=date(2026, 7, 25),
+            key_rate=Decimal('18.50'),
+            is_active=False,
+        )
+
+    def test_series_answers_latest_and_as_of_lookups(self):
+        """Checks lookups use active meetings in date order."""
+        self.assertEqual(get_latest_key_rate(), Decimal('20.00'))
+        self.assertEqual(
+            get_key_rate_as_of(date(2026, 3, 19), default=Decimal('0')),
+            Decimal('0'),
+        )
+        self.assertEqual(
+            get_key_rate_as_of(date(2026, 3, 20)),
+            Decimal('21.00'),
+        )
+        self.assertEqual(
+            get_key_rate_as_of(date(2026, 6, 5)),
+            Decimal('21.00'),
+        )
+        self.assertEqual(
+            get_key_rate_as_of(date(2026, 8, 1)),
+            Decimal('20.00'),
+        )
+
+    def test_series_is_reused_until_generation_changes(self):
+        """Checks only the generation is queried until key rates change."""
+        series = get_key_rate_series()
+
+        with self.assertNumQueries(1):
+            self.assertIs(get_key_rate_series(), series)
+        with self.assertNumQueries(1):
+            self.assertEqual(get_latest_key_rate(), Decimal('20.00'))
+
+        KeyRate.objects.filter(meeting_date=date(2026, 7, 25)).get().save()
+        self.assertEqual(get_latest_key_rate(), Decimal('20.00'))
+        self.assertIsNot(get_key_rate_series(), series)
+
+        KeyRate.objects.create(
+            meeting_date=date(2026, 9, 12),
+            key_rate=Decimal('17.00'),
+        )
+        self.assertEqual(get_latest_key_rate(), Decimal('17.00'))
+
+        KeyRate.objects.filter(meeting_date=date(2026, 9, 12)).delete()
+        self.assertEqual(get_latest_key_rate(), Decimal('20.00'))
+
+    def test_series_is_checked_once_per_request(self):
+        """Checks a request reuses the series until key rates change."""
+        get_key_rate_series()
+        start_key_rate_request()
+        try:
+            with self.assertNumQueries(1):
+                series = get_key_rate_series()
+                self.assertEqual(get_latest_key_rate(), Decimal('20.00'))
+                self.assertIs(get_key_rate_series(), series)
+
+            KeyRate.objects.create(
+                meeting_date=date(2026, 9, 12),
+                key_rate=Decimal('17.00'),
+            )
+            self.assertEqual(get_latest_key_rate(), Decimal('17.00'))
+        finally:
+            finish_key_rate_request()
+
+    def test_sync_key_rates_changes_generation_for_bulk_writes(self):
+        """Checks bulk key rate sync invalidates loaded series."""
+        generation = get_key_rate_generation()
+        raw_html = build_cbr_key_rate_html(
+            [(date(2026, 6, 6), '20,00'), (date(2026, 9, 12), '17,00')],
+            date(2026, 9, 20),
+        )
+
+        with patch(
+            'bank.key_rate_sync._download_cbr_payload',
+            return_value=raw_html,
+        ):
+            sync_key_rates(
+                from_date=date(2026, 6, 6),
+                to_date=date(2026, 9, 20),
+            )
+
+        self.assertNotEqual(get_key_rate_generation(), generation)
+        self.assertEqual(get_latest_key_rate(), Decimal('17.00'))
+
+
 class KeyRateListViewTests(TestCase):
     def setUp(self):
         """Log in as application administrator for key rate sync tests."""
@@ -10,6 +10,7 @@ from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
 from django.views.generic import TemplateView
 
+from jobs.queue import enqueue_job
 from property.views import BaseCatalogView, CatalogModelConfig
 from users.roles import (
     CatalogManagementRequiredMixin,
@@ -19,10 +20,6 @@ from users.roles import (
 
 from .forms import BankForm, BankProgramFormSet
 from .key_rate_sync import KeyRateSyncError, sync_key_rates
-from .mortgage_offer_sync import (
-    BankMortgageSyncError,
-    sync_bank_mortgage_offers,
-)
 from .models import (
     Bank,
     BankProgram,
@@ -31,6 +28,7 @@ from .models import (
     MortgageProgramAlias,
     MortgageProgramRegionalCreditLimit,
 )
+from .tasks import BANK_MORTGAGE_SYNC_JOB, get_bank_mortgage_sync_label
 
 
 class BankCatalogView(BaseCatalogView):
@@ -132,43 +130,19 @@ class BankCatalogView(BaseCatalogView):
         return super().post(request, *args, **kwargs)
 
     def handle_bank_mortgage_sync(self, update_bank_registry=True):
-        """Synchronize bank mortgage offer data from the external source."""
-        sync_label = (
-            'данные банков'
-            if update_bank_registry
-            else 'ипотечные программы банков'
+        """Queue bank mortgage offer synchronization as a background job."""
+        job = enqueue_job(
+            BANK_MORTGAGE_SYNC_JOB,
+            payload={'update_bank_registry': update_bank_registry},
+            user=self.request.user,
+        )
+        messages.info(
+            self.request,
+            (
+                f'{get_bank_mortgage_sync_label(update_bank_registry)} '
+                f'поставлено в очередь: задача №{job.pk}.'
+            ),
         )
-        try:
-            result = sync_bank_mortgage_offers(
-                update_bank_registry=update_bank_registry
-            )
-        except BankMortgageSyncError as error:
-            messages.error(
-                self.request,
-                f'Не удалось обновить {sync_label}: {error}',
-            )
-        else:
-            success_label = (
-                'Обновление данных банков'
-                if update_bank_registry
-                else 'Обновление ипотечных программ банков'
-            )
-            messages.success(
-                self.request,
-                (
-                    f'{success_label} завершено: '
-                    f'создано={result["created"]}, '
-                    f'обновлено={result["updated"]}, '
-                    f'обработано={result["processed"]}, '
-                    'эталонных программ='
-                    f'{result.get("reference_programs_processed", 0)}, '
-                    'алиасов программ='
-                    f'{result.get("reference_program_aliases_created", 0)}.'
-                ),
-            )
-            for warning in result.get('warnings', []):
-                messages.warning(self.request, warning)
-
         return redirect(self.get_model_url('bank'))
 
     def _safe_decimal(self, value):
@@ -1,6 +1,23 @@
+from decimal import Decimal
+
 from django.db import models
 
 
+def get_stored_decimal_value(instance, field_name):
+    """Возвращает значение DecimalField так, как оно хранится в базе данных.
+
+    Значение округляется до ``decimal_places`` поля и приводится к float;
+    пустое значение считается нулем.
+    """
+    value = getattr(instance, field_name)
+    if value in (None, ''):
+        return 0.0
+    decimal_places = instance._meta.get_field(field_name).decimal_places
+    return float(
+        Decimal(str(value)).quantize(Decimal(1).scaleb(-decimal_places))
+    )
+
+
 class BaseModel(models.Model):
     """
     Абстрактная модель.
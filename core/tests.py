@@ -1,5 +1,9 @@
+from decimal import Decimal
+
 from django.urls import reverse
 
+from core.models import get_stored_decimal_value
+from mortgage.models import MortgageCalculation
 from real_estate_investing import settings as project_settings
 
 
@@ -23,3 +27,14 @@ def test_get_env_int_returns_configured_value(monkeypatch):
     monkeypatch.setenv('EMAIL_PORT', '2525')
 
     assert project_settings.get_env_int('EMAIL_PORT', 25) == 2525
+
+
+def test_get_stored_decimal_value_rounds_to_field_precision():
+    """Decimal helper returns values the way the database stores them."""
+    calculation = MortgageCalculation(
+        annual_rate=Decimal('12.346'),
+        grace_period_rate=None,
+    )
+
+    assert get_stored_decimal_value(calculation, 'annual_rate') == 12.35
+    assert get_stored_decimal_value(calculation, 'grace_period_rate') == 0.0
@@ -5,7 +5,8 @@ from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils import timezone
 
-from bank.models import KeyRate, MortgageProgram
+from bank.key_rate_series import get_latest_key_rate
+from bank.models import MortgageProgram
 from core.models import BaseModel
 from location.models import City, District
 from property.models import ApartmentLayout
@@ -338,12 +339,7 @@ class Customer(BaseModel):
         Возвращает:
             Any: Тип результата зависит от контекста использования.
         """
-        rate = (
-            KeyRate.objects.order_by('-meeting_date')
-            .values_list('key_rate', flat=True)
-            .first()
-        )
-        return rate if rate is not None else Decimal('0')
+        return get_latest_key_rate(default=Decimal('0'))
 
     def get_effective_annual_rate(self):
         """Описание метода get_effective_annual_rate.
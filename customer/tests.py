@@ -8,13 +8,20 @@ from zipfile import ZipFile
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
-from bank.models import MortgageProgram, MortgageProgramRegionalCreditLimit
+from bank.models import (
+    KeyRate,
+    MortgageProgram,
+    MortgageProgramRegionalCreditLimit,
+)
 from location.models import City, District, Region
 from mortgage.models import MortgageCalculation
 from mortgage.utils import format_currency
+from mortgage.word import _load_word_template
 from property.models import (
     ApartmentDecoration,
     ApartmentLayout,
@@ -206,6 +213,35 @@ class CustomerDetailViewTests(TestCase):
         self.assertContains(response, 'Карточка клиента Иван Петров')
         self.assertNotContains(response, f'Карточка клиента #{customer.pk}')
 
+    def test_detail_page_checks_key_rates_once(self):
+        """Проверяет, что карточка читает ключевые ставки одним запросом."""
+        KeyRate.objects.create(
+            meeting_date=date(2026, 6, 6),
+            key_rate=Decimal('20.00'),
+        )
+        customer = Customer.objects.create(
+            user=self.user,
+            first_name='Иван',
+            initial_payment_amount=Decimal('1000000'),
+            max_monthly_payment=Decimal('100000'),
+        )
+        url = reverse('customer:detail', kwargs={'pk': customer.pk})
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        self.assertEqual(
+            response.context['calculated']['actual_key_rate'],
+            '20.00',
+        )
+        key_rate_queries = [
+            query['sql']
+            for query in queries.captured_queries
+            if 'FROM "key_rate"' in query['sql']
+        ]
+        self.assertLessEqual(len(key_rate_queries), 1, key_rate_queries)
+
     def test_detail_page_calculates_preferential_max_property_cost(self):
         """Проверяет расчет максимальной стоимости по льготной ставке."""
         customer = Customer.objects.create(
@@ -870,6 +906,42 @@ class CustomerDeleteViewTests(TestCase):
         self.assertGreaterEqual(document_xml.count('w:type="page"'), 2)
         self.assertNotIn('</w:tbl><w:tbl>', document_xml)
 
+    def test_saved_calculations_word_export_keeps_section_order(self):
+        """Проверяет порядок разделов, собранных в пуле потоков."""
+        customer = Customer.objects.create(
+            user=self.user,
+            first_name='Иван',
+            last_name='Петров',
+        )
+        complex_names = [f'ЖК Порядок {number}' for number in range(6)]
+        selected_calculations = []
+        for complex_name in complex_names:
+            customer_calculation = CustomerCalculation.objects.create(
+                customer=customer,
+                calculation=self._create_calculation(
+                    complex_name=complex_name,
+                ),
+            )
+            selected_calculations.append(f'market:{customer_calculation.pk}')
+        _load_word_template.cache_clear()
+
+        for _ in range(2):
+            response = self.client.post(
+                reverse(
+                    'customer:calculations_export_word',
+                    kwargs={'pk': customer.pk},
+                ),
+                {'calculations': selected_calculations},
+            )
+            self.assertEqual(response.status_code, 200)
+
+        document_xml = self._extract_docx_document_xml(response.content)
+        document_text = self._extract_docx_text(response.content)
+        positions = [document_text.index(name) for name in complex_names]
+        self.assertEqual(positions, sorted(positions))
+        self.assertEqual(document_xml.count('w:type="page"'), 5)
+        self.assertEqual(_load_word_template.cache_info().misses, 1)
+
     def test_saved_calculations_word_export_ignores_unavailable_links(self):
         """Проверяет, что чужие связи расчетов не попадают в отчет."""
         customer = Customer.objects.create(
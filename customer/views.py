@@ -15,7 +15,7 @@ from django.views.generic import (
 )
 
 from bank.models import MortgageProgram
-from mortgage.mortgage_calculator import MortgageCalculator
+from mortgage.schedule_store import get_calculation_payment_schedule
 from mortgage.utils import (
     build_calculation_table_headers,
     format_currency,
@@ -301,7 +301,8 @@ def _get_customer_word_market_links(customer, user, link_ids):
     )
     queryset = _filter_customer_word_export_queryset(queryset, user)
     return queryset.select_related(
-        *CUSTOMER_WORD_CALCULATION_SELECT_RELATED
+        *CUSTOMER_WORD_CALCULATION_SELECT_RELATED,
+        'calculation__stored_schedule',
     ).prefetch_related(*CUSTOMER_WORD_CALCULATION_PREFETCH_RELATED)
 
 
@@ -313,7 +314,8 @@ def _get_customer_word_trench_links(customer, user, link_ids):
     )
     queryset = _filter_customer_word_export_queryset(queryset, user)
     return queryset.select_related(
-        *CUSTOMER_WORD_CALCULATION_SELECT_RELATED
+        *CUSTOMER_WORD_CALCULATION_SELECT_RELATED,
+        'calculation__stored_schedule',
     ).prefetch_related(
         *CUSTOMER_WORD_CALCULATION_PREFETCH_RELATED,
         'calculation__trenches',
@@ -364,17 +366,7 @@ def _get_selected_customer_calculation_links(customer, user, selections):
 
 def _build_market_customer_payment_schedule(calculation):
     """Return a saved market calculation payment schedule."""
-    calculator = MortgageCalculator(
-        property_cost=float(calculation.final_property_cost),
-        initial_payment_percent=float(calculation.initial_payment_percent),
-        initial_payment_date=calculation.initial_payment_date,
-        mortgage_term=int(calculation.mortgage_term),
-        annual_rate=float(calculation.annual_rate),
-        has_grace_period=calculation.has_grace_period,
-        grace_period_term=int(calculation.grace_period_term or 0),
-        grace_period_rate=float(calculation.grace_period_rate or 0),
-    )
-    return calculator.get_payment_schedule()
+    return get_calculation_payment_schedule(calculation)
 
 
 def _build_customer_word_calculation(link):
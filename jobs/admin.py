@@ -0,0 +1,48 @@
+from django.contrib import admin
+
+from .models import BackgroundJob, ScheduledJob
+
+
+@admin.register(BackgroundJob)
+class BackgroundJobAdmin(admin.ModelAdmin):
+    """Администрирование фоновых задач."""
+
+    list_display = (
+        'job_type',
+        'status',
+        'progress_current',
+        'progress_total',
+        'schedule_name',
+        'created_by',
+        'created_at',
+        'duration_seconds',
+    )
+    list_filter = ('status', 'job_type', 'schedule_name', 'created_at')
+    search_fields = ('job_type', 'error')
+    ordering = ('-created_at',)
+    readonly_fields = (
+        'started_at',
+        'finished_at',
+        'duration_seconds',
+        'worker_name',
+        'created_at',
+        'updated_at',
+    )
+
+
+@admin.register(ScheduledJob)
+class ScheduledJobAdmin(admin.ModelAdmin):
+    """Администрирование периодических задач."""
+
+    list_display = (
+        'name',
+        'job_type',
+        'cron',
+        'next_run_at',
+        'last_run_at',
+        'is_active',
+    )
+    list_filter = ('is_active',)
+    search_fields = ('name', 'job_type')
+    ordering = ('name',)
+    readonly_fields = ('last_run_at', 'last_job', 'created_at', 'updated_at')
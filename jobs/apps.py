@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+
+
+class JobsConfig(AppConfig):
+    """Background job queue configuration."""
+
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'jobs'
+    verbose_name = 'Фоновые задачи'
+
+    def ready(self):
+        """Register job handlers declared in application task modules."""
+        from django.utils.module_loading import autodiscover_modules
+
+        autodiscover_modules('tasks')
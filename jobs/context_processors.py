@@ -0,0 +1,24 @@
+"""Template context helpers for background jobs."""
+
+from users.roles import can_sync_external_data
+
+from .models import BackgroundJob
+from .queue import ACTIVE_JOB_STATUSES
+
+
+def active_background_jobs(request):
+    """Expose the current user's unfinished jobs to templates.
+
+    Запрос выполняется только для пользователей, которые могут
+    запускать синхронизацию внешних данных.
+    """
+    if not can_sync_external_data(request.user):
+        return {'active_background_jobs': ()}
+
+    return {
+        'active_background_jobs': BackgroundJob.objects.filter(
+            created_by=request.user,
+            status__in=ACTIVE_JOB_STATUSES,
+            is_active=True,
+        ).order_by('created_at', 'pk'),
+    }
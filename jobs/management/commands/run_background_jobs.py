@@ -0,0 +1,78 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs.queue import get_default_worker_name, run_pending_jobs
+from jobs.scheduler import JobScheduler
+
+DEFAULT_POLL_INTERVAL_SECONDS = 5
+
+
+class Command(BaseCommand):
+    """Run queued background jobs and the periodic job scheduler."""
+
+    help = (
+        'Выполняет фоновые задачи из очереди и ставит в очередь '
+        'периодические задачи.'
+    )
+
+    def add_arguments(self, parser):
+        """Register worker options."""
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help=(
+                'Выполнить задачи из очереди без планировщика '
+                'и завершить работу.'
+            ),
+        )
+        parser.add_argument(
+            '--no-scheduler',
+            action='store_true',
+            help='Не участвовать в выборе лидера планировщика.',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=DEFAULT_POLL_INTERVAL_SECONDS,
+            help='Пауза между проверками пустой очереди, секунд.',
+        )
+        parser.add_argument(
+            '--worker-name',
+            default='',
+            help='Имя обработчика в задачах и аренде планировщика.',
+        )
+
+    def handle(self, *args, **options):
+        """Poll the queue and run jobs."""
+        worker_name = options['worker_name'] or get_default_worker_name()
+        if options['once']:
+            processed = run_pending_jobs(worker_name=worker_name)
+            self.stdout.write(
+                self.style.SUCCESS(f'Выполнено фоновых задач: {processed}.')
+            )
+            return
+
+        scheduler = None
+        heartbeat = None
+        if not options['no_scheduler']:
+            scheduler = JobScheduler(worker_name)
+            heartbeat = scheduler.renew_lease
+        self.stdout.write(f'Обработчик фоновых задач {worker_name} запущен.')
+        try:
+            while True:
+                if scheduler is not None:
+                    scheduler.tick()
+                # Между задачами аренду лидера продлевает tick, во время
+                # задачи - heartbeat.
+                if not run_pending_jobs(
+                    worker_name=worker_name,
+                    limit=1,
+                    heartbeat=heartbeat,
+                ):
+                    time.sleep(options['poll_interval'])
+        except KeyboardInterrupt:
+            self.stdout.write('Обработчик фоновых задач остановлен.')
+        finally:
+            if scheduler is not None:
+                scheduler.stop()
@@ -0,0 +1,47 @@
+# Generated by Django 6.0.4 on 2026-10-18 10:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BackgroundJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_active', models.BooleanField(db_index=True, default=True, help_text='Снимите галочку, чтобы скрыть запись.', verbose_name='Активно')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Дата создания')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Дата изменения')),
+                ('job_type', models.CharField(db_index=True, max_length=100, verbose_name='Тип задачи')),
+                ('status', models.CharField(choices=[('queued', 'В очереди'), ('running', 'Выполняется'), ('succeeded', 'Выполнена'), ('failed', 'Ошибка')], db_index=True, default='queued', max_length=20, verbose_name='Статус')),
+                ('payload', models.JSONField(blank=True, default=dict, verbose_name='Параметры')),
+                ('source_file', models.FileField(blank=True, upload_to='background_jobs/', verbose_name='Файл источника')),
+                ('progress_current', models.PositiveIntegerField(default=0, verbose_name='Выполнено шагов')),
+                ('progress_total', models.PositiveIntegerField(default=0, verbose_name='Всего шагов')),
+                ('progress_message', models.CharField(blank=True, default='', max_length=255, verbose_name='Текущий шаг')),
+                ('result', models.JSONField(blank=True, default=dict, verbose_name='Результат')),
+                ('error', models.TextField(blank=True, default='', verbose_name='Ошибка')),
+                ('worker_name', models.CharField(blank=True, default='', max_length=255, verbose_name='Обработчик')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Дата запуска')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Дата завершения')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='background_jobs', to=settings.AUTH_USER_MODEL, verbose_name='Автор')),
+            ],
+            options={
+                'verbose_name': 'Фоновая задача',
+                'verbose_name_plural': 'Фоновые задачи',
+                'db_table': 'background_job',
+                'ordering': ['-created_at', '-pk'],
+                'abstract': False,
+                'indexes': [models.Index(fields=['status', 'created_at'], name='background_job_queue_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 6.0.4 on 2026-10-18 10:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SchedulerLease',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='Название')),
+                ('owner', models.CharField(max_length=255, verbose_name='Владелец')),
+                ('expires_at', models.DateTimeField(verbose_name='Действует до')),
+            ],
+            options={
+                'verbose_name': 'Аренда планировщика',
+                'verbose_name_plural': 'Аренды планировщика',
+                'db_table': 'scheduler_lease',
+            },
+        ),
+        migrations.AddField(
+            model_name='backgroundjob',
+            name='duration_seconds',
+            field=models.FloatField(blank=True, null=True, verbose_name='Длительность, с'),
+        ),
+        migrations.AddField(
+            model_name='backgroundjob',
+            name='schedule_name',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=100, verbose_name='Расписание'),
+        ),
+        migrations.CreateModel(
+            name='ScheduledJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_active', models.BooleanField(db_index=True, default=True, help_text='Снимите галочку, чтобы скрыть запись.', verbose_name='Активно')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Дата создания')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Дата изменения')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='Название')),
+                ('job_type', models.CharField(max_length=100, verbose_name='Тип задачи')),
+                ('cron', models.CharField(max_length=100, verbose_name='Расписание cron')),
+                ('next_run_at', models.DateTimeField(verbose_name='Следующий запуск')),
+                ('last_run_at', models.DateTimeField(blank=True, null=True, verbose_name='Последний запуск')),
+                ('last_job', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='jobs.backgroundjob', verbose_name='Последняя задача')),
+            ],
+            options={
+                'verbose_name': 'Периодическая задача',
+                'verbose_name_plural': 'Периодические задачи',
+                'db_table': 'scheduled_job',
+                'ordering': ['name'],
+                'abstract': False,
+            },
+        ),
+    ]
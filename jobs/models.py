@@ -0,0 +1,208 @@
+from django.conf import settings
+from django.db import models
+
+from core.models import BaseModel
+
+
+class BackgroundJob(BaseModel):
+    """Задача, которую фоновый обработчик выполняет вне HTTP-запроса."""
+
+    class Status(models.TextChoices):
+        """Состояния фоновой задачи."""
+
+        QUEUED = 'queued', 'В очереди'
+        RUNNING = 'running', 'Выполняется'
+        SUCCEEDED = 'succeeded', 'Выполнена'
+        FAILED = 'failed', 'Ошибка'
+
+    job_type = models.CharField(
+        max_length=100,
+        db_index=True,
+        verbose_name='Тип задачи',
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.QUEUED,
+        db_index=True,
+        verbose_name='Статус',
+    )
+    payload = models.JSONField(
+        blank=True,
+        default=dict,
+        verbose_name='Параметры',
+    )
+    source_file = models.FileField(
+        upload_to='background_jobs/',
+        blank=True,
+        verbose_name='Файл источника',
+    )
+    progress_current = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Выполнено шагов',
+    )
+    progress_total = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Всего шагов',
+    )
+    progress_message = models.CharField(
+        max_length=255,
+        blank=True,
+        default='',
+        verbose_name='Текущий шаг',
+    )
+    result = models.JSONField(
+        blank=True,
+        default=dict,
+        verbose_name='Результат',
+    )
+    error = models.TextField(
+        blank=True,
+        default='',
+        verbose_name='Ошибка',
+    )
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='background_jobs',
+        verbose_name='Автор',
+    )
+    schedule_name = models.CharField(
+        max_length=100,
+        blank=True,
+        default='',
+        db_index=True,
+        verbose_name='Расписание',
+    )
+    worker_name = models.CharField(
+        max_length=255,
+        blank=True,
+        default='',
+        verbose_name='Обработчик',
+    )
+    started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Дата запуска',
+    )
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Дата завершения',
+    )
+    duration_seconds = models.FloatField(
+        null=True,
+        blank=True,
+        verbose_name='Длительность, с',
+    )
+
+    class Meta(BaseModel.Meta):
+        """Метаданные таблицы фоновых задач."""
+
+        db_table = 'background_job'
+        verbose_name = 'Фоновая задача'
+        verbose_name_plural = 'Фоновые задачи'
+        ordering = ['-created_at', '-pk']
+        indexes = [
+            models.Index(
+                fields=['status', 'created_at'],
+                name='background_job_queue_idx',
+            ),
+        ]
+
+    def __str__(self):
+        """Return job type and status for admin lists."""
+        return f'{self.job_type} #{self.pk} ({self.get_status_display()})'
+
+    @property
+    def is_finished(self):
+        """Return whether the job reached a final status."""
+        return self.status in (self.Status.SUCCEEDED, self.Status.FAILED)
+
+    def report_progress(self, current, total=None, message=None):
+        """Save job progress without touching other fields.
+
+        Обработчик задачи вызывает метод между шагами; состояние сразу
+        видно в эндпоинте опроса.
+        """
+        self.progress_current = current
+        update_fields = ['progress_current', 'updated_at']
+        if total is not None:
+            self.progress_total = total
+            update_fields.append('progress_total')
+        if message is not None:
+            self.progress_message = message[:255]
+            update_fields.append('progress_message')
+        self.save(update_fields=update_fields)
+
+
+class ScheduledJob(BaseModel):
+    """Состояние периодической задачи планировщика."""
+
+    name = models.CharField(
+        max_length=100,
+        unique=True,
+        verbose_name='Название',
+    )
+    job_type = models.CharField(
+        max_length=100,
+        verbose_name='Тип задачи',
+    )
+    cron = models.CharField(
+        max_length=100,
+        verbose_name='Расписание cron',
+    )
+    next_run_at = models.DateTimeField(verbose_name='Следующий запуск')
+    last_run_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Последний запуск',
+    )
+    last_job = models.ForeignKey(
+        BackgroundJob,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name='Последняя задача',
+    )
+
+    class Meta(BaseModel.Meta):
+        """Метаданные таблицы периодических задач."""
+
+        db_table = 'scheduled_job'
+        verbose_name = 'Периодическая задача'
+        verbose_name_plural = 'Периодические задачи'
+        ordering = ['name']
+
+    def __str__(self):
+        """Return schedule name and cron expression."""
+        return f'{self.name} ({self.cron})'
+
+
+class SchedulerLease(models.Model):
+    """Аренда лидера планировщика."""
+
+    name = models.CharField(
+        max_length=100,
+        unique=True,
+        verbose_name='Название',
+    )
+    owner = models.CharField(
+        max_length=255,
+        verbose_name='Владелец',
+    )
+    expires_at = models.DateTimeField(verbose_name='Действует до')
+
+    class Meta:
+        """Метаданные таблицы аренды планировщика."""
+
+        db_table = 'scheduler_lease'
+        verbose_name = 'Аренда планировщика'
+        verbose_name_plural = 'Аренды планировщика'
+
+    def __str__(self):
+        """Return lease owner."""
+        return f'{self.name}: {self.owner}'
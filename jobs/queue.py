@@ -0,0 +1,245 @@
+"""Database-backed queue of background jobs."""
+
+import logging
+import os
+import socket
+import threading
+from datetime import timedelta
+
+from django.db import connections
+from django.utils import timezone
+
+from .models import BackgroundJob
+from .registry import BackgroundJobError, get_job_handler
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_JOB_STATUSES = (
+    BackgroundJob.Status.QUEUED,
+    BackgroundJob.Status.RUNNING,
+)
+# Выполняемая задача отмечается не реже раза в JOB_HEARTBEAT_SECONDS;
+# задача без отметки дольше STALE_JOB_SECONDS считается брошенной.
+JOB_HEARTBEAT_SECONDS = 30
+STALE_JOB_SECONDS = 10 * 60
+
+
+def get_default_worker_name():
+    """Return a worker name unique for the host and process."""
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def enqueue_job(
+    job_type,
+    payload=None,
+    user=None,
+    source_file=None,
+    schedule_name='',
+):
+    """Create a queued job and return it.
+
+    Тип задачи проверяется сразу, чтобы ошибка в имени обработчика
+    не ждала запуска фонового обработчика.
+    """
+    get_job_handler(job_type)
+    job = BackgroundJob(
+        job_type=job_type,
+        payload=payload or {},
+        created_by=user if getattr(user, 'is_authenticated', False) else None,
+        schedule_name=schedule_name,
+    )
+    if source_file is not None:
+        job.source_file.save(source_file.name, source_file, save=False)
+    job.save()
+    return job
+
+
+def claim_next_job(worker_name=None):
+    """Mark the oldest queued job as running and return it.
+
+    Задача захватывается условным UPDATE по статусу, поэтому несколько
+    обработчиков не выполнят одну задачу дважды. Возвращает None, если
+    очередь пуста.
+    """
+    worker_name = worker_name or get_default_worker_name()
+    queued_job_ids = BackgroundJob.objects.filter(
+        status=BackgroundJob.Status.QUEUED,
+        is_active=True,
+    ).order_by('created_at', 'pk').values_list('pk', flat=True)
+
+    for job_id in queued_job_ids[:10]:
+        now = timezone.now()
+        claimed = BackgroundJob.objects.filter(
+            pk=job_id,
+            status=BackgroundJob.Status.QUEUED,
+        ).update(
+            status=BackgroundJob.Status.RUNNING,
+            worker_name=worker_name[:255],
+            started_at=now,
+            updated_at=now,
+        )
+        if claimed:
+            return BackgroundJob.objects.get(pk=job_id)
+    return None
+
+
+def fail_stale_jobs(now=None):
+    """Fail running jobs abandoned by a stopped worker and return them.
+
+    Обработчик, убитый во время задачи, оставляет ее в статусе
+    RUNNING, и расписание этой задачи больше не запускается. Задача,
+    которую давно не отмечал heartbeat, завершается ошибкой условным
+    UPDATE: задача, отмеченная после выборки, не затрагивается.
+    """
+    now = now or timezone.now()
+    stale_before = now - timedelta(seconds=STALE_JOB_SECONDS)
+    stale_jobs = list(
+        BackgroundJob.objects.filter(
+            status=BackgroundJob.Status.RUNNING,
+            updated_at__lt=stale_before,
+        )
+    )
+    failed_jobs = []
+    for job in stale_jobs:
+        failed = BackgroundJob.objects.filter(
+            pk=job.pk,
+            status=BackgroundJob.Status.RUNNING,
+            updated_at__lt=stale_before,
+        ).update(
+            status=BackgroundJob.Status.FAILED,
+            error='Обработчик задачи остановился во время выполнения.',
+            finished_at=now,
+            updated_at=now,
+        )
+        if not failed:
+            continue
+        logger.warning(
+            'Background job %s abandoned by worker %s failed.',
+            job.pk,
+            job.worker_name,
+        )
+        if job.source_file:
+            job.source_file.delete(save=False)
+            BackgroundJob.objects.filter(pk=job.pk).update(source_file='')
+        failed_jobs.append(job)
+    return failed_jobs
+
+
+class JobHeartbeat:
+    """Mark a running job as alive from a side thread.
+
+    Пока задача выполняется, поток раз в ``interval`` секунд обновляет
+    ``updated_at`` задачи и вызывает ``callback``, например продление
+    аренды планировщика.
+    """
+
+    def __init__(self, job, callback=None, interval=JOB_HEARTBEAT_SECONDS):
+        """Store the job, the optional callback and the beat interval."""
+        self.job = job
+        self.callback = callback
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        """Start the heartbeat thread."""
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f'job-heartbeat-{self.job.pk}',
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop the heartbeat thread and wait for it."""
+        self._stopped.set()
+        self._thread.join()
+
+    def beat(self):
+        """Mark the job as alive and run the callback."""
+        BackgroundJob.objects.filter(
+            pk=self.job.pk,
+            status=BackgroundJob.Status.RUNNING,
+        ).update(updated_at=timezone.now())
+        if self.callback is not None:
+            self.callback()
+
+    def _run(self):
+        """Beat until the job finishes."""
+        try:
+            while not self._stopped.wait(self.interval):
+                try:
+                    self.beat()
+                except Exception:
+                    logger.exception(
+                        'Heartbeat of background job %s failed.',
+                        self.job.pk,
+                    )
+        finally:
+            # У потока свои соединения с базой: их нужно закрыть.
+            connections.close_all()
+
+
+def run_job(job, heartbeat=None):
+    """Run a claimed job and store its result or error.
+
+    ``heartbeat`` вызывается из потока ``JobHeartbeat``, пока задача
+    выполняется.
+    """
+    result = {}
+    error = ''
+    try:
+        handler = get_job_handler(job.job_type)
+        with JobHeartbeat(job, callback=heartbeat):
+            result = handler.function(job) or {}
+    except BackgroundJobError as job_error:
+        error = str(job_error)
+    except Exception as job_error:
+        logger.exception('Background job %s failed.', job.pk)
+        error = f'Внутренняя ошибка задачи: {job_error}'
+
+    update_fields = [
+        'status',
+        'result',
+        'error',
+        'finished_at',
+        'duration_seconds',
+        'updated_at',
+    ]
+    if job.source_file:
+        # Загруженный файл нужен только на время выполнения задачи.
+        job.source_file.delete(save=False)
+        update_fields.append('source_file')
+    if error:
+        job.status = BackgroundJob.Status.FAILED
+    else:
+        job.status = BackgroundJob.Status.SUCCEEDED
+        job.progress_current = max(job.progress_current, job.progress_total)
+        update_fields.append('progress_current')
+    job.result = result
+    job.error = error
+    job.finished_at = timezone.now()
+    if job.started_at:
+        job.duration_seconds = (
+            job.finished_at - job.started_at
+        ).total_seconds()
+    job.save(update_fields=update_fields)
+    return job
+
+
+def run_pending_jobs(worker_name=None, limit=None, heartbeat=None):
+    """Run queued jobs until the queue is empty and return their count.
+
+    Перед запуском брошенные задачи завершаются ошибкой, чтобы их
+    расписания снова могли ставить задачи в очередь.
+    """
+    fail_stale_jobs()
+    processed = 0
+    while limit is None or processed < limit:
+        job = claim_next_job(worker_name=worker_name)
+        if job is None:
+            break
+        run_job(job, heartbeat=heartbeat)
+        processed += 1
+    return processed
@@ -0,0 +1,53 @@
+"""Registry of background job handlers."""
+
+from dataclasses import dataclass
+
+
+class BackgroundJobError(Exception):
+    """Raised by a job handler to fail a job with a user-facing message."""
+
+
+@dataclass(frozen=True)
+class JobHandler:
+    """Registered handler of one background job type."""
+
+    job_type: str
+    label: str
+    function: object
+
+
+_job_handlers = {}
+
+
+def register_job(job_type, label):
+    """Register a function as the handler of a background job type.
+
+    Обработчик получает объект ``BackgroundJob`` и возвращает словарь
+    результата, который сохраняется в задаче.
+    """
+
+    def decorator(function):
+        _job_handlers[job_type] = JobHandler(
+            job_type=job_type,
+            label=label,
+            function=function,
+        )
+        return function
+
+    return decorator
+
+
+def get_job_handler(job_type):
+    """Return a registered job handler or raise BackgroundJobError."""
+    try:
+        return _job_handlers[job_type]
+    except KeyError as error:
+        raise BackgroundJobError(
+            f'Неизвестный тип фоновой задачи: {job_type}.'
+        ) from error
+
+
+def get_job_label(job_type):
+    """Return a human-readable job label."""
+    handler = _job_handlers.get(job_type)
+    return handler.label if handler else job_type
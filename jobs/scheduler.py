@@ -0,0 +1,328 @@
+"""Single-leader scheduler of periodic background jobs.
+
+Планировщик работает в процессах ``run_background_jobs``. Лидер
+выбирается арендой строки ``SchedulerLease``: только процесс, который
+держит аренду, ставит задачи по расписанию в очередь, остальные
+процессы планировщика простаивают. Выполняет задачи обычная очередь,
+поэтому история запусков и их длительность хранятся в
+``BackgroundJob``.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import BackgroundJob, ScheduledJob, SchedulerLease
+from .queue import ACTIVE_JOB_STATUSES, enqueue_job
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_LEASE_NAME = 'default'
+SCHEDULER_LEASE_SECONDS = 60
+CRON_FIELD_RANGES = (
+    ('minute', 0, 59),
+    ('hour', 0, 23),
+    ('day', 1, 31),
+    ('month', 1, 12),
+    ('weekday', 0, 6),
+)
+CRON_SEARCH_DAYS = 366 * 5
+
+
+class CronScheduleError(ValueError):
+    """Raised for an invalid cron expression."""
+
+
+def _parse_cron_field(value, minimum, maximum):
+    """Return the set of values matched by one cron field."""
+    values = set()
+    for part in value.split(','):
+        range_part, _, step_part = part.partition('/')
+        step = int(step_part) if step_part else 1
+        if range_part == '*':
+            start, end = minimum, maximum
+        elif '-' in range_part:
+            start, end = (int(item) for item in range_part.split('-', 1))
+        else:
+            start = end = int(range_part)
+            if step_part:
+                end = maximum
+        if step <= 0 or start < minimum or end > maximum or start > end:
+            raise CronScheduleError(f'Недопустимое поле cron: {value}.')
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+@dataclass(frozen=True)
+class CronSchedule:
+    """Расписание в формате cron: минута, час, день, месяц, день недели.
+
+    День недели задается числом от 0 (воскресенье) до 6; 7 также
+    означает воскресенье. Если ограничены и день месяца, и день недели,
+    достаточно совпадения любого из них, как в cron.
+    """
+
+    expression: str
+    minutes: frozenset
+    hours: frozenset
+    days: frozenset
+    months: frozenset
+    weekdays: frozenset
+    restricts_day: bool
+    restricts_weekday: bool
+
+    @classmethod
+    def parse(cls, expression):
+        """Parse a five-field cron expression."""
+        fields = expression.split()
+        if len(fields) != len(CRON_FIELD_RANGES):
+            raise CronScheduleError(
+                f'Выражение cron должно содержать пять полей: {expression}.'
+            )
+
+        fields[4] = ','.join(
+            '0' if item == '7' else item for item in fields[4].split(',')
+        )
+        try:
+            parsed_fields = [
+                _parse_cron_field(value, minimum, maximum)
+                for value, (_, minimum, maximum) in zip(
+                    fields,
+                    CRON_FIELD_RANGES,
+                )
+            ]
+        except ValueError as error:
+            raise CronScheduleError(
+                f'Недопустимое выражение cron: {expression}.'
+            ) from error
+
+        return cls(
+            expression,
+            *parsed_fields,
+            restricts_day=fields[2] != '*',
+            restricts_weekday=fields[4] != '*',
+        )
+
+    def matches_date(self, value):
+        """Return whether the schedule runs on a calendar date."""
+        if value.month not in self.months:
+            return False
+        day_matches = value.day in self.days
+        weekday_matches = (value.weekday() + 1) % 7 in self.weekdays
+        if self.restricts_day and self.restricts_weekday:
+            return day_matches or weekday_matches
+        return day_matches and weekday_matches
+
+    def next_after(self, moment):
+        """Return the first scheduled moment strictly after ``moment``."""
+        moment = moment.replace(second=0, microsecond=0)
+        current_date = moment.date()
+        for _ in range(CRON_SEARCH_DAYS):
+            if self.matches_date(current_date):
+                for hour in sorted(self.hours):
+                    for minute in sorted(self.minutes):
+                        candidate = datetime.combine(
+                            current_date,
+                            time(hour, minute),
+                            tzinfo=moment.tzinfo,
+                        )
+                        if candidate > moment:
+                            return candidate
+            current_date += timedelta(days=1)
+        raise CronScheduleError(
+            f'Расписание {self.expression} не срабатывает.'
+        )
+
+
+@dataclass(frozen=True)
+class ScheduleEntry:
+    """Periodic job registered in the scheduler."""
+
+    name: str
+    job_type: str
+    schedule: CronSchedule
+    payload: dict
+    run_on_start: object = None
+
+
+_schedule_entries = {}
+
+
+def register_schedule(
+    name,
+    job_type,
+    cron,
+    payload=None,
+    run_on_start=None,
+):
+    """Register a job type to be queued on a cron schedule.
+
+    ``run_on_start`` - необязательная функция без аргументов: если она
+    возвращает истину, когда процесс становится лидером, задача ставится
+    в очередь сразу, не дожидаясь расписания.
+    """
+    _schedule_entries[name] = ScheduleEntry(
+        name=name,
+        job_type=job_type,
+        schedule=CronSchedule.parse(cron),
+        payload=payload or {},
+        run_on_start=run_on_start,
+    )
+
+
+def get_schedule_entries():
+    """Return registered schedules ordered by name."""
+    return [_schedule_entries[name] for name in sorted(_schedule_entries)]
+
+
+def get_scheduler_timezone():
+    """Return the timezone used to evaluate cron schedules."""
+    return ZoneInfo(getattr(settings, 'TIME_ZONE', 'Europe/Moscow'))
+
+
+def acquire_scheduler_lease(owner, now=None):
+    """Take or renew the scheduler lease and return whether it is held.
+
+    Аренда продлевается условным UPDATE: текущий владелец продлевает
+    ее, а другой процесс может забрать ее только после истечения.
+    """
+    now = now or timezone.now()
+    expires_at = now + timedelta(seconds=SCHEDULER_LEASE_SECONDS)
+    renewed = SchedulerLease.objects.filter(
+        Q(owner=owner) | Q(expires_at__lte=now),
+        name=SCHEDULER_LEASE_NAME,
+    ).update(owner=owner, expires_at=expires_at)
+    if renewed:
+        return True
+
+    try:
+        with transaction.atomic():
+            SchedulerLease.objects.create(
+                name=SCHEDULER_LEASE_NAME,
+                owner=owner,
+                expires_at=expires_at,
+            )
+    except IntegrityError:
+        return False
+    return True
+
+
+def release_scheduler_lease(owner):
+    """Release the scheduler lease if this process holds it."""
+    SchedulerLease.objects.filter(
+        name=SCHEDULER_LEASE_NAME,
+        owner=owner,
+    ).update(expires_at=timezone.now())
+
+
+class JobScheduler:
+    """Queue registered periodic jobs while holding the leader lease."""
+
+    def __init__(self, owner):
+        """Store the process identity used for the leader lease."""
+        self.owner = owner[:255]
+        self.is_leader = False
+
+    def tick(self, now=None):
+        """Run one scheduler step and return the queued jobs."""
+        now = now or timezone.now()
+        is_leader = acquire_scheduler_lease(self.owner, now=now)
+        became_leader = is_leader and not self.is_leader
+        if is_leader != self.is_leader:
+            logger.info(
+                'Scheduler %s %s leadership.',
+                self.owner,
+                'acquired' if is_leader else 'lost',
+            )
+        self.is_leader = is_leader
+        if not is_leader:
+            return []
+
+        queued_jobs = []
+        for entry in get_schedule_entries():
+            job = self.run_entry(entry, now, on_start=became_leader)
+            if job is not None:
+                queued_jobs.append(job)
+        return queued_jobs
+
+    def renew_lease(self):
+        """Renew the leader lease while a long job runs.
+
+        Вызывается из heartbeat выполняемой задачи: иначе аренда
+        истекает посреди долгой задачи и лидером становится другой
+        процесс.
+        """
+        if not self.is_leader:
+            return
+        if not acquire_scheduler_lease(self.owner):
+            logger.info('Scheduler %s lost leadership.', self.owner)
+            self.is_leader = False
+
+    def stop(self):
+        """Release leadership so another process can take over."""
+        if self.is_leader:
+            release_scheduler_lease(self.owner)
+            self.is_leader = False
+
+    def run_entry(self, entry, now, on_start=False):
+        """Queue a scheduled job if it is due and not already active."""
+        local_now = timezone.localtime(now, get_scheduler_timezone())
+        scheduled_job, created = ScheduledJob.objects.get_or_create(
+            name=entry.name,
+            defaults={
+                'job_type': entry.job_type,
+                'cron': entry.schedule.expression,
+                'next_run_at': entry.schedule.next_after(local_now),
+            },
+        )
+        if scheduled_job.cron != entry.schedule.expression:
+            scheduled_job.cron = entry.schedule.expression
+            scheduled_job.next_run_at = entry.schedule.next_after(local_now)
+            scheduled_job.save(
+                update_fields=['cron', 'next_run_at', 'updated_at']
+            )
+
+        is_due = now >= scheduled_job.next_run_at
+        if (
+            not is_due
+            and (on_start or created)
+            and entry.run_on_start is not None
+        ):
+            is_due = bool(entry.run_on_start())
+        if not is_due or not scheduled_job.is_active:
+            return None
+
+        scheduled_job.next_run_at = entry.schedule.next_after(local_now)
+        if BackgroundJob.objects.filter(
+            schedule_name=entry.name,
+            status__in=ACTIVE_JOB_STATUSES,
+        ).exists():
+            logger.info(
+                'Skipped scheduled job %s: previous run is not finished.',
+                entry.name,
+            )
+            scheduled_job.save(update_fields=['next_run_at', 'updated_at'])
+            return None
+
+        job = enqueue_job(
+            entry.job_type,
+            payload=entry.payload,
+            schedule_name=entry.name,
+        )
+        scheduled_job.last_run_at = now
+        scheduled_job.last_job = job
+        scheduled_job.save(
+            update_fields=[
+                'next_run_at',
+                'last_run_at',
+                'last_job',
+                'updated_at',
+            ]
+        )
+        return job
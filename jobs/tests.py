@@ -0,0 +1,407 @@
+from datetime import datetime, timedelta
+from io import StringIO
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from users.roles import APPLICATION_ADMINISTRATOR_GROUP_NAME
+
+from .models import BackgroundJob, ScheduledJob, SchedulerLease
+from .queue import (
+    STALE_JOB_SECONDS,
+    JobHeartbeat,
+    claim_next_job,
+    enqueue_job,
+    fail_stale_jobs,
+    run_job,
+    run_pending_jobs,
+)
+from .registry import BackgroundJobError, register_job
+from .scheduler import (
+    CronSchedule,
+    CronScheduleError,
+    JobScheduler,
+    ScheduleEntry,
+    acquire_scheduler_lease,
+)
+
+TEST_JOB = 'jobs.test_job'
+FAILING_JOB = 'jobs.failing_job'
+BROKEN_JOB = 'jobs.broken_job'
+MOSCOW_TIMEZONE = ZoneInfo('Europe/Moscow')
+
+
+@register_job(TEST_JOB, 'Тестовая задача')
+def run_test_job(job):
+    """Report progress and echo the job payload."""
+    job.report_progress(1, total=2, message='Первый шаг')
+    return {'message': 'Готово', 'payload': job.payload}
+
+
+@register_job(FAILING_JOB, 'Задача с ошибкой')
+def run_failing_job(job):
+    """Fail with a user-facing error."""
+    raise BackgroundJobError('Источник недоступен')
+
+
+@register_job(BROKEN_JOB, 'Задача с исключением')
+def run_broken_job(job):
+    """Fail with an unexpected exception."""
+    raise RuntimeError('boom')
+
+
+def create_user(email, phone_number, group_name=None):
+    """Create a test user and optionally add an application role group."""
+    user = get_user_model().objects.create_user(
+        email=email,
+        password='password',
+        phone_number=phone_number,
+        first_name='Test',
+        last_name='User',
+    )
+    if group_name:
+        group, _created = Group.objects.get_or_create(name=group_name)
+        user.groups.add(group)
+    return user
+
+
+@pytest.mark.django_db
+def test_enqueue_job_rejects_unknown_job_type():
+    """Unknown job types fail when queued, not in the worker."""
+    with pytest.raises(BackgroundJobError):
+        enqueue_job('jobs.unknown')
+
+    assert not BackgroundJob.objects.exists()
+
+
+@pytest.mark.django_db
+def test_run_pending_jobs_runs_jobs_in_queue_order():
+    """Worker runs queued jobs oldest first and stores results."""
+    first_job = enqueue_job(TEST_JOB, payload={'index': 1})
+    second_job = enqueue_job(TEST_JOB, payload={'index': 2})
+
+    assert run_pending_jobs(worker_name='test-worker') == 2
+
+    first_job.refresh_from_db()
+    second_job.refresh_from_db()
+    assert first_job.status == BackgroundJob.Status.SUCCEEDED
+    assert first_job.result == {'message': 'Готово', 'payload': {'index': 1}}
+    assert first_job.progress_current == 2
+    assert first_job.progress_total == 2
+    assert first_job.progress_message == 'Первый шаг'
+    assert first_job.worker_name == 'test-worker'
+    assert first_job.started_at <= first_job.finished_at
+    assert first_job.duration_seconds >= 0
+    assert first_job.finished_at <= second_job.started_at
+
+
+@pytest.mark.django_db
+def test_claim_next_job_does_not_return_claimed_job_twice():
+    """A running job cannot be claimed by another worker."""
+    job = enqueue_job(TEST_JOB)
+
+    assert claim_next_job(worker_name='first').pk == job.pk
+    assert claim_next_job(worker_name='second') is None
+    job.refresh_from_db()
+    assert job.status == BackgroundJob.Status.RUNNING
+    assert job.worker_name == 'first'
+
+
+@pytest.mark.django_db
+def test_run_job_stores_handler_errors():
+    """Handler errors fail the job instead of stopping the worker."""
+    failing_job = enqueue_job(FAILING_JOB)
+    broken_job = enqueue_job(BROKEN_JOB)
+
+    run_job(claim_next_job())
+    run_job(claim_next_job())
+
+    failing_job.refresh_from_db()
+    broken_job.refresh_from_db()
+    assert failing_job.status == BackgroundJob.Status.FAILED
+    assert failing_job.error == 'Источник недоступен'
+    assert broken_job.status == BackgroundJob.Status.FAILED
+    assert broken_job.error == 'Внутренняя ошибка задачи: boom'
+
+
+@pytest.mark.django_db
+def test_fail_stale_jobs_fails_only_abandoned_running_jobs():
+    """Running jobs without a recent heartbeat are failed."""
+    abandoned_job = enqueue_job(TEST_JOB)
+    alive_job = enqueue_job(TEST_JOB)
+    claim_next_job(worker_name='killed')
+    claim_next_job(worker_name='alive')
+    now = timezone.now()
+    BackgroundJob.objects.filter(pk=abandoned_job.pk).update(
+        updated_at=now - timedelta(seconds=STALE_JOB_SECONDS + 1)
+    )
+
+    failed_jobs = fail_stale_jobs(now=now)
+
+    abandoned_job.refresh_from_db()
+    alive_job.refresh_from_db()
+    assert [job.pk for job in failed_jobs] == [abandoned_job.pk]
+    assert abandoned_job.status == BackgroundJob.Status.FAILED
+    assert abandoned_job.finished_at == now
+    assert alive_job.status == BackgroundJob.Status.RUNNING
+
+
+@pytest.mark.django_db
+def test_job_heartbeat_marks_job_and_renews_scheduler_lease():
+    """A heartbeat keeps the job alive and the leader lease current."""
+    scheduler = JobScheduler('leader')
+    with patch.dict('jobs.scheduler._schedule_entries', {}, clear=True):
+        scheduler.tick()
+    job = enqueue_job(TEST_JOB)
+    claim_next_job()
+    expired_at = timezone.now() - timedelta(seconds=1)
+    BackgroundJob.objects.filter(pk=job.pk).update(updated_at=expired_at)
+    SchedulerLease.objects.update(expires_at=expired_at)
+
+    JobHeartbeat(job, callback=scheduler.renew_lease).beat()
+
+    job.refresh_from_db()
+    assert job.updated_at > expired_at
+    assert scheduler.is_leader
+    assert SchedulerLease.objects.get().expires_at > timezone.now()
+    assert not fail_stale_jobs()
+
+
+@pytest.mark.django_db
+def test_run_background_jobs_command_runs_queue_once():
+    """Worker command drains the queue and exits with --once."""
+    job = enqueue_job(TEST_JOB)
+    output = StringIO()
+
+    call_command('run_background_jobs', '--once', stdout=output)
+
+    job.refresh_from_db()
+    assert job.status == BackgroundJob.Status.SUCCEEDED
+    assert 'Выполнено фоновых задач: 1.' in output.getvalue()
+
+
+@pytest.mark.django_db
+def test_job_status_api_returns_progress_to_job_author(client):
+    """Polling endpoint exposes status and progress to the job author."""
+    user = create_user('job-author@example.com', '+79993000001')
+    job = enqueue_job(TEST_JOB, user=user)
+    job.report_progress(3, total=10, message='Загрузка')
+    client.force_login(user)
+
+    response = client.get(reverse('jobs:job_status', args=[job.pk]))
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload['id'] == job.pk
+    assert payload['label'] == 'Тестовая задача'
+    assert payload['status'] == 'queued'
+    assert payload['is_finished'] is False
+    assert payload['progress'] == {
+        'current': 3,
+        'total': 10,
+        'message': 'Загрузка',
+    }
+
+
+@pytest.mark.django_db
+def test_job_status_api_hides_other_users_jobs(client):
+    """Polling endpoint hides jobs of other users from regular users."""
+    author = create_user('job-owner@example.com', '+79993000002')
+    job = enqueue_job(TEST_JOB, user=author)
+
+    response = client.get(reverse('jobs:job_status', args=[job.pk]))
+    assert response.status_code == 401
+
+    client.force_login(create_user('job-other@example.com', '+79993000003'))
+    response = client.get(reverse('jobs:job_status', args=[job.pk]))
+    assert response.status_code == 404
+    assert response.json() == {'error': 'Job not found.'}
+
+    client.force_login(
+        create_user(
+            'job-admin@example.com',
+            '+79993000004',
+            APPLICATION_ADMINISTRATOR_GROUP_NAME,
+        )
+    )
+    response = client.get(reverse('jobs:job_status', args=[job.pk]))
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_active_jobs_are_rendered_for_polling(client):
+    """Pages show unfinished jobs of sync administrators for polling."""
+    user = create_user(
+        'job-page-admin@example.com',
+        '+79993000005',
+        APPLICATION_ADMINISTRATOR_GROUP_NAME,
+    )
+    job = enqueue_job(TEST_JOB, user=user)
+    client.force_login(user)
+
+    response = client.get(reverse('homepage:index'))
+
+    content = response.content.decode()
+    assert reverse('jobs:job_status', args=[job.pk]) in content
+    assert 'js/background_jobs.js' in content
+
+
+def build_schedule_entries(**entries):
+    """Return a scheduler registry with test schedules only."""
+    return {
+        name: ScheduleEntry(
+            name=name,
+            job_type=TEST_JOB,
+            schedule=CronSchedule.parse(cron),
+            payload={'schedule': name},
+            run_on_start=run_on_start,
+        )
+        for name, (cron, run_on_start) in entries.items()
+    }
+
+
+def test_cron_schedule_returns_next_daily_run():
+    """Daily schedules run later the same day or on the next day."""
+    schedule = CronSchedule.parse('0 15 * * *')
+
+    assert schedule.next_after(
+        datetime(2026, 10, 18, 14, 59, tzinfo=MOSCOW_TIMEZONE)
+    ) == datetime(2026, 10, 18, 15, 0, tzinfo=MOSCOW_TIMEZONE)
+    assert schedule.next_after(
+        datetime(2026, 10, 18, 15, 0, tzinfo=MOSCOW_TIMEZONE)
+    ) == datetime(2026, 10, 19, 15, 0, tzinfo=MOSCOW_TIMEZONE)
+
+
+def test_cron_schedule_supports_weekdays_steps_and_lists():
+    """Cron fields accept weekdays, steps, ranges and lists."""
+    monday_schedule = CronSchedule.parse('0 4 * * 1')
+    step_schedule = CronSchedule.parse('*/15 9-10 * * *')
+    sunday_schedule = CronSchedule.parse('30 6 * * 7')
+
+    assert monday_schedule.next_after(
+        datetime(2026, 10, 18, 12, 0, tzinfo=MOSCOW_TIMEZONE)
+    ) == datetime(2026, 10, 19, 4, 0, tzinfo=MOSCOW_TIMEZONE)
+    assert step_schedule.next_after(
+        datetime(2026, 10, 18, 9, 50, tzinfo=MOSCOW_TIMEZONE)
+    ) == datetime(2026, 10, 18, 10, 0, tzinfo=MOSCOW_TIMEZONE)
+    assert sunday_schedule.next_after(
+        datetime(2026, 10, 18, 7, 0, tzinfo=MOSCOW_TIMEZONE)
+    ) == datetime(2026, 10, 25, 6, 30, tzinfo=MOSCOW_TIMEZONE)
+
+
+@pytest.mark.parametrize(
+    'expression',
+    ['0 15 * *', '60 * * * *', 'a * * * *'],
+)
+def test_cron_schedule_rejects_invalid_expressions(expression):
+    """Invalid cron expressions fail when the schedule is registered."""
+    with pytest.raises(CronScheduleError):
+        CronSchedule.parse(expression)
+
+
+@pytest.mark.django_db
+def test_scheduler_lease_has_single_leader_until_expiry():
+    """Only one process holds the lease until it expires."""
+    now = datetime(2026, 10, 18, 12, 0, tzinfo=MOSCOW_TIMEZONE)
+
+    assert acquire_scheduler_lease('first', now=now)
+    assert not acquire_scheduler_lease('second', now=now)
+    assert acquire_scheduler_lease('first', now=now + timedelta(seconds=30))
+    assert not acquire_scheduler_lease(
+        'second',
+        now=now + timedelta(seconds=60),
+    )
+    assert acquire_scheduler_lease(
+        'second',
+        now=now + timedelta(seconds=91),
+    )
+    assert not acquire_scheduler_lease(
+        'first',
+        now=now + timedelta(seconds=92),
+    )
+
+
+@pytest.mark.django_db
+def test_scheduler_queues_due_jobs_only_on_leader():
+    """The leader queues due jobs once; other schedulers stay idle."""
+    now = datetime(2026, 10, 18, 14, 59, tzinfo=MOSCOW_TIMEZONE)
+    entries = build_schedule_entries(daily=('0 15 * * *', None))
+    leader = JobScheduler('leader')
+    follower = JobScheduler('follower')
+
+    with patch.dict('jobs.scheduler._schedule_entries', entries, clear=True):
+        assert leader.tick(now=now) == []
+        assert follower.tick(now=now) == []
+        due_time = now + timedelta(minutes=1)
+        queued_jobs = leader.tick(now=due_time)
+        assert follower.tick(now=due_time) == []
+        assert leader.tick(now=due_time + timedelta(seconds=5)) == []
+
+    assert leader.is_leader
+    assert not follower.is_leader
+    assert len(queued_jobs) == 1
+    assert queued_jobs[0].schedule_name == 'daily'
+    assert queued_jobs[0].payload == {'schedule': 'daily'}
+    scheduled_job = ScheduledJob.objects.get(name='daily')
+    assert scheduled_job.last_job == queued_jobs[0]
+    assert scheduled_job.next_run_at == datetime(
+        2026, 10, 19, 15, 0, tzinfo=MOSCOW_TIMEZONE
+    )
+
+
+@pytest.mark.django_db
+def test_scheduler_runs_start_check_and_skips_active_runs():
+    """Start checks queue a job at once; active runs are not duplicated."""
+    now = datetime(2026, 10, 18, 10, 0, tzinfo=MOSCOW_TIMEZONE)
+    entries = build_schedule_entries(
+        on_start=('0 15 * * *', lambda: True),
+        every_minute=('* * * * *', None),
+    )
+    scheduler = JobScheduler('leader')
+
+    with patch.dict('jobs.scheduler._schedule_entries', entries, clear=True):
+        first_jobs = scheduler.tick(now=now)
+        second_jobs = scheduler.tick(now=now + timedelta(minutes=2))
+        skipped_jobs = scheduler.tick(now=now + timedelta(minutes=4))
+        run_pending_jobs()
+        third_jobs = scheduler.tick(now=now + timedelta(minutes=6))
+
+    assert [job.schedule_name for job in first_jobs] == ['on_start']
+    assert [job.schedule_name for job in second_jobs] == ['every_minute']
+    assert skipped_jobs == []
+    assert [job.schedule_name for job in third_jobs] == ['every_minute']
+    assert BackgroundJob.objects.filter(
+        schedule_name='every_minute',
+        status=BackgroundJob.Status.SUCCEEDED,
+        duration_seconds__isnull=False,
+    ).count() == 1
+
+
+@pytest.mark.django_db
+def test_scheduler_resumes_after_abandoned_run_is_failed():
+    """A run left by a killed worker stops blocking its schedule."""
+    now = timezone.now()
+    entries = build_schedule_entries(every_minute=('* * * * *', None))
+    scheduler = JobScheduler('leader')
+
+    with patch.dict('jobs.scheduler._schedule_entries', entries, clear=True):
+        scheduler.tick(now=now)
+        first_jobs = scheduler.tick(now=now + timedelta(minutes=2))
+        claim_next_job(worker_name='killed')
+        BackgroundJob.objects.filter(pk=first_jobs[0].pk).update(
+            updated_at=now - timedelta(seconds=STALE_JOB_SECONDS + 1)
+        )
+        skipped_jobs = scheduler.tick(now=now + timedelta(minutes=4))
+        run_pending_jobs()
+        resumed_jobs = scheduler.tick(now=now + timedelta(minutes=6))
+
+    first_jobs[0].refresh_from_db()
+    assert skipped_jobs == []
+    assert first_jobs[0].status == BackgroundJob.Status.FAILED
+    assert [job.schedule_name for job in resumed_jobs] == ['every_minute']
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import job_status_api
+
+app_name = 'jobs'
+
+urlpatterns = [
+    path('<int:pk>/', job_status_api, name='job_status'),
+]
@@ -0,0 +1,51 @@
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+from users.roles import can_sync_external_data
+
+from .models import BackgroundJob
+from .registry import get_job_label
+
+
+def serialize_background_job(job):
+    """Return the public JSON representation of a background job."""
+    return {
+        'id': job.pk,
+        'job_type': job.job_type,
+        'label': get_job_label(job.job_type),
+        'status': job.status,
+        'status_display': job.get_status_display(),
+        'is_finished': job.is_finished,
+        'progress': {
+            'current': job.progress_current,
+            'total': job.progress_total,
+            'message': job.progress_message,
+        },
+        'result': job.result,
+        'error': job.error,
+        'created_at': job.created_at.isoformat(),
+        'started_at': (
+            job.started_at.isoformat() if job.started_at else None
+        ),
+        'finished_at': (
+            job.finished_at.isoformat() if job.finished_at else None
+        ),
+    }
+
+
+@require_GET
+def job_status_api(request, pk):
+    """Return background job status for polling from the UI."""
+    if not request.user.is_authenticated:
+        return JsonResponse({'error': 'Authentication required.'}, status=401)
+
+    job = BackgroundJob.objects.filter(pk=pk, is_active=True).first()
+    if job is None:
+        return JsonResponse({'error': 'Job not found.'}, status=404)
+    if (
+        job.created_by_id != request.user.pk
+        and not can_sync_external_data(request.user)
+    ):
+        return JsonResponse({'error': 'Job not found.'}, status=404)
+
+    return JsonResponse(serialize_background_job(job))
@@ -1,17 +1,11 @@
 from django.apps import AppConfig
 
 
-FORM_DATA_CACHE_KEYS = (
-    'mortgage:property_form_data:v1',
-    'mortgage:program_form_data:v1',
-)
-
-
 def clear_form_data_cache(**kwargs):
-    """Clear cached mortgage form selector payloads."""
-    from django.core.cache import cache
+    """Invalidate cached mortgage form selector payloads in all workers."""
+    from mortgage.form_data_cache import bump_form_data_cache_generation
 
-    cache.delete_many(FORM_DATA_CACHE_KEYS)
+    bump_form_data_cache_generation()
 
 
 class CalculatorConfig(AppConfig):
@@ -22,11 +16,19 @@ class CalculatorConfig(AppConfig):
     verbose_name = 'Ипотека'
 
     def ready(self):
-        """Register cache invalidation hooks for selector payloads."""
+        """Register cache invalidation and schedule store hooks."""
         from django.db.models.signals import post_delete, post_save
 
-        from bank.models import Bank, BankProgram, KeyRate
-        from location.models import City, District
+        from bank.models import (
+            Bank,
+            BankProgram,
+            KeyRate,
+            MortgageProgram,
+            MortgageProgramRegionalCreditLimit,
+        )
+        from location.models import City, District, Region
+        from mortgage.models import MortgageCalculation
+        from mortgage.schedule_store import store_calculation_schedule_on_save
         from property.models import (
             ApartmentDecoration,
             ApartmentLayout,
@@ -45,9 +47,12 @@ class CalculatorConfig(AppConfig):
             Developer,
             District,
             KeyRate,
+            MortgageProgram,
+            MortgageProgramRegionalCreditLimit,
             Property,
             RealEstateComplex,
             RealEstateComplexBuilding,
+            Region,
         ):
             dispatch_uid = f'mortgage.clear_form_data_cache.{model._meta.label}'
             post_save.connect(
@@ -60,3 +65,9 @@ class CalculatorConfig(AppConfig):
                 sender=model,
                 dispatch_uid=f'{dispatch_uid}.delete',
             )
+
+        post_save.connect(
+            store_calculation_schedule_on_save,
+            sender=MortgageCalculation,
+            dispatch_uid='mortgage.store_calculation_schedule_on_save',
+        )
@@ -1,11 +1,40 @@
+import tempfile
 from dataclasses import dataclass
 from decimal import Decimal
+from wsgiref.util import FileWrapper
 
 import openpyxl
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Font, NamedStyle
 from openpyxl.utils import get_column_letter
 
+from .schedule_store import get_calculation_payment_schedule
+
+EXCEL_CONTENT_TYPE = (
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+)
+EXCEL_STREAM_CHUNK_SIZE = 64 * 1024
+MORTGAGE_WORKSHEET_TITLE = 'Ипотечный расчет'
+MAX_BULK_EXCEL_CALCULATIONS = 100
+
+TITLE_STYLE = 'title_style'
+SECTION_STYLE = 'section_style'
+HEADER_STYLE = 'header_style'
+VALUE_STYLE = 'value_style'
+NUMBER_STYLE = 'number_style'
+INTEGER_STYLE = 'integer_style'
+CENTERED_INTEGER_STYLE = 'centered_integer_style'
+
+PAYMENT_SCHEDULE_HEADERS = (
+    '№',
+    'Дата платежа',
+    'Сумма платежа, руб.',
+    'В том числе проценты, руб.',
+    'В том числе основной долг, руб.',
+    'Остаток долга, руб.',
+)
+
 
 @dataclass
 class MortgageExcelData:
@@ -33,18 +62,31 @@ def get_discount_markup_labels(discount_markup_type):
 
 def export_mortgage_excel(excel_data):
     """Формирует HTTP-ответ с Excel-файлом ипотечного расчета."""
-    response = HttpResponse(
-        content_type=(
-            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        )
+    workbook = _build_mortgage_workbook(
+        [(MORTGAGE_WORKSHEET_TITLE, excel_data)]
     )
-    response['Content-Disposition'] = (
-        'attachment; filename="mortgage_calculation.xlsx"'
+    return _stream_workbook(workbook, 'mortgage_calculation.xlsx')
+
+
+def export_saved_mortgage_calculations_excel(calculations):
+    """Формирует одну книгу Excel по нескольким сохраненным расчетам.
+
+    Каждый расчет выводится на отдельный лист. Графики платежей
+    читаются по одному при записи листа, поэтому в памяти одновременно
+    находится только график текущего расчета.
+    """
+    worksheets = (
+        (
+            f'Расчет №{calculation.pk}',
+            build_saved_mortgage_excel_data(
+                calculation,
+                get_calculation_payment_schedule(calculation),
+            ),
+        )
+        for calculation in calculations
     )
-
-    workbook = _build_mortgage_workbook(excel_data)
-    workbook.save(response)
-    return response
+    workbook = _build_mortgage_workbook(worksheets)
+    return _stream_workbook(workbook, 'mortgage_calculations.xlsx')
 
 
 def build_saved_mortgage_excel_data(calculation, payment_schedule):
@@ -98,110 +140,156 @@ def export_saved_mortgage_calculation_excel(calculation, payment_schedule):
     return export_mortgage_excel(excel_data)
 
 
-def _build_mortgage_workbook(excel_data):
-    """Создает книгу Excel с разделами ипотечного расчета."""
-    workbook = openpyxl.Workbook()
-    worksheet = workbook.active
-    worksheet.title = 'Ипотечный расчет'
-
-    number_style = NamedStyle(name='number_style')
-    number_style.number_format = '# ##0.00'
-    workbook.add_named_style(number_style)
-
-    integer_style = NamedStyle(name='integer_style')
-    integer_style.number_format = '# ##0'
-    workbook.add_named_style(integer_style)
-
-    worksheet.merge_cells('A1:B1')
-    worksheet['A1'] = 'Ипотечный калькулятор - результаты расчета'
-    worksheet['A1'].font = Font(bold=True, size=14)
-    worksheet['A1'].alignment = Alignment(horizontal='center')
-
-    worksheet['A3'] = 'Данные объекта:'
-    worksheet['A3'].font = Font(bold=True)
-
-    property_rows = _build_property_rows(excel_data)
-    for row_number, (label, value) in enumerate(property_rows, start=4):
-        worksheet[f'A{row_number}'] = label
-        cell = worksheet[f'B{row_number}']
-        _set_value_with_style(
-            cell,
-            value,
-            label,
-            number_style,
-            integer_style,
-            integer_labels={'Этаж'},
-            number_labels={
-                'Площадь, м2',
-                'Скидка, %',
-                'Скидка, руб.',
-                'Удорожание, %',
-                'Удорожание, руб.',
-                'Базовая стоимость объекта, руб.',
-                'Итоговая стоимость объекта, руб.',
-            },
-        )
-
-    start_row = len(property_rows) + 5
-    worksheet[f'A{start_row}'] = 'Параметры ипотеки:'
-    worksheet[f'A{start_row}'].font = Font(bold=True)
-
-    mortgage_rows = _build_mortgage_rows(excel_data)
-    for row_number, (label, value) in enumerate(
-        mortgage_rows, start=start_row + 1
-    ):
-        worksheet[f'A{row_number}'] = label
-        cell = worksheet[f'B{row_number}']
-        _set_value_with_style(
-            cell,
-            value,
-            label,
-            number_style,
-            integer_style,
-            integer_labels={
-                'Срок ипотеки, годы',
-                'Срок ипотеки, мес.',
-                'Срок льготного периода, годы',
-                'Срок льготного периода, мес.',
-            },
-        )
+def _stream_workbook(workbook, filename):
+    """Возвращает книгу Excel потоковым HTTP-ответом.
 
-    result_start = start_row + len(mortgage_rows) + 2
-    worksheet[f'A{result_start}'] = 'Результаты расчета:'
-    worksheet[f'A{result_start}'].font = Font(bold=True)
-
-    result_rows = _build_result_rows(excel_data)
-    for row_number, (label, value) in enumerate(
-        result_rows, start=result_start + 1
-    ):
-        worksheet[f'A{row_number}'] = label
-        cell = worksheet[f'B{row_number}']
-        _set_value_with_style(
-            cell,
-            value,
-            label,
-            number_style,
-            integer_style,
-            integer_labels={
-                'Число платежей за льготный период',
-                'Число платежей за основной период',
-            },
-        )
+    Книга сохраняется во временный файл, который отдается клиенту
+    частями и закрывается вместе с ответом.
+    """
+    workbook_file = tempfile.TemporaryFile()
+    workbook.save(workbook_file)
+    content_length = workbook_file.tell()
+    workbook_file.seek(0)
 
-    schedule_start = result_start + len(result_rows) + 2
-    worksheet[f'A{schedule_start}'] = 'График платежей:'
-    worksheet[f'A{schedule_start}'].font = Font(bold=True)
-    _write_payment_schedule(
-        worksheet,
-        excel_data.payment_schedule,
-        schedule_start + 1,
-        number_style,
-        integer_style,
+    response = StreamingHttpResponse(
+        FileWrapper(workbook_file, EXCEL_STREAM_CHUNK_SIZE),
+        content_type=EXCEL_CONTENT_TYPE,
     )
-    _apply_column_widths(worksheet)
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response['Content-Length'] = content_length
+    return response
+
+
+def _create_named_styles():
+    """Создает именованные стили, общие для всех листов книги."""
+    center = Alignment(horizontal='center')
+    return [
+        NamedStyle(
+            name=TITLE_STYLE,
+            font=Font(bold=True, size=14),
+            alignment=center,
+        ),
+        NamedStyle(name=SECTION_STYLE, font=Font(bold=True)),
+        NamedStyle(
+            name=HEADER_STYLE,
+            font=Font(bold=True),
+            alignment=center,
+        ),
+        NamedStyle(name=VALUE_STYLE, alignment=center),
+        NamedStyle(
+            name=NUMBER_STYLE,
+            number_format='# ##0.00',
+            alignment=center,
+        ),
+        NamedStyle(name=INTEGER_STYLE, number_format='# ##0'),
+        NamedStyle(
+            name=CENTERED_INTEGER_STYLE,
+            number_format='# ##0',
+            alignment=center,
+        ),
+    ]
+
+
+def _build_mortgage_workbook(worksheets):
+    """Создает книгу Excel в режиме потоковой записи.
+
+    Аргументы:
+        worksheets: Пары ``(название листа, MortgageExcelData)``.
+    """
+    workbook = openpyxl.Workbook(write_only=True)
+    for style in _create_named_styles():
+        workbook.add_named_style(style)
+
+    for title, excel_data in worksheets:
+        _write_mortgage_worksheet(workbook, title, excel_data)
     return workbook
 
 
+def _write_mortgage_worksheet(workbook, title, excel_data):
+    """Записывает лист с разделами ипотечного расчета.
+
+    Строки листа строятся генератором дважды: сначала для подбора
+    ширины столбцов, которую нужно задать до записи, затем для записи.
+    """
+    worksheet = workbook.create_sheet(title=title[:31])
+    _apply_column_widths(worksheet, _iter_mortgage_rows(excel_data))
+    worksheet.merged_cells.add('A1:B1')
+
+    for row in _iter_mortgage_rows(excel_data):
+        worksheet.append(
+            [_build_cell(worksheet, value, style) for value, style in row]
+        )
+
+
+def _build_cell(worksheet, value, style):
+    """Создает ячейку для потоковой записи с именованным стилем."""
+    cell = WriteOnlyCell(worksheet, value=value)
+    if style is not None:
+        cell.style = style
+    return cell
+
+
+def _iter_mortgage_rows(excel_data):
+    """Перебирает строки листа как списки пар ``(значение, стиль)``."""
+    yield [('Ипотечный калькулятор - результаты расчета', TITLE_STYLE)]
+    yield []
+    yield [('Данные объекта:', SECTION_STYLE)]
+    for label, value in _build_property_rows(excel_data):
+        yield [
+            (label, None),
+            _get_styled_value(
+                value,
+                label,
+                integer_labels={'Этаж'},
+                number_labels={
+                    'Площадь, м2',
+                    'Скидка, %',
+                    'Скидка, руб.',
+                    'Удорожание, %',
+                    'Удорожание, руб.',
+                    'Базовая стоимость объекта, руб.',
+                    'Итоговая стоимость объекта, руб.',
+                },
+            ),
+        ]
+
+    yield []
+    yield [('Параметры ипотеки:', SECTION_STYLE)]
+    for label, value in _build_mortgage_rows(excel_data):
+        yield [
+            (label, None),
+            _get_styled_value(
+                value,
+                label,
+                integer_labels={
+                    'Срок ипотеки, годы',
+                    'Срок ипотеки, мес.',
+                    'Срок льготного периода, годы',
+                    'Срок льготного периода, мес.',
+                },
+            ),
+        ]
+
+    yield []
+    yield [('Результаты расчета:', SECTION_STYLE)]
+    for label, value in _build_result_rows(excel_data):
+        yield [
+            (label, None),
+            _get_styled_value(
+                value,
+                label,
+                integer_labels={
+                    'Число платежей за льготный период',
+                    'Число платежей за основной период',
+                },
+            ),
+        ]
+
+    yield []
+    yield [('График платежей:', SECTION_STYLE)]
+    yield from _iter_payment_schedule_rows(excel_data.payment_schedule)
+
+
 def _build_property_rows(excel_data):
     """Возвращает строки раздела с данными объекта."""
     (
@@ -372,98 +460,61 @@ def _build_result_rows(excel_data):
     return result_rows
 
 
-def _write_payment_schedule(
-    worksheet,
-    payment_schedule,
-    header_row,
-    number_style,
-    integer_style,
-):
-    """Записывает график платежей в лист Excel."""
-    headers = [
-        '№',
-        'Дата платежа',
-        'Сумма платежа, руб.',
-        'В том числе проценты, руб.',
-        'В том числе основной долг, руб.',
-        'Остаток долга, руб.',
-    ]
-
-    for column, header in enumerate(headers, start=1):
-        cell = worksheet.cell(row=header_row, column=column, value=header)
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal='center')
+def _iter_payment_schedule_rows(payment_schedule):
+    """Перебирает строки графика платежей для листа Excel."""
+    yield [(header, HEADER_STYLE) for header in PAYMENT_SCHEDULE_HEADERS]
 
-    for row_number, payment in enumerate(
-        payment_schedule, start=header_row + 1
-    ):
-        number_cell = worksheet.cell(
-            row=row_number, column=1, value=payment['payment_number']
-        )
-        number_cell.style = integer_style
-        worksheet.cell(
-            row=row_number,
-            column=2,
-            value=payment['payment_date'].strftime('%d.%m.%Y'),
-        )
-
-        for column, key in enumerate(
-            [
-                'payment_amount',
-                'interest_amount',
-                'principal_amount',
-                'remaining_debt',
-            ],
-            start=3,
+    for payment in payment_schedule:
+        row = [
+            (payment['payment_number'], INTEGER_STYLE),
+            (payment['payment_date'].strftime('%d.%m.%Y'), None),
+        ]
+        for key in (
+            'payment_amount',
+            'interest_amount',
+            'principal_amount',
+            'remaining_debt',
         ):
             value = payment[key]
             if isinstance(value, str):
                 numeric_value = float(value.replace(' ', '').replace(',', '.'))
             else:
                 numeric_value = float(value)
-            cell = worksheet.cell(
-                row=row_number, column=column, value=numeric_value
-            )
-            cell.style = number_style
-            cell.alignment = Alignment(horizontal='center')
+            row.append((numeric_value, NUMBER_STYLE))
+        yield row
 
 
-def _set_value_with_style(
-    cell,
+def _get_styled_value(
     value,
     label,
-    number_style,
-    integer_style,
     integer_labels=None,
     number_labels=None,
 ):
-    """Записывает значение в ячейку и применяет числовой стиль."""
+    """Возвращает значение ячейки и имя стиля для строки раздела."""
     integer_labels = integer_labels or set()
     number_labels = number_labels or set()
     numeric_types = (int, float, Decimal)
 
     if isinstance(value, numeric_types):
         if label in integer_labels:
-            cell.value = int(value)
-            cell.style = integer_style
-        elif not number_labels or label in number_labels:
-            cell.value = float(value)
-            cell.style = number_style
-        else:
-            cell.value = value
-    else:
-        cell.value = value
-    cell.alignment = Alignment(horizontal='center')
-
-
-def _apply_column_widths(worksheet):
-    """Подбирает ширину столбцов по содержимому."""
-    for column in worksheet.columns:
-        max_length = 0
-        column_letter = get_column_letter(column[0].column)
-        for cell in column:
-            if cell.value:
-                max_length = max(max_length, len(str(cell.value)))
+            return int(value), CENTERED_INTEGER_STYLE
+        if not number_labels or label in number_labels:
+            return float(value), NUMBER_STYLE
+    return value, VALUE_STYLE
+
+
+def _apply_column_widths(worksheet, rows):
+    """Подбирает ширину столбцов по содержимому строк листа."""
+    column_lengths = {}
+    for row in rows:
+        for column, (value, _style) in enumerate(row, start=1):
+            if value:
+                column_lengths[column] = max(
+                    column_lengths.get(column, 0), len(str(value))
+                )
+
+    for column, max_length in column_lengths.items():
+        column_letter = get_column_letter(column)
         worksheet.column_dimensions[column_letter].width = min(
             max_length + 2, 50
         )
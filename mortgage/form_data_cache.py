@@ -0,0 +1,72 @@
+# mortgage/form_data_cache.py
+import time
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from .models import FormDataCacheGeneration
+
+FORM_DATA_CACHE_GENERATION_NAME = 'mortgage_form_data'
+# Устаревшие поколения не читаются и вытесняются из кеша сами.
+FORM_DATA_CACHE_TIMEOUT = 24 * 60 * 60
+
+
+def get_form_data_cache_generation():
+    """Возвращает текущее поколение данных формы калькулятора.
+
+    Если счетчика еще нет, он создается со значением от текущего
+    времени, чтобы не совпасть с поколением, уже закешированным ранее.
+    """
+    generation = (
+        FormDataCacheGeneration.objects.filter(
+            name=FORM_DATA_CACHE_GENERATION_NAME
+        )
+        .values_list('generation', flat=True)
+        .first()
+    )
+    if generation is None:
+        generation = _create_generation()
+    return generation
+
+
+def bump_form_data_cache_generation():
+    """Увеличивает поколение данных формы калькулятора.
+
+    Счетчик меняется в той же транзакции, что и справочники: другие
+    процессы увидят новое поколение вместе с новыми данными.
+    """
+    updated_count = FormDataCacheGeneration.objects.filter(
+        name=FORM_DATA_CACHE_GENERATION_NAME
+    ).update(generation=F('generation') + 1)
+    if not updated_count:
+        _create_generation()
+
+
+def get_cached_form_data(cache_key, build_form_data):
+    """Возвращает данные формы текущего поколения из кеша.
+
+    Данные собираются ``build_form_data`` только при смене поколения,
+    поэтому каждый процесс пересобирает их один раз после изменения.
+    """
+    generation = get_form_data_cache_generation()
+    return cache.get_or_set(
+        f'{cache_key}:{generation}',
+        build_form_data,
+        FORM_DATA_CACHE_TIMEOUT,
+    )
+
+
+def _create_generation():
+    """Создает счетчик поколения и возвращает его значение."""
+    try:
+        with transaction.atomic():
+            generation_row = FormDataCacheGeneration.objects.create(
+                name=FORM_DATA_CACHE_GENERATION_NAME,
+                generation=time.time_ns(),
+            )
+    except IntegrityError:
+        return FormDataCacheGeneration.objects.get(
+            name=FORM_DATA_CACHE_GENERATION_NAME
+        ).generation
+    return generation_row.generation
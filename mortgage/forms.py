@@ -1,7 +1,9 @@
 # mortgage/forms.py
 from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
 
 from django import forms
+from django.urls import reverse_lazy
 
 from location.models import City, District
 from property.form_fields import (
@@ -131,6 +133,8 @@ class MortgageForm(forms.Form):
                 'data-cascade-empty-label': 'Выберите корпус',
                 'data-cascade-parent-complex': 'real_estate_complex_id',
                 'data-cascade-required-parents': 'complex',
+                'data-cascade-source-url': reverse_lazy('buildings_api'),
+                'data-cascade-source-param-complex': 'complex_id',
             }
         ),
     )
@@ -225,6 +229,7 @@ class MortgageForm(forms.Form):
                 'real_estate_complex'
             ).order_by('real_estate_complex__name', 'number')
         )
+        self._limit_building_choices_to_selected_complex()
         self.fields['OBJECT_LAYOUT'].queryset = ApartmentLayout.objects.order_by(
             'name'
         )
@@ -232,6 +237,27 @@ class MortgageForm(forms.Form):
             ApartmentDecoration.objects.order_by('name')
         )
 
+    def _limit_building_choices_to_selected_complex(self):
+        """Render only buildings of the selected complex.
+
+        Validation still uses the full queryset; the browser loads
+        buildings of another complex from the catalog API.
+        """
+        building_field = self.fields['OBJECT_BUILDING']
+        choices = [('', building_field.empty_label)]
+        try:
+            complex_id = int(self['OBJECT_COMPLEX'].value() or 0)
+        except (TypeError, ValueError):
+            complex_id = 0
+        if complex_id > 0:
+            choices.extend(
+                (building.pk, building_field.label_from_instance(building))
+                for building in building_field.queryset.filter(
+                    real_estate_complex_id=complex_id
+                )
+            )
+        building_field.widget.choices = choices
+
     def has_manual_property_data(self):
         """Return whether the object block contains a new property."""
         if not hasattr(self, 'cleaned_data'):
@@ -576,3 +602,193 @@ class MortgageForm(forms.Form):
                 )
 
         return cleaned_data
+
+
+MAX_SCENARIO_AXIS_VALUES = 100
+MAX_SCENARIO_GRID_SIZE = 20000
+
+
+class ScenarioRangeField(forms.Field):
+    """Поле со списком значений оси сетки сценариев.
+
+    Принимает одно число, список через запятую или диапазон
+    ``начало:конец:шаг`` с включенной правой границей.
+    """
+
+    default_error_messages = {
+        'invalid': (
+            'Укажите число, список чисел через запятую '
+            'или диапазон начало:конец:шаг.'
+        ),
+        'too_many_values': 'Слишком много значений: не больше %(limit)s.',
+        'min_value': 'Значения должны быть не меньше %(limit)s.',
+        'max_value': 'Значения должны быть не больше %(limit)s.',
+    }
+
+    def __init__(
+        self,
+        *,
+        integer=False,
+        min_value=None,
+        max_value=None,
+        **kwargs,
+    ):
+        """Сохраняет тип и допустимые границы значений оси."""
+        self.integer = integer
+        self.min_value = min_value
+        self.max_value = max_value
+        super().__init__(**kwargs)
+
+    def to_python(self, value):
+        """Преобразует строку параметра в кортеж значений оси."""
+        value = str(value or '').strip().replace(' ', '')
+        if not value:
+            return ()
+
+        try:
+            if ':' in value:
+                values = self._expand_range(value)
+            else:
+                values = [Decimal(item) for item in value.split(',')]
+        except (InvalidOperation, ValueError) as exc:
+            raise forms.ValidationError(
+                self.error_messages['invalid'], code='invalid'
+            ) from exc
+
+        if any(not item.is_finite() for item in values):
+            raise forms.ValidationError(
+                self.error_messages['invalid'], code='invalid'
+            )
+        if self.integer:
+            if any(item != item.to_integral_value() for item in values):
+                raise forms.ValidationError(
+                    self.error_messages['invalid'], code='invalid'
+                )
+            values = [int(item) for item in values]
+        return tuple(sorted(set(values)))
+
+    def _expand_range(self, value):
+        """Разворачивает диапазон ``начало:конец:шаг`` в список значений."""
+        parts = [Decimal(part) for part in value.split(':')]
+        if len(parts) == 2:
+            parts.append(Decimal('1'))
+        if len(parts) != 3:
+            raise ValueError(value)
+
+        start, stop, step = parts
+        if step <= 0 or stop < start:
+            raise ValueError(value)
+        if (stop - start) / step >= MAX_SCENARIO_AXIS_VALUES:
+            raise forms.ValidationError(
+                self.error_messages['too_many_values'],
+                code='too_many_values',
+                params={'limit': MAX_SCENARIO_AXIS_VALUES},
+            )
+
+        values = []
+        current = start
+        while current <= stop:
+            values.append(current)
+            current += step
+        return values
+
+    def validate(self, value):
+        """Проверяет обязательность, количество и границы значений."""
+        super().validate(value)
+        if len(value) > MAX_SCENARIO_AXIS_VALUES:
+            raise forms.ValidationError(
+                self.error_messages['too_many_values'],
+                code='too_many_values',
+                params={'limit': MAX_SCENARIO_AXIS_VALUES},
+            )
+        if self.min_value is not None and any(
+            item < self.min_value for item in value
+        ):
+            raise forms.ValidationError(
+                self.error_messages['min_value'],
+                code='min_value',
+                params={'limit': self.min_value},
+            )
+        if self.max_value is not None and any(
+            item > self.max_value for item in value
+        ):
+            raise forms.ValidationError(
+                self.error_messages['max_value'],
+                code='max_value',
+                params={'limit': self.max_value},
+            )
+
+
+class MortgageScenarioGridForm(forms.Form):
+    """Параметры пакетного расчета сценариев рыночной ипотеки."""
+
+    property_cost = forms.DecimalField(
+        label='Стоимость объекта, руб.',
+        min_value=0,
+        max_digits=15,
+        decimal_places=2,
+    )
+    initial_payment_date = forms.DateField(
+        label='Дата первоначального взноса',
+        input_formats=['%Y-%m-%d', '%d.%m.%Y'],
+    )
+    annual_rate = ScenarioRangeField(
+        label='Годовая ставка, %',
+        min_value=0,
+        max_value=100,
+    )
+    mortgage_term = ScenarioRangeField(
+        label='Срок ипотеки, мес.',
+        integer=True,
+        min_value=1,
+        max_value=600,
+    )
+    initial_payment_percent = ScenarioRangeField(
+        label='Первоначальный взнос, %',
+        min_value=0,
+        max_value=100,
+    )
+    grace_period_term = ScenarioRangeField(
+        label='Срок льготного периода, мес.',
+        integer=True,
+        min_value=0,
+        max_value=600,
+        required=False,
+    )
+    grace_period_rate = ScenarioRangeField(
+        label='Годовая ставка в льготный период, %',
+        min_value=0,
+        max_value=100,
+        required=False,
+    )
+
+    def clean(self):
+        """Подставляет значения по умолчанию и ограничивает размер сетки."""
+        cleaned_data = super().clean()
+        if not cleaned_data.get('grace_period_term'):
+            cleaned_data['grace_period_term'] = (0,)
+        if not cleaned_data.get('grace_period_rate'):
+            cleaned_data['grace_period_rate'] = (Decimal('0'),)
+
+        grid_size = 1
+        for field_name in (
+            'annual_rate',
+            'mortgage_term',
+            'initial_payment_percent',
+            'grace_period_term',
+            'grace_period_rate',
+        ):
+            grid_size *= len(cleaned_data.get(field_name) or ())
+        if grid_size > MAX_SCENARIO_GRID_SIZE:
+            raise forms.ValidationError(
+                (
+                    'Слишком много сценариев: %(size)s, '
+                    'допускается не больше %(limit)s.'
+                ),
+                code='too_many_scenarios',
+                params={
+                    'size': grid_size,
+                    'limit': MAX_SCENARIO_GRID_SIZE,
+                },
+            )
+        return cleaned_data
@@ -0,0 +1,30 @@
+# Generated by Django 6.0.4 on 2026-10-18 07:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mortgage', '0004_mortgagecalculation_user'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MortgageCalculationSchedule',
+            fields=[
+                ('calculation', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stored_schedule', serialize=False, to='mortgage.mortgagecalculation', verbose_name='Расчет ипотеки')),
+                ('input_hash', models.CharField(max_length=64, verbose_name='Хеш исходных данных')),
+                ('format_version', models.PositiveSmallIntegerField(verbose_name='Версия формата')),
+                ('payment_count', models.PositiveIntegerField(verbose_name='Число платежей')),
+                ('columns', models.BinaryField(verbose_name='Колонки графика')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Дата обновления')),
+            ],
+            options={
+                'verbose_name': 'График платежей расчета',
+                'verbose_name_plural': 'Графики платежей расчетов',
+                'db_table': 'mortgage_calculation_schedule',
+            },
+        ),
+    ]
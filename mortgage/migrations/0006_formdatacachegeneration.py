@@ -0,0 +1,27 @@
+# Generated by Django 6.0.4 on 2026-10-18 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mortgage', '0005_mortgagecalculationschedule'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FormDataCacheGeneration',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='Название')),
+                ('generation', models.BigIntegerField(verbose_name='Поколение')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Дата обновления')),
+            ],
+            options={
+                'verbose_name': 'Поколение кеша формы',
+                'verbose_name_plural': 'Поколения кеша формы',
+                'db_table': 'mortgage_form_data_cache_generation',
+            },
+        ),
+    ]
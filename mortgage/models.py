@@ -124,3 +124,81 @@ class MortgageCalculation(models.Model):
         verbose_name = 'Расчет ипотеки'
         verbose_name_plural = 'Расчеты ипотеки'
         ordering = ['-timestamp']
+
+
+class MortgageCalculationSchedule(models.Model):
+    """
+    Сохраненный график платежей рыночного расчета.
+
+    Денежные колонки графика хранятся упакованными массивами float64,
+    даты платежей восстанавливаются по дате первоначального взноса.
+    """
+
+    calculation = models.OneToOneField(
+        MortgageCalculation,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stored_schedule',
+        verbose_name='Расчет ипотеки',
+    )
+    input_hash = models.CharField(
+        max_length=64,
+        verbose_name='Хеш исходных данных',
+    )
+    format_version = models.PositiveSmallIntegerField(
+        verbose_name='Версия формата',
+    )
+    payment_count = models.PositiveIntegerField(
+        verbose_name='Число платежей',
+    )
+    columns = models.BinaryField(verbose_name='Колонки графика')
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Дата обновления',
+    )
+
+    def __str__(self):
+        """Возвращает строковое представление сохраненного графика."""
+        return f'График платежей расчета #{self.calculation_id}'
+
+    class Meta:
+        """
+        Метаданные таблицы.
+        """
+
+        db_table = 'mortgage_calculation_schedule'
+        verbose_name = 'График платежей расчета'
+        verbose_name_plural = 'Графики платежей расчетов'
+
+
+class FormDataCacheGeneration(models.Model):
+    """
+    Поколение кешированных данных формы калькулятора.
+
+    Счетчик хранится в базе, поэтому все процессы видят одно значение
+    и пересобирают данные формы один раз после изменения справочников.
+    """
+
+    name = models.CharField(
+        max_length=100,
+        unique=True,
+        verbose_name='Название',
+    )
+    generation = models.BigIntegerField(verbose_name='Поколение')
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Дата обновления',
+    )
+
+    def __str__(self):
+        """Возвращает название и номер поколения."""
+        return f'{self.name}: {self.generation}'
+
+    class Meta:
+        """
+        Метаданные таблицы.
+        """
+
+        db_table = 'mortgage_form_data_cache_generation'
+        verbose_name = 'Поколение кеша формы'
+        verbose_name_plural = 'Поколения кеша формы'
@@ -1,8 +1,12 @@
 # mortgage/mortgage_calculator.py
-from math import pow
-
 from dateutil.relativedelta import relativedelta
 
+from .payment_schedule import (
+    annuity_payment,
+    build_schedule_columns,
+    remaining_balance,
+)
+
 
 class MortgageCalculator:
     """Описание класса MortgageCalculator.
@@ -56,6 +60,7 @@ class MortgageCalculator:
         self.loan_amount = property_cost - self.initial_payment
         self.current_loan_balance = self.loan_amount
         self.payment_schedule = []
+        self._payment_schedule_columns = None
 
     def calculate(self):
         # Основные параметры
@@ -74,14 +79,13 @@ class MortgageCalculator:
             monthly_grace_rate = self.grace_period_rate / 100 / 12
 
             # Расчет аннуитетного платежа для льготного периода на полный срок
-            annuity_coefficient_grace = (
-                monthly_grace_rate * pow(1 + monthly_grace_rate, total_months)
-            ) / (pow(1 + monthly_grace_rate, total_months) - 1)
-            grace_monthly_payment = (
-                self.loan_amount * annuity_coefficient_grace
+            grace_monthly_payment = annuity_payment(
+                self.loan_amount, monthly_grace_rate, total_months
             )
 
-            # Расчет остатка долга после льготного периода
+            # Расчет остатка долга после льготного периода в закрытой
+            # форме: остаток и переплата могут отличаться от помесячного
+            # пересчета на SCHEDULE_ROUNDING_TOLERANCE
             remaining_debt_after_grace = self._calculate_remaining_debt(
                 self.loan_amount,
                 monthly_grace_rate,
@@ -95,15 +99,9 @@ class MortgageCalculator:
 
             # Расчет аннуитетного платежа для основного периода
             # на оставшийся срок
-            if main_months > 0:
-                annuity_coefficient_main = (
-                    monthly_main_rate * pow(1 + monthly_main_rate, main_months)
-                ) / (pow(1 + monthly_main_rate, main_months) - 1)
-                main_monthly_payment = (
-                    remaining_debt_after_grace * annuity_coefficient_main
-                )
-            else:
-                main_monthly_payment = 0
+            main_monthly_payment = annuity_payment(
+                remaining_debt_after_grace, monthly_main_rate, main_months
+            )
 
             # Даты
             grace_period_end_date = self.initial_payment_date + relativedelta(
@@ -136,10 +134,9 @@ class MortgageCalculator:
         else:
             # Расчет без льготного периода
             monthly_rate = self.annual_rate / 100 / 12
-            annuity_coefficient = (
-                monthly_rate * pow(1 + monthly_rate, total_months)
-            ) / (pow(1 + monthly_rate, total_months) - 1)
-            monthly_payment = self.loan_amount * annuity_coefficient
+            monthly_payment = annuity_payment(
+                self.loan_amount, monthly_rate, total_months
+            )
 
             # Даты
             mortgage_end_date = self.initial_payment_date + relativedelta(
@@ -166,11 +163,9 @@ class MortgageCalculator:
         self, initial_debt, monthly_rate, monthly_payment, months
     ):
         """Рассчитывает остаток долга после указанного количества месяцев"""
-        debt = initial_debt
-        for _ in range(months):
-            interest = debt * monthly_rate
-            principal = monthly_payment - interest
-            debt -= principal
+        debt = remaining_balance(
+            initial_debt, monthly_rate, monthly_payment, months
+        )
         return max(debt, 0)  # Не может быть отрицательным
 
     def get_payment_schedule(self):
@@ -182,110 +177,66 @@ class MortgageCalculator:
             Any: Тип результата зависит от контекста использования.
         """
         if not self.payment_schedule:
-            self._generate_payment_schedule()
+            self.payment_schedule = (
+                self.get_payment_schedule_columns().to_rows()
+            )
         return self.payment_schedule
 
-    def _generate_payment_schedule(self):
-        """Описание метода _generate_payment_schedule.
+    def get_payment_schedule_columns(self):
+        """Возвращает график платежей в колоночном виде.
 
-        Выполняет прикладную операцию текущего модуля.
+        В отличие от ``get_payment_schedule`` не создает словарь на
+        каждый платеж: суммы хранятся в массивах NumPy без округления.
 
         Возвращает:
-            Any: Тип результата определяется вызывающим кодом.
+            PaymentScheduleColumns: Колонки графика платежей.
+        """
+        if self._payment_schedule_columns is None:
+            self._payment_schedule_columns = build_schedule_columns(
+                self.initial_payment_date,
+                self.loan_amount,
+                self._get_schedule_segments(),
+            )
+        return self._payment_schedule_columns
+
+    def _get_schedule_segments(self):
+        """Возвращает участки графика с постоянной ставкой и платежом.
+
+        Возвращает:
+            list: Кортежи ``(monthly_rate, monthly_payment, months)``.
         """
         total_months = self.mortgage_term
-        current_date = self.initial_payment_date
-        current_balance = self.loan_amount
 
         if self.has_grace_period and self.grace_period_term > 0:
-            # Льготный период
+            # Льготный период: аннуитет на полный срок по льготной ставке
             grace_months = self.grace_period_term
             monthly_grace_rate = self.grace_period_rate / 100 / 12
+            grace_monthly_payment = annuity_payment(
+                self.loan_amount, monthly_grace_rate, total_months
+            )
+            balance_after_grace = remaining_balance(
+                self.loan_amount,
+                monthly_grace_rate,
+                grace_monthly_payment,
+                grace_months,
+            )
 
-            # Расчет аннуитетного платежа для льготного периода на полный срок
-            annuity_coefficient_grace = (
-                monthly_grace_rate * pow(1 + monthly_grace_rate, total_months)
-            ) / (pow(1 + monthly_grace_rate, total_months) - 1)
-            grace_monthly_payment = current_balance * annuity_coefficient_grace
-
-            for month in range(1, grace_months + 1):
-                interest = current_balance * monthly_grace_rate
-                principal = grace_monthly_payment - interest
-                payment_amount = grace_monthly_payment
-                current_balance -= principal
-
-                self.payment_schedule.append(
-                    {
-                        'payment_number': month,
-                        'payment_date': current_date,
-                        'payment_amount': round(payment_amount, 2),
-                        'interest_amount': round(interest, 2),
-                        'principal_amount': round(principal, 2),
-                        'remaining_debt': round(current_balance, 2),
-                    }
-                )
-
-                current_date += relativedelta(months=1)
-
-            # Основной период
+            # Основной период: аннуитет на оставшийся срок
             main_months = total_months - grace_months
             monthly_main_rate = self.annual_rate / 100 / 12
-
-            if main_months > 0:
-                # Расчет аннуитетного платежа для основного периода
-                # на оставшийся срок
-                annuity_coefficient_main = (
-                    monthly_main_rate * pow(1 + monthly_main_rate, main_months)
-                ) / (pow(1 + monthly_main_rate, main_months) - 1)
-                main_monthly_payment = (
-                    current_balance * annuity_coefficient_main
-                )
-
-                for month in range(1, main_months + 1):
-                    interest = current_balance * monthly_main_rate
-                    principal = main_monthly_payment - interest
-                    payment_amount = main_monthly_payment
-                    current_balance -= principal
-
-                    self.payment_schedule.append(
-                        {
-                            'payment_number': grace_months + month,
-                            'payment_date': current_date,
-                            'payment_amount': round(payment_amount, 2),
-                            'interest_amount': round(interest, 2),
-                            'principal_amount': round(principal, 2),
-                            'remaining_debt': round(current_balance, 2)
-                            if current_balance > 0
-                            else 0,
-                        }
-                    )
-
-                    current_date += relativedelta(months=1)
-        else:
-            # Без льготного периода
-            monthly_rate = self.annual_rate / 100 / 12
-            annuity_coefficient = (
-                monthly_rate * pow(1 + monthly_rate, total_months)
-            ) / (pow(1 + monthly_rate, total_months) - 1)
-            monthly_payment = current_balance * annuity_coefficient
-
-            for month in range(1, total_months + 1):
-                interest = current_balance * monthly_rate
-                principal = monthly_payment - interest
-                payment_amount = monthly_payment
-                current_balance -= principal
-
-                self.payment_schedule.append(
-                    {
-                        'payment_number': month,
-                        'payment_date': current_date,
-                        'payment_amount': round(payment_amount, 2),
-                        'interest_amount': round(interest, 2),
-                        'principal_amount': round(principal, 2),
-                        'remaining_debt': round(current_balance, 2)
-                        if current_balance > 0
-                        else 0,
-                    }
-                )
-
-                current_date += relativedelta(months=1)
+            main_monthly_payment = annuity_payment(
+                balance_after_grace, monthly_main_rate, main_months
+            )
+            return [
+                (monthly_grace_rate, grace_monthly_payment, grace_months),
+                (monthly_main_rate, main_monthly_payment, main_months),
+            ]
+
+        monthly_rate = self.annual_rate / 100 / 12
+        return [
+            (
+                monthly_rate,
+                annuity_payment(self.loan_amount, monthly_rate, total_months),
+                total_months,
+            )
+        ]
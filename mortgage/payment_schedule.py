@@ -0,0 +1,199 @@
+# mortgage/payment_schedule.py
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+# Допустимое расхождение с помесячным пересчетом остатка, в рублях.
+# Закрытая форма и последовательное вычитание накапливают ошибку
+# float64 по-разному, поэтому на границе округления до копеек суммы
+# графика и переплата изредка отличаются на одну копейку.
+SCHEDULE_ROUNDING_TOLERANCE = 0.01
+
+
+@dataclass(frozen=True)
+class PaymentScheduleColumns:
+    """Колоночное представление графика платежей.
+
+    Денежные колонки хранятся без округления в массивах float64,
+    даты платежей - в массиве datetime64[D]. Построчные словари
+    формируются только по запросу через ``to_rows``.
+    """
+
+    payment_numbers: np.ndarray
+    payment_dates: np.ndarray
+    payment_amount: np.ndarray
+    interest_amount: np.ndarray
+    principal_amount: np.ndarray
+    remaining_debt: np.ndarray
+
+    def __len__(self):
+        """Возвращает количество платежей в графике."""
+        return len(self.payment_numbers)
+
+    def to_rows(self):
+        """Возвращает график в виде списка словарей по платежам.
+
+        Суммы округляются до копеек, неположительный остаток долга
+        заменяется нулем.
+        """
+        rows = []
+        columns = zip(
+            self.payment_numbers.tolist(),
+            self.payment_dates.tolist(),
+            self.payment_amount.tolist(),
+            self.interest_amount.tolist(),
+            self.principal_amount.tolist(),
+            self.remaining_debt.tolist(),
+        )
+        for (
+            payment_number,
+            payment_date,
+            payment_amount,
+            interest_amount,
+            principal_amount,
+            remaining_debt,
+        ) in columns:
+            rows.append(
+                {
+                    'payment_number': payment_number,
+                    'payment_date': payment_date,
+                    'payment_amount': round(payment_amount, 2),
+                    'interest_amount': round(interest_amount, 2),
+                    'principal_amount': round(principal_amount, 2),
+                    'remaining_debt': (
+                        round(remaining_debt, 2) if remaining_debt > 0 else 0
+                    ),
+                }
+            )
+        return rows
+
+
+def annuity_payment(loan_amount, monthly_rate, months):
+    """Возвращает аннуитетный платеж для суммы, ставки и срока."""
+    if months <= 0:
+        return 0.0
+    if monthly_rate == 0:
+        return loan_amount / months
+    factor = pow(1 + monthly_rate, months)
+    return loan_amount * (monthly_rate * factor / (factor - 1))
+
+
+def remaining_balance(loan_amount, monthly_rate, monthly_payment, months):
+    """Возвращает остаток долга после ``months`` аннуитетных платежей.
+
+    Результат совпадает с помесячным пересчетом остатка с точностью
+    до ``SCHEDULE_ROUNDING_TOLERANCE`` после округления до копеек.
+    """
+    if monthly_rate == 0:
+        return loan_amount - monthly_payment * months
+    factor = pow(1 + monthly_rate, months)
+    return (
+        loan_amount * factor
+        - monthly_payment * (factor - 1) / monthly_rate
+    )
+
+
+def annuity_segment(loan_amount, monthly_rate, monthly_payment, months):
+    """Рассчитывает колонки аннуитетного участка графика в закрытой форме.
+
+    Возвращает массивы процентов, погашения основного долга и остатка
+    долга после каждого из ``months`` платежей. Округленные до копеек
+    суммы могут отличаться от помесячного пересчета не более чем на
+    ``SCHEDULE_ROUNDING_TOLERANCE``.
+    """
+    payment_indexes = np.arange(months + 1, dtype=np.float64)
+    if monthly_rate == 0:
+        balances = loan_amount - monthly_payment * payment_indexes
+    else:
+        factors = np.power(1 + monthly_rate, payment_indexes)
+        balances = (
+            loan_amount * factors
+            - monthly_payment * (factors - 1) / monthly_rate
+        )
+
+    interest = balances[:-1] * monthly_rate
+    principal = monthly_payment - interest
+    return interest, principal, balances[1:]
+
+
+@lru_cache(maxsize=256)
+def _month_offset_table(start_date, months, keep_clamped_day):
+    """Возвращает таблицу дат, отстоящих от ``start_date`` на 0..N мес.
+
+    Число месяца ограничивается длиной месяца. При ``keep_clamped_day``
+    даты совпадают с последовательным прибавлением
+    ``relativedelta(months=1)``: день, сдвинутый на конец короткого
+    месяца, дальше уже не возвращается к исходному числу. Иначе каждая
+    дата равна ``start_date + relativedelta(months=index)``.
+    """
+    first_month = np.datetime64(start_date, 'M')
+    payment_months = first_month + np.arange(months)
+    days_in_month = (
+        (payment_months + 1).astype('datetime64[D]')
+        - payment_months.astype('datetime64[D]')
+    ).astype(np.int64)
+    payment_days = np.minimum(days_in_month, start_date.day)
+    if keep_clamped_day:
+        payment_days = np.minimum.accumulate(payment_days)
+    payment_dates = payment_months.astype('datetime64[D]') + (
+        payment_days - 1
+    )
+    payment_dates.flags.writeable = False
+    return payment_dates
+
+
+def monthly_payment_dates(start_date, months):
+    """Возвращает даты ``months`` платежей с последовательным шагом."""
+    return _month_offset_table(start_date, int(months), True)
+
+
+def month_offset_dates(start_date, months):
+    """Возвращает даты ``start_date + relativedelta(months=index)``."""
+    return _month_offset_table(start_date, int(months), False)
+
+
+def build_schedule_columns(start_date, loan_amount, segments):
+    """Собирает колоночный график из последовательных участков.
+
+    Каждый участок задается кортежем ``(monthly_rate, monthly_payment,
+    months)``; остаток долга после участка становится суммой кредита
+    следующего участка.
+    """
+    interest_parts = []
+    principal_parts = []
+    balance_parts = []
+    payment_parts = []
+    balance = loan_amount
+    for monthly_rate, monthly_payment, months in segments:
+        if months <= 0:
+            continue
+        interest, principal, balances = annuity_segment(
+            balance, monthly_rate, monthly_payment, months
+        )
+        interest_parts.append(interest)
+        principal_parts.append(principal)
+        balance_parts.append(balances)
+        payment_parts.append(np.full(months, monthly_payment))
+        balance = balances[-1]
+
+    total_months = sum(len(part) for part in balance_parts)
+    if not total_months:
+        empty = np.empty(0, dtype=np.float64)
+        return PaymentScheduleColumns(
+            payment_numbers=np.empty(0, dtype=np.int64),
+            payment_dates=np.empty(0, dtype='datetime64[D]'),
+            payment_amount=empty,
+            interest_amount=empty,
+            principal_amount=empty,
+            remaining_debt=empty,
+        )
+
+    return PaymentScheduleColumns(
+        payment_numbers=np.arange(1, total_months + 1, dtype=np.int64),
+        payment_dates=monthly_payment_dates(start_date, total_months),
+        payment_amount=np.concatenate(payment_parts),
+        interest_amount=np.concatenate(interest_parts),
+        principal_amount=np.concatenate(principal_parts),
+        remaining_debt=np.concatenate(balance_parts),
+    )
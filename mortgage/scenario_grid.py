@@ -0,0 +1,244 @@
+# mortgage/scenario_grid.py
+from dataclasses import dataclass
+from datetime import date
+from itertools import product
+
+import numpy as np
+from dateutil.relativedelta import relativedelta
+
+SCENARIO_GRID_AXES = (
+    'annual_rate',
+    'mortgage_term',
+    'initial_payment_percent',
+    'grace_period_term',
+    'grace_period_rate',
+)
+
+
+@dataclass(frozen=True)
+class MortgageScenarioGrid:
+    """Результаты рыночного расчета для всех комбинаций параметров.
+
+    Массивы результатов имеют форму ``shape``: по одной оси на каждый
+    параметр из ``SCENARIO_GRID_AXES`` в том же порядке.
+    """
+
+    property_cost: float
+    initial_payment_date: date
+    annual_rates: tuple
+    mortgage_terms: tuple
+    initial_payment_percents: tuple
+    grace_period_terms: tuple
+    grace_period_rates: tuple
+    is_valid: np.ndarray
+    grace_monthly_payment: np.ndarray
+    loan_after_grace: np.ndarray
+    main_monthly_payment: np.ndarray
+    total_loan_amount: np.ndarray
+    total_overpayment: np.ndarray
+
+    @property
+    def axes(self):
+        """Возвращает значения осей сетки по именам параметров."""
+        return dict(
+            zip(
+                SCENARIO_GRID_AXES,
+                (
+                    self.annual_rates,
+                    self.mortgage_terms,
+                    self.initial_payment_percents,
+                    self.grace_period_terms,
+                    self.grace_period_rates,
+                ),
+            )
+        )
+
+    @property
+    def shape(self):
+        """Возвращает размерность сетки сценариев."""
+        return self.is_valid.shape
+
+    def get_inputs(self, index):
+        """Возвращает входные параметры сценария по индексу сетки."""
+        return {
+            axis_name: axis_values[axis_index]
+            for (axis_name, axis_values), axis_index in zip(
+                self.axes.items(), index
+            )
+        }
+
+    def get_result(self, index):
+        """Возвращает результат сценария в формате ``calculate()``.
+
+        Возвращает:
+            dict | None: Результат расчета или None для недопустимой
+            комбинации параметров.
+        """
+        if not self.is_valid[index]:
+            return None
+
+        inputs = self.get_inputs(index)
+        mortgage_term = int(inputs['mortgage_term'])
+        grace_months = int(inputs['grace_period_term'])
+        result = {
+            'grace_payments_count': 0,
+            'grace_period_end_date': None,
+            'grace_monthly_payment': 0,
+            'loan_after_grace': round(float(self.loan_after_grace[index]), 2),
+            'main_payments_count': mortgage_term,
+            'mortgage_end_date': self.initial_payment_date + relativedelta(
+                months=mortgage_term
+            ),
+            'main_monthly_payment': round(
+                float(self.main_monthly_payment[index]), 2
+            ),
+            'total_loan_amount': round(
+                float(self.total_loan_amount[index]), 2
+            ),
+            'total_overpayment': round(
+                float(self.total_overpayment[index]), 2
+            ),
+        }
+        if grace_months > 0:
+            result.update(
+                {
+                    'grace_payments_count': grace_months,
+                    'grace_period_end_date': (
+                        self.initial_payment_date
+                        + relativedelta(months=grace_months)
+                    ),
+                    'grace_monthly_payment': round(
+                        float(self.grace_monthly_payment[index]), 2
+                    ),
+                    'main_payments_count': mortgage_term - grace_months,
+                }
+            )
+        return result
+
+    def iter_results(self):
+        """Перебирает допустимые сценарии в порядке осей сетки.
+
+        Возвращает:
+            Iterator[tuple[dict, dict]]: Пары входных параметров
+            и результата расчета.
+        """
+        for index in product(*(range(size) for size in self.shape)):
+            result = self.get_result(index)
+            if result is not None:
+                yield self.get_inputs(index), result
+
+
+def _annuity_payments(loan_amounts, monthly_rates, months):
+    """Возвращает аннуитетные платежи для массивов параметров."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factors = np.power(1 + monthly_rates, months)
+        payments = loan_amounts * (monthly_rates * factors / (factors - 1))
+        payments = np.where(
+            monthly_rates == 0, loan_amounts / months, payments
+        )
+    return np.where(months > 0, payments, 0.0)
+
+
+def _remaining_balances(loan_amounts, monthly_rates, payments, months):
+    """Возвращает остатки долга после ``months`` платежей."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factors = np.power(1 + monthly_rates, months)
+        balances = (
+            loan_amounts * factors
+            - payments * (factors - 1) / monthly_rates
+        )
+        balances = np.where(
+            monthly_rates == 0, loan_amounts - payments * months, balances
+        )
+    return np.maximum(balances, 0)
+
+
+def calculate_mortgage_scenario_grid(
+    property_cost,
+    initial_payment_date,
+    annual_rates,
+    mortgage_terms,
+    initial_payment_percents,
+    grace_period_terms=(0,),
+    grace_period_rates=(0,),
+):
+    """Рассчитывает рыночную ипотеку для всех комбинаций параметров.
+
+    Все сценарии считаются одним векторным проходом NumPy по тем же
+    формулам, что и ``MortgageCalculator.calculate``. Нулевой срок
+    льготного периода означает расчет без льготного периода. Комбинации,
+    где льготный период не короче срока ипотеки, помечаются
+    недопустимыми.
+
+    Возвращает:
+        MortgageScenarioGrid: Сетка результатов расчета.
+    """
+    axes = (
+        tuple(annual_rates),
+        tuple(mortgage_terms),
+        tuple(initial_payment_percents),
+        tuple(grace_period_terms),
+        tuple(grace_period_rates),
+    )
+    (
+        rate_values,
+        term_values,
+        percent_values,
+        grace_term_values,
+        grace_rate_values,
+    ) = np.ix_(*(np.asarray(axis, dtype=np.float64) for axis in axes))
+
+    property_cost = float(property_cost)
+    initial_payments = property_cost * percent_values / 100
+    loan_amounts = property_cost - initial_payments
+    monthly_rates = rate_values / 100 / 12
+    monthly_grace_rates = grace_rate_values / 100 / 12
+    has_grace_period = grace_term_values > 0
+    main_months = np.where(
+        has_grace_period, term_values - grace_term_values, term_values
+    )
+
+    grace_payments = np.where(
+        has_grace_period,
+        _annuity_payments(loan_amounts, monthly_grace_rates, term_values),
+        0.0,
+    )
+    loan_after_grace = np.where(
+        has_grace_period,
+        _remaining_balances(
+            loan_amounts,
+            monthly_grace_rates,
+            grace_payments,
+            grace_term_values,
+        ),
+        loan_amounts,
+    )
+    main_payments = _annuity_payments(
+        loan_after_grace, monthly_rates, main_months
+    )
+    total_overpayment = (
+        np.where(has_grace_period, grace_payments * grace_term_values, 0.0)
+        + main_payments * main_months
+        - loan_amounts
+    )
+    shape = total_overpayment.shape
+    is_valid = np.broadcast_to(
+        ~has_grace_period | (grace_term_values < term_values),
+        shape,
+    )
+
+    return MortgageScenarioGrid(
+        property_cost=property_cost,
+        initial_payment_date=initial_payment_date,
+        annual_rates=axes[0],
+        mortgage_terms=axes[1],
+        initial_payment_percents=axes[2],
+        grace_period_terms=axes[3],
+        grace_period_rates=axes[4],
+        is_valid=is_valid,
+        grace_monthly_payment=np.broadcast_to(grace_payments, shape),
+        loan_after_grace=np.broadcast_to(loan_after_grace, shape),
+        main_monthly_payment=np.broadcast_to(main_payments, shape),
+        total_loan_amount=np.broadcast_to(loan_amounts, shape),
+        total_overpayment=total_overpayment,
+    )
@@ -0,0 +1,137 @@
+# mortgage/schedule_store.py
+import hashlib
+import json
+
+import numpy as np
+
+from core.models import get_stored_decimal_value
+
+from .models import MortgageCalculationSchedule
+from .mortgage_calculator import MortgageCalculator
+from .payment_schedule import PaymentScheduleColumns, monthly_payment_dates
+
+SCHEDULE_FORMAT_VERSION = 1
+SCHEDULE_COLUMN_DTYPE = np.dtype('<f8')
+STORED_SCHEDULE_COLUMNS = (
+    'payment_amount',
+    'interest_amount',
+    'principal_amount',
+    'remaining_debt',
+)
+
+
+def get_calculator_inputs(calculation):
+    """Возвращает параметры калькулятора для сохраненного расчета."""
+    return {
+        'property_cost': get_stored_decimal_value(
+            calculation, 'final_property_cost'
+        ),
+        'initial_payment_percent': get_stored_decimal_value(
+            calculation, 'initial_payment_percent'
+        ),
+        'initial_payment_date': calculation.initial_payment_date,
+        'mortgage_term': int(calculation.mortgage_term),
+        'annual_rate': get_stored_decimal_value(calculation, 'annual_rate'),
+        'has_grace_period': bool(calculation.has_grace_period),
+        'grace_period_term': int(calculation.grace_period_term or 0),
+        'grace_period_rate': get_stored_decimal_value(
+            calculation, 'grace_period_rate'
+        ),
+    }
+
+
+def get_calculation_input_hash(calculation):
+    """Возвращает хеш исходных данных, от которых зависит график."""
+    inputs = get_calculator_inputs(calculation)
+    inputs['initial_payment_date'] = inputs['initial_payment_date'].isoformat()
+    inputs['format_version'] = SCHEDULE_FORMAT_VERSION
+    payload = json.dumps(inputs, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()
+
+
+def pack_schedule_columns(columns):
+    """Упаковывает денежные колонки графика в байты float64."""
+    return np.stack(
+        [getattr(columns, name) for name in STORED_SCHEDULE_COLUMNS]
+    ).astype(SCHEDULE_COLUMN_DTYPE).tobytes()
+
+
+def unpack_schedule_columns(packed_columns, payment_dates):
+    """Восстанавливает колоночный график из упакованных байтов.
+
+    Даты платежей не хранятся в упакованных колонках и передаются
+    вызывающим кодом; их количество задает длину графика.
+    """
+    payment_count = len(payment_dates)
+    values = np.frombuffer(
+        bytes(packed_columns), dtype=SCHEDULE_COLUMN_DTYPE
+    ).reshape(len(STORED_SCHEDULE_COLUMNS), payment_count)
+    return PaymentScheduleColumns(
+        payment_numbers=np.arange(1, payment_count + 1, dtype=np.int64),
+        payment_dates=payment_dates,
+        **dict(zip(STORED_SCHEDULE_COLUMNS, values)),
+    )
+
+
+def store_calculation_schedule(calculation):
+    """Пересчитывает и сохраняет график платежей расчета.
+
+    Возвращает:
+        PaymentScheduleColumns: Сохраненный график в колоночном виде.
+    """
+    columns = MortgageCalculator(
+        **get_calculator_inputs(calculation)
+    ).get_payment_schedule_columns()
+    stored_schedule, _created = (
+        MortgageCalculationSchedule.objects.update_or_create(
+            calculation_id=calculation.pk,
+            defaults={
+                'input_hash': get_calculation_input_hash(calculation),
+                'format_version': SCHEDULE_FORMAT_VERSION,
+                'payment_count': len(columns),
+                'columns': pack_schedule_columns(columns),
+            },
+        )
+    )
+    calculation.stored_schedule = stored_schedule
+    return columns
+
+
+def get_calculation_schedule_columns(calculation):
+    """Возвращает график расчета из хранилища или пересчитывает его.
+
+    Сохраненный график используется, только если совпадают версия
+    формата и хеш исходных данных; иначе он пересобирается.
+    """
+    try:
+        stored_schedule = calculation.stored_schedule
+    except MortgageCalculationSchedule.DoesNotExist:
+        stored_schedule = None
+
+    if (
+        stored_schedule is not None
+        and stored_schedule.format_version == SCHEDULE_FORMAT_VERSION
+        and stored_schedule.input_hash
+        == get_calculation_input_hash(calculation)
+    ):
+        return unpack_schedule_columns(
+            stored_schedule.columns,
+            monthly_payment_dates(
+                calculation.initial_payment_date,
+                stored_schedule.payment_count,
+            ),
+        )
+
+    return store_calculation_schedule(calculation)
+
+
+def get_calculation_payment_schedule(calculation):
+    """Возвращает график платежей сохраненного расчета по строкам."""
+    return get_calculation_schedule_columns(calculation).to_rows()
+
+
+def store_calculation_schedule_on_save(sender, instance, raw=False, **kwargs):
+    """Обновляет сохраненный график после сохранения расчета."""
+    if raw:
+        return
+    store_calculation_schedule(instance)
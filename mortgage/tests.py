@@ -1,13 +1,16 @@
 from datetime import date
 from decimal import Decimal
 from io import BytesIO
+import random
 import re
+from unittest.mock import Mock, patch
 from zipfile import ZipFile
 
 from openpyxl import load_workbook
 import pytest
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.db.models import F
 from django.test import TestCase
 from django.urls import reverse
 
@@ -21,7 +24,22 @@ from bank.models import (
 from customer.models import Customer, CustomerTrenchCalculation
 from location.models import City, District, Region
 from mortgage.forms import MortgageForm
-from mortgage.models import MortgageCalculation
+from mortgage.form_data_cache import (
+    FORM_DATA_CACHE_GENERATION_NAME,
+    get_cached_form_data,
+    get_form_data_cache_generation,
+)
+from mortgage.models import (
+    FormDataCacheGeneration,
+    MortgageCalculation,
+    MortgageCalculationSchedule,
+)
+from mortgage.mortgage_calculator import MortgageCalculator
+from mortgage.payment_schedule import SCHEDULE_ROUNDING_TOLERANCE
+from mortgage.schedule_store import (
+    get_calculation_input_hash,
+    get_calculation_payment_schedule,
+)
 from property.models import (
     ApartmentDecoration,
     ApartmentLayout,
@@ -34,7 +52,11 @@ from property.models import (
     RealEstateType,
 )
 from mortgage.views import _build_saved_trench_calculation_data
-from trench_mortgage.models import Trench, TrenchMortgageCalculation
+from trench_mortgage.models import (
+    Trench,
+    TrenchMortgageCalculation,
+    TrenchMortgageCalculationSchedule,
+)
 from users.roles import (
     APPLICATION_ADMINISTRATOR_GROUP_NAME,
     MODERATOR_GROUP_NAME,
@@ -121,6 +143,175 @@ def test_mortgage_calculator_prefills_property_data_from_query_parameter(
     assert form_initial['OBJECT_DECORATION'] == property_obj.decoration_id
 
 
+def test_payment_schedule_columns_match_schedule_rows():
+    """Columnar schedule should carry the same values as the row schedule."""
+    calculator = MortgageCalculator(
+        property_cost=12000000,
+        initial_payment_percent=20,
+        initial_payment_date=date(2025, 1, 31),
+        mortgage_term=360,
+        annual_rate=18,
+        has_grace_period=True,
+        grace_period_term=24,
+        grace_period_rate=6,
+    )
+
+    columns = calculator.get_payment_schedule_columns()
+    rows = calculator.get_payment_schedule()
+
+    assert len(columns) == len(rows) == 360
+    assert rows[0]['payment_date'] == date(2025, 1, 31)
+    assert rows[1]['payment_date'] == date(2025, 2, 28)
+    assert rows[2]['payment_date'] == date(2025, 3, 28)
+    assert rows[-1]['payment_number'] == 360
+    assert rows[-1]['remaining_debt'] == 0
+    assert rows[23]['remaining_debt'] == calculator.calculate()[
+        'loan_after_grace'
+    ]
+    assert columns.payment_amount[0] == pytest.approx(
+        calculator.calculate()['grace_monthly_payment'], abs=0.01
+    )
+    assert columns.principal_amount.sum() == pytest.approx(
+        calculator.loan_amount
+    )
+
+
+def test_payment_schedule_rows_match_iterative_annuity():
+    """Closed-form schedule should match month-by-month amortization."""
+    calculator = MortgageCalculator(
+        property_cost=5000000,
+        initial_payment_percent=30,
+        initial_payment_date=date(2024, 2, 29),
+        mortgage_term=120,
+        annual_rate=12.5,
+    )
+    monthly_rate = 12.5 / 100 / 12
+    columns = calculator.get_payment_schedule_columns()
+    monthly_payment = float(columns.payment_amount[0])
+    balance = calculator.loan_amount
+
+    for payment in calculator.get_payment_schedule():
+        interest = balance * monthly_rate
+        balance -= monthly_payment - interest
+        assert payment['interest_amount'] == pytest.approx(
+            round(interest, 2), abs=0.01
+        )
+        assert payment['remaining_debt'] == pytest.approx(
+            max(round(balance, 2), 0), abs=0.01
+        )
+
+
+def _iterative_schedule(calculator):
+    """Build schedule rows and overpayment with month-by-month amortization."""
+    segments = calculator._get_schedule_segments()
+    balance = calculator.loan_amount
+    months_left = calculator.mortgage_term
+    rows = []
+    total_payments = 0
+    for monthly_rate, _payment, months in segments:
+        if months <= 0:
+            continue
+        # Аннуитет каждого участка считается на весь оставшийся срок
+        factor = pow(1 + monthly_rate, months_left)
+        months_left -= months
+        monthly_payment = balance * (monthly_rate * factor / (factor - 1))
+        total_payments += monthly_payment * months
+        for _ in range(months):
+            interest = balance * monthly_rate
+            principal = monthly_payment - interest
+            balance -= principal
+            rows.append(
+                (
+                    round(monthly_payment, 2),
+                    round(interest, 2),
+                    round(principal, 2),
+                    round(balance, 2) if balance > 0 else 0,
+                )
+            )
+    return rows, round(total_payments - calculator.loan_amount, 2)
+
+
+def test_closed_form_schedule_stays_within_rounding_tolerance():
+    """Closed-form amounts should stay within a kopeck of amortization."""
+    rng = random.Random(20261018)
+    differences = []
+    for _ in range(300):
+        mortgage_term = rng.randint(12, 360)
+        calculator = MortgageCalculator(
+            property_cost=rng.randint(1000000, 50000000),
+            initial_payment_percent=rng.randint(10, 50),
+            initial_payment_date=date(2025, 1, 15),
+            mortgage_term=mortgage_term,
+            annual_rate=round(rng.uniform(1, 25), 2),
+            has_grace_period=rng.random() < 0.5,
+            grace_period_term=rng.randint(1, mortgage_term - 1),
+            grace_period_rate=round(rng.uniform(0.1, 10), 2),
+        )
+        expected_rows, expected_overpayment = _iterative_schedule(calculator)
+        rows = [
+            (
+                row['payment_amount'],
+                row['interest_amount'],
+                row['principal_amount'],
+                row['remaining_debt'],
+            )
+            for row in calculator.get_payment_schedule()
+        ]
+
+        assert len(rows) == len(expected_rows)
+        differences.extend(
+            abs(value - expected_value)
+            for row, expected_row in zip(rows, expected_rows)
+            for value, expected_value in zip(row, expected_row)
+        )
+        differences.append(
+            abs(
+                calculator.calculate()['total_overpayment']
+                - expected_overpayment
+            )
+        )
+
+    assert max(differences) == pytest.approx(SCHEDULE_ROUNDING_TOLERANCE)
+    kopeck_differences = [
+        difference for difference in differences if difference > 0.005
+    ]
+    assert len(kopeck_differences) < len(differences) / 100
+
+
+@pytest.mark.django_db
+def test_form_data_is_rebuilt_once_per_generation():
+    """Cached form data should be rebuilt only after a generation bump."""
+    build_form_data = Mock(side_effect=[{'version': 1}, {'version': 2}])
+
+    first = get_cached_form_data('mortgage:test_form_data', build_form_data)
+    second = get_cached_form_data('mortgage:test_form_data', build_form_data)
+    # Другой процесс меняет счетчик напрямую в базе, без сигналов.
+    FormDataCacheGeneration.objects.filter(
+        name=FORM_DATA_CACHE_GENERATION_NAME
+    ).update(generation=F('generation') + 1)
+    third = get_cached_form_data('mortgage:test_form_data', build_form_data)
+
+    assert (first, second, third) == (
+        {'version': 1},
+        {'version': 1},
+        {'version': 2},
+    )
+    assert build_form_data.call_count == 2
+
+
+@pytest.mark.django_db
+def test_catalog_changes_bump_form_data_generation():
+    """Saving and deleting form catalog rows should bump the generation."""
+    generation = get_form_data_cache_generation()
+
+    bank = Bank.objects.create(name='Generation Bank')
+    after_save = get_form_data_cache_generation()
+    bank.delete()
+    after_delete = get_form_data_cache_generation()
+
+    assert generation < after_save < after_delete
+
+
 class MortgageFormDeveloperChoiceTests(TestCase):
     """Tests for mortgage form developer selector labels."""
 
@@ -450,13 +641,15 @@ class MortgageCalculatorViewTests(TestCase):
         self.assertContains(response, 'Номер квартиры')
         self.assertNotContains(response, 'Объект недвижимости')
         self.assertEqual(
-            response.context['property_form_data']['properties'][0]['id'],
-            self.property.pk,
+            set(response.context['property_form_data']),
+            {'cities', 'districts', 'complexes'},
         )
         self.assertIn(
             'region_id',
             response.context['property_form_data']['cities'][0],
         )
+        self.assertContains(response, reverse('mortgage:property_lookup_api'))
+        self.assertContains(response, 'data-cascade-source-url')
 
     def test_calculation_list_is_available_from_calculation_menu(self):
         response = self.client.get(self.url)
@@ -932,7 +1125,7 @@ class MortgageCalculatorViewTests(TestCase):
             'attachment; filename="mortgage_calculation.xlsx"',
             response['Content-Disposition'],
         )
-        workbook = load_workbook(BytesIO(response.content))
+        workbook = load_workbook(BytesIO(response.getvalue()))
         worksheet = workbook.active
         self.assertEqual(worksheet.title, 'Ипотечный расчет')
         self.assertEqual(
@@ -2044,7 +2237,7 @@ class MortgageCalculatorViewTests(TestCase):
             'attachment; filename="mortgage_calculation.xlsx"',
             response['Content-Disposition'],
         )
-        workbook = load_workbook(BytesIO(response.content))
+        workbook = load_workbook(BytesIO(response.getvalue()))
         worksheet = workbook.active
         self.assertEqual(worksheet.title, 'Ипотечный расчет')
         self.assertEqual(
@@ -2202,6 +2395,123 @@ class MortgageCalculatorViewTests(TestCase):
         )
         self.assertEqual(payload['apartment_number'], '101')
 
+    def test_property_lookup_api_pages_building_apartments(self):
+        """Lookup should page apartments of the selected building."""
+        building = self.property.building
+        for apartment_number in ('102', '103', '201'):
+            Property.objects.create(
+                apartment_number=apartment_number,
+                building=building,
+                decoration=self.property.decoration,
+                layout=self.property.layout,
+                area=Decimal('40.00'),
+                floor=2,
+                property_cost=Decimal('6000000.00'),
+            )
+        url = reverse('mortgage:property_lookup_api')
+        params = {
+            'complex_id': building.real_estate_complex_id,
+            'building_id': building.pk,
+            'q': '10',
+        }
+
+        with patch('mortgage.views.PROPERTY_LOOKUP_PAGE_SIZE', 2):
+            first_page = self.client.get(url, params)
+            second_page = self.client.get(url, {**params, 'page': 2})
+
+        self.assertEqual(first_page.status_code, 200)
+        first_results = first_page.json()['results']
+        second_results = second_page.json()['results']
+        self.assertEqual(
+            [item['apartment_number'] for item in first_results],
+            ['101', '102'],
+        )
+        self.assertTrue(first_page.json()['has_next'])
+        self.assertEqual(
+            [item['apartment_number'] for item in second_results],
+            ['103'],
+        )
+        self.assertFalse(second_page.json()['has_next'])
+        self.assertEqual(
+            first_results[0]['complex_id'],
+            building.real_estate_complex_id,
+        )
+        self.assertIn('no-cache', first_page['Cache-Control'])
+
+    def test_property_lookup_api_answers_not_modified_for_same_etag(self):
+        """Unchanged lookups should be revalidated with 304 responses."""
+        url = reverse('mortgage:property_lookup_api')
+        params = {
+            'complex_id': self.property.building.real_estate_complex_id,
+        }
+
+        response = self.client.get(url, params)
+        etag = response['ETag']
+        cached_response = self.client.get(
+            url,
+            params,
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.property.area = Decimal('41.00')
+        self.property.save()
+        changed_response = self.client.get(
+            url,
+            params,
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(cached_response.status_code, 304)
+        self.assertEqual(changed_response.status_code, 200)
+        self.assertNotEqual(changed_response['ETag'], etag)
+        self.assertEqual(
+            changed_response.json()['results'][0]['area'],
+            '41.00',
+        )
+
+    def test_property_lookup_api_rejects_invalid_parameters(self):
+        """Lookup should require a complex and validate numeric filters."""
+        url = reverse('mortgage:property_lookup_api')
+
+        missing_response = self.client.get(url)
+        invalid_response = self.client.get(
+            url,
+            {'complex_id': 1, 'building_id': 'abc'},
+        )
+
+        self.assertEqual(missing_response.status_code, 400)
+        self.assertEqual(
+            missing_response.json(),
+            {'error': 'Invalid complex_id.'},
+        )
+        self.assertEqual(invalid_response.status_code, 400)
+
+    def test_calculator_renders_only_buildings_of_selected_complex(self):
+        """Building options should not embed the whole catalog."""
+        other_property = self._create_property(
+            cost=Decimal('7000000.00'),
+            complex_name='ЖК Другой',
+        )
+        other_building = other_property.building
+        other_building.number = 'Другой корпус'
+        other_building.save()
+
+        empty_response = self.client.get(self.url)
+        selected_response = self.client.get(
+            self.url,
+            {'property_id': self.property.pk},
+        )
+
+        self.assertNotContains(empty_response, 'Другой корпус')
+        building_widget = (
+            selected_response.context['mortgage_form']
+            .fields['OBJECT_BUILDING'].widget
+        )
+        self.assertEqual(
+            [value for value, label in building_widget.choices],
+            ['', self.property.building.pk],
+        )
+
     def test_property_cost_api_rejects_post(self):
         """The property cost API should be read-only."""
         url = reverse(
@@ -2211,3 +2521,345 @@ class MortgageCalculatorViewTests(TestCase):
         response = self.client.post(url)
 
         self.assertEqual(response.status_code, 405)
+
+    def test_calculate_renders_sensitivity_table_from_scenario_grid(self):
+        """Sensitivity table center cell should repeat the main result."""
+        payload = self._base_payload()
+        payload.update({'calculate': '1', 'PROPERTY_COST': '5000000'})
+
+        response = self.client.post(self.url, payload)
+
+        self.assertEqual(response.status_code, 200)
+        sensitivity_table = response.context['sensitivity_table']
+        selected_cells = [
+            cell
+            for row in sensitivity_table['rows']
+            for cell in row['cells']
+            if cell['is_selected']
+        ]
+        self.assertEqual(len(selected_cells), 1)
+        self.assertEqual(
+            selected_cells[0]['main_monthly_payment'],
+            response.context['result']['main_monthly_payment'],
+        )
+        self.assertEqual(
+            selected_cells[0]['total_overpayment'],
+            response.context['result']['total_overpayment'],
+        )
+
+    def test_scenario_grid_api_matches_single_calculation(self):
+        """Every grid result should equal MortgageCalculator.calculate()."""
+        response = self.client.get(
+            reverse('mortgage:scenario_grid_api'),
+            {
+                'property_cost': '6000000',
+                'initial_payment_date': '2025-01-31',
+                'annual_rate': '10:12:1',
+                'mortgage_term': '120,240',
+                'initial_payment_percent': '20',
+                'grace_period_term': '0,24',
+                'grace_period_rate': '6',
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['shape'], [3, 2, 1, 2, 1])
+        self.assertEqual(
+            payload['axes']['annual_rate'], ['10', '11', '12']
+        )
+        self.assertEqual(len(payload['results']), 12)
+        for scenario in payload['results']:
+            expected = MortgageCalculator(
+                property_cost=6000000.0,
+                initial_payment_percent=20.0,
+                initial_payment_date=date(2025, 1, 31),
+                mortgage_term=scenario['mortgage_term'],
+                annual_rate=float(scenario['annual_rate']),
+                has_grace_period=scenario['grace_period_term'] > 0,
+                grace_period_term=scenario['grace_period_term'],
+                grace_period_rate=6.0,
+            ).calculate()
+            self.assertEqual(
+                scenario['main_monthly_payment'],
+                expected['main_monthly_payment'],
+            )
+            self.assertEqual(
+                scenario['total_overpayment'],
+                expected['total_overpayment'],
+            )
+            self.assertEqual(
+                scenario['mortgage_end_date'],
+                expected['mortgage_end_date'].isoformat(),
+            )
+
+    def test_scenario_grid_api_rejects_oversized_grid(self):
+        """The scenario grid API should bound the number of combinations."""
+        response = self.client.get(
+            reverse('mortgage:scenario_grid_api'),
+            {
+                'property_cost': '6000000',
+                'initial_payment_date': '2025-01-31',
+                'annual_rate': '0:99:1',
+                'mortgage_term': '12:600:12',
+                'initial_payment_percent': '10:90:10',
+            },
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('__all__', response.json()['errors'])
+
+    def test_saved_calculation_stores_packed_payment_schedule(self):
+        """Saving a calculation should persist its float64 schedule."""
+        calculation = self._create_calculation()
+
+        stored_schedule = MortgageCalculationSchedule.objects.get(
+            calculation=calculation
+        )
+        self.assertEqual(stored_schedule.payment_count, 240)
+        self.assertEqual(len(bytes(stored_schedule.columns)), 240 * 4 * 8)
+        self.assertEqual(
+            stored_schedule.input_hash,
+            get_calculation_input_hash(calculation),
+        )
+
+    def test_calculation_detail_reads_stored_payment_schedule(self):
+        """Detail page should reuse the stored schedule without recomputing."""
+        calculation = self._create_calculation()
+        expected_schedule = MortgageCalculator(
+            property_cost=5000000.0,
+            initial_payment_percent=20.0,
+            initial_payment_date=date(2026, 1, 1),
+            mortgage_term=240,
+            annual_rate=12.0,
+        ).get_payment_schedule()
+        self.client.force_login(self.user)
+
+        with patch(
+            'mortgage.schedule_store.MortgageCalculator'
+        ) as calculator_class:
+            response = self.client.get(
+                reverse(
+                    'mortgage:calculation_detail',
+                    kwargs={'pk': calculation.pk},
+                )
+            )
+
+        self.assertEqual(response.status_code, 200)
+        calculator_class.assert_not_called()
+        self.assertEqual(
+            response.context['payment_schedule'], expected_schedule
+        )
+
+    def test_edited_calculation_refreshes_stored_payment_schedule(self):
+        """Changed inputs should invalidate the stored schedule."""
+        calculation = self._create_calculation()
+        calculation.mortgage_term = 120
+        calculation.save()
+
+        stored_schedule = MortgageCalculationSchedule.objects.get(
+            calculation=calculation
+        )
+        self.assertEqual(stored_schedule.payment_count, 120)
+
+        MortgageCalculation.objects.filter(pk=calculation.pk).update(
+            mortgage_term=60
+        )
+        calculation.refresh_from_db()
+        payment_schedule = get_calculation_payment_schedule(calculation)
+
+        self.assertEqual(len(payment_schedule), 60)
+        stored_schedule.refresh_from_db()
+        self.assertEqual(stored_schedule.payment_count, 60)
+
+    def test_trench_calculate_stores_payment_schedule(self):
+        """Saving a trench calculation should persist its schedule."""
+        payload = self._base_payload()
+        payload.update(
+            {
+                'calculate': 'trench',
+                'CALCULATION_TYPE': 'trench',
+                'TRENCH_COUNT': '2',
+                'trench_date_1': '2026-01-01',
+                'trench_percent_1': '2.50',
+                'trench_amount_1': '100000',
+                'trench_amount_source_1': 'rubles',
+                'annual_rate_1': '12',
+                'trench_date_2': '2026-07-01',
+                'trench_percent_2': '',
+                'trench_amount_2': '',
+                'trench_amount_source_2': 'rubles',
+                'annual_rate_2': '12',
+            }
+        )
+
+        response = self.client.post(self.url, payload)
+
+        self.assertEqual(response.status_code, 200)
+        calculation = TrenchMortgageCalculation.objects.get()
+        stored_schedule = TrenchMortgageCalculationSchedule.objects.get(
+            calculation=calculation
+        )
+        self.assertEqual(
+            stored_schedule.payment_count,
+            len(response.context['trench_payment_schedule']),
+        )
+        self.assertEqual(stored_schedule.first_payment_date, date(2026, 1, 1))
+
+        with patch(
+            'trench_mortgage.schedule_store.build_trench_schedule_columns'
+        ) as build_columns:
+            calculation_data = _build_saved_trench_calculation_data(
+                TrenchMortgageCalculation.objects.get()
+            )
+
+        build_columns.assert_not_called()
+        self.assertEqual(
+            len(calculation_data['payment_schedule']),
+            stored_schedule.payment_count,
+        )
+        self.assertEqual(
+            calculation_data['payment_schedule'][6]['payment_date'],
+            date(2026, 7, 1),
+        )
+
+    def test_saved_trench_calculation_schedule_is_stored_on_first_read(self):
+        """A saved trench calculation without a stored schedule gets one."""
+        calculation = self._create_trench_calculation()
+
+        first_data = _build_saved_trench_calculation_data(calculation)
+        stored_schedule = TrenchMortgageCalculationSchedule.objects.get(
+            calculation=calculation
+        )
+        calculation = TrenchMortgageCalculation.objects.prefetch_related(
+            'trenches'
+        ).select_related('stored_schedule').get(pk=calculation.pk)
+        second_data = _build_saved_trench_calculation_data(calculation)
+
+        self.assertEqual(stored_schedule.payment_count, 240)
+        self.assertEqual(
+            second_data['payment_schedule'],
+            first_data['payment_schedule'],
+        )
+
+    def test_saved_trench_schedule_is_rebuilt_after_engine_version_change(
+        self,
+    ):
+        """Stored schedules from another engine version are recomputed."""
+        calculation = self._create_trench_calculation()
+        _build_saved_trench_calculation_data(calculation)
+
+        with patch(
+            'trench_mortgage.schedule_store.TRENCH_SCHEDULE_ENGINE_VERSION',
+            2,
+        ):
+            calculation = TrenchMortgageCalculation.objects.get(
+                pk=calculation.pk
+            )
+            calculation_data = _build_saved_trench_calculation_data(
+                calculation
+            )
+
+        stored_schedule = TrenchMortgageCalculationSchedule.objects.get(
+            calculation=calculation
+        )
+        self.assertEqual(stored_schedule.engine_version, 2)
+        self.assertEqual(len(calculation_data['payment_schedule']), 240)
+
+    def test_calculation_list_export_streams_workbook_with_sheet_per_item(
+        self,
+    ):
+        """Bulk export should stream one worksheet per saved calculation."""
+        first_calculation = self._create_calculation()
+        second_calculation = self._create_calculation()
+        self.client.force_login(self.user)
+
+        response = self.client.get(
+            reverse('mortgage:calculation_list_export')
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertIn(
+            'attachment; filename="mortgage_calculations.xlsx"',
+            response['Content-Disposition'],
+        )
+        workbook = load_workbook(BytesIO(response.getvalue()))
+        self.assertEqual(
+            workbook.sheetnames,
+            [
+                f'Расчет №{second_calculation.pk}',
+                f'Расчет №{first_calculation.pk}',
+            ],
+        )
+        worksheet = workbook.worksheets[0]
+        self.assertEqual(
+            worksheet['A1'].value,
+            'Ипотечный калькулятор - результаты расчета',
+        )
+        self.assertIn('A1:B1', worksheet.merged_cells)
+        header_row = next(
+            row
+            for row in worksheet.iter_rows()
+            if row[0].value == '№'
+        )
+        first_payment = worksheet[header_row[0].row + 1]
+        self.assertEqual(first_payment[0].value, 1)
+        self.assertEqual(first_payment[2].number_format, '# ##0.00')
+        self.assertEqual(worksheet.max_row, header_row[0].row + 240)
+
+    def test_calculation_list_export_respects_selected_calculations(self):
+        """Bulk export should include only selected calculations."""
+        self._create_calculation()
+        selected_calculation = self._create_calculation()
+        self.client.force_login(self.user)
+
+        response = self.client.get(
+            reverse('mortgage:calculation_list_export'),
+            {'calculations': [selected_calculation.pk]},
+        )
+
+        workbook = load_workbook(BytesIO(response.getvalue()))
+        self.assertEqual(
+            workbook.sheetnames,
+            [f'Расчет №{selected_calculation.pk}'],
+        )
+
+    def test_calculation_list_export_ignores_invalid_selected_ids(self):
+        """Non-numeric selected ids should be dropped instead of failing."""
+        selected_calculation = self._create_calculation()
+        self.client.force_login(self.user)
+
+        response = self.client.get(
+            reverse('mortgage:calculation_list_export'),
+            {'calculations': ['abc', selected_calculation.pk]},
+        )
+        invalid_response = self.client.get(
+            reverse('mortgage:calculation_list_export'),
+            {'calculations': ['abc']},
+        )
+
+        workbook = load_workbook(BytesIO(response.getvalue()))
+        self.assertEqual(
+            workbook.sheetnames,
+            [f'Расчет №{selected_calculation.pk}'],
+        )
+        self.assertRedirects(
+            invalid_response,
+            reverse('mortgage:calculation_list'),
+            fetch_redirect_response=False,
+        )
+
+    def test_calculation_list_export_without_calculations_redirects(self):
+        """Bulk export without matching calculations returns to the list."""
+        self.client.force_login(self.user)
+
+        response = self.client.get(
+            reverse('mortgage:calculation_list_export')
+        )
+
+        self.assertRedirects(
+            response,
+            reverse('mortgage:calculation_list'),
+            fetch_redirect_response=False,
+        )
@@ -12,7 +12,22 @@ urlpatterns = [
         views.property_cost_api,
         name='property_cost_api',
     ),
+    path(
+        'properties/',
+        views.property_lookup_api,
+        name='property_lookup_api',
+    ),
+    path(
+        'scenarios/',
+        views.scenario_grid_api,
+        name='scenario_grid_api',
+    ),
     path('calculations/', views.calculation_list, name='calculation_list'),
+    path(
+        'calculations/export/',
+        views.calculation_list_export,
+        name='calculation_list_export',
+    ),
     path(
         'calculations/<int:pk>/delete/',
         views.calculation_delete,
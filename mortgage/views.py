@@ -1,15 +1,17 @@
 # mortgage/views.py
 import decimal
+import hashlib
 
 from dateutil.relativedelta import relativedelta
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.core.cache import cache
 from django.core.paginator import Paginator
 from django.db import transaction
-from django.db.models import DecimalField, OuterRef, Subquery
+from django.db.models import Count, DecimalField, Max, OuterRef, Subquery
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
 from django.views.decorators.http import require_GET, require_POST
 
 from location.models import City, District
@@ -19,10 +21,8 @@ from property.models import (
     Developer,
     Property,
     RealEstateComplex,
-    RealEstateComplexBuilding,
 )
 from trench_mortgage.views import (
-    _build_trench_payment_schedule,
     _build_trench_input_rows,
     _calculate_trench_mortgage,
     _calculate_months_remaining,
@@ -37,18 +37,27 @@ from trench_mortgage.views import (
     _save_trench_calculation,
 )
 from trench_mortgage.models import Trench, TrenchMortgageCalculation
+from trench_mortgage.schedule_store import (
+    get_trench_calculation_payment_schedule,
+)
 from users.roles import can_manage_catalogs, can_view_all_private_records
 
-from bank.models import Bank, BankProgram, KeyRate
+from bank.key_rate_series import get_latest_key_rate
+from bank.models import Bank, BankProgram
 
 from .excel import (
+    MAX_BULK_EXCEL_CALCULATIONS,
     MortgageExcelData,
     export_mortgage_excel,
     export_saved_mortgage_calculation_excel,
+    export_saved_mortgage_calculations_excel,
 )
-from .forms import MortgageForm
+from .form_data_cache import get_cached_form_data
+from .forms import MortgageForm, MortgageScenarioGridForm
 from .models import MortgageCalculation
 from .mortgage_calculator import MortgageCalculator
+from .scenario_grid import calculate_mortgage_scenario_grid
+from .schedule_store import get_calculation_payment_schedule
 from .utils import (
     apply_calculation_filters,
     apply_calculation_sort,
@@ -67,9 +76,11 @@ from .word import (
 
 
 CALCULATION_LIST_PAGE_SIZE = 20
-FORM_DATA_CACHE_TIMEOUT = 600
-PROPERTY_FORM_DATA_CACHE_KEY = 'mortgage:property_form_data:v1'
+PROPERTY_FORM_DATA_CACHE_KEY = 'mortgage:property_form_data:v2'
 MORTGAGE_PROGRAM_FORM_DATA_CACHE_KEY = 'mortgage:program_form_data:v1'
+PROPERTY_LOOKUP_PAGE_SIZE = 50
+SENSITIVITY_RATE_OFFSETS = (-2, -1, 0, 1, 2)
+SENSITIVITY_TERM_OFFSETS = (-60, 0, 60)
 
 
 def _get_target_customer(request):
@@ -317,9 +328,73 @@ def _populate_market_report_context(
     context['has_grace_period'] = data['HAS_GRACE_PERIOD'] == 'yes'
     context['payment_schedule'] = payment_schedule
     context['market_payment_schedule'] = payment_schedule
+    context['sensitivity_table'] = _build_market_sensitivity_table(
+        data,
+        final_property_cost,
+        initial_payment_percent,
+    )
     return result
 
 
+def _build_market_sensitivity_table(
+    data,
+    final_property_cost,
+    initial_payment_percent,
+):
+    """Build a rate by term payment table around the submitted scenario."""
+    annual_rate = decimal.Decimal(str(data['ANNUAL_RATE']))
+    mortgage_term = int(data['MORTGAGE_TERM'])
+    has_grace_period = data['HAS_GRACE_PERIOD'] == 'yes'
+    grace_period_term = (
+        int(data['GRACE_PERIOD_TERM'] or 0) if has_grace_period else 0
+    )
+    grace_period_rate = decimal.Decimal(
+        str(data['GRACE_PERIOD_RATE'] or 0) if has_grace_period else '0'
+    )
+
+    annual_rates = [
+        annual_rate + offset
+        for offset in SENSITIVITY_RATE_OFFSETS
+        if annual_rate + offset >= 0
+    ]
+    mortgage_terms = [
+        mortgage_term + offset
+        for offset in SENSITIVITY_TERM_OFFSETS
+        if grace_period_term < mortgage_term + offset <= 600
+    ]
+    grid = calculate_mortgage_scenario_grid(
+        property_cost=final_property_cost,
+        initial_payment_date=data['INITIAL_PAYMENT_DATE'],
+        annual_rates=annual_rates,
+        mortgage_terms=mortgage_terms,
+        initial_payment_percents=(initial_payment_percent,),
+        grace_period_terms=(grace_period_term,),
+        grace_period_rates=(grace_period_rate,),
+    )
+
+    rows = []
+    for rate_index, rate in enumerate(annual_rates):
+        cells = []
+        for term_index, term in enumerate(mortgage_terms):
+            result = grid.get_result((rate_index, term_index, 0, 0, 0))
+            cells.append(
+                {
+                    'main_monthly_payment': format_currency(
+                        result['main_monthly_payment']
+                    ),
+                    'total_overpayment': format_currency(
+                        result['total_overpayment']
+                    ),
+                    'is_selected': (
+                        rate == annual_rate and term == mortgage_term
+                    ),
+                }
+            )
+        rows.append({'annual_rate': rate, 'cells': cells})
+
+    return {'mortgage_terms': mortgage_terms, 'rows': rows}
+
+
 def _populate_trench_report_context(
     context,
     request,
@@ -414,30 +489,20 @@ def _get_property_payload(property_obj):
 
 def _get_property_form_data():
     """Return cached selector data for the mortgage object block."""
-    return cache.get_or_set(
+    return get_cached_form_data(
         PROPERTY_FORM_DATA_CACHE_KEY,
         _build_property_form_data,
-        FORM_DATA_CACHE_TIMEOUT,
     )
 
 
 def _build_property_form_data():
-    """Build reusable selector data for the mortgage object block."""
-    districts = District.objects.select_related('city').order_by('name')
-    complexes = RealEstateComplex.objects.select_related(
-        'developer',
-        'district__city',
-    ).order_by('name')
-    buildings = RealEstateComplexBuilding.objects.select_related(
-        'real_estate_complex'
-    ).order_by('real_estate_complex__name', 'number')
-    properties = Property.objects.select_related(
-        'building',
-        'building__real_estate_complex__developer',
-        'building__real_estate_complex__district__city',
-        'layout',
-        'decoration',
-    ).order_by('building_id', 'apartment_number')
+    """Build top-level selector data for the mortgage object block.
+
+    Buildings and apartments are not embedded: the page loads them
+    for the selected complex through the lookup APIs.
+    """
+    districts = District.objects.order_by('name')
+    complexes = RealEstateComplex.objects.order_by('name')
 
     return {
         'cities': list(
@@ -453,25 +518,46 @@ def _build_property_form_data():
                 'district__city_id',
             )
         ),
-        'buildings': list(
-            buildings.values('id', 'number', 'real_estate_complex_id')
-        ),
-        'properties': [
-            _get_property_payload(property_obj)
-            for property_obj in properties
-        ],
     }
 
 
-def _get_latest_key_rate():
-    """Return the latest stored CBR key rate."""
-    return (
-        KeyRate.objects.filter(is_active=True)
-        .order_by('-meeting_date')
-        .values_list('key_rate', flat=True)
+def _parse_lookup_id(value):
+    """Return a positive integer lookup parameter or None."""
+    try:
+        parsed_value = int(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed_value if parsed_value > 0 else None
+
+
+def _get_property_lookup_etag(complex_id, properties, query_values):
+    """Return an ETag for one page of the property lookup.
+
+    The tag changes whenever a property of the complex is added,
+    edited or deleted, or the complex moves to another district.
+    """
+    property_state = properties.aggregate(
+        count=Count('id'),
+        updated_at=Max('updated_at'),
+    )
+    complex_state = (
+        RealEstateComplex.objects.filter(pk=complex_id)
+        .values_list('district_id', 'developer_id', 'updated_at')
         .first()
-        or decimal.Decimal('0')
     )
+    state = (
+        query_values,
+        property_state['count'],
+        property_state['updated_at'],
+        complex_state,
+    )
+    digest = hashlib.sha256(repr(state).encode('utf-8')).hexdigest()
+    return quote_etag(digest[:32])
+
+
+def _get_latest_key_rate():
+    """Return the latest stored CBR key rate."""
+    return get_latest_key_rate(default=decimal.Decimal('0'))
 
 
 def _decimal_to_json_value(value):
@@ -483,10 +569,9 @@ def _decimal_to_json_value(value):
 
 def _get_mortgage_program_form_data():
     """Return cached bank mortgage program selector data."""
-    return cache.get_or_set(
+    return get_cached_form_data(
         MORTGAGE_PROGRAM_FORM_DATA_CACHE_KEY,
         _build_mortgage_program_form_data,
-        FORM_DATA_CACHE_TIMEOUT,
     )
 
 
@@ -1035,6 +1120,13 @@ def mortgage_calculator(request):
                 context['has_grace_period'] = data['HAS_GRACE_PERIOD'] == 'yes'
                 context['payment_schedule'] = payment_schedule
                 context['market_payment_schedule'] = payment_schedule
+                context['sensitivity_table'] = (
+                    _build_market_sensitivity_table(
+                        data,
+                        final_property_cost,
+                        initial_payment_percent,
+                    )
+                )
                 context['active_calculation_type'] = 'market'
                 context['final_property_cost'] = format_currency(
                     final_property_cost
@@ -1212,6 +1304,130 @@ def property_cost_api(request, pk):
     return JsonResponse(_get_property_payload(property_obj))
 
 
+@require_GET
+def property_lookup_api(request):
+    """Return one page of apartments of the selected complex.
+
+    Accepts ``complex_id`` and optional ``building_id``, ``q`` (start of
+    the apartment number) and ``page``. Responses carry an ETag, so the
+    browser revalidates repeated lookups without a new payload.
+    """
+    complex_id = _parse_lookup_id(request.GET.get('complex_id'))
+    if complex_id is None:
+        return JsonResponse({'error': 'Invalid complex_id.'}, status=400)
+
+    building_id = None
+    if request.GET.get('building_id'):
+        building_id = _parse_lookup_id(request.GET['building_id'])
+        if building_id is None:
+            return JsonResponse({'error': 'Invalid building_id.'}, status=400)
+
+    page = 1
+    if request.GET.get('page'):
+        page = _parse_lookup_id(request.GET['page'])
+        if page is None:
+            return JsonResponse({'error': 'Invalid page.'}, status=400)
+
+    query = request.GET.get('q', '').strip()
+    properties = Property.objects.filter(
+        building__real_estate_complex_id=complex_id
+    )
+    if building_id is not None:
+        properties = properties.filter(building_id=building_id)
+    if query:
+        properties = properties.filter(apartment_number__istartswith=query)
+
+    etag = _get_property_lookup_etag(
+        complex_id,
+        properties,
+        (complex_id, building_id, query, page),
+    )
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        offset = (page - 1) * PROPERTY_LOOKUP_PAGE_SIZE
+        page_properties = list(
+            properties.select_related(
+                'building__real_estate_complex__district',
+            ).order_by('building_id', 'apartment_number', 'id')[
+                offset:offset + PROPERTY_LOOKUP_PAGE_SIZE + 1
+            ]
+        )
+        response = JsonResponse(
+            {
+                'results': [
+                    _get_property_payload(property_obj)
+                    for property_obj in (
+                        page_properties[:PROPERTY_LOOKUP_PAGE_SIZE]
+                    )
+                ],
+                'page': page,
+                'has_next': len(page_properties) > PROPERTY_LOOKUP_PAGE_SIZE,
+            }
+        )
+
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+@require_GET
+def scenario_grid_api(request):
+    """Return market mortgage results for every combination of ranges."""
+    form = MortgageScenarioGridForm(request.GET)
+    if not form.is_valid():
+        return JsonResponse(
+            {
+                'errors': {
+                    field_name: [str(error) for error in errors]
+                    for field_name, errors in form.errors.items()
+                },
+            },
+            status=400,
+        )
+
+    data = form.cleaned_data
+    grid = calculate_mortgage_scenario_grid(
+        property_cost=data['property_cost'],
+        initial_payment_date=data['initial_payment_date'],
+        annual_rates=data['annual_rate'],
+        mortgage_terms=data['mortgage_term'],
+        initial_payment_percents=data['initial_payment_percent'],
+        grace_period_terms=data['grace_period_term'],
+        grace_period_rates=data['grace_period_rate'],
+    )
+    return JsonResponse(
+        {
+            'axes': {
+                axis_name: [
+                    _decimal_to_json_value(value)
+                    if isinstance(value, decimal.Decimal)
+                    else value
+                    for value in axis_values
+                ]
+                for axis_name, axis_values in grid.axes.items()
+            },
+            'shape': list(grid.shape),
+            'results': [
+                {
+                    'annual_rate': _decimal_to_json_value(
+                        inputs['annual_rate']
+                    ),
+                    'mortgage_term': inputs['mortgage_term'],
+                    'initial_payment_percent': _decimal_to_json_value(
+                        inputs['initial_payment_percent']
+                    ),
+                    'grace_period_term': inputs['grace_period_term'],
+                    'grace_period_rate': _decimal_to_json_value(
+                        inputs['grace_period_rate']
+                    ),
+                    **result,
+                }
+                for inputs, result in grid.iter_results()
+            ],
+        }
+    )
+
+
 @login_required
 def calculation_list(request):
     """Список всех расчетов"""
@@ -1288,10 +1504,51 @@ def calculation_list(request):
                 request,
                 excluded_fields=('timestamp',),
             ),
+            'max_bulk_excel_calculations': MAX_BULK_EXCEL_CALCULATIONS,
         },
     )
 
 
+@login_required
+def calculation_list_export(request):
+    """Выгрузка отфильтрованных расчетов в одну книгу Excel."""
+    calculations = _filter_private_queryset_for_user(
+        MortgageCalculation.objects.select_related(
+            'property',
+            'property__layout',
+            'property__decoration',
+            'property__building',
+            'property__building__real_estate_complex',
+            'property__building__real_estate_complex__developer',
+            'property__building__real_estate_complex__district',
+            'property__building__real_estate_complex__district__city',
+            'stored_schedule',
+        ),
+        request.user,
+    )
+    selected_values = request.GET.getlist('calculations')
+    if selected_values:
+        # Нечисловые идентификаторы отбрасываются, а не приводят к ошибке.
+        selected_ids = [
+            int(value) for value in selected_values if value.isdecimal()
+        ]
+        calculations = calculations.filter(pk__in=selected_ids)
+    calculation_sort, calculation_order = get_calculation_sort(request)
+    calculations = apply_calculation_sort(
+        apply_calculation_filters(
+            annotate_calculation_table_values(calculations),
+            get_calculation_filters(request),
+        ),
+        calculation_sort,
+        calculation_order,
+    )[:MAX_BULK_EXCEL_CALCULATIONS]
+
+    if not calculations.exists():
+        messages.info(request, 'Нет расчетов для выгрузки в Excel.')
+        return redirect('mortgage:calculation_list')
+    return export_saved_mortgage_calculations_excel(calculations.iterator())
+
+
 @require_POST
 @login_required
 def calculation_delete(request, pk):
@@ -1319,22 +1576,13 @@ def calculation_detail(request, pk):
         'property__building__real_estate_complex__district',
         'property__building__real_estate_complex__district__city',
         'property__building__real_estate_complex__real_estate_class',
+        'stored_schedule',
     )
     calculation = get_object_or_404(
         _filter_private_queryset_for_user(calculation_queryset, request.user),
         pk=pk,
     )
-    calculator = MortgageCalculator(
-        property_cost=float(calculation.final_property_cost),
-        initial_payment_percent=float(calculation.initial_payment_percent),
-        initial_payment_date=calculation.initial_payment_date,
-        mortgage_term=int(calculation.mortgage_term),
-        annual_rate=float(calculation.annual_rate),
-        has_grace_period=calculation.has_grace_period,
-        grace_period_term=int(calculation.grace_period_term or 0),
-        grace_period_rate=float(calculation.grace_period_rate or 0),
-    )
-    payment_schedule = calculator.get_payment_schedule()
+    payment_schedule = get_calculation_payment_schedule(calculation)
 
     if request.method == 'POST' and request.POST.get('export') == 'market':
         return export_saved_mortgage_calculation_excel(
@@ -1444,8 +1692,8 @@ def _build_saved_trench_calculation_data(calculation):
         'total_loan_amount': float(calculation.total_loan_amount),
         'total_overpayment': float(calculation.total_overpayment),
         'trenches': trenches,
-        'payment_schedule': _build_trench_payment_schedule(
-            trenches, mortgage_end_date
+        'payment_schedule': get_trench_calculation_payment_schedule(
+            calculation, trenches, mortgage_end_date
         ),
     }
 
@@ -1543,7 +1791,9 @@ def trench_calculation_delete(request, pk):
 def trench_calculation_detail(request, pk):
     """Show detailed information about a saved trench mortgage calculation."""
     calculation = get_object_or_404(
-        _get_trench_calculation_queryset(request.user),
+        _get_trench_calculation_queryset(request.user).select_related(
+            'stored_schedule'
+        ),
         pk=pk,
     )
     calculation_data = _build_saved_trench_calculation_data(calculation)
@@ -1,7 +1,9 @@
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime
+from functools import lru_cache, partial
 from io import BytesIO
 from pathlib import Path
 
@@ -13,6 +15,13 @@ from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.opc.constants import RELATIONSHIP_TYPE as RELATIONSHIP_TYPE
 from docx.shared import Inches, Pt, RGBColor
+from docx.table import Table, _Cell
+from docx.text.paragraph import Paragraph
+
+from property.image_derivatives import (
+    REPORT_IMAGE_VARIANT,
+    get_image_derivative_path,
+)
 
 from .excel import (
     _build_property_rows,
@@ -30,6 +39,7 @@ WORD_TEMPLATE_PATH = (
     / 'word_templates'
     / 'mortgage_report_template.docx'
 )
+WORD_SECTION_WORKERS = 4
 COMPLEX_ROW_LABELS = {
     'Город',
     'Район',
@@ -52,6 +62,95 @@ class MortgageWordCalculation:
     program_label: str
 
 
+@dataclass(frozen=True)
+class _TemplateTable:
+    """Исходная таблица Word-шаблона с картой ячеек.
+
+    ``cell_positions`` для каждой строки хранит индексы ``(tr, tc)``
+    ячеек в том виде, как их возвращает ``row.cells``: объединенные
+    ячейки указывают на один и тот же элемент.
+    """
+
+    element: object
+    cell_positions: tuple
+
+
+@dataclass(frozen=True)
+class _WordTemplate:
+    """Разобранный Word-шаблон, общий для всех выгрузок процесса."""
+
+    content: bytes
+    tables: tuple
+
+
+@dataclass(frozen=True)
+class _WordSectionData:
+    """Значения одного раздела отчета, подготовленные до сборки XML.
+
+    Содержит только строки и пути к файлам, поэтому раздел можно
+    собирать в отдельном потоке без обращений к базе данных.
+    """
+
+    complex_values: dict
+    complex_photo_path: object
+    object_values: dict
+    calculation_rows: list
+    calculation_heading: str
+    layout_image_path: object
+    floor_plan_image_path: object
+    window_view_image_path: object
+    include_complex_table: bool = True
+    page_break_before: bool = False
+
+
+@dataclass
+class _WordSection:
+    """Собранные XML-фрагменты раздела и отложенные операции.
+
+    Изображения и ссылки требуют связей в части документа, поэтому
+    добавляются при сборке документа в порядке их появления.
+    """
+
+    elements: list = field(default_factory=list)
+    media_operations: list = field(default_factory=list)
+
+
+class _TemplateTableCells:
+    """Доступ к ячейкам копии таблицы шаблона по готовой карте."""
+
+    def __init__(self, table, cell_positions):
+        """Сохраняет таблицу и карту позиций ее ячеек."""
+        self.table = table
+        self._cell_positions = list(cell_positions)
+        self._row_cells = {}
+
+    @property
+    def row_count(self):
+        """Возвращает количество строк таблицы."""
+        return len(self._cell_positions)
+
+    def row(self, row_number):
+        """Возвращает ячейки строки с учетом объединений."""
+        if row_number not in self._row_cells:
+            row_elements = self.table._tbl.tr_lst
+            self._row_cells[row_number] = [
+                _Cell(row_elements[tr_index].tc_lst[tc_index], self.table)
+                for tr_index, tc_index in self._cell_positions[row_number]
+            ]
+        return self._row_cells[row_number]
+
+    def add_row(self):
+        """Добавляет строку с отдельными ячейками в конец таблицы."""
+        row = self.table.add_row()
+        row_index = len(self._cell_positions)
+        self._cell_positions.append(
+            tuple(
+                (row_index, tc_index)
+                for tc_index in range(len(row._tr.tc_lst))
+            )
+        )
+
+
 def export_mortgage_word(report_data):
     """Формирует HTTP-ответ с Word-файлом ипотечного расчета."""
     document = _build_market_mortgage_document(report_data)
@@ -144,65 +243,115 @@ def _build_trench_mortgage_document(calculation):
 
 
 def _build_customer_mortgage_document(calculations):
-    """Create a grouped Word document for customer selected calculations."""
+    """Create a grouped Word document for customer selected calculations.
+
+    Sections for property groups are built from template table copies
+    in a thread pool and appended to the document in one pass.
+    """
     document = _create_template_document()
     if not calculations:
         _clear_document_body(document)
         return document
 
-    if len(document.tables) < 3:
+    template = _load_word_template()
+    if not template.tables:
         _populate_customer_fallback_document(document, calculations)
         return document
 
-    template_tables = [
-        deepcopy(table._tbl)
-        for table in document.tables[:3]
-    ]
-    grouped_calculations = _group_word_calculations(calculations)
+    section_data = _build_customer_section_data(
+        _group_word_calculations(calculations)
+    )
     _clear_document_body(document)
+    build_section = partial(
+        _build_customer_word_section,
+        template,
+        document._body,
+    )
+    if len(section_data) == 1:
+        sections = [build_section(section_data[0])]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(WORD_SECTION_WORKERS, len(section_data))
+        ) as executor:
+            sections = list(executor.map(build_section, section_data))
 
-    is_first_complex = True
-    for complex_group in grouped_calculations:
-        if not is_first_complex:
-            _append_page_break(document)
-        is_first_complex = False
+    _append_word_sections(document, sections)
+    return document
 
-        first_property_group = complex_group['property_groups'][0]
-        complex_table = _append_template_table(
-            document,
-            template_tables[0],
-        )
-        _populate_complex_table(
-            complex_table,
-            first_property_group['property_obj'],
-            first_property_group['template_rows']['complex_rows'],
-        )
 
+def _build_customer_section_data(grouped_calculations):
+    """Return prepared section values in document order."""
+    section_data = []
+    for complex_group in grouped_calculations:
         for property_index, property_group in enumerate(
             complex_group['property_groups']
         ):
-            if property_index > 0:
-                _append_page_break(document)
-            _append_customer_property_tables(
-                document,
-                template_tables,
-                property_group,
+            section_data.append(
+                _build_word_section_data(
+                    property_group['property_obj'],
+                    property_group['template_rows'],
+                    property_group['calculation_heading'],
+                    include_complex_table=property_index == 0,
+                    page_break_before=bool(section_data),
+                )
             )
+    return section_data
+
+
+def _build_customer_word_section(template, parent, data):
+    """Build filled table copies for one property group section."""
+    section = _WordSection()
+    if data.page_break_before:
+        section.elements.append(_create_page_break_element(parent))
+    if data.include_complex_table:
+        _fill_complex_table(
+            _append_section_table(section, template.tables[0], parent),
+            section,
+            data,
+        )
+    object_cells = _append_section_table(section, template.tables[1], parent)
+    image_cells = _append_section_table(section, template.tables[2], parent)
+    _fill_object_and_calculation_table(object_cells, section, data)
+    _fill_image_table(image_cells, section, data)
+    return section
+
+
+def _append_section_table(section, template_table, parent):
+    """Append a template table copy and a separator to the section."""
+    table_element = deepcopy(template_table.element)
+    section.elements.append(table_element)
+    section.elements.append(OxmlElement('w:p'))
+    return _TemplateTableCells(
+        Table(table_element, parent),
+        template_table.cell_positions,
+    )
 
-    return document
 
+def _append_word_sections(document, sections):
+    """Append built sections to the document body in a single pass."""
+    body = document._element.body
+    section_properties = body.find(qn('w:sectPr'))
+    for section in sections:
+        for element in section.elements:
+            if section_properties is None:
+                body.append(element)
+            else:
+                section_properties.addprevious(element)
+    for section in sections:
+        _apply_media_operations(section)
 
-def _append_customer_property_tables(document, template_tables, property_group):
-    """Append and fill object, calculation and image tables."""
-    object_table = _append_template_table(document, template_tables[1])
-    image_table = _append_template_table(document, template_tables[2])
-    _populate_object_and_calculation_table(
-        object_table,
-        property_group['property_obj'],
-        property_group['template_rows'],
-        property_group['calculation_heading'],
-    )
-    _populate_image_table(image_table, property_group['property_obj'])
+
+def _apply_media_operations(section):
+    """Run deferred image and hyperlink insertions in their order."""
+    for operation in section.media_operations:
+        operation()
+
+
+def _create_page_break_element(parent):
+    """Return a detached paragraph element with a page break."""
+    paragraph = Paragraph(OxmlElement('w:p'), parent)
+    paragraph.add_run().add_break(WD_BREAK.PAGE)
+    return paragraph._p
 
 
 def _populate_customer_fallback_document(document, calculations):
@@ -317,33 +466,6 @@ def _get_word_property_key(property_obj):
     return ('property', property_obj.pk)
 
 
-def _append_template_table(document, table_element):
-    """Append a cloned template table to the document body."""
-    cloned_table = deepcopy(table_element)
-    _append_body_element(document, cloned_table)
-    _append_table_separator_paragraph(document)
-    return document.tables[-1]
-
-
-def _append_table_separator_paragraph(document):
-    """Append an empty paragraph so Word keeps adjacent tables separate."""
-    _append_body_element(document, OxmlElement('w:p'))
-
-
-def _append_body_element(document, element):
-    """Append a body XML element before section properties."""
-    body = document._element.body
-    section_properties = None
-    for child in body:
-        if child.tag == qn('w:sectPr'):
-            section_properties = child
-            break
-    if section_properties is None:
-        body.append(element)
-    else:
-        section_properties.addprevious(element)
-
-
 def _append_page_break(document):
     """Append a page break to the document."""
     paragraph = document.add_paragraph()
@@ -353,11 +475,44 @@ def _append_page_break(document):
 
 def _create_template_document():
     """Создает пустой документ на основе приложенного Word-шаблона."""
-    document = Document(str(WORD_TEMPLATE_PATH))
+    document = Document(BytesIO(_load_word_template().content))
     _apply_document_defaults(document)
     return document
 
 
+@lru_cache(maxsize=1)
+def _load_word_template():
+    """Читает Word-шаблон и карту ячеек его таблиц один раз на процесс.
+
+    Если в шаблоне меньше трех таблиц, список таблиц пуст и отчеты
+    строятся в резервном табличном виде.
+    """
+    content = WORD_TEMPLATE_PATH.read_bytes()
+    document = Document(BytesIO(content))
+    tables = ()
+    if len(document.tables) >= 3:
+        tables = tuple(
+            _build_template_table(table) for table in document.tables[:3]
+        )
+    return _WordTemplate(content=content, tables=tables)
+
+
+def _build_template_table(table):
+    """Сохраняет исходный XML таблицы и индексы ее ячеек."""
+    tc_positions = {}
+    for tr_index, tr in enumerate(table._tbl.tr_lst):
+        for tc_index, tc in enumerate(tr.tc_lst):
+            tc_positions[tc] = (tr_index, tc_index)
+    cell_positions = tuple(
+        tuple(tc_positions[cell._tc] for cell in row.cells)
+        for row in table.rows
+    )
+    return _TemplateTable(
+        element=deepcopy(table._tbl),
+        cell_positions=cell_positions,
+    )
+
+
 def _apply_document_defaults(document):
     """Настраивает базовый шрифт, не меняя геометрию шаблона."""
     normal_style = document.styles['Normal']
@@ -372,7 +527,8 @@ def _populate_template_document(
     calculation_heading,
 ):
     """Заполняет приложенный Word-шаблон данными расчета."""
-    if len(document.tables) < 3:
+    template = _load_word_template()
+    if not template.tables:
         _populate_fallback_document(
             document,
             template_rows,
@@ -380,18 +536,55 @@ def _populate_template_document(
         )
         return
 
-    _populate_complex_table(
-        document.tables[0],
-        property_obj,
-        template_rows['complex_rows'],
-    )
-    _populate_object_and_calculation_table(
-        document.tables[1],
+    data = _build_word_section_data(
         property_obj,
         template_rows,
         calculation_heading,
     )
-    _populate_image_table(document.tables[2], property_obj)
+    section = _WordSection()
+    table_cells = [
+        _TemplateTableCells(table, template_table.cell_positions)
+        for table, template_table in zip(document.tables, template.tables)
+    ]
+    _fill_complex_table(table_cells[0], section, data)
+    _fill_object_and_calculation_table(table_cells[1], section, data)
+    _fill_image_table(table_cells[2], section, data)
+    _apply_media_operations(section)
+
+
+def _build_word_section_data(
+    property_obj,
+    template_rows,
+    calculation_heading,
+    include_complex_table=True,
+    page_break_before=False,
+):
+    """Подготавливает значения раздела отчета для сборки шаблона."""
+    complex_photo = None
+    layout_image = None
+    floor_plan_image = None
+    window_view_image = None
+    if property_obj is not None:
+        complex_photo = property_obj.building.real_estate_complex.photo
+        layout_image = property_obj.layout_image
+        floor_plan_image = property_obj.floor_plan_image
+        window_view_image = property_obj.window_view_image
+
+    return _WordSectionData(
+        complex_values=_build_complex_template_values(
+            property_obj,
+            template_rows['complex_rows'],
+        ),
+        complex_photo_path=_get_report_image_path(complex_photo),
+        object_values=dict(template_rows['object_rows']),
+        calculation_rows=template_rows['calculation_rows'],
+        calculation_heading=calculation_heading,
+        layout_image_path=_get_report_image_path(layout_image),
+        floor_plan_image_path=_get_report_image_path(floor_plan_image),
+        window_view_image_path=_get_report_image_path(window_view_image),
+        include_complex_table=include_complex_table,
+        page_break_before=page_break_before,
+    )
 
 
 def _populate_fallback_document(
@@ -432,54 +625,43 @@ def _clear_document_body(document):
             body.remove(child)
 
 
-def _populate_complex_table(table, property_obj, fallback_complex_rows):
+def _fill_complex_table(table_cells, section, data):
     """Заполняет верхний блок шаблона данными ЖК."""
-    complex_values = _build_complex_template_values(
-        property_obj,
-        fallback_complex_rows,
-    )
-    for row_number, label in enumerate(
-        complex_values.keys()
-    ):
-        if row_number >= len(table.rows):
+    for row_number, label in enumerate(data.complex_values.keys()):
+        if row_number >= table_cells.row_count:
             break
-        _set_cell_plain_text(table.rows[row_number].cells[0], label)
+        row_cells = table_cells.row(row_number)
+        _set_cell_plain_text(row_cells[0], label)
         if label == 'Ссылка на карту ЖК':
-            _set_cell_hyperlink(
-                table.rows[row_number].cells[1],
-                complex_values.get(label, ''),
-                'Открыть карту ЖК',
+            section.media_operations.append(
+                partial(
+                    _set_cell_hyperlink,
+                    row_cells[1],
+                    data.complex_values.get(label, ''),
+                    'Открыть карту ЖК',
+                )
             )
         else:
             _set_cell_plain_text(
-                table.rows[row_number].cells[1],
-                complex_values.get(label, ''),
+                row_cells[1],
+                data.complex_values.get(label, ''),
             )
 
-    if len(table.rows[0].cells) > 2:
+    first_row_cells = table_cells.row(0)
+    if len(first_row_cells) > 2:
         _replace_cell_image(
-            table.rows[0].cells[2],
-            (
-                property_obj.building.real_estate_complex.photo
-                if property_obj is not None
-                else None
-            ),
+            section,
+            first_row_cells[2],
+            data.complex_photo_path,
             Inches(2.25),
         )
 
 
-
-def _populate_object_and_calculation_table(
-    table,
-    property_obj,
-    template_rows,
-    calculation_heading,
-):
+def _fill_object_and_calculation_table(table_cells, section, data):
     """Заполняет блок объекта и результата расчета в шаблоне."""
-    object_values = dict(template_rows['object_rows'])
-    calculation_rows = template_rows['calculation_rows']
+    calculation_rows = data.calculation_rows
     _set_cell_plain_text(
-        table.rows[0].cells[0],
+        table_cells.row(0)[0],
         'Параметры объекта недвижимости',
     )
 
@@ -495,72 +677,90 @@ def _populate_object_and_calculation_table(
         'Стоимость',
     ]
     for row_number, label in enumerate(object_labels, start=1):
-        if row_number >= len(table.rows):
+        if row_number >= table_cells.row_count:
             break
-        _set_cell_plain_text(table.rows[row_number].cells[0], label)
+        row_cells = table_cells.row(row_number)
+        _set_cell_plain_text(row_cells[0], label)
         _set_cell_plain_text(
-            table.rows[row_number].cells[1],
-            object_values.get(label, ''),
+            row_cells[1],
+            data.object_values.get(label, ''),
         )
 
-    if len(table.rows) > 10:
-        _set_cell_plain_text(table.rows[10].cells[0], calculation_heading)
+    if table_cells.row_count > 10:
+        _set_cell_plain_text(
+            table_cells.row(10)[0],
+            data.calculation_heading,
+        )
 
     _ensure_distinct_value_rows(
-        table,
+        table_cells,
         start_row=11,
         needed_count=len(calculation_rows),
     )
-    available_rows = _get_distinct_value_row_numbers(table, start_row=11)
+    available_rows = _get_distinct_value_row_numbers(
+        table_cells,
+        start_row=11,
+    )
     for row_number, row_data in zip(available_rows, calculation_rows):
         label, value = row_data
-        _set_cell_plain_text(table.rows[row_number].cells[0], label)
-        _set_cell_plain_text(table.rows[row_number].cells[1], value)
+        row_cells = table_cells.row(row_number)
+        _set_cell_plain_text(row_cells[0], label)
+        _set_cell_plain_text(row_cells[1], value)
 
-    for row_number in range(11, len(table.rows)):
+    for row_number in range(11, table_cells.row_count):
         if row_number in available_rows[:len(calculation_rows)]:
             continue
-        _clear_table_row_text(table.rows[row_number], keep_image_cells=True)
+        _clear_table_row_text(
+            table_cells.row(row_number),
+            keep_image_cells=True,
+        )
 
-    if len(table.rows[0].cells) > 2:
+    if len(table_cells.row(0)) > 2:
         _replace_cell_image(
-            table.rows[1].cells[2],
-            property_obj.layout_image if property_obj is not None else None,
+            section,
+            table_cells.row(1)[2],
+            data.layout_image_path,
             Inches(2.35),
         )
 
 
-def _populate_image_table(table, property_obj):
+def _fill_image_table(table_cells, section, data):
     """Заполняет нижний блок изображений объекта."""
-    if len(table.rows) < 2:
+    if table_cells.row_count < 2:
         return
 
+    row_cells = table_cells.row(1)
     _replace_cell_image(
-        table.rows[1].cells[0],
-        property_obj.floor_plan_image if property_obj is not None else None,
+        section,
+        row_cells[0],
+        data.floor_plan_image_path,
         Inches(3.1),
     )
     _replace_cell_image(
-        table.rows[1].cells[1],
-        property_obj.window_view_image if property_obj is not None else None,
+        section,
+        row_cells[1],
+        data.window_view_image_path,
         Inches(3.1),
     )
 
 
-def _get_distinct_value_row_numbers(table, start_row):
+def _get_distinct_value_row_numbers(table_cells, start_row):
     """Возвращает строки с отдельными ячейками подписи и значения."""
     row_numbers = []
-    for row_number in range(start_row, len(table.rows)):
-        cells = table.rows[row_number].cells
+    for row_number in range(start_row, table_cells.row_count):
+        cells = table_cells.row(row_number)
         if len(cells) > 1 and cells[0]._tc is not cells[1]._tc:
             row_numbers.append(row_number)
     return row_numbers
 
 
-def _ensure_distinct_value_rows(table, start_row, needed_count):
+def _ensure_distinct_value_rows(table_cells, start_row, needed_count):
     """Добавляет строки, если в шаблоне их недостаточно для расчета."""
-    while len(_get_distinct_value_row_numbers(table, start_row)) < needed_count:
-        table.add_row()
+    distinct_row_count = len(
+        _get_distinct_value_row_numbers(table_cells, start_row)
+    )
+    for _ in range(needed_count - distinct_row_count):
+        table_cells.add_row()
 
 
 def _build_complex_template_values(property_obj, fallback_complex_rows=None):
@@ -942,18 +1142,21 @@ def _normalize_url(url):
     return f'https://{url}'
 
 
-def _clear_table_row_text(row, keep_image_cells=False):
+def _clear_table_row_text(row_cells, keep_image_cells=False):
     """Очищает текстовые ячейки строки."""
-    for cell in row.cells:
+    for cell in row_cells:
         if keep_image_cells and _cell_has_drawing(cell):
             continue
         _set_cell_plain_text(cell, '')
 
 
-def _replace_cell_image(cell, image_field, width):
-    """Заменяет изображение в ячейке или очищает ее."""
+def _replace_cell_image(section, cell, image_path, width):
+    """Заменяет изображение в ячейке или очищает ее.
+
+    Вставка картинки откладывается до сборки документа, где доступна
+    его часть со связями изображений.
+    """
     _clear_cell_content(cell)
-    image_path = _get_image_path(image_field)
     if image_path is None:
         cell.add_paragraph()
         return
@@ -961,7 +1164,17 @@ def _replace_cell_image(cell, image_field, width):
     paragraph = cell.add_paragraph()
     paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = paragraph.add_run()
-    run.add_picture(str(image_path), width=width)
+    section.media_operations.append(
+        partial(run.add_picture, str(image_path), width=width)
+    )
+
+
+def _get_report_image_path(image_field):
+    """Возвращает путь к уменьшенной копии изображения для отчета."""
+    image_path = get_image_derivative_path(image_field, REPORT_IMAGE_VARIANT)
+    if image_path is not None and image_path.exists():
+        return image_path
+    return _get_image_path(image_field)
 
 
 def _get_image_path(image_field):
@@ -1,9 +1,24 @@
+import base64
+import binascii
+import hashlib
+import json
+import zlib
+from functools import wraps
+
 from django.conf import settings
-from django.http import JsonResponse
+from django.db import connection, transaction
+from django.db.models import Count, Max, Q
+from django.http import JsonResponse, StreamingHttpResponse
 from django.urls import path
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date, quote_etag
 from django.views.decorators.http import require_GET
 
-from location.models import City, District
+from location.models import City, District, Region
 
 from .models import RealEstateComplex, RealEstateComplexBuilding
 
@@ -18,6 +33,15 @@ COMPLEX_API_FIELDS = (
     'district__city__region_id',
 )
 BUILDING_API_FIELDS = ('id', 'number', 'real_estate_complex_id')
+CATALOG_SNAPSHOT_SECTIONS = (
+    ('region', Region, ('id', 'name', 'code')),
+    ('city', City, ('id', 'name', 'region_id')),
+    ('district', District, ('id', 'name', 'city_id')),
+    ('complex', RealEstateComplex, COMPLEX_API_FIELDS),
+    ('building', RealEstateComplexBuilding, BUILDING_API_FIELDS),
+)
+CATALOG_SNAPSHOT_CHUNK_SIZE = 2000
+CATALOG_SNAPSHOT_FLUSH_SIZE = 64 * 1024
 
 
 def get_public_catalog_api_limit():
@@ -25,6 +49,96 @@ def get_public_catalog_api_limit():
     return getattr(settings, 'PUBLIC_CATALOG_API_MAX_RESULTS', 200)
 
 
+def get_public_catalog_api_max_age():
+    """Return how long clients may reuse public catalog API responses."""
+    return getattr(settings, 'PUBLIC_CATALOG_API_CACHE_MAX_AGE', 60)
+
+
+def get_catalog_state(models):
+    """Return the newest update time and row count of each model table."""
+    return [
+        model.objects.aggregate(
+            updated_at=Max('updated_at'),
+            count=Count('pk'),
+        )
+        for model in models
+    ]
+
+
+def get_catalog_validators(request, models, etag_suffix=''):
+    """Return the ETag and Last-Modified timestamp for a catalog request.
+
+    Validators depend on the query string and on the state of every
+    table the response reads, so any insert, update or delete there
+    produces a new ETag. The suffix tells apart representations that
+    differ in bytes, such as the gzip-encoded snapshot.
+    """
+    state = get_catalog_state(models)
+    updated_at_values = [
+        table_state['updated_at']
+        for table_state in state
+        if table_state['updated_at'] is not None
+    ]
+    last_modified = (
+        int(max(updated_at_values).timestamp()) if updated_at_values else None
+    )
+    etag_source = repr((sorted(request.GET.lists()), state))
+    etag_hash = hashlib.sha256(etag_source.encode('utf-8')).hexdigest()
+    etag = quote_etag(etag_hash[:32] + etag_suffix)
+    return etag, last_modified
+
+
+def accepts_gzip(request):
+    """Return whether the client accepts a gzip-encoded response."""
+    return 'gzip' in request.headers.get('Accept-Encoding', '')
+
+
+def catalog_conditional_get(*models, public=True, gzip_variant=False):
+    """Answer unchanged catalog requests with 304 Not Modified.
+
+    Successful responses get ETag, Last-Modified and Cache-Control
+    headers, so browsers and proxies can revalidate them without
+    running the catalog query. Responses for signed-in users only are
+    marked private. Views that compress their own body pass
+    ``gzip_variant``, so the gzip representation gets its own ETag.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapped_view(request, *args, **kwargs):
+            etag_suffix = (
+                '-gzip' if gzip_variant and accepts_gzip(request) else ''
+            )
+            etag, last_modified = get_catalog_validators(
+                request,
+                models,
+                etag_suffix,
+            )
+            response = get_conditional_response(
+                request,
+                etag=etag,
+                last_modified=last_modified,
+            )
+            if response is None:
+                response = view(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+            patch_cache_control(
+                response,
+                max_age=get_public_catalog_api_max_age(),
+                **{'public' if public else 'private': True},
+            )
+            return response
+
+        return wrapped_view
+
+    return decorator
+
+
 def parse_positive_integer_param(request, name):
     """Return a positive integer query parameter or an error response."""
     value = request.GET.get(name)
@@ -48,15 +162,117 @@ def parse_positive_integer_param(request, name):
     return parsed_value, None
 
 
-def limited_json_response(queryset):
-    """Return a bounded JSON response for public selector endpoints."""
-    return JsonResponse(
-        list(queryset[:get_public_catalog_api_limit()]),
-        safe=False,
+def encode_catalog_cursor(sort_value, pk):
+    """Encode the last returned sort value and id as an opaque cursor."""
+    payload = json.dumps([sort_value, pk], ensure_ascii=False)
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def decode_catalog_cursor(cursor):
+    """Decode a cursor into a sort value and id or return None."""
+    try:
+        sort_value, pk = json.loads(
+            base64.urlsafe_b64decode(cursor.encode('ascii'))
+        )
+    except (binascii.Error, UnicodeError, TypeError, ValueError):
+        return None
+
+    if not isinstance(sort_value, str) or not isinstance(pk, int):
+        return None
+    return sort_value, pk
+
+
+def paginated_json_response(request, queryset, sort_field, fields):
+    """Return one keyset page of a public selector endpoint.
+
+    Rows are ordered by ``(sort_field, id)``. When more rows follow,
+    the cursor of the next page is returned in the ``X-Next-Cursor``
+    header and as a ``Link: rel="next"`` URL; the body stays a list.
+    """
+    limit, error_response = parse_positive_integer_param(request, 'limit')
+    if error_response:
+        return error_response
+    max_results = get_public_catalog_api_limit()
+    limit = min(limit or max_results, max_results)
+
+    cursor = request.GET.get('cursor')
+    if cursor:
+        cursor_values = decode_catalog_cursor(cursor)
+        if cursor_values is None:
+            return JsonResponse({'error': 'Invalid cursor.'}, status=400)
+        sort_value, pk = cursor_values
+        queryset = queryset.filter(
+            Q(**{f'{sort_field}__gt': sort_value})
+            | Q(**{sort_field: sort_value, 'pk__gt': pk})
+        )
+
+    rows = list(
+        queryset.order_by(sort_field, 'pk').values(*fields)[:limit + 1]
     )
+    response = JsonResponse(rows[:limit], safe=False)
+    if len(rows) > limit:
+        last_row = rows[limit - 1]
+        next_cursor = encode_catalog_cursor(
+            last_row[sort_field],
+            last_row['id'],
+        )
+        query_params = request.GET.copy()
+        query_params['cursor'] = next_cursor
+        next_url = request.build_absolute_uri(
+            f'{request.path}?{query_params.urlencode()}'
+        )
+        response['X-Next-Cursor'] = next_cursor
+        response['Link'] = f'<{next_url}>; rel="next"'
+    return response
+
+
+def iter_catalog_snapshot_lines():
+    """Yield the location and complex tree as NDJSON lines.
+
+    Parents come before children: regions, cities, districts, complexes
+    and buildings, each section ordered by id and read in chunks. All
+    sections are read in one transaction, on PostgreSQL with REPEATABLE
+    READ isolation, so a child never refers to a parent that was
+    deleted or not yet committed when an earlier section was read.
+    """
+    in_transaction = connection.in_atomic_block
+    with transaction.atomic():
+        if not in_transaction and connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SET TRANSACTION ISOLATION LEVEL REPEATABLE READ'
+                )
+        for record_type, model, fields in CATALOG_SNAPSHOT_SECTIONS:
+            rows = model.objects.order_by('pk').values(*fields)
+            for row in rows.iterator(
+                chunk_size=CATALOG_SNAPSHOT_CHUNK_SIZE
+            ):
+                yield json.dumps(
+                    {'type': record_type, **row},
+                    ensure_ascii=False,
+                ) + '\n'
+
+
+def iter_gzip_chunks(lines):
+    """Compress text lines into a gzip stream of bounded chunks."""
+    compressor = zlib.compressobj(wbits=31)
+    buffer = []
+    buffer_size = 0
+    for line in lines:
+        data = line.encode('utf-8')
+        buffer.append(data)
+        buffer_size += len(data)
+        if buffer_size >= CATALOG_SNAPSHOT_FLUSH_SIZE:
+            chunk = compressor.compress(b''.join(buffer))
+            buffer = []
+            buffer_size = 0
+            if chunk:
+                yield chunk
+    yield compressor.compress(b''.join(buffer)) + compressor.flush()
 
 
 @require_GET
+@catalog_conditional_get(City)
 def cities_api(request):
     """Return cities for a selected region."""
     region_id, error_response = parse_positive_integer_param(
@@ -70,12 +286,16 @@ def cities_api(request):
     if region_id is not None:
         cities = City.objects.filter(region_id=region_id)
 
-    return limited_json_response(
-        cities.order_by('name').values(*CITY_API_FIELDS)
+    return paginated_json_response(
+        request,
+        cities,
+        'name',
+        CITY_API_FIELDS,
     )
 
 
 @require_GET
+@catalog_conditional_get(District)
 def districts_api(request):
     """Return districts for a selected city."""
     city_id, error_response = parse_positive_integer_param(
@@ -89,12 +309,16 @@ def districts_api(request):
     if city_id is not None:
         districts = District.objects.filter(city_id=city_id)
 
-    return limited_json_response(
-        districts.order_by('name').values(*DISTRICT_API_FIELDS)
+    return paginated_json_response(
+        request,
+        districts,
+        'name',
+        DISTRICT_API_FIELDS,
     )
 
 
 @require_GET
+@catalog_conditional_get(RealEstateComplex, District, City)
 def complexes_api(request):
     """Return complexes for selected public catalog filters."""
     region_id, error_response = parse_positive_integer_param(
@@ -140,12 +364,16 @@ def complexes_api(request):
     elif region_id:
         complexes = complexes.filter(district__city__region_id=region_id)
 
-    return limited_json_response(
-        complexes.order_by('name').values(*COMPLEX_API_FIELDS)
+    return paginated_json_response(
+        request,
+        complexes,
+        'name',
+        COMPLEX_API_FIELDS,
     )
 
 
 @require_GET
+@catalog_conditional_get(RealEstateComplexBuilding)
 def buildings_api(request):
     """Return buildings for a selected complex."""
     complex_id, error_response = parse_positive_integer_param(
@@ -161,9 +389,43 @@ def buildings_api(request):
             real_estate_complex_id=complex_id
         )
 
-    return limited_json_response(
-        buildings.order_by('number').values(*BUILDING_API_FIELDS)
+    return paginated_json_response(
+        request,
+        buildings,
+        'number',
+        BUILDING_API_FIELDS,
+    )
+
+
+@require_GET
+def catalog_snapshot_api(request):
+    """Stream the whole location and complex tree for integrations."""
+    if not request.user.is_authenticated:
+        return JsonResponse({'error': 'Authentication required.'}, status=401)
+    return catalog_snapshot_response(request)
+
+
+@catalog_conditional_get(
+    Region,
+    City,
+    District,
+    RealEstateComplex,
+    RealEstateComplexBuilding,
+    public=False,
+    gzip_variant=True,
+)
+def catalog_snapshot_response(request):
+    """Return the NDJSON snapshot, gzip-compressed when accepted."""
+    lines = iter_catalog_snapshot_lines()
+    compress = accepts_gzip(request)
+    response = StreamingHttpResponse(
+        iter_gzip_chunks(lines) if compress else lines,
+        content_type='application/x-ndjson; charset=utf-8',
     )
+    if compress:
+        response['Content-Encoding'] = 'gzip'
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
 
 
 urlpatterns = [
@@ -171,4 +433,9 @@ urlpatterns = [
     path('districts/', districts_api, name='districts_api'),
     path('complexes/', complexes_api, name='complexes_api'),
     path('buildings/', buildings_api, name='buildings_api'),
+    path(
+        'catalog/snapshot/',
+        catalog_snapshot_api,
+        name='catalog_snapshot_api',
+    ),
 ]
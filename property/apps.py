@@ -22,17 +22,29 @@ class PropertyConfig(AppConfig):
     verbose_name = 'Недвижимость'
 
     def ready(self):
-        """Register cache invalidation hooks for location payloads."""
+        """Register cache invalidation and image derivative hooks."""
         from django.db.models.signals import post_delete, post_save
 
         from location.models import City, District, Metro
 
+        from .image_derivatives import generate_model_image_derivatives
         from .models import (
             Developer,
+            Property,
             RealEstateComplex,
             RealEstateComplexBuilding,
         )
 
+        for model in (Property, RealEstateComplex):
+            post_save.connect(
+                generate_model_image_derivatives,
+                sender=model,
+                dispatch_uid=(
+                    'property.generate_model_image_derivatives.'
+                    f'{model._meta.label}'
+                ),
+            )
+
         for model in (
             City,
             Developer,
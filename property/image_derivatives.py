@@ -0,0 +1,228 @@
+import hashlib
+import posixpath
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+
+from django.core.files.base import ContentFile
+from django.db import models
+from PIL import Image, ImageOps
+
+IMAGE_DERIVATIVE_DIRECTORY = 'derivatives'
+IMAGE_HASH_LENGTH = 32
+REPORT_IMAGE_VARIANT = 'report'
+THUMBNAIL_IMAGE_VARIANT = 'thumbnail'
+
+
+@dataclass(frozen=True)
+class ImageVariant:
+    """Параметры производного изображения."""
+
+    max_size: tuple
+    format: str
+    extension: str
+    quality: int
+
+
+IMAGE_VARIANTS = {
+    # Word вставляет изображения шириной до 3,1 дюйма: 1200 пикселей
+    # хватает для печати с запасом.
+    REPORT_IMAGE_VARIANT: ImageVariant(
+        max_size=(1200, 1200),
+        format='JPEG',
+        extension='.jpg',
+        quality=85,
+    ),
+    THUMBNAIL_IMAGE_VARIANT: ImageVariant(
+        max_size=(640, 640),
+        format='WEBP',
+        extension='.webp',
+        quality=80,
+    ),
+}
+IMAGE_DERIVATIVE_ERRORS = (OSError, ValueError, Image.DecompressionBombError)
+
+
+def get_image_derivative_name(image_field, variant_name):
+    """Возвращает имя производного изображения в хранилище.
+
+    Имя строится по хешу, сохраненному в модели; если хеша нет,
+    производное изображение создается из исходного файла. Возвращает
+    None для пустого поля и для файлов, которые не удалось прочитать
+    как изображение.
+    """
+    if not image_field:
+        return None
+
+    content_hash = get_stored_image_hash(image_field)
+    if content_hash is not None:
+        if not content_hash:
+            return None
+        return _build_derivative_name(
+            image_field.name,
+            content_hash,
+            variant_name,
+            IMAGE_VARIANTS[variant_name],
+        )
+
+    derivative_names = generate_image_derivatives(
+        image_field,
+        variant_names=(variant_name,),
+    )
+    return derivative_names.get(variant_name)
+
+
+def get_image_derivative_path(image_field, variant_name):
+    """Возвращает локальный путь к производному изображению."""
+    derivative_name = get_image_derivative_name(image_field, variant_name)
+    if derivative_name is None:
+        return None
+
+    try:
+        return Path(image_field.storage.path(derivative_name))
+    except NotImplementedError:
+        return None
+
+
+def get_image_derivative_url(image_field, variant_name):
+    """Возвращает URL производного изображения или исходного файла.
+
+    Файлы не читаются: без сохраненного в модели хеша возвращается
+    URL исходного файла.
+    """
+    if not image_field:
+        return ''
+
+    content_hash = get_stored_image_hash(image_field)
+    if not content_hash:
+        return image_field.url
+    return image_field.storage.url(
+        _build_derivative_name(
+            image_field.name,
+            content_hash,
+            variant_name,
+            IMAGE_VARIANTS[variant_name],
+        )
+    )
+
+
+def get_stored_image_hash(image_field):
+    """Возвращает сохраненный в модели хеш содержимого файла поля.
+
+    Пустая строка означает, что файл не удалось прочитать как
+    изображение; None - что хеша для текущего файла поля нет.
+    """
+    image_hashes = getattr(image_field.instance, 'image_hashes', None) or {}
+    stored_image = image_hashes.get(image_field.field.name)
+    if not stored_image or stored_image.get('name') != image_field.name:
+        return None
+    return stored_image.get('hash', '')
+
+
+def generate_image_derivatives(image_field, variant_names=None):
+    """Создает недостающие производные изображения для файла поля.
+
+    Исходный файл читается один раз на все варианты. Возвращает
+    словарь имен сохраненных вариантов; варианты, которые не удалось
+    построить, в словарь не попадают.
+    """
+    _, derivative_names = _generate_image_derivatives(
+        image_field,
+        variant_names or IMAGE_VARIANTS,
+    )
+    return derivative_names
+
+
+def generate_model_image_derivatives(sender, instance, **kwargs):
+    """Создает производные изображения для измененных файлов модели.
+
+    Хеш содержимого каждого файла сохраняется в ``image_hashes`` вместе
+    с именем файла, поэтому исходный файл читается только после его
+    замены, а шаблоны строят URL без обращения к хранилищу.
+    """
+    image_hashes = {}
+    for model_field in sender._meta.concrete_fields:
+        if not isinstance(model_field, models.ImageField):
+            continue
+        image_field = getattr(instance, model_field.attname)
+        if not image_field:
+            continue
+        content_hash = get_stored_image_hash(image_field)
+        if content_hash is None:
+            content_hash, derivative_names = _generate_image_derivatives(
+                image_field,
+                IMAGE_VARIANTS,
+            )
+            if len(derivative_names) < len(IMAGE_VARIANTS):
+                content_hash = ''
+        image_hashes[model_field.name] = {
+            'name': image_field.name,
+            'hash': content_hash,
+        }
+
+    if image_hashes != instance.image_hashes:
+        instance.image_hashes = image_hashes
+        sender.objects.filter(pk=instance.pk).update(image_hashes=image_hashes)
+
+
+def _generate_image_derivatives(image_field, variant_names):
+    """Создает производные изображения и возвращает хеш и их имена."""
+    if not image_field:
+        return '', {}
+
+    storage = image_field.storage
+    try:
+        with storage.open(image_field.name, 'rb') as image_file:
+            content = image_file.read()
+    except IMAGE_DERIVATIVE_ERRORS:
+        return '', {}
+
+    content_hash = hashlib.sha256(content).hexdigest()[:IMAGE_HASH_LENGTH]
+    derivative_names = {}
+    for variant_name in variant_names:
+        variant = IMAGE_VARIANTS[variant_name]
+        derivative_name = _build_derivative_name(
+            image_field.name,
+            content_hash,
+            variant_name,
+            variant,
+        )
+        if not storage.exists(derivative_name):
+            try:
+                derivative_content = _render_image_variant(content, variant)
+            except IMAGE_DERIVATIVE_ERRORS:
+                continue
+            derivative_name = storage.save(
+                derivative_name,
+                ContentFile(derivative_content),
+            )
+        derivative_names[variant_name] = derivative_name
+    return content_hash, derivative_names
+
+
+def _build_derivative_name(name, content_hash, variant_name, variant):
+    """Возвращает имя производного изображения рядом с исходным."""
+    return posixpath.join(
+        posixpath.dirname(name),
+        IMAGE_DERIVATIVE_DIRECTORY,
+        f'{content_hash}_{variant_name}{variant.extension}',
+    )
+
+
+def _render_image_variant(content, variant):
+    """Масштабирует изображение и кодирует его в формат варианта."""
+    with Image.open(BytesIO(content)) as source_image:
+        image = ImageOps.exif_transpose(source_image)
+        has_alpha = image.mode in ('RGBA', 'LA', 'PA') or (
+            image.mode == 'P' and 'transparency' in image.info
+        )
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+        image.thumbnail(variant.max_size, Image.Resampling.LANCZOS)
+        if has_alpha and variant.format == 'JPEG':
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            image = background
+
+        output = BytesIO()
+        image.save(output, variant.format, quality=variant.quality)
+    return output.getvalue()
@@ -0,0 +1,33 @@
+"""Build image derivatives for images saved before hashes were stored."""
+
+from django.core.management.base import BaseCommand
+from django.db import models
+
+from property.image_derivatives import generate_model_image_derivatives
+from property.models import Property, RealEstateComplex
+
+
+class Command(BaseCommand):
+    """Store image hashes and derivatives for existing objects."""
+
+    help = (
+        'Build image derivatives for properties and complexes and store '
+        'image hashes used by thumbnail URLs.'
+    )
+
+    def handle(self, *args, **options):
+        """Process every property and complex."""
+        processed = 0
+        for model in (Property, RealEstateComplex):
+            image_fields = [
+                model_field.name
+                for model_field in model._meta.concrete_fields
+                if isinstance(model_field, models.ImageField)
+            ]
+            queryset = model.objects.only('pk', 'image_hashes', *image_fields)
+            for instance in queryset.iterator():
+                generate_model_image_derivatives(model, instance)
+                processed += 1
+        self.stdout.write(
+            self.style.SUCCESS(f'Processed objects: {processed}.')
+        )
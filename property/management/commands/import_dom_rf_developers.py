@@ -1,7 +1,12 @@
 """Import developers from the DOM.RF developer registry."""
 
+import json
+
 from django.core.management.base import BaseCommand, CommandError
 
+from property.services.developer_registry_cache import (
+    get_default_developer_detail_cache,
+)
 from property.services.developer_registry_client import (
     DEFAULT_DEVELOPER_REGISTRY_REGIONS,
     DomRfDeveloperRegistryClient,
@@ -34,7 +39,18 @@ class Command(BaseCommand):
         parser.add_argument(
             '--dry-run',
             action='store_true',
-            help='Fetch and process records without committing changes.',
+            help=(
+                'Plan changes without writing to the database. With '
+                '--verbosity 2 the planned diff is printed as JSON.'
+            ),
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help=(
+                'Ignore checkpoints of an interrupted import and fetch '
+                'every region from the first page.'
+            ),
         )
         parser.add_argument(
             '--limit',
@@ -49,6 +65,14 @@ class Command(BaseCommand):
             '--detail-api-url',
             help='Optional DOM.RF developer detail API URL.',
         )
+        parser.add_argument(
+            '--max-workers',
+            type=int,
+            help=(
+                'Number of concurrent DOM.RF requests. Defaults to '
+                'DOM_RF_DEVELOPER_REGISTRY_MAX_WORKERS or 4.'
+            ),
+        )
         parser.add_argument(
             '--source-file',
             help=(
@@ -62,16 +86,23 @@ class Command(BaseCommand):
         regions = options['regions'] or list(DEFAULT_DEVELOPER_REGISTRY_REGIONS)
         client = None
         source_file = options.get('source_file')
+        api_overrides = (
+            options.get('api_url')
+            or options.get('detail_api_url')
+            or options.get('max_workers')
+        )
         if source_file:
-            if options.get('api_url') or options.get('detail_api_url'):
+            if api_overrides:
                 raise CommandError(
-                    '--source-file cannot be used with API URL overrides.'
+                    '--source-file cannot be used with API client options.'
                 )
             client = FileDeveloperRegistryClient(source_file)
-        elif options.get('api_url') or options.get('detail_api_url'):
+        elif api_overrides:
             client = DomRfDeveloperRegistryClient(
                 api_url=options.get('api_url'),
                 detail_api_url=options.get('detail_api_url'),
+                max_workers=options.get('max_workers'),
+                detail_cache=get_default_developer_detail_cache(),
             )
 
         try:
@@ -80,8 +111,17 @@ class Command(BaseCommand):
                 dry_run=options['dry_run'],
                 limit=options.get('limit'),
                 client=client,
+                resume=not options['restart'],
             )
         except DeveloperRegistryImportError as exception:
             raise CommandError(str(exception)) from exception
 
+        if summary.plan is not None and options['verbosity'] > 1:
+            self.stdout.write(
+                json.dumps(
+                    summary.plan.to_diff(),
+                    ensure_ascii=False,
+                    indent=2,
+                )
+            )
         self.stdout.write(self.style.SUCCESS(summary.to_message()))
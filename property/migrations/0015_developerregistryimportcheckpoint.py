@@ -0,0 +1,28 @@
+# Generated by Django 6.0.4 on 2026-10-18 10:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0014_developerregion_developer_regions_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeveloperRegistryImportCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('region_code', models.CharField(max_length=20, unique=True, verbose_name='Код региона')),
+                ('next_offset', models.PositiveIntegerField(default=0, verbose_name='Смещение продолжения')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Дата изменения')),
+            ],
+            options={
+                'verbose_name': 'Позиция импорта ЕРЗ',
+                'verbose_name_plural': 'Позиции импорта ЕРЗ',
+                'db_table': 'developer_registry_import_checkpoint',
+                'ordering': ['region_code'],
+            },
+        ),
+    ]
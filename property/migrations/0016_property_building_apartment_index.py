@@ -0,0 +1,17 @@
+# Generated by Django 6.0.4 on 2026-10-18 10:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0015_developerregistryimportcheckpoint'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['building', 'apartment_number'], name='property_building_apt_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.4 on 2026-10-18 11:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0016_property_building_apartment_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='image_hashes',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Хеши изображений'),
+        ),
+        migrations.AddField(
+            model_name='realestatecomplex',
+            name='image_hashes',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Хеши изображений'),
+        ),
+    ]
@@ -134,6 +134,40 @@ class CompanyGroup(models.Model):
         return self.name
 
 
+class DeveloperRegistryImportCheckpoint(models.Model):
+    """Позиция продолжения импорта ЕРЗ по региону строительства.
+
+    Сохраняется после фиксации каждой порции записей; прерванный импорт
+    продолжается с сохраненного смещения, успешный - удаляет позиции.
+    """
+
+    region_code = models.CharField(
+        max_length=20,
+        unique=True,
+        verbose_name='Код региона',
+    )
+    next_offset = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Смещение продолжения',
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Дата изменения',
+    )
+
+    class Meta:
+        """Метаданные таблицы позиций импорта ЕРЗ."""
+
+        db_table = 'developer_registry_import_checkpoint'
+        verbose_name = 'Позиция импорта ЕРЗ'
+        verbose_name_plural = 'Позиции импорта ЕРЗ'
+        ordering = ['region_code']
+
+    def __str__(self):
+        """Возвращает регион и смещение продолжения импорта."""
+        return f'{self.region_code}: {self.next_offset}'
+
+
 class RealEstateType(BaseModel):
     """
     Справочник типов недвижимости.
@@ -218,6 +252,12 @@ class RealEstateComplex(BaseModel):
         validators=[validate_property_image_upload],
         verbose_name='Фото ЖК',
     )
+    image_hashes = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name='Хеши изображений',
+    )
 
     developer = models.ForeignKey(
         Developer, on_delete=models.PROTECT, verbose_name='Застройщик'
@@ -590,6 +630,12 @@ class Property(BaseModel):
         validators=[validate_property_image_upload],
         verbose_name='Вид из окна',
     )
+    image_hashes = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name='Хеши изображений',
+    )
     window_views = models.ManyToManyField(
         WindowView,
         through='PropertyWindowView',
@@ -612,6 +658,10 @@ class Property(BaseModel):
                 fields=['apartment_number'],
                 name='property_apartment_num_idx',
             ),
+            models.Index(
+                fields=['building', 'apartment_number'],
+                name='property_building_apt_idx',
+            ),
         ]
 
     def get_absolute_url(self):
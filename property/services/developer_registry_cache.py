@@ -0,0 +1,100 @@
+"""Persistent cache of DOM.RF developer detail payloads."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+
+
+DEVELOPER_DETAIL_CACHE_FILE_NAME = 'developer_details.sqlite3'
+
+
+class DeveloperDetailCache:
+    """SQLite store of developer detail payloads keyed by detail id.
+
+    Entries older than ``ttl_seconds`` are treated as misses and are
+    refreshed by the client. A refreshed payload is rewritten only when
+    its content hash changes; otherwise just the fetch time moves on.
+    Hit and miss counters cover the lifetime of the cache object.
+    """
+
+    def __init__(self, directory, ttl_seconds):
+        """Store cache location and expiration settings."""
+        self.path = Path(directory) / DEVELOPER_DETAIL_CACHE_FILE_NAME
+        self.ttl_seconds = ttl_seconds
+        self.lock = threading.Lock()
+        self.connection = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, detail_id):
+        """Return a fresh cached payload or None."""
+        with self.lock:
+            row = self.get_connection().execute(
+                'SELECT payload, fetched_at FROM developer_detail '
+                'WHERE detail_id = ?',
+                (str(detail_id),),
+            ).fetchone()
+            if row is None or time.time() - row[1] >= self.ttl_seconds:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, detail_id, payload):
+        """Store a fetched payload, keeping unchanged content as is."""
+        content = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        with self.lock:
+            connection = self.get_connection()
+            with connection:
+                connection.execute(
+                    'INSERT INTO developer_detail '
+                    '(detail_id, payload, content_hash, fetched_at) '
+                    'VALUES (?, ?, ?, ?) '
+                    'ON CONFLICT (detail_id) DO UPDATE SET '
+                    'payload = CASE '
+                    'WHEN content_hash = excluded.content_hash '
+                    'THEN payload ELSE excluded.payload END, '
+                    'content_hash = excluded.content_hash, '
+                    'fetched_at = excluded.fetched_at',
+                    (str(detail_id), content, content_hash, time.time()),
+                )
+
+    def get_connection(self):
+        """Open the SQLite database and create its table on first use."""
+        if self.connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.connection = sqlite3.connect(
+                self.path,
+                timeout=30,
+                check_same_thread=False,
+            )
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS developer_detail ('
+                'detail_id TEXT PRIMARY KEY, '
+                'payload TEXT NOT NULL, '
+                'content_hash TEXT NOT NULL, '
+                'fetched_at REAL NOT NULL)'
+            )
+        return self.connection
+
+    def close(self):
+        """Close the SQLite connection; it is reopened on next use."""
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+
+def get_default_developer_detail_cache():
+    """Return a detail cache configured from project settings."""
+    return DeveloperDetailCache(
+        settings.DOM_RF_DEVELOPER_DETAIL_CACHE_DIR,
+        settings.DOM_RF_DEVELOPER_DETAIL_CACHE_TTL_SECONDS,
+    )
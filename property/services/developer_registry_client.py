@@ -1,9 +1,14 @@
 """Client for the DOM.RF developer registry source."""
 
+import http.client
 import json
 import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from urllib import error, parse, request
+from urllib import parse
 
 
 DEFAULT_DEVELOPER_REGISTRY_API_URL = (
@@ -17,6 +22,14 @@ DEFAULT_DEVELOPER_REGISTRY_TIMEOUT_SECONDS = 30
 DEFAULT_DEVELOPER_REGISTRY_USER_AGENT = (
     'real-estate-investing-developer-registry-importer/1.0'
 )
+DEFAULT_DEVELOPER_REGISTRY_MAX_WORKERS = 4
+DEFAULT_DEVELOPER_REGISTRY_REQUESTS_PER_SECOND = 5
+DEFAULT_DEVELOPER_REGISTRY_MAX_RETRIES = 3
+DEFAULT_DEVELOPER_REGISTRY_RETRY_BACKOFF_SECONDS = 1.0
+DETAIL_PREFETCH_ROWS_PER_WORKER = 4
+RETRYABLE_HTTP_STATUSES = {429, 500, 502, 503, 504}
+REDIRECT_HTTP_STATUSES = {301, 302, 303, 307, 308}
+MAX_HTTP_REDIRECTS = 5
 DEVELOPER_REGISTRY_DETAIL_ID_ALIASES = (
     'id',
     'developerId',
@@ -32,14 +45,53 @@ class DeveloperRegistryClientError(Exception):
 
 @dataclass(frozen=True)
 class DeveloperRegistrySourceItem:
-    """Raw source item with its construction region filter."""
+    """Raw source item with its construction region filter.
+
+    ``next_offset`` is the region offset a resumed import starts from
+    once this item is stored; sources without paging leave it empty.
+    """
 
     region_code: str
     payload: dict
+    next_offset: int | None = None
+
+
+class HostRateLimiter:
+    """Spread requests to each host at a fixed minimal interval."""
+
+    def __init__(self, requests_per_second):
+        """Store the allowed request rate per host."""
+        self.interval = (
+            1 / requests_per_second if requests_per_second else 0
+        )
+        self.lock = threading.Lock()
+        self.next_request_times = {}
+
+    def wait(self, host):
+        """Block until the next request to the host is allowed."""
+        if not self.interval:
+            return
+
+        with self.lock:
+            now = time.monotonic()
+            request_time = max(now, self.next_request_times.get(host, now))
+            self.next_request_times[host] = request_time + self.interval
+        if request_time > now:
+            time.sleep(request_time - now)
 
 
 class DomRfDeveloperRegistryClient:
-    """Fetch developer registry rows from DOM.RF."""
+    """Fetch developer registry rows from DOM.RF.
+
+    Regions, pages and detail lookups are fetched by a bounded pool of
+    ``max_workers`` threads: the first page of every region is requested
+    up front, the next page of a region while the current one is being
+    enriched, and detail lookups run ahead of the consumer within a
+    window. Rows are still yielded in region, page and row order.
+    """
+
+    # Rows carry region offsets, so an interrupted import can resume.
+    supports_resume = True
 
     def __init__(
         self,
@@ -48,8 +100,19 @@ class DomRfDeveloperRegistryClient:
         page_size=DEFAULT_DEVELOPER_REGISTRY_PAGE_SIZE,
         timeout_seconds=DEFAULT_DEVELOPER_REGISTRY_TIMEOUT_SECONDS,
         user_agent=DEFAULT_DEVELOPER_REGISTRY_USER_AGENT,
+        max_workers=None,
+        requests_per_second=None,
+        max_retries=DEFAULT_DEVELOPER_REGISTRY_MAX_RETRIES,
+        retry_backoff_seconds=(
+            DEFAULT_DEVELOPER_REGISTRY_RETRY_BACKOFF_SECONDS
+        ),
+        detail_cache=None,
     ):
-        """Store HTTP client settings."""
+        """Store HTTP client settings.
+
+        ``detail_cache`` is an optional persistent store of detail
+        payloads with ``get`` and ``set`` methods.
+        """
         self.api_url = (
             api_url
             or os.getenv('DOM_RF_DEVELOPER_REGISTRY_API_URL')
@@ -63,47 +126,144 @@ class DomRfDeveloperRegistryClient:
         self.page_size = page_size
         self.timeout_seconds = timeout_seconds
         self.user_agent = user_agent
-
-    def fetch_developers(self, region_codes=None, limit=None):
-        """Yield raw developer rows for the requested construction regions."""
-        selected_regions = (
-            tuple(region_codes)
-            if region_codes
-            else DEFAULT_DEVELOPER_REGISTRY_REGIONS
+        self.max_workers = max(
+            int(
+                max_workers
+                or os.getenv('DOM_RF_DEVELOPER_REGISTRY_MAX_WORKERS')
+                or DEFAULT_DEVELOPER_REGISTRY_MAX_WORKERS
+            ),
+            1,
         )
+        self.rate_limiter = HostRateLimiter(
+            float(
+                requests_per_second
+                or os.getenv('DOM_RF_DEVELOPER_REGISTRY_REQUESTS_PER_SECOND')
+                or DEFAULT_DEVELOPER_REGISTRY_REQUESTS_PER_SECOND
+            )
+        )
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.detail_cache = detail_cache
+        self.local = threading.local()
+        self.connections_lock = threading.Lock()
+        self.connections = []
+
+    def fetch_developers(
+        self,
+        region_codes=None,
+        limit=None,
+        start_offsets=None,
+    ):
+        """Yield raw developer rows for the requested construction regions.
+
+        ``start_offsets`` maps region codes to the offset of the first row
+        to fetch, so an interrupted import can skip stored pages.
+        """
+        selected_regions = tuple(
+            str(region_code)
+            for region_code in region_codes
+            or DEFAULT_DEVELOPER_REGISTRY_REGIONS
+        )
+        start_offsets = start_offsets or {}
         yielded_count = 0
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix='dom-rf-registry',
+        )
 
-        for region_code in selected_regions:
-            for source_item in self.fetch_region_developers(region_code):
-                yield source_item
-                yielded_count += 1
-                if limit and yielded_count >= limit:
-                    return
-
-    def fetch_region_developers(self, region_code):
-        """Yield raw developer rows for one construction region."""
-        offset = 0
+        try:
+            first_pages = {
+                region_code: executor.submit(
+                    self.fetch_page,
+                    region_code,
+                    start_offsets.get(region_code, 0),
+                )
+                for region_code in selected_regions
+            }
+            for region_code in selected_regions:
+                for source_item in self.fetch_region_developers(
+                    region_code,
+                    offset=start_offsets.get(region_code, 0),
+                    executor=executor,
+                    first_page=first_pages[region_code],
+                ):
+                    yield source_item
+                    yielded_count += 1
+                    if limit and yielded_count >= limit:
+                        return
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.close()
+
+    def fetch_region_developers(
+        self,
+        region_code,
+        offset=0,
+        executor=None,
+        first_page=None,
+    ):
+        """Yield raw developer rows for one construction region.
+
+        Without an ``executor`` pages and details are fetched in the
+        calling thread.
+        """
+        executor = executor or SynchronousExecutor()
+        page = first_page or executor.submit(
+            self.fetch_page,
+            region_code,
+            offset,
+        )
+        submit_detail = (
+            executor.submit
+            if self.detail_api_url
+            else SynchronousExecutor().submit
+        )
+        pending_rows = deque()
+        prefetch_window = self.max_workers * DETAIL_PREFETCH_ROWS_PER_WORKER
 
-        while True:
-            payload = self.fetch_page(region_code, offset)
+        while page is not None:
+            payload = page.result()
             rows = extract_rows_from_payload(payload)
             if not rows:
-                return
-
-            for row in rows:
-                if isinstance(row, dict):
-                    row = self.enrich_row_with_detail(row)
-                    yield DeveloperRegistrySourceItem(
-                        region_code=str(region_code),
-                        payload=row,
-                    )
+                break
 
             total_count = extract_total_count_from_payload(payload)
+            page_offset = offset
             offset += len(rows)
-            if total_count is not None and offset >= total_count:
-                return
-            if len(rows) < self.page_size:
-                return
+            has_next_page = len(rows) >= self.page_size and (
+                total_count is None or offset < total_count
+            )
+            page = (
+                executor.submit(self.fetch_page, region_code, offset)
+                if has_next_page
+                else None
+            )
+
+            for row_index, row in enumerate(rows, start=1):
+                if not isinstance(row, dict):
+                    continue
+                pending_rows.append(
+                    (
+                        page_offset + row_index,
+                        submit_detail(self.enrich_row_with_detail, row),
+                    )
+                )
+                while len(pending_rows) > prefetch_window:
+                    yield self.build_source_item(
+                        region_code,
+                        *pending_rows.popleft(),
+                    )
+
+        while pending_rows:
+            yield self.build_source_item(region_code, *pending_rows.popleft())
+
+    def build_source_item(self, region_code, next_offset, enriched_row):
+        """Wait for an enriched row and wrap it into a source item."""
+        return DeveloperRegistrySourceItem(
+            region_code=str(region_code),
+            payload=enriched_row.result(),
+            next_offset=next_offset,
+        )
 
     def fetch_page(self, region_code, offset):
         """Fetch one JSON page from the DOM.RF registry API."""
@@ -114,40 +274,11 @@ class DomRfDeveloperRegistryClient:
                 'limit': self.page_size,
             }
         )
-        url = f'{self.api_url}?{query}'
-        http_request = request.Request(
-            url,
-            headers={
-                'Accept': 'application/json',
-                'User-Agent': self.user_agent,
-            },
+        return self.fetch_json(
+            f'{self.api_url}?{query}',
+            'DOM.RF developer registry',
         )
 
-        try:
-            with request.urlopen(
-                http_request,
-                timeout=self.timeout_seconds,
-            ) as response:
-                content = response.read().decode('utf-8')
-        except error.HTTPError as exception:
-            raise DeveloperRegistryClientError(
-                (
-                    'DOM.RF developer registry returned HTTP '
-                    f'{exception.code}.'
-                )
-            ) from exception
-        except error.URLError as exception:
-            raise DeveloperRegistryClientError(
-                f'DOM.RF developer registry is unavailable: {exception.reason}'
-            ) from exception
-
-        try:
-            return json.loads(content)
-        except json.JSONDecodeError as exception:
-            raise DeveloperRegistryClientError(
-                'DOM.RF developer registry returned invalid JSON.'
-            ) from exception
-
     def enrich_row_with_detail(self, row):
         """Merge row with developer detail payload when detail API is configured."""
         if not self.detail_api_url:
@@ -168,7 +299,18 @@ class DomRfDeveloperRegistryClient:
         return row
 
     def fetch_detail(self, developer_id):
-        """Fetch one developer detail payload."""
+        """Fetch one developer detail payload, using the detail cache."""
+        if self.detail_cache is None:
+            return self.request_detail(developer_id)
+
+        payload = self.detail_cache.get(developer_id)
+        if payload is None:
+            payload = self.request_detail(developer_id)
+            self.detail_cache.set(developer_id, payload)
+        return payload
+
+    def request_detail(self, developer_id):
+        """Request one developer detail payload from DOM.RF."""
         if '{developer_id}' in self.detail_api_url:
             url = self.detail_api_url.format(
                 developer_id=parse.quote(str(developer_id))
@@ -178,38 +320,148 @@ class DomRfDeveloperRegistryClient:
             separator = '&' if '?' in self.detail_api_url else '?'
             url = f'{self.detail_api_url}{separator}{query}'
 
-        http_request = request.Request(
-            url,
-            headers={
-                'Accept': 'application/json',
-                'User-Agent': self.user_agent,
-            },
-        )
-        try:
-            with request.urlopen(
-                http_request,
-                timeout=self.timeout_seconds,
-            ) as response:
-                content = response.read().decode('utf-8')
-        except error.HTTPError as exception:
-            raise DeveloperRegistryClientError(
-                (
-                    'DOM.RF developer detail returned HTTP '
-                    f'{exception.code}.'
+        return self.fetch_json(url, 'DOM.RF developer detail')
+
+    def fetch_json(self, url, source_name):
+        """Fetch and decode a JSON document, retrying transient errors.
+
+        Connection errors and ``RETRYABLE_HTTP_STATUSES`` are retried
+        ``max_retries`` times with exponential backoff; redirects are
+        followed up to ``MAX_HTTP_REDIRECTS`` times.
+        """
+        redirects = 0
+        attempt = 0
+        while True:
+            try:
+                status, headers, content = self.request(url)
+            except (OSError, http.client.HTTPException) as exception:
+                if attempt < self.max_retries:
+                    self.wait_before_retry(attempt)
+                    attempt += 1
+                    continue
+                raise DeveloperRegistryClientError(
+                    f'{source_name} is unavailable: {exception}'
+                ) from exception
+
+            location = headers.get('Location')
+            if (
+                status in REDIRECT_HTTP_STATUSES
+                and location
+                and redirects < MAX_HTTP_REDIRECTS
+            ):
+                url = parse.urljoin(url, location)
+                redirects += 1
+                continue
+            if status in RETRYABLE_HTTP_STATUSES and attempt < (
+                self.max_retries
+            ):
+                self.wait_before_retry(attempt, headers.get('Retry-After'))
+                attempt += 1
+                continue
+            if status >= 400:
+                raise DeveloperRegistryClientError(
+                    f'{source_name} returned HTTP {status}.'
                 )
-            ) from exception
-        except error.URLError as exception:
-            raise DeveloperRegistryClientError(
-                f'DOM.RF developer detail is unavailable: {exception.reason}'
-            ) from exception
+            break
 
         try:
-            return json.loads(content)
-        except json.JSONDecodeError as exception:
+            return json.loads(content.decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError) as exception:
             raise DeveloperRegistryClientError(
-                'DOM.RF developer detail returned invalid JSON.'
+                f'{source_name} returned invalid JSON.'
             ) from exception
 
+    def request(self, url):
+        """Send one GET request over a kept-alive connection.
+
+        Every worker thread keeps its own connection per host; the
+        connection is dropped after errors and when the server closes it.
+        """
+        split_url = parse.urlsplit(url)
+        self.rate_limiter.wait(split_url.netloc)
+        connection = self.get_connection(split_url.scheme, split_url.netloc)
+        path = split_url.path or '/'
+        if split_url.query:
+            path = f'{path}?{split_url.query}'
+
+        try:
+            connection.request(
+                'GET',
+                path,
+                headers={
+                    'Accept': 'application/json',
+                    'User-Agent': self.user_agent,
+                },
+            )
+            response = connection.getresponse()
+            content = response.read()
+        except (OSError, http.client.HTTPException):
+            self.drop_connection(split_url.scheme, split_url.netloc)
+            raise
+
+        if response.will_close:
+            self.drop_connection(split_url.scheme, split_url.netloc)
+        return response.status, response.headers, content
+
+    def get_connection(self, scheme, netloc):
+        """Return the current thread's connection to the host."""
+        connections = getattr(self.local, 'connections', None)
+        if connections is None:
+            connections = self.local.connections = {}
+
+        connection = connections.get((scheme, netloc))
+        if connection is None:
+            connection_class = (
+                http.client.HTTPSConnection
+                if scheme == 'https'
+                else http.client.HTTPConnection
+            )
+            connection = connection_class(
+                netloc,
+                timeout=self.timeout_seconds,
+            )
+            connections[(scheme, netloc)] = connection
+            with self.connections_lock:
+                self.connections.append(connection)
+        return connection
+
+    def drop_connection(self, scheme, netloc):
+        """Close the current thread's connection to the host."""
+        connections = getattr(self.local, 'connections', {})
+        connection = connections.pop((scheme, netloc), None)
+        if connection is not None:
+            connection.close()
+
+    def close(self):
+        """Close connections opened by worker threads and the cache."""
+        with self.connections_lock:
+            connections, self.connections = self.connections, []
+        for connection in connections:
+            connection.close()
+        self.local = threading.local()
+        if self.detail_cache is not None:
+            self.detail_cache.close()
+
+    def wait_before_retry(self, attempt, retry_after=None):
+        """Sleep with exponential backoff or the server's Retry-After."""
+        delay = self.retry_backoff_seconds * 2 ** attempt
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, int(retry_after))
+        time.sleep(delay)
+
+
+class SynchronousExecutor:
+    """Executor running submitted calls immediately in the caller."""
+
+    def submit(self, function, *args):
+        """Run the call and return a completed future."""
+        future = Future()
+        try:
+            future.set_result(function(*args))
+        except Exception as exception:
+            future.set_exception(exception)
+        return future
+
 
 def extract_rows_from_payload(payload):
     """Extract row list from common DOM.RF API response shapes."""
@@ -96,6 +96,7 @@ HEADER_ALIAS_MAP = {
     'юридический адрес': 'legalAddress',
     'юридическое лицо': 'name',
 }
+XLSX_READ_ERRORS = (OSError, InvalidFileException, BadZipFile, ValueError)
 
 
 class DeveloperRegistryFileError(DeveloperRegistryClientError):
@@ -105,6 +106,10 @@ class DeveloperRegistryFileError(DeveloperRegistryClientError):
 class FileDeveloperRegistryClient:
     """Read developer registry rows from a local CSV, XLSX, or JSON file."""
 
+    # File rows carry no offsets: imports neither use nor clear the
+    # resume checkpoints of the online registry.
+    supports_resume = False
+
     def __init__(
         self,
         source_file_path,
@@ -114,8 +119,17 @@ class FileDeveloperRegistryClient:
         self.source_file_path = Path(source_file_path)
         self.source_region_code = str(source_region_code)
 
-    def fetch_developers(self, region_codes=None, limit=None):
-        """Yield developer rows from the configured local file."""
+    def fetch_developers(
+        self,
+        region_codes=None,
+        limit=None,
+        start_offsets=None,
+    ):
+        """Yield developer rows from the configured local file.
+
+        File rows carry no resume offsets, so ``start_offsets`` is
+        accepted for interface compatibility and ignored.
+        """
         yielded_count = 0
 
         for payload in load_developer_registry_file(self.source_file_path):
@@ -129,7 +143,12 @@ class FileDeveloperRegistryClient:
 
 
 def load_developer_registry_file(source_file_path):
-    """Load registry rows from a supported local source file."""
+    """Return a lazy iterator over rows of a supported local source file.
+
+    CSV and XLSX rows are read one at a time, so memory use does not
+    grow with the file size. Read errors are raised as
+    ``DeveloperRegistryFileError`` while the iterator is consumed.
+    """
     path = Path(source_file_path)
     if not path.exists():
         raise DeveloperRegistryFileError(
@@ -142,11 +161,11 @@ def load_developer_registry_file(source_file_path):
 
     extension = path.suffix.casefold()
     if extension == '.csv':
-        return load_csv_developer_registry_file(path)
+        return iter_csv_developer_registry_file(path)
     if extension == '.json':
-        return load_json_developer_registry_file(path)
+        return iter(load_json_developer_registry_file(path))
     if extension == '.xlsx':
-        return load_xlsx_developer_registry_file(path)
+        return iter_xlsx_developer_registry_file(path)
 
     supported_extensions = ', '.join(SUPPORTED_SOURCE_FILE_EXTENSIONS)
     raise DeveloperRegistryFileError(
@@ -157,23 +176,24 @@ def load_developer_registry_file(source_file_path):
     )
 
 
-def load_csv_developer_registry_file(path):
-    """Load registry rows from a UTF-8 CSV file."""
+def iter_csv_developer_registry_file(path):
+    """Yield registry rows from a UTF-8 CSV file one record at a time."""
     try:
         with path.open('r', encoding='utf-8-sig', newline='') as source_file:
             sample = source_file.read(4096)
             source_file.seek(0)
-            reader = csv.DictReader(
+            reader = csv.reader(
                 source_file,
                 dialect=detect_csv_dialect(sample),
             )
-            if not reader.fieldnames:
-                return []
-            return [
-                normalize_source_row(row, row_number=row_number)
-                for row_number, row in enumerate(reader, start=2)
-                if row_has_values(row.values())
-            ]
+            header_columns = compile_source_headers(next(reader, None))
+            if not header_columns:
+                return
+
+            for row_number, row in enumerate(reader, start=2):
+                if not row_has_values(row):
+                    continue
+                yield build_source_row(header_columns, row, row_number)
     except (OSError, UnicodeDecodeError, csv.Error) as exception:
         raise DeveloperRegistryFileError(
             f'Cannot read developer registry CSV file {path}: {exception}'
@@ -200,56 +220,77 @@ def load_json_developer_registry_file(path):
     ]
 
 
-def load_xlsx_developer_registry_file(path):
-    """Load registry rows from every worksheet of an XLSX file."""
+def iter_xlsx_developer_registry_file(path):
+    """Yield registry rows from every worksheet of an XLSX file.
+
+    The workbook is opened in read-only mode, which parses worksheet
+    XML incrementally instead of building every cell in memory.
+    """
     try:
         workbook = load_workbook(path, read_only=True, data_only=True)
-    except (
-        OSError,
-        InvalidFileException,
-        BadZipFile,
-        ValueError,
-    ) as exception:
+    except XLSX_READ_ERRORS as exception:
         raise DeveloperRegistryFileError(
             f'Cannot read developer registry XLSX file {path}: {exception}'
         ) from exception
 
     try:
-        source_rows = []
         for worksheet in workbook.worksheets:
-            source_rows.extend(load_xlsx_worksheet_rows(worksheet))
-        return source_rows
+            yield from iter_xlsx_worksheet_rows(worksheet)
+    except XLSX_READ_ERRORS as exception:
+        raise DeveloperRegistryFileError(
+            f'Cannot read developer registry XLSX file {path}: {exception}'
+        ) from exception
     finally:
         workbook.close()
 
 
-def load_xlsx_worksheet_rows(worksheet):
-    """Load normalized developer rows from one XLSX worksheet."""
+def iter_xlsx_worksheet_rows(worksheet):
+    """Yield normalized developer rows from one XLSX worksheet."""
     rows = worksheet.iter_rows(values_only=True)
-    headers = next(rows, None)
-    if not headers:
-        return []
+    header_columns = compile_source_headers(next(rows, None))
+    if not header_columns:
+        return
 
-    normalized_headers = [normalize_source_header(header) for header in headers]
-    source_rows = []
+    worksheet_region = normalize_source_value(worksheet.title)
     for row_number, row in enumerate(rows, start=2):
         if not row_has_values(row):
             continue
 
-        source_row = normalize_source_row(
-            {
-                header: value
-                for header, value in zip(normalized_headers, row)
-                if header
-            },
-            row_number=row_number,
-            headers_already_normalized=True,
-        )
+        source_row = build_source_row(header_columns, row, row_number)
         source_row['_sourceSheetName'] = worksheet.title
         if not source_row.get('region'):
-            source_row['region'] = normalize_source_value(worksheet.title)
-        source_rows.append(source_row)
-    return source_rows
+            source_row['region'] = worksheet_region
+        yield source_row
+
+
+def compile_source_headers(headers):
+    """Return column indexes paired with normalized header names.
+
+    Headers are normalized once per file or worksheet; columns without
+    a usable header are left out.
+    """
+    if not headers:
+        return ()
+
+    header_columns = []
+    for index, header in enumerate(headers):
+        normalized_header = normalize_source_header(header)
+        if normalized_header:
+            header_columns.append((index, normalized_header))
+    return tuple(header_columns)
+
+
+def build_source_row(header_columns, row, row_number):
+    """Build a normalized source row from a positional file row."""
+    row_length = len(row)
+    return normalize_source_row(
+        {
+            header: row[index] if index < row_length else None
+            for index, header in header_columns
+        },
+        row_number=row_number,
+        headers_already_normalized=True,
+    )
 
 
 def detect_csv_dialect(sample):
@@ -2,12 +2,27 @@
 
 import re
 from dataclasses import dataclass, field
+from datetime import timedelta
+from itertools import islice
 
 from django.db import transaction
+from django.utils import timezone
 
 from location.models import Region
-from property.models import CompanyGroup, Developer, DeveloperRegion
+from mortgage.apps import (
+    clear_form_data_cache as clear_mortgage_form_data_cache,
+)
+from property.apps import (
+    clear_form_data_cache as clear_property_form_data_cache,
+)
+from property.models import (
+    CompanyGroup,
+    Developer,
+    DeveloperRegion,
+    DeveloperRegistryImportCheckpoint,
+)
 
+from .developer_registry_cache import get_default_developer_detail_cache
 from .developer_registry_client import (
     DEFAULT_DEVELOPER_REGISTRY_REGIONS,
     DeveloperRegistryClientError,
@@ -97,6 +112,27 @@ REGION_ALIASES = (
     'developer.regionName',
 )
 IGNORED_SOURCE_REGION_REFERENCES = {'file'}
+DEVELOPER_REGISTRY_BULK_BATCH_SIZE = 500
+DEVELOPER_REGISTRY_IMPORT_CHUNK_SIZE = 1000
+# Older checkpoints belong to an abandoned run and are not resumed.
+DEVELOPER_REGISTRY_CHECKPOINT_MAX_AGE = timedelta(days=1)
+DEVELOPER_LOOKUP_FIELDS = (
+    'taxpayer_identification_number',
+    'primary_state_registration_number',
+    'name',
+)
+DEVELOPER_REGISTRY_FIELDS = (
+    'name',
+    'legal_address',
+    'actual_address',
+    'taxpayer_identification_number',
+    'tax_registration_reason_code',
+    'primary_state_registration_number',
+)
+DEVELOPER_REGISTRY_RECORD_VALUE_FIELDS = (
+    *DEVELOPER_REGISTRY_FIELDS,
+    'company_group_name',
+)
 
 
 class DeveloperRegistryImportError(Exception):
@@ -117,6 +153,149 @@ class DeveloperRegistryRecord:
     source_regions: tuple[str, ...] = ()
 
 
+@dataclass
+class DeveloperRegistryImportPlan:
+    """Catalog changes planned by a developer registry import.
+
+    The plan is computed from preloaded indexes without touching the
+    database. ``apply`` writes exactly these changes with chunked bulk
+    queries and ``to_diff`` describes them as plain data. Developer
+    updates map ``id()`` of the developer to the developer and its
+    changed fields as ``(old, new)`` pairs.
+    """
+
+    company_groups: list = field(default_factory=list)
+    developers: list = field(default_factory=list)
+    developer_updates: dict = field(default_factory=dict)
+    region_links: list = field(default_factory=list)
+
+    def add_update(self, developer, changes):
+        """Record changed fields, keeping the first old value of each."""
+        _developer, planned_changes = self.developer_updates.setdefault(
+            id(developer),
+            (developer, {}),
+        )
+        for field_name, (old_value, new_value) in changes.items():
+            if field_name in planned_changes:
+                old_value = planned_changes[field_name][0]
+            planned_changes[field_name] = (old_value, new_value)
+
+    def extend(self, plan):
+        """Append the changes of a later plan of the same run."""
+        self.company_groups.extend(plan.company_groups)
+        self.developers.extend(plan.developers)
+        for developer, changes in plan.developer_updates.values():
+            self.add_update(developer, changes)
+        self.region_links.extend(plan.region_links)
+
+    def is_empty(self):
+        """Return whether the plan has no changes."""
+        return not (
+            self.company_groups
+            or self.developers
+            or self.developer_updates
+            or self.region_links
+        )
+
+    @transaction.atomic(savepoint=False)
+    def apply(self):
+        """Write planned company groups, developers and region links."""
+        CompanyGroup.objects.bulk_create(
+            self.company_groups,
+            batch_size=DEVELOPER_REGISTRY_BULK_BATCH_SIZE,
+        )
+        Developer.objects.bulk_create(
+            self.developers,
+            batch_size=DEVELOPER_REGISTRY_BULK_BATCH_SIZE,
+        )
+        if self.developer_updates:
+            updated_at = timezone.now()
+            updated_fields = set()
+            for developer, changes in self.developer_updates.values():
+                developer.updated_at = updated_at
+                updated_fields.update(changes)
+            Developer.objects.bulk_update(
+                [
+                    developer
+                    for developer, _changes in self.developer_updates.values()
+                ],
+                [*sorted(updated_fields), 'updated_at'],
+                batch_size=DEVELOPER_REGISTRY_BULK_BATCH_SIZE,
+            )
+        DeveloperRegion.objects.bulk_create(
+            [
+                DeveloperRegion(developer=developer, region_id=region_id)
+                for developer, region_id in self.region_links
+            ],
+            batch_size=DEVELOPER_REGISTRY_BULK_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+
+        if self.developers or self.developer_updates:
+            # Bulk queries skip post_save: form caches are cleared here.
+            clear_property_form_data_cache()
+            clear_mortgage_form_data_cache()
+
+    def to_diff(self):
+        """Return the planned changes as JSON-serializable data."""
+        return {
+            'company_groups': {
+                'create': [
+                    company_group.name
+                    for company_group in self.company_groups
+                ],
+            },
+            'developers': {
+                'create': [
+                    {
+                        field_name: _get_diff_value(
+                            getattr(developer, field_name)
+                        )
+                        for field_name in (
+                            *DEVELOPER_REGISTRY_FIELDS,
+                            'company_group',
+                        )
+                    }
+                    for developer in self.developers
+                ],
+                'update': [
+                    {
+                        'id': developer.pk,
+                        'name': developer.name,
+                        'changes': {
+                            field_name: {
+                                'old': _get_diff_value(old_value),
+                                'new': _get_diff_value(new_value),
+                            }
+                            for field_name, (
+                                old_value,
+                                new_value,
+                            ) in changes.items()
+                        },
+                    }
+                    for developer, changes in self.developer_updates.values()
+                ],
+            },
+            'developer_regions': {
+                'create': [
+                    {
+                        'developer_id': developer.pk,
+                        'developer': developer.name,
+                        'region_id': region_id,
+                    }
+                    for developer, region_id in self.region_links
+                ],
+            },
+        }
+
+
+def _get_diff_value(value):
+    """Return a plan value suitable for JSON output."""
+    if isinstance(value, CompanyGroup):
+        return value.name
+    return value
+
+
 @dataclass
 class DeveloperRegistryImportSummary:
     """Counters returned after a developer registry import."""
@@ -129,8 +308,14 @@ class DeveloperRegistryImportSummary:
     created_company_groups: int = 0
     created_developer_region_links: int = 0
     skipped_records: int = 0
+    detail_cache_hits: int = 0
+    detail_cache_misses: int = 0
     errors: list[str] = field(default_factory=list)
     dry_run: bool = False
+    plan: DeveloperRegistryImportPlan | None = field(
+        default=None,
+        repr=False,
+    )
 
     def to_message(self):
         """Return a concise human-readable import summary."""
@@ -144,6 +329,16 @@ class DeveloperRegistryImportSummary:
             f'добавлено связей с регионами '
             f'{self.created_developer_region_links}, '
             f'пропущено {self.skipped_records}.'
+        ) + self.get_detail_cache_message()
+
+    def get_detail_cache_message(self):
+        """Return detail cache counters when details were looked up."""
+        if not self.detail_cache_hits and not self.detail_cache_misses:
+            return ''
+        return (
+            ' Карточки застройщиков из кеша: '
+            f'{self.detail_cache_hits}, загружено заново: '
+            f'{self.detail_cache_misses}.'
         )
 
 
@@ -152,6 +347,7 @@ def import_dom_rf_developers(
     dry_run=False,
     limit=None,
     client=None,
+    resume=True,
 ):
     """Import DOM.RF developer registry data into local catalogs."""
     importer = DeveloperRegistryImporter(client=client)
@@ -159,33 +355,121 @@ def import_dom_rf_developers(
         region_codes=region_codes,
         dry_run=dry_run,
         limit=limit,
+        resume=resume,
     )
 
 
 class DeveloperRegistryImporter:
     """Normalize and load DOM.RF developer registry data."""
 
-    def __init__(self, client=None):
+    def __init__(self, client=None, chunk_size=None):
         """Store importer dependencies."""
-        self.client = client or DomRfDeveloperRegistryClient()
-
-    def import_developers(self, region_codes, dry_run=False, limit=None):
-        """Fetch, normalize, deduplicate, and load developer records."""
+        self.client = client or DomRfDeveloperRegistryClient(
+            detail_cache=get_default_developer_detail_cache()
+        )
+        self.chunk_size = chunk_size or DEVELOPER_REGISTRY_IMPORT_CHUNK_SIZE
+
+    def import_developers(
+        self,
+        region_codes,
+        dry_run=False,
+        limit=None,
+        resume=True,
+    ):
+        """Fetch, normalize, deduplicate, and load developer records.
+
+        Source rows are processed as they arrive in chunks of
+        ``chunk_size``; the plan of each chunk is applied in its own
+        transaction together with per-region checkpoints. When ``resume``
+        is set, an interrupted import continues from the stored
+        checkpoints younger than ``DEVELOPER_REGISTRY_CHECKPOINT_MAX_AGE``;
+        other checkpoints of the regions are dropped at the start, so
+        the run begins from the first page. Checkpoints are used only by
+        clients that set ``supports_resume``. A dry run writes nothing:
+        the plans of all chunks are collected into ``summary.plan``,
+        which can be applied later.
+        """
         summary = DeveloperRegistryImportSummary(dry_run=dry_run)
-
+        region_codes = tuple(str(code) for code in region_codes or ())
+        use_checkpoints = not dry_run and getattr(
+            self.client,
+            'supports_resume',
+            False,
+        )
+        start_offsets = {}
+        if use_checkpoints:
+            if resume:
+                start_offsets = get_developer_registry_checkpoints(
+                    region_codes
+                )
+            # Ignored checkpoints must not mix with this run's progress
+            # if it is interrupted and resumed later.
+            DeveloperRegistryImportCheckpoint.objects.filter(
+                region_code__in=region_codes
+            ).exclude(region_code__in=start_offsets).delete()
+
+        fetch_options = {'region_codes': region_codes, 'limit': limit}
+        if start_offsets:
+            fetch_options['start_offsets'] = start_offsets
+
+        detail_cache = getattr(self.client, 'detail_cache', None)
+        if detail_cache is not None:
+            cache_hits = detail_cache.hits
+            cache_misses = detail_cache.misses
+
+        if dry_run:
+            summary.plan = DeveloperRegistryImportPlan()
+        filled_fields_by_key = {}
+        index = DeveloperRegistryIndex.load()
         try:
-            source_items = list(
-                self.client.fetch_developers(
-                    region_codes=region_codes,
-                    limit=limit,
+            source_items = iter(self.client.fetch_developers(**fetch_options))
+            while chunk := list(islice(source_items, self.chunk_size)):
+                summary.source_records += len(chunk)
+                plan = self.plan_records(
+                    self.deduplicate_source_items(
+                        chunk,
+                        summary,
+                        filled_fields_by_key,
+                    ),
+                    summary=summary,
+                    index=index,
                 )
-            )
+                if dry_run:
+                    summary.plan.extend(plan)
+                    continue
+                with transaction.atomic():
+                    plan.apply()
+                    if use_checkpoints:
+                        save_developer_registry_checkpoints(chunk)
         except DeveloperRegistryClientError as exception:
             raise DeveloperRegistryImportError(str(exception)) from exception
 
-        summary.source_records = len(source_items)
-        deduplicated_records = {}
+        summary.normalized_records = len(filled_fields_by_key)
+        if detail_cache is not None:
+            summary.detail_cache_hits = detail_cache.hits - cache_hits
+            summary.detail_cache_misses = detail_cache.misses - cache_misses
+        if use_checkpoints:
+            DeveloperRegistryImportCheckpoint.objects.filter(
+                region_code__in=region_codes
+            ).delete()
+        return summary
 
+    def deduplicate_source_items(
+        self,
+        source_items,
+        summary,
+        filled_fields_by_key,
+    ):
+        """Normalize and deduplicate one chunk of source items.
+
+        Records are merged with duplicates from the same chunk. Earlier
+        chunks are remembered only by ``filled_fields_by_key``: the
+        record fields already filled for each key, so memory stays flat
+        while the developers themselves live in the index. Returns pairs
+        of a record and the fields filled earlier in the run, or None if
+        the developer was not loaded by this run yet.
+        """
+        chunk_records = {}
         for source_item in source_items:
             record = normalize_developer_registry_item(
                 source_item.payload,
@@ -196,72 +480,97 @@ class DeveloperRegistryImporter:
                 continue
 
             key = get_developer_registry_record_key(record)
-            existing_record = deduplicated_records.get(key)
+            existing_record = chunk_records.get(key)
             if existing_record:
-                deduplicated_records[key] = merge_developer_registry_records(
+                record = merge_developer_registry_records(
                     existing_record,
                     record,
                 )
-                continue
-
-            deduplicated_records[key] = record
-
-        summary.normalized_records = len(deduplicated_records)
-        self.load_records(
-            deduplicated_records.values(),
-            summary=summary,
-            dry_run=dry_run,
-        )
-        return summary
-
-    def load_records(self, records, summary, dry_run=False):
-        """Load normalized records into CompanyGroup and Developer models."""
-        with transaction.atomic():
-            for record in records:
-                self.load_record(record, summary)
-
-            if dry_run:
-                transaction.set_rollback(True)
-
-    def load_record(self, record, summary):
-        """Create or update one developer and its company group."""
-        company_group = self.get_or_create_company_group(record, summary)
-        developer = find_existing_developer(record)
+            chunk_records[key] = record
+
+        records = []
+        for key, record in chunk_records.items():
+            filled_fields = filled_fields_by_key.get(key)
+            records.append((record, filled_fields))
+            filled_fields_by_key[key] = (
+                filled_fields or frozenset()
+            ) | get_filled_record_fields(record)
+        return records
+
+    def plan_records(self, records, summary, index):
+        """Plan changes of CompanyGroup and Developer models for records.
+
+        Records are matched against the run-wide ``index``; creates and
+        updates are computed in memory without writing anything and
+        returned as a ``DeveloperRegistryImportPlan``. Records already
+        planned earlier in the run only add missing values and region
+        links and are not counted again.
+        """
+        for record, filled_fields in records:
+            self.plan_record(
+                record,
+                summary,
+                index,
+                filled_fields=filled_fields,
+            )
+        return index.take_plan()
+
+    def plan_record(self, record, summary, index, filled_fields=None):
+        """Plan the creation or update of one developer in the index.
+
+        ``filled_fields`` are the record fields already filled by the
+        run; they are not overwritten, as if the records were merged.
+        """
+        is_loaded = filled_fields is not None
+        filled_fields = filled_fields or frozenset()
+        company_group = None
+        if 'company_group_name' not in filled_fields:
+            company_group = self.get_or_create_company_group(
+                record,
+                summary,
+                index,
+            )
+        developer = index.find_developer(record)
 
         if developer is None:
-            developer = Developer.objects.create(
-                name=record.name,
-                company_group=company_group,
-                legal_address=record.legal_address or None,
-                actual_address=record.actual_address or None,
-                taxpayer_identification_number=(
-                    record.taxpayer_identification_number or None
-                ),
-                tax_registration_reason_code=(
-                    record.tax_registration_reason_code or None
-                ),
-                primary_state_registration_number=(
-                    record.primary_state_registration_number or None
-                ),
+            developer = index.add_developer(
+                Developer(
+                    name=record.name,
+                    company_group=company_group,
+                    legal_address=record.legal_address or None,
+                    actual_address=record.actual_address or None,
+                    taxpayer_identification_number=(
+                        record.taxpayer_identification_number or None
+                    ),
+                    tax_registration_reason_code=(
+                        record.tax_registration_reason_code or None
+                    ),
+                    primary_state_registration_number=(
+                        record.primary_state_registration_number or None
+                    ),
+                )
             )
             summary.created_developers += 1
-            summary.created_developer_region_links += (
-                sync_developer_regions(developer, record.source_regions)
+            summary.created_developer_region_links += index.add_region_links(
+                developer,
+                record.source_regions,
             )
             return
 
-        changed_fields = apply_developer_registry_record(
+        changed_fields = index.update_developer(
             developer,
             record,
             company_group,
+            skipped_fields=filled_fields,
         )
-        created_region_links = sync_developer_regions(
+        created_region_links = index.add_region_links(
             developer,
             record.source_regions,
         )
         summary.created_developer_region_links += created_region_links
+        if is_loaded:
+            return
         if changed_fields:
-            developer.save(update_fields=[*changed_fields, 'updated_at'])
             summary.updated_developers += 1
             return
         if created_region_links:
@@ -270,24 +579,279 @@ class DeveloperRegistryImporter:
 
         summary.unchanged_developers += 1
 
-    def get_or_create_company_group(self, record, summary):
+    def get_or_create_company_group(self, record, summary, index):
         """Return the company group from the record, creating it if needed."""
         if not record.company_group_name:
             return None
 
-        company_group = CompanyGroup.objects.filter(
-            name__iexact=record.company_group_name
-        ).first()
+        company_group = index.find_company_group(record.company_group_name)
         if company_group:
             return company_group
 
-        company_group, created = CompanyGroup.objects.get_or_create(
-            name=record.company_group_name
+        summary.created_company_groups += 1
+        return index.add_company_group(
+            CompanyGroup(name=record.company_group_name)
+        )
+
+
+class DeveloperRegistryIndex:
+    """In-memory view of the catalog used by one registry import run.
+
+    Developers are indexed by INN, OGRN and name, company groups by
+    case-insensitive name, regions by code and normalized name. Planned
+    creates, updates and region links are collected into ``plan`` and
+    handed over by ``take_plan``; the index itself never writes.
+    """
+
+    def __init__(self, developers, company_groups, regions, region_links):
+        """Build lookup indexes from preloaded catalog rows."""
+        self.developers_by_lookup = {
+            field_name: {} for field_name in DEVELOPER_LOOKUP_FIELDS
+        }
+        developers_by_pk = {}
+        for developer in developers:
+            developers_by_pk[developer.pk] = developer
+            self._index_developer(developer)
+
+        self.company_groups_by_name = {}
+        self.company_groups_by_pk = {}
+        for company_group in company_groups:
+            self.company_groups_by_pk[company_group.pk] = company_group
+            self.company_groups_by_name.setdefault(
+                company_group.name.casefold(),
+                company_group,
+            )
+
+        self.region_ids_by_code = {}
+        self.region_ids_by_name = {}
+        for region_id, code, name in regions:
+            self.region_ids_by_code[code] = region_id
+            self.region_ids_by_name.setdefault(
+                normalize_region_name(name),
+                set(),
+            ).add(region_id)
+        self.region_ids_by_reference = {}
+
+        # Keyed by id() so unsaved developers can be linked too; the
+        # developer is kept in the value to pin its identity.
+        self.region_links_by_developer = {}
+        for developer_id, region_id in region_links:
+            developer = developers_by_pk.get(developer_id)
+            if developer is not None:
+                self._get_linked_region_ids(developer).add(region_id)
+
+        self.plan = DeveloperRegistryImportPlan()
+
+    @classmethod
+    def load(cls):
+        """Load the catalog rows needed for matching registry records."""
+        return cls(
+            developers=Developer.objects.only(
+                'company_group',
+                *DEVELOPER_REGISTRY_FIELDS,
+            ).order_by('name', 'pk'),
+            company_groups=CompanyGroup.objects.order_by('name', 'pk'),
+            regions=Region.objects.values_list('pk', 'code', 'name'),
+            region_links=DeveloperRegion.objects.values_list(
+                'developer_id',
+                'region_id',
+            ),
+        )
+
+    def take_plan(self):
+        """Return the changes planned so far and start a new plan."""
+        plan, self.plan = self.plan, DeveloperRegistryImportPlan()
+        return plan
+
+    def find_developer(self, record):
+        """Find a developer by INN, OGRN, or exact name."""
+        for field_name in DEVELOPER_LOOKUP_FIELDS:
+            value = getattr(record, field_name)
+            if not value:
+                continue
+            developer = self.developers_by_lookup[field_name].get(value)
+            if developer:
+                return developer
+        return None
+
+    def is_name_taken(self, name, developer):
+        """Return whether another developer already uses the name."""
+        name_owner = self.developers_by_lookup['name'].get(name)
+        return name_owner is not None and name_owner is not developer
+
+    def add_developer(self, developer):
+        """Plan the creation of a developer and index it."""
+        self.plan.developers.append(developer)
+        self._index_developer(developer)
+        return developer
+
+    def update_developer(
+        self,
+        developer,
+        record,
+        company_group,
+        skipped_fields=(),
+    ):
+        """Apply the record to a developer and plan its update.
+
+        Returns the changed field names; lookup indexes follow the new
+        INN, OGRN and name values. A developer still pending creation
+        gets the changes on the planned instance itself, so no update
+        is planned for it.
+        """
+        previous_values = {
+            field_name: getattr(developer, field_name)
+            for field_name in DEVELOPER_REGISTRY_FIELDS
+        }
+        previous_values['company_group'] = self._get_company_group(
+            developer
+        )
+        self._unindex_developer(developer)
+        changed_fields = apply_developer_registry_record(
+            developer,
+            record,
+            company_group,
+            self,
+            skipped_fields=skipped_fields,
+        )
+        self._index_developer(developer)
+        if changed_fields and developer.pk is not None:
+            self.plan.add_update(
+                developer,
+                {
+                    field_name: (
+                        previous_values[field_name],
+                        getattr(developer, field_name),
+                    )
+                    for field_name in changed_fields
+                },
+            )
+        return changed_fields
+
+    def find_company_group(self, name):
+        """Find a company group by case-insensitive name."""
+        return self.company_groups_by_name.get(name.casefold())
+
+    def add_company_group(self, company_group):
+        """Plan the creation of a company group and index it."""
+        self.plan.company_groups.append(company_group)
+        self.company_groups_by_name[company_group.name.casefold()] = (
+            company_group
         )
-        if created:
-            summary.created_company_groups += 1
         return company_group
 
+    def add_region_links(self, developer, source_region_references):
+        """Plan missing region links for the developer."""
+        region_ids = self.resolve_region_ids(source_region_references)
+        if not region_ids:
+            return 0
+
+        linked_region_ids = self._get_linked_region_ids(developer)
+        new_region_ids = region_ids - linked_region_ids
+        linked_region_ids.update(new_region_ids)
+        self.plan.region_links.extend(
+            (developer, region_id) for region_id in sorted(new_region_ids)
+        )
+        return len(new_region_ids)
+
+    def resolve_region_ids(self, source_region_references):
+        """Return region ids matching source region codes or names."""
+        region_ids = set()
+        for region_reference in normalize_region_references(
+            *source_region_references
+        ):
+            region_ids.update(self._resolve_region_reference(region_reference))
+        return region_ids
+
+    def _get_company_group(self, developer):
+        """Return the developer's company group without a query."""
+        if Developer.company_group.is_cached(developer):
+            return developer.company_group
+        return self.company_groups_by_pk.get(developer.company_group_id)
+
+    def _get_linked_region_ids(self, developer):
+        """Return the mutable set of region ids linked to the developer."""
+        _developer, region_ids = self.region_links_by_developer.setdefault(
+            id(developer),
+            (developer, set()),
+        )
+        return region_ids
+
+    def _index_developer(self, developer):
+        """Index the developer by its lookup values."""
+        for field_name in DEVELOPER_LOOKUP_FIELDS:
+            value = getattr(developer, field_name)
+            if value:
+                self.developers_by_lookup[field_name].setdefault(
+                    value,
+                    developer,
+                )
+
+    def _unindex_developer(self, developer):
+        """Remove index entries that point to the developer."""
+        for field_name in DEVELOPER_LOOKUP_FIELDS:
+            developers = self.developers_by_lookup[field_name]
+            value = getattr(developer, field_name)
+            if developers.get(value) is developer:
+                del developers[value]
+
+    def _resolve_region_reference(self, region_reference):
+        """Return region ids for one normalized source region reference."""
+        region_ids = self.region_ids_by_reference.get(region_reference)
+        if region_ids is not None:
+            return region_ids
+
+        region_ids = {
+            self.region_ids_by_code[code]
+            for code in get_region_code_lookup_values(region_reference)
+            if code in self.region_ids_by_code
+        }
+        if not region_reference.isdigit():
+            region_ids.update(
+                self.region_ids_by_name.get(
+                    normalize_region_name(region_reference),
+                    (),
+                )
+            )
+        self.region_ids_by_reference[region_reference] = region_ids
+        return region_ids
+
+
+def get_developer_registry_checkpoints(region_codes):
+    """Return recent resume offsets for the construction regions."""
+    return dict(
+        DeveloperRegistryImportCheckpoint.objects.filter(
+            region_code__in=region_codes,
+            updated_at__gte=(
+                timezone.now() - DEVELOPER_REGISTRY_CHECKPOINT_MAX_AGE
+            ),
+        ).values_list('region_code', 'next_offset')
+    )
+
+
+def save_developer_registry_checkpoints(source_items):
+    """Store the furthest resume offset of each region in the chunk."""
+    next_offsets = {}
+    for source_item in source_items:
+        if source_item.next_offset is None:
+            continue
+        next_offsets[source_item.region_code] = max(
+            source_item.next_offset,
+            next_offsets.get(source_item.region_code, 0),
+        )
+    DeveloperRegistryImportCheckpoint.objects.bulk_create(
+        [
+            DeveloperRegistryImportCheckpoint(
+                region_code=region_code,
+                next_offset=next_offset,
+            )
+            for region_code, next_offset in next_offsets.items()
+        ],
+        update_conflicts=True,
+        unique_fields=['region_code'],
+        update_fields=['next_offset', 'updated_at'],
+    )
+
 
 def normalize_developer_registry_item(payload, region_code=''):
     """Normalize one raw DOM.RF registry row into a typed record."""
@@ -418,6 +982,15 @@ def get_developer_registry_record_key(record):
     return ('name', record.name.casefold())
 
 
+def get_filled_record_fields(record):
+    """Return the names of non-empty value fields of a record."""
+    return frozenset(
+        field_name
+        for field_name in DEVELOPER_REGISTRY_RECORD_VALUE_FIELDS
+        if getattr(record, field_name)
+    )
+
+
 def merge_developer_registry_records(first_record, second_record):
     """Merge duplicate normalized records from different region filters."""
     source_regions = tuple(
@@ -449,81 +1022,6 @@ def merge_developer_registry_records(first_record, second_record):
     )
 
 
-def find_existing_developer(record):
-    """Find an existing developer by INN, OGRN, or exact name."""
-    lookup_order = (
-        (
-            'taxpayer_identification_number',
-            record.taxpayer_identification_number,
-        ),
-        (
-            'primary_state_registration_number',
-            record.primary_state_registration_number,
-        ),
-        ('name', record.name),
-    )
-    for field_name, value in lookup_order:
-        if not value:
-            continue
-        developer = Developer.objects.filter(**{field_name: value}).first()
-        if developer:
-            return developer
-    return None
-
-
-def sync_developer_regions(developer, source_region_codes):
-    """Create missing region links for the developer from source references."""
-    source_region_references = set(
-        normalize_region_references(*source_region_codes)
-    )
-    if not source_region_references:
-        return 0
-
-    region_codes = set()
-    region_names = set()
-    for region_reference in source_region_references:
-        region_codes.update(get_region_code_lookup_values(region_reference))
-        if not normalize_text(region_reference).isdigit():
-            region_names.add(normalize_region_name(region_reference))
-
-    region_ids = set()
-    if region_codes:
-        region_ids.update(
-            Region.objects.filter(code__in=region_codes).values_list(
-                'pk',
-                flat=True,
-            )
-        )
-    if region_names:
-        region_ids.update(
-            region.pk
-            for region in Region.objects.all()
-            if normalize_region_name(region.name) in region_names
-        )
-
-    if not region_ids:
-        return 0
-
-    existing_region_ids = set(
-        DeveloperRegion.objects.filter(
-            developer=developer,
-            region_id__in=region_ids,
-        ).values_list('region_id', flat=True)
-    )
-    new_region_ids = region_ids - existing_region_ids
-    if not new_region_ids:
-        return 0
-
-    DeveloperRegion.objects.bulk_create(
-        [
-            DeveloperRegion(developer=developer, region_id=region_id)
-            for region_id in sorted(new_region_ids)
-        ],
-        ignore_conflicts=True,
-    )
-    return len(new_region_ids)
-
-
 def get_region_code_lookup_values(region_reference):
     """Return possible region code forms for a source region reference."""
     digits = normalize_digits(region_reference)
@@ -543,8 +1041,17 @@ def normalize_region_name(region_name):
     return normalize_text(region_name).replace('ё', 'е').casefold()
 
 
-def apply_developer_registry_record(developer, record, company_group):
-    """Apply non-empty source values to an existing developer."""
+def apply_developer_registry_record(
+    developer,
+    record,
+    company_group,
+    index,
+    skipped_fields=(),
+):
+    """Apply non-empty source values to an existing developer.
+
+    ``skipped_fields`` are left unchanged even if the record has values.
+    """
     changed_fields = []
     field_updates = {
         'name': record.name,
@@ -560,21 +1067,19 @@ def apply_developer_registry_record(developer, record, company_group):
     }
 
     for field_name, value in field_updates.items():
-        if not value:
+        if not value or field_name in skipped_fields:
             continue
-        if (
-            field_name == 'name'
-            and Developer.objects.exclude(pk=developer.pk)
-            .filter(name=value)
-            .exists()
-        ):
+        if field_name == 'name' and index.is_name_taken(value, developer):
             continue
         if getattr(developer, field_name) == value:
             continue
         setattr(developer, field_name, value)
         changed_fields.append(field_name)
 
-    if company_group and developer.company_group_id != company_group.pk:
+    if company_group and (
+        company_group.pk is None
+        or developer.company_group_id != company_group.pk
+    ):
         developer.company_group = company_group
         changed_fields.append('company_group')
 
@@ -0,0 +1,59 @@
+"""Background jobs of the property application."""
+
+from jobs.registry import BackgroundJobError, register_job
+from jobs.scheduler import register_schedule
+
+from .services.developer_registry_file_client import (
+    FileDeveloperRegistryClient,
+)
+from .services.developer_registry_importer import (
+    DeveloperRegistryImportError,
+    import_dom_rf_developers,
+)
+
+DEVELOPER_REGISTRY_IMPORT_JOB = 'property.import_dom_rf_developers'
+DEVELOPER_REGISTRY_IMPORT_CRON = '0 4 * * 1'
+
+
+@register_job(DEVELOPER_REGISTRY_IMPORT_JOB, 'Импорт застройщиков из ЕРЗ')
+def run_developer_registry_import_job(job):
+    """Import developers from an uploaded file or the online registry.
+
+    Scheduled runs start from the first page so every region is
+    refreshed each cycle; manual runs and runs queued with
+    ``{'resume': true}`` continue an interrupted import.
+    """
+    client = None
+    if job.source_file:
+        client = FileDeveloperRegistryClient(job.source_file.path)
+
+    job.report_progress(0, total=1, message='Загрузка данных ЕРЗ')
+    try:
+        if client is None:
+            summary = import_dom_rf_developers(
+                resume=job.payload.get('resume', not job.schedule_name)
+            )
+        else:
+            summary = import_dom_rf_developers(client=client)
+    except DeveloperRegistryImportError as exception:
+        raise BackgroundJobError(
+            f'Не удалось обновить застройщиков из ЕРЗ: {exception}'
+        ) from exception
+
+    return {
+        'message': summary.to_message(),
+        'warnings': summary.errors,
+        'created_developers': summary.created_developers,
+        'updated_developers': summary.updated_developers,
+        'unchanged_developers': summary.unchanged_developers,
+        'skipped_records': summary.skipped_records,
+        'detail_cache_hits': summary.detail_cache_hits,
+        'detail_cache_misses': summary.detail_cache_misses,
+    }
+
+
+register_schedule(
+    'property.dom_rf_developers',
+    DEVELOPER_REGISTRY_IMPORT_JOB,
+    DEVELOPER_REGISTRY_IMPORT_CRON,
+)
@@ -0,0 +1,14 @@
+from django import template
+
+from property.image_derivatives import (
+    THUMBNAIL_IMAGE_VARIANT,
+    get_image_derivative_url,
+)
+
+register = template.Library()
+
+
+@register.filter
+def thumbnail_url(image_field):
+    """Возвращает URL уменьшенной копии изображения для страниц."""
+    return get_image_derivative_url(image_field, THUMBNAIL_IMAGE_VARIANT)
@@ -1,10 +1,15 @@
+import gzip
+import hashlib
 import json
-from datetime import date
+import threading
+import time
+from datetime import date, timedelta
 from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from io import StringIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 import pytest
 from django.conf import settings
@@ -13,11 +18,16 @@ from django.contrib.auth.models import Group
 from django.contrib.messages import get_messages
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.management import call_command
-from django.db import IntegrityError, transaction
+from django.db import IntegrityError, connection, transaction
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from openpyxl import Workbook
+from PIL import Image
 
+from jobs.models import BackgroundJob
+from jobs.queue import enqueue_job, run_pending_jobs
 from location.models import City, District, Metro, MetroLine, Region
 from users.roles import (
     APPLICATION_ADMINISTRATOR_GROUP_NAME,
@@ -32,12 +42,20 @@ from .forms import (
     RealEstateComplexForm,
     RealEstateComplexMetroAvailabilityForm,
 )
+from .image_derivatives import (
+    REPORT_IMAGE_VARIANT,
+    THUMBNAIL_IMAGE_VARIANT,
+    generate_image_derivatives,
+    get_image_derivative_name,
+    get_image_derivative_path,
+)
 from .models import (
     ApartmentDecoration,
     ApartmentLayout,
     CompanyGroup,
     Developer,
     DeveloperRegion,
+    DeveloperRegistryImportCheckpoint,
     Property,
     RealEstateClass,
     RealEstateComplex,
@@ -47,15 +65,27 @@ from .models import (
     TransportAccessibilityType,
     WindowView,
 )
-from .services.developer_registry_client import DeveloperRegistrySourceItem
+from .services.developer_registry_cache import DeveloperDetailCache
+from .services.developer_registry_client import (
+    DeveloperRegistryClientError,
+    DeveloperRegistrySourceItem,
+    DomRfDeveloperRegistryClient,
+)
 from .services.developer_registry_file_client import (
+    DeveloperRegistryFileError,
     FileDeveloperRegistryClient,
+    load_developer_registry_file,
+    normalize_source_header,
 )
 from .services.developer_registry_importer import (
+    DeveloperRegistryImporter,
+    DeveloperRegistryImportError,
     DeveloperRegistryImportSummary,
     import_dom_rf_developers,
     normalize_developer_registry_item,
 )
+from .tasks import DEVELOPER_REGISTRY_IMPORT_JOB
+from .templatetags.property_images import thumbnail_url
 
 
 SIMPLE_GIF = (
@@ -449,6 +479,622 @@ def test_import_dom_rf_developers_updates_existing_without_blank_overwrite():
     assert second_summary.unchanged_developers == 1
 
 
+def build_developer_registry_items(count):
+    """Return registry items with region names and company groups."""
+    return [
+        DeveloperRegistrySourceItem(
+            region_code='77',
+            payload={
+                'devShortCleanNm': f'ООО Застройщик {index}',
+                'devInn': f'77000000{index:02d}',
+                'devLegalAddr': f'Москва, ул. Новая, {index}',
+                'developerGroup': {'name': f'ГК {index % 3}'},
+                'regionName': 'Санкт-Петербург',
+            },
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.django_db
+def test_import_dom_rf_developers_query_count_does_not_grow_with_records(
+    django_assert_max_num_queries,
+):
+    """Importer should match and write records with bulk queries."""
+    Region.objects.create(name='Москва', code='77')
+    Region.objects.create(name='Санкт-Петербург', code='78')
+    CompanyGroup.objects.create(name='гк 0')
+    Developer.objects.create(
+        name='Старое название',
+        taxpayer_identification_number='7700000001',
+    )
+
+    # Один из запросов меняет поколение кеша формы калькулятора.
+    with django_assert_max_num_queries(13):
+        summary = import_dom_rf_developers(
+            client=FakeDeveloperRegistryClient(
+                build_developer_registry_items(40)
+            )
+        )
+
+    developer = Developer.objects.get(
+        taxpayer_identification_number='7700000001'
+    )
+    assert summary.created_developers == 39
+    assert summary.updated_developers == 1
+    assert summary.created_company_groups == 2
+    assert summary.created_developer_region_links == 80
+    assert developer.name == 'ООО Застройщик 1'
+    assert developer.company_group.name == 'ГК 1'
+    assert CompanyGroup.objects.get(
+        developers__name='ООО Застройщик 0'
+    ).name == 'гк 0'
+    assert set(developer.regions.values_list('code', flat=True)) == {
+        '77',
+        '78',
+    }
+
+    with django_assert_max_num_queries(8):
+        second_summary = import_dom_rf_developers(
+            client=FakeDeveloperRegistryClient(
+                build_developer_registry_items(40)
+            )
+        )
+    assert second_summary.unchanged_developers == 40
+    assert second_summary.created_developer_region_links == 0
+
+
+@pytest.mark.django_db
+def test_import_dom_rf_developers_keeps_name_unique_on_rename():
+    """Importer should not rename a developer to a name in use."""
+    Developer.objects.create(
+        name='ООО Занято',
+        taxpayer_identification_number='7700000001',
+    )
+    developer = Developer.objects.create(
+        name='ООО Старое',
+        taxpayer_identification_number='7700000002',
+    )
+    client = FakeDeveloperRegistryClient(
+        [
+            DeveloperRegistrySourceItem(
+                region_code='77',
+                payload={
+                    'devShortCleanNm': 'ООО Занято',
+                    'devInn': '7700000002',
+                    'devOgrn': '1234567890123',
+                },
+            ),
+        ]
+    )
+
+    summary = import_dom_rf_developers(client=client)
+    developer.refresh_from_db()
+
+    assert summary.updated_developers == 1
+    assert developer.name == 'ООО Старое'
+    assert developer.primary_state_registration_number == '1234567890123'
+
+
+@pytest.mark.django_db
+def test_developer_registry_dry_run_returns_plan_without_writes():
+    """Dry run should only read and return a diff that can be applied."""
+    Region.objects.create(name='Москва', code='77')
+    old_group = CompanyGroup.objects.create(name='Старая ГК')
+    developer = Developer.objects.create(
+        name='ООО Старое',
+        company_group=old_group,
+        taxpayer_identification_number='7700000001',
+    )
+    client = FakeDeveloperRegistryClient(
+        [
+            DeveloperRegistrySourceItem(
+                region_code='77',
+                payload={
+                    'devShortCleanNm': 'ООО Новое',
+                    'devInn': '7700000001',
+                    'developerGroup': {'name': 'Новая ГК'},
+                },
+            ),
+            DeveloperRegistrySourceItem(
+                region_code='77',
+                payload={
+                    'devShortCleanNm': 'ООО Второе',
+                    'devInn': '7700000002',
+                },
+            ),
+        ]
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        summary = import_dom_rf_developers(client=client, dry_run=True)
+
+    assert all(
+        query['sql'].lstrip().upper().startswith('SELECT')
+        for query in queries.captured_queries
+    )
+    assert Developer.objects.count() == 1
+    assert summary.created_developers == 1
+    assert summary.updated_developers == 1
+    assert summary.plan.to_diff() == {
+        'company_groups': {'create': ['Новая ГК']},
+        'developers': {
+            'create': [
+                {
+                    'name': 'ООО Второе',
+                    'legal_address': None,
+                    'actual_address': None,
+                    'taxpayer_identification_number': '7700000002',
+                    'tax_registration_reason_code': None,
+                    'primary_state_registration_number': None,
+                    'company_group': None,
+                },
+            ],
+            'update': [
+                {
+                    'id': developer.pk,
+                    'name': 'ООО Новое',
+                    'changes': {
+                        'name': {'old': 'ООО Старое', 'new': 'ООО Новое'},
+                        'company_group': {
+                            'old': 'Старая ГК',
+                            'new': 'Новая ГК',
+                        },
+                    },
+                },
+            ],
+        },
+        'developer_regions': {
+            'create': [
+                {
+                    'developer_id': developer.pk,
+                    'developer': 'ООО Новое',
+                    'region_id': Region.objects.get(code='77').pk,
+                },
+                {
+                    'developer_id': None,
+                    'developer': 'ООО Второе',
+                    'region_id': Region.objects.get(code='77').pk,
+                },
+            ],
+        },
+    }
+
+    summary.plan.apply()
+    developer.refresh_from_db()
+
+    assert developer.name == 'ООО Новое'
+    assert developer.company_group.name == 'Новая ГК'
+    assert Developer.objects.get(
+        taxpayer_identification_number='7700000002'
+    ).regions.get().code == '77'
+    assert import_dom_rf_developers(
+        client=client
+    ).unchanged_developers == 2
+
+
+class FakePagedDeveloperRegistryClient:
+    """Test client yielding paged rows with resume offsets."""
+
+    supports_resume = True
+
+    def __init__(self, rows_by_region, fail_after=None):
+        """Store source rows and the number of rows before a failure."""
+        self.rows_by_region = rows_by_region
+        self.fail_after = fail_after
+        self.requested_offsets = []
+
+    def fetch_developers(
+        self,
+        region_codes=None,
+        limit=None,
+        start_offsets=None,
+    ):
+        """Yield rows from stored offsets and fail when configured."""
+        start_offsets = start_offsets or {}
+        self.requested_offsets.append(dict(start_offsets))
+        yielded_count = 0
+        for region_code in region_codes:
+            rows = self.rows_by_region[region_code]
+            offset = start_offsets.get(region_code, 0)
+            for next_offset, row in enumerate(rows[offset:], offset + 1):
+                if yielded_count == self.fail_after:
+                    raise DeveloperRegistryClientError('Page failed.')
+                yield DeveloperRegistrySourceItem(
+                    region_code=region_code,
+                    payload=row,
+                    next_offset=next_offset,
+                )
+                yielded_count += 1
+
+
+def build_developer_registry_rows(*indexes):
+    """Return raw registry rows for developers with numbered INNs."""
+    return [
+        {
+            'devShortCleanNm': f'ООО Застройщик {index}',
+            'devInn': f'77000000{index:02d}',
+        }
+        for index in indexes
+    ]
+
+
+@pytest.mark.django_db
+def test_developer_registry_import_resumes_from_region_checkpoints():
+    """Importer should commit chunks and resume an interrupted run."""
+    Region.objects.create(name='Москва', code='77')
+    Region.objects.create(name='Санкт-Петербург', code='78')
+    rows_by_region = {
+        '77': build_developer_registry_rows(1, 2, 3),
+        '78': build_developer_registry_rows(4, 5),
+    }
+    failing_client = FakePagedDeveloperRegistryClient(
+        rows_by_region,
+        fail_after=4,
+    )
+
+    with pytest.raises(DeveloperRegistryImportError, match='Page failed'):
+        DeveloperRegistryImporter(
+            client=failing_client,
+            chunk_size=2,
+        ).import_developers(region_codes=('77', '78'))
+
+    assert Developer.objects.count() == 4
+    assert dict(
+        DeveloperRegistryImportCheckpoint.objects.values_list(
+            'region_code',
+            'next_offset',
+        )
+    ) == {'77': 3, '78': 1}
+
+    client = FakePagedDeveloperRegistryClient(rows_by_region)
+    summary = DeveloperRegistryImporter(
+        client=client,
+        chunk_size=2,
+    ).import_developers(region_codes=('77', '78'))
+
+    assert client.requested_offsets == [{'77': 3, '78': 1}]
+    assert summary.source_records == 1
+    assert summary.created_developers == 1
+    assert Developer.objects.count() == 5
+    assert not DeveloperRegistryImportCheckpoint.objects.exists()
+
+
+@pytest.mark.django_db
+def test_developer_registry_import_ignores_stale_checkpoints():
+    """Importer should restart regions whose checkpoints are too old."""
+    Region.objects.create(name='Москва', code='77')
+    Region.objects.create(name='Санкт-Петербург', code='78')
+    DeveloperRegistryImportCheckpoint.objects.create(
+        region_code='77',
+        next_offset=2,
+    )
+    DeveloperRegistryImportCheckpoint.objects.create(
+        region_code='78',
+        next_offset=1,
+    )
+    DeveloperRegistryImportCheckpoint.objects.filter(region_code='78').update(
+        updated_at=timezone.now() - timedelta(days=2)
+    )
+    client = FakePagedDeveloperRegistryClient(
+        {
+            '77': build_developer_registry_rows(1, 2, 3),
+            '78': build_developer_registry_rows(4, 5),
+        }
+    )
+
+    summary = DeveloperRegistryImporter(
+        client=client,
+        chunk_size=2,
+    ).import_developers(region_codes=('77', '78'))
+
+    assert client.requested_offsets == [{'77': 2}]
+    assert summary.created_developers == 3
+    assert not DeveloperRegistryImportCheckpoint.objects.exists()
+
+
+@pytest.mark.django_db
+def test_developer_registry_import_merges_duplicates_across_chunks():
+    """Importer should count a developer once across chunks."""
+    Region.objects.create(name='Москва', code='77')
+    Region.objects.create(name='Санкт-Петербург', code='78')
+    client = FakePagedDeveloperRegistryClient(
+        {
+            '77': build_developer_registry_rows(1, 2),
+            '78': [
+                {
+                    'devShortCleanNm': 'ООО Застройщик 1',
+                    'devInn': '7700000001',
+                    'devFactAddr': 'Санкт-Петербург, ул. Вторая, 2',
+                },
+            ],
+        }
+    )
+
+    summary = DeveloperRegistryImporter(
+        client=client,
+        chunk_size=2,
+    ).import_developers(region_codes=('77', '78'))
+
+    developer = Developer.objects.get(
+        taxpayer_identification_number='7700000001'
+    )
+    assert summary.source_records == 3
+    assert summary.normalized_records == 2
+    assert summary.created_developers == 2
+    assert summary.updated_developers == 0
+    assert summary.created_developer_region_links == 3
+    assert developer.actual_address == 'Санкт-Петербург, ул. Вторая, 2'
+    assert set(developer.regions.values_list('code', flat=True)) == {
+        '77',
+        '78',
+    }
+
+
+@pytest.mark.django_db
+def test_developer_registry_import_keeps_first_values_across_chunks():
+    """Later duplicates should only fill fields earlier rows left empty."""
+    Region.objects.create(name='Москва', code='77')
+    client = FakePagedDeveloperRegistryClient(
+        {
+            '77': [
+                {
+                    'devShortCleanNm': 'ООО Застройщик 1',
+                    'devInn': '7700000001',
+                    'devFactAddr': 'Москва, ул. Первая, 1',
+                },
+                *build_developer_registry_rows(2),
+                {
+                    'devShortCleanNm': 'ООО Застройщик 1',
+                    'devInn': '7700000001',
+                    'devFactAddr': 'Москва, ул. Третья, 3',
+                    'devLegalAddr': 'Москва, ул. Вторая, 2',
+                },
+            ],
+        }
+    )
+
+    summary = DeveloperRegistryImporter(
+        client=client,
+        chunk_size=2,
+    ).import_developers(region_codes=('77',))
+
+    developer = Developer.objects.get(
+        taxpayer_identification_number='7700000001'
+    )
+    assert summary.normalized_records == 2
+    assert summary.updated_developers == 0
+    assert developer.actual_address == 'Москва, ул. Первая, 1'
+    assert developer.legal_address == 'Москва, ул. Вторая, 2'
+
+
+@pytest.mark.django_db
+def test_developer_registry_dry_run_merges_changes_into_pending_create():
+    """A developer planned for creation is not planned for update too."""
+    Region.objects.create(name='Москва', code='77')
+    client = FakePagedDeveloperRegistryClient(
+        {
+            '77': [
+                *build_developer_registry_rows(1),
+                {
+                    'devShortCleanNm': 'ООО Застройщик 1',
+                    'devInn': '7700000001',
+                    'devFactAddr': 'Москва, ул. Первая, 1',
+                },
+            ],
+        }
+    )
+
+    summary = DeveloperRegistryImporter(
+        client=client,
+        chunk_size=1,
+    ).import_developers(region_codes=('77',), dry_run=True)
+
+    diff = summary.plan.to_diff()['developers']
+    assert not Developer.objects.exists()
+    assert diff['update'] == []
+    assert [developer['actual_address'] for developer in diff['create']] == [
+        'Москва, ул. Первая, 1',
+    ]
+
+
+class SlowDomRfDeveloperRegistryClient(DomRfDeveloperRegistryClient):
+    """DOM.RF client serving prepared pages with slow detail lookups."""
+
+    def __init__(self, rows_by_region, **kwargs):
+        """Store source rows and track concurrent requests."""
+        super().__init__(
+            detail_api_url='https://registry.example/{developer_id}',
+            page_size=2,
+            **kwargs,
+        )
+        self.rows_by_region = rows_by_region
+        self.lock = threading.Lock()
+        self.active_requests = 0
+        self.max_active_requests = 0
+
+    def fetch_page(self, region_code, offset):
+        """Return one prepared page of region rows."""
+        rows = self.rows_by_region[region_code]
+        return {
+            'data': {
+                'list': rows[offset:offset + self.page_size],
+                'total': len(rows),
+            }
+        }
+
+    def fetch_detail(self, developer_id):
+        """Return a detail payload after a short delay."""
+        with self.lock:
+            self.active_requests += 1
+            self.max_active_requests = max(
+                self.max_active_requests,
+                self.active_requests,
+            )
+        time.sleep(0.02)
+        with self.lock:
+            self.active_requests -= 1
+        return {'data': {'devOgrn': f'10000000000{developer_id:02d}'}}
+
+
+def test_dom_rf_client_fetches_details_concurrently_in_source_order():
+    """DOM.RF client should overlap lookups and keep row order."""
+    client = SlowDomRfDeveloperRegistryClient(
+        {
+            '77': [{'id': index} for index in range(1, 6)],
+            '78': [{'id': index} for index in range(6, 9)],
+        },
+        max_workers=4,
+    )
+
+    items = list(client.fetch_developers(region_codes=['77', '78']))
+
+    assert [
+        (item.region_code, item.payload['id'], item.next_offset)
+        for item in items
+    ] == [
+        ('77', 1, 1),
+        ('77', 2, 2),
+        ('77', 3, 3),
+        ('77', 4, 4),
+        ('77', 5, 5),
+        ('78', 6, 1),
+        ('78', 7, 2),
+        ('78', 8, 3),
+    ]
+    assert items[0].payload['devOgrn'] == '1000000000001'
+    assert client.max_active_requests > 1
+
+
+def test_dom_rf_client_retries_errors_over_kept_alive_connection():
+    """DOM.RF client should retry transient errors on one connection."""
+    requests_log = []
+
+    class RegistryHandler(BaseHTTPRequestHandler):
+        """Serve a failing and then a successful registry page."""
+
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            """Answer with HTTP 503 once, then with a JSON page."""
+            requests_log.append((self.client_address[1], self.path))
+            if len(requests_log) == 1:
+                status = 503
+                body = b'{}'
+            else:
+                status = 200
+                body = json.dumps(
+                    {'data': {'list': [{'name': 'ООО Тест'}], 'total': 1}}
+                ).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            """Silence request logging."""
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), RegistryHandler)
+    server_thread = threading.Thread(target=server.serve_forever)
+    server_thread.start()
+    try:
+        client = DomRfDeveloperRegistryClient(
+            api_url=f'http://127.0.0.1:{server.server_port}/developers',
+            max_workers=1,
+            requests_per_second=1000,
+            retry_backoff_seconds=0,
+        )
+        items = list(client.fetch_developers(region_codes=['77']))
+    finally:
+        server.shutdown()
+        server.server_close()
+        server_thread.join()
+
+    assert [item.payload for item in items] == [{'name': 'ООО Тест'}]
+    assert len(requests_log) == 2
+    assert len({client_port for client_port, _path in requests_log}) == 1
+    assert requests_log[0][1] == (
+        '/developers?regionHD=77&offset=0&limit=100'
+    )
+
+
+class CachedDomRfDeveloperRegistryClient(DomRfDeveloperRegistryClient):
+    """DOM.RF client serving prepared pages and counting detail requests."""
+
+    def __init__(self, rows, **kwargs):
+        """Store source rows for region 77."""
+        super().__init__(
+            detail_api_url='https://registry.example/{developer_id}',
+            **kwargs,
+        )
+        self.rows = rows
+        self.requested_detail_ids = []
+
+    def fetch_page(self, region_code, offset):
+        """Return all prepared rows as one page."""
+        return {
+            'data': {'list': self.rows[offset:], 'total': len(self.rows)}
+        }
+
+    def request_detail(self, developer_id):
+        """Return a detail payload and remember the request."""
+        self.requested_detail_ids.append(developer_id)
+        return {'data': {'devInn': f'77000000{developer_id:02d}'}}
+
+
+@pytest.mark.django_db
+def test_import_dom_rf_developers_reads_details_from_disk_cache(tmp_path):
+    """Importer should request cached developer details only once."""
+    rows = [
+        {'id': 1, 'devShortCleanNm': 'ООО Первый'},
+        {'id': 2, 'devShortCleanNm': 'ООО Второй'},
+    ]
+    client = CachedDomRfDeveloperRegistryClient(
+        rows,
+        detail_cache=DeveloperDetailCache(tmp_path, ttl_seconds=3600),
+    )
+
+    first_summary = import_dom_rf_developers(
+        region_codes=['77'],
+        client=client,
+    )
+    second_summary = import_dom_rf_developers(
+        region_codes=['77'],
+        client=CachedDomRfDeveloperRegistryClient(
+            rows,
+            detail_cache=DeveloperDetailCache(tmp_path, ttl_seconds=3600),
+        ),
+    )
+
+    assert client.requested_detail_ids == [1, 2]
+    assert (tmp_path / 'developer_details.sqlite3').exists()
+    assert first_summary.detail_cache_hits == 0
+    assert first_summary.detail_cache_misses == 2
+    assert second_summary.detail_cache_hits == 2
+    assert second_summary.detail_cache_misses == 0
+    assert second_summary.unchanged_developers == 2
+    assert 'из кеша: 2, загружено заново: 0' in second_summary.to_message()
+    assert Developer.objects.get(
+        taxpayer_identification_number='7700000002'
+    ).name == 'ООО Второй'
+
+
+def test_developer_detail_cache_refreshes_expired_entries(tmp_path):
+    """Detail cache should treat expired entries as misses."""
+    cache = DeveloperDetailCache(tmp_path, ttl_seconds=0)
+    cache.set(7, {'data': {'name': 'ООО Тест'}})
+
+    assert cache.get(7) is None
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    cache.ttl_seconds = 3600
+    cache.set(7, {'data': {'name': 'ООО Тест'}})
+    assert cache.get(7) == {'data': {'name': 'ООО Тест'}}
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.close()
+
+
 @pytest.mark.django_db
 def test_import_dom_rf_developers_reads_local_csv_source_file(tmp_path):
     """Importer should load developers from a local CSV source file."""
@@ -483,6 +1129,81 @@ def test_import_dom_rf_developers_reads_local_csv_source_file(tmp_path):
     assert second_summary.unchanged_developers == 1
 
 
+@pytest.mark.django_db
+def test_file_import_keeps_online_registry_checkpoints(tmp_path):
+    """File imports should not touch checkpoints of an online import."""
+    DeveloperRegistryImportCheckpoint.objects.create(
+        region_code='77',
+        next_offset=40,
+    )
+    source_file = tmp_path / 'developers.csv'
+    source_file.write_text(
+        'Застройщик;ИНН\nООО Файл Девелопмент;7712345678\n',
+        encoding='utf-8-sig',
+    )
+
+    summary = import_dom_rf_developers(
+        client=FileDeveloperRegistryClient(source_file)
+    )
+
+    assert summary.created_developers == 1
+    assert dict(
+        DeveloperRegistryImportCheckpoint.objects.values_list(
+            'region_code',
+            'next_offset',
+        )
+    ) == {'77': 40}
+
+
+def test_load_developer_registry_file_streams_csv_rows(tmp_path):
+    """CSV rows should be read lazily with headers normalized once."""
+    source_file = tmp_path / 'developers.csv'
+    with source_file.open('w', encoding='utf-8-sig', newline='') as output:
+        output.write('Застройщик;ИНН;Регион\n')
+        for index in range(1, 2001):
+            output.write(f'ООО Поток {index};{7700000000 + index};77\n')
+        output.write('ООО Короткая строка\n')
+
+    with patch(
+        'property.services.developer_registry_file_client.'
+        'normalize_source_header',
+        wraps=normalize_source_header,
+    ) as header_normalizer:
+        rows = load_developer_registry_file(source_file)
+        first_row = next(rows)
+        remaining_rows = list(rows)
+
+    assert header_normalizer.call_count == 3
+    assert first_row == {
+        'name': 'ООО Поток 1',
+        'inn': '7700000001',
+        'region': '77',
+        '_sourceRowNumber': 2,
+    }
+    assert len(remaining_rows) == 2000
+    assert remaining_rows[-1] == {
+        'name': 'ООО Короткая строка',
+        'inn': '',
+        'region': '',
+        '_sourceRowNumber': 2002,
+    }
+
+
+def test_load_developer_registry_file_reports_late_csv_errors(tmp_path):
+    """Decoding errors after the dialect sample should stay file errors."""
+    source_file = tmp_path / 'developers.csv'
+    source_file.write_bytes(
+        'Застройщик;ИНН\n'.encode('utf-8')
+        + 'ООО Первый;7700000001\n'.encode('utf-8') * 500
+        + b'\xff\xfe;broken\n'
+    )
+
+    rows = load_developer_registry_file(source_file)
+
+    with pytest.raises(DeveloperRegistryFileError):
+        list(rows)
+
+
 def test_file_developer_registry_client_reads_json_source_file(tmp_path):
     """File client should read JSON files with common list wrappers."""
     source_file = tmp_path / 'developers.json'
@@ -660,7 +1381,7 @@ def test_import_dom_rf_developers_command_accepts_source_file(tmp_path):
 
 @pytest.mark.django_db
 def test_developer_registry_import_button_runs_for_application_admin(client):
-    """Application administrators should be able to run registry import."""
+    """Application administrators should be able to queue registry import."""
     client.force_login(
         create_application_administrator(
             'developer-sync-admin@example.com',
@@ -670,14 +1391,45 @@ def test_developer_registry_import_button_runs_for_application_admin(client):
     summary = DeveloperRegistryImportSummary(created_developers=2)
 
     with patch(
-        'property.views.import_dom_rf_developers',
+        'property.tasks.import_dom_rf_developers',
         return_value=summary,
     ) as import_mock:
         response = client.post(reverse('property:developer_registry_import'))
+        import_mock.assert_not_called()
+        run_pending_jobs()
 
     assert response.status_code == 302
     assert response.url == reverse('property:developer_list')
-    import_mock.assert_called_once_with()
+    import_mock.assert_called_once_with(resume=True)
+    job = BackgroundJob.objects.get()
+    assert job.job_type == DEVELOPER_REGISTRY_IMPORT_JOB
+    assert job.status == BackgroundJob.Status.SUCCEEDED
+    assert job.result['message'] == summary.to_message()
+
+
+@pytest.mark.django_db
+def test_scheduled_developer_registry_import_starts_fresh():
+    """Scheduled registry imports should not resume old checkpoints."""
+    enqueue_job(
+        DEVELOPER_REGISTRY_IMPORT_JOB,
+        schedule_name='property.dom_rf_developers',
+    )
+    enqueue_job(
+        DEVELOPER_REGISTRY_IMPORT_JOB,
+        payload={'resume': True},
+        schedule_name='property.dom_rf_developers',
+    )
+
+    with patch(
+        'property.tasks.import_dom_rf_developers',
+        return_value=DeveloperRegistryImportSummary(),
+    ) as import_mock:
+        run_pending_jobs()
+
+    assert import_mock.call_args_list == [
+        call(resume=False),
+        call(resume=True),
+    ]
 
 
 @pytest.mark.django_db
@@ -698,13 +1450,28 @@ def test_developer_registry_import_view_imports_uploaded_file(client):
         content_type='text/csv',
     )
 
-    response = client.post(
-        reverse('property:developer_registry_import'),
-        {'source_file': uploaded_file},
-    )
+    with TemporaryDirectory() as media_root:
+        with override_settings(MEDIA_ROOT=media_root):
+            response = client.post(
+                reverse('property:developer_registry_import'),
+                {'source_file': uploaded_file},
+            )
+            job = BackgroundJob.objects.get()
+            source_file_path = Path(job.source_file.path)
+            assert source_file_path.exists()
+            assert not Developer.objects.filter(
+                name='ООО Загрузка Через Форму'
+            ).exists()
+
+            run_pending_jobs()
+
+            assert not source_file_path.exists()
 
     assert response.status_code == 302
     assert response.url == reverse('property:developer_list')
+    job.refresh_from_db()
+    assert job.status == BackgroundJob.Status.SUCCEEDED
+    assert not job.source_file
     developer = Developer.objects.get(name='ООО Загрузка Через Форму')
     assert developer.company_group.name == 'ГК Форма'
     assert developer.taxpayer_identification_number == '7711000000'
@@ -736,6 +1503,7 @@ def test_developer_registry_import_view_rejects_unsupported_file(client):
     assert response.status_code == 302
     assert any('Файл импорта должен быть' in text for text in message_texts)
     assert not Developer.objects.filter(name='ООО Неверный Файл').exists()
+    assert not BackgroundJob.objects.exists()
 
 
 @pytest.mark.django_db
@@ -748,11 +1516,10 @@ def test_moderator_cannot_run_developer_registry_import(client):
         )
     )
 
-    with patch('property.views.import_dom_rf_developers') as import_mock:
-        response = client.post(reverse('property:developer_registry_import'))
+    response = client.post(reverse('property:developer_registry_import'))
 
     assert response.status_code == 403
-    import_mock.assert_not_called()
+    assert not BackgroundJob.objects.exists()
 
 
 @pytest.mark.django_db
@@ -853,6 +1620,174 @@ def test_dependent_selects_static_supports_cascade_configuration():
     assert 'clearDependentValues' in script
 
 
+def test_dependent_selects_source_loader_follows_next_cursor():
+    """Source selects should load every page of a cursor-paged API."""
+    script_path = Path(settings.BASE_DIR) / 'static/js/dependent_selects.js'
+    script = script_path.read_text(encoding='utf-8')
+
+    assert "response.headers.get('X-Next-Cursor')" in script
+    assert "nextUrl.searchParams.set('cursor', nextCursor)" in script
+    assert 'fetchSourcePages(select, url, [])' in script
+
+
+def _write_test_image(media_root, name, size, mode='RGBA'):
+    """Save a generated PNG image into the test media root."""
+    image_path = Path(media_root) / name
+    image_path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new(mode, size, (200, 80, 40, 128)).save(image_path, 'PNG')
+    return image_path
+
+
+def test_image_derivatives_are_scaled_and_keyed_by_content_hash(
+    tmp_path,
+    settings,
+):
+    settings.MEDIA_ROOT = tmp_path
+    image_path = _write_test_image(
+        tmp_path,
+        'property/layouts/layout.png',
+        (2400, 1200),
+    )
+    content_hash = hashlib.sha256(image_path.read_bytes()).hexdigest()[:32]
+    image_field = Property(layout_image='property/layouts/layout.png')
+
+    derivative_names = generate_image_derivatives(image_field.layout_image)
+
+    assert derivative_names == {
+        REPORT_IMAGE_VARIANT: (
+            f'property/layouts/derivatives/{content_hash}_report.jpg'
+        ),
+        THUMBNAIL_IMAGE_VARIANT: (
+            f'property/layouts/derivatives/{content_hash}_thumbnail.webp'
+        ),
+    }
+    with Image.open(tmp_path / derivative_names[REPORT_IMAGE_VARIANT]) as image:
+        assert (image.format, image.mode, image.size) == (
+            'JPEG',
+            'RGB',
+            (1200, 600),
+        )
+    thumbnail_path = tmp_path / derivative_names[THUMBNAIL_IMAGE_VARIANT]
+    with Image.open(thumbnail_path) as image:
+        assert (image.format, image.size) == ('WEBP', (640, 320))
+
+    assert get_image_derivative_path(
+        image_field.layout_image,
+        REPORT_IMAGE_VARIANT,
+    ) == tmp_path / derivative_names[REPORT_IMAGE_VARIANT]
+    assert len(list((tmp_path / 'property/layouts/derivatives').iterdir())) == 2
+
+
+def test_thumbnail_url_falls_back_to_original_for_unreadable_image(
+    tmp_path,
+    settings,
+):
+    settings.MEDIA_ROOT = tmp_path
+    image_path = tmp_path / 'property/complexes/broken.png'
+    image_path.parent.mkdir(parents=True)
+    image_path.write_bytes(b'not an image')
+    complex_photo = RealEstateComplex(
+        photo='property/complexes/broken.png'
+    ).photo
+
+    assert thumbnail_url(complex_photo) == (
+        f'{settings.MEDIA_URL}property/complexes/broken.png'
+    )
+    assert thumbnail_url(RealEstateComplex().photo) == ''
+    assert not (tmp_path / 'property/complexes/derivatives').exists()
+
+
+@pytest.mark.django_db
+def test_property_save_generates_image_derivatives(tmp_path, settings):
+    settings.MEDIA_ROOT = tmp_path
+    _write_test_image(tmp_path, 'property/floor_plans/plan.png', (900, 300))
+    region = Region.objects.create(name='Region 1')
+    city = City.objects.create(name='City 1', region=region)
+    real_estate_complex = RealEstateComplex.objects.create(
+        name='Complex 1',
+        developer=Developer.objects.create(name='Developer 1'),
+        district=District.objects.create(name='District 1', city=city),
+        real_estate_class=RealEstateClass.objects.create(
+            name='Comfort',
+            weight=Decimal('1.00'),
+        ),
+        real_estate_type=RealEstateType.objects.create(name='Flat'),
+    )
+
+    property_obj = Property.objects.create(
+        apartment_number='101',
+        building=RealEstateComplexBuilding.objects.create(
+            real_estate_complex=real_estate_complex,
+            number='1',
+        ),
+        decoration=ApartmentDecoration.objects.create(name='Clean'),
+        layout=ApartmentLayout.objects.create(name='1'),
+        area=Decimal('42.00'),
+        floor=10,
+        property_cost=Decimal('1000000.00'),
+        floor_plan_image='property/floor_plans/plan.png',
+    )
+
+    thumbnail_name = get_image_derivative_name(
+        property_obj.floor_plan_image,
+        THUMBNAIL_IMAGE_VARIANT,
+    )
+    assert thumbnail_name.startswith('property/floor_plans/derivatives/')
+    assert sorted(
+        path.suffix
+        for path in (tmp_path / 'property/floor_plans/derivatives').iterdir()
+    ) == ['.jpg', '.webp']
+
+    property_obj = Property.objects.get(pk=property_obj.pk)
+    assert property_obj.image_hashes['floor_plan_image']['name'] == (
+        'property/floor_plans/plan.png'
+    )
+    with patch.object(
+        property_obj.floor_plan_image.storage,
+        'open',
+        side_effect=AssertionError('image file was read'),
+    ):
+        assert thumbnail_url(property_obj.floor_plan_image) == (
+            f'{settings.MEDIA_URL}{thumbnail_name}'
+        )
+        property_obj.floor = 11
+        property_obj.save()
+
+
+@pytest.mark.django_db
+def test_generate_image_derivatives_command_stores_image_hashes(
+    tmp_path,
+    settings,
+):
+    settings.MEDIA_ROOT = tmp_path
+    _write_test_image(tmp_path, 'property/complexes/photo.png', (300, 300))
+    region = Region.objects.create(name='Region 1')
+    city = City.objects.create(name='City 1', region=region)
+    real_estate_complex = RealEstateComplex.objects.create(
+        name='Complex 1',
+        developer=Developer.objects.create(name='Developer 1'),
+        district=District.objects.create(name='District 1', city=city),
+        real_estate_class=RealEstateClass.objects.create(
+            name='Comfort',
+            weight=Decimal('1.00'),
+        ),
+        real_estate_type=RealEstateType.objects.create(name='Flat'),
+    )
+    RealEstateComplex.objects.filter(pk=real_estate_complex.pk).update(
+        photo='property/complexes/photo.png'
+    )
+    real_estate_complex.refresh_from_db()
+    assert thumbnail_url(real_estate_complex.photo) == (
+        f'{settings.MEDIA_URL}property/complexes/photo.png'
+    )
+
+    call_command('generate_image_derivatives', stdout=StringIO())
+
+    real_estate_complex.refresh_from_db()
+    assert real_estate_complex.image_hashes['photo']['hash']
+    assert '/derivatives/' in thumbnail_url(real_estate_complex.photo)
+
+
 class RealEstateComplexFormLocationTests(TestCase):
     def setUp(self):
         self.client.force_login(
@@ -2154,6 +3089,189 @@ class PropertyFormCascadeTests(TestCase):
         self.assertEqual(len(response.json()), 1)
         self.assertEqual(set(response.json()[0]), {'id', 'name'})
 
+    def test_cities_api_supports_conditional_get(self):
+        """Unchanged catalog responses should be revalidated with 304."""
+        params = {'region_id': self.region.pk}
+
+        response = self.client.get('/api/cities/', params)
+        etag = response['ETag']
+        not_modified_response = self.client.get(
+            '/api/cities/',
+            params,
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        other_filter_response = self.client.get(
+            '/api/cities/',
+            {'region_id': self.region.pk + 1},
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        City.objects.create(name='City 0', region=self.region)
+        changed_response = self.client.get(
+            '/api/cities/',
+            params,
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('public', response['Cache-Control'])
+        self.assertIn('max-age=', response['Cache-Control'])
+        self.assertTrue(response.has_header('Last-Modified'))
+        self.assertEqual(not_modified_response.status_code, 304)
+        self.assertEqual(not_modified_response['ETag'], etag)
+        self.assertEqual(other_filter_response.status_code, 200)
+        self.assertEqual(changed_response.status_code, 200)
+        self.assertNotEqual(changed_response['ETag'], etag)
+
+    def test_buildings_api_supports_if_modified_since(self):
+        """Catalog responses should honour Last-Modified validators."""
+        params = {'complex_id': self.complex.pk}
+
+        response = self.client.get('/api/buildings/', params)
+        not_modified_response = self.client.get(
+            '/api/buildings/',
+            params,
+            HTTP_IF_MODIFIED_SINCE=response['Last-Modified'],
+        )
+        error_response = self.client.get(
+            '/api/buildings/',
+            {'complex_id': 'abc'},
+        )
+
+        self.assertEqual(not_modified_response.status_code, 304)
+        self.assertEqual(error_response.status_code, 400)
+        self.assertFalse(error_response.has_header('ETag'))
+
+    def test_complexes_api_pages_with_cursor(self):
+        """Selector APIs should page all rows with a keyset cursor."""
+        same_name_complex = self.create_complex(
+            'Complex 1',
+            self.other_developer,
+            self.district,
+        )
+        first_complex = self.create_complex(
+            'Complex 0',
+            self.developer,
+            self.district,
+        )
+
+        pages = []
+        params = {'district_id': self.district.pk, 'limit': 2}
+        while True:
+            response = self.client.get('/api/complexes/', params)
+            self.assertEqual(response.status_code, 200)
+            pages.append([item['id'] for item in response.json()])
+            if not response.has_header('X-Next-Cursor'):
+                break
+            self.assertIn('rel="next"', response['Link'])
+            params['cursor'] = response['X-Next-Cursor']
+
+        self.assertEqual(
+            pages,
+            [
+                [first_complex.pk, self.complex.pk],
+                [same_name_complex.pk],
+            ],
+        )
+
+    def test_cities_api_rejects_invalid_cursor(self):
+        """Selector APIs should reject cursors they did not issue."""
+        response = self.client.get(
+            '/api/cities/',
+            {'region_id': self.region.pk, 'cursor': 'not a cursor'},
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'Invalid cursor.'})
+
+    def test_catalog_snapshot_streams_compressed_ndjson(self):
+        """The snapshot should stream the whole catalog tree as NDJSON."""
+        response = self.client.get(
+            '/api/catalog/snapshot/',
+            HTTP_ACCEPT_ENCODING='gzip',
+        )
+        content = gzip.decompress(b''.join(response.streaming_content))
+        records = [
+            json.loads(line)
+            for line in content.decode('utf-8').splitlines()
+        ]
+        not_modified_response = self.client.get(
+            '/api/catalog/snapshot/',
+            HTTP_ACCEPT_ENCODING='gzip',
+            HTTP_IF_NONE_MATCH=response['ETag'],
+        )
+        self.client.logout()
+        anonymous_response = self.client.get('/api/catalog/snapshot/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('private', response['Cache-Control'])
+        self.assertEqual(
+            [record['type'] for record in records],
+            [
+                'region',
+                'region',
+                'city',
+                'city',
+                'district',
+                'district',
+                'complex',
+                'complex',
+                'building',
+                'building',
+            ],
+        )
+        self.assertIn(
+            {
+                'type': 'building',
+                'id': self.building.pk,
+                'number': self.building.number,
+                'real_estate_complex_id': self.complex.pk,
+            },
+            records,
+        )
+        self.assertEqual(not_modified_response.status_code, 304)
+        self.assertEqual(anonymous_response.status_code, 401)
+
+    def test_catalog_snapshot_etag_depends_on_encoding(self):
+        """Gzip and identity snapshots should not share a strong ETag."""
+        gzip_response = self.client.get(
+            '/api/catalog/snapshot/',
+            HTTP_ACCEPT_ENCODING='gzip',
+        )
+        identity_response = self.client.get('/api/catalog/snapshot/')
+        cross_response = self.client.get(
+            '/api/catalog/snapshot/',
+            HTTP_IF_NONE_MATCH=gzip_response['ETag'],
+        )
+
+        self.assertTrue(gzip_response['ETag'].endswith('-gzip"'))
+        self.assertNotEqual(gzip_response['ETag'], identity_response['ETag'])
+        self.assertNotIn('Content-Encoding', identity_response)
+        self.assertEqual(cross_response.status_code, 200)
+        self.assertEqual(cross_response['ETag'], identity_response['ETag'])
+
+    def test_catalog_snapshot_reads_sections_in_one_transaction(self):
+        """Every snapshot section should be read in the same transaction."""
+        atomic_states = []
+        original_dumps = json.dumps
+
+        def record_dumps(*args, **kwargs):
+            atomic_states.append(
+                (connection.in_atomic_block, len(connection.savepoint_ids))
+            )
+            return original_dumps(*args, **kwargs)
+
+        response = self.client.get('/api/catalog/snapshot/')
+        outer_savepoints = len(connection.savepoint_ids)
+        with patch('property.api_urls.json.dumps', side_effect=record_dumps):
+            b''.join(response.streaming_content)
+
+        self.assertEqual(len(atomic_states), 10)
+        self.assertEqual(
+            set(atomic_states),
+            {(True, outer_savepoints + 1)},
+        )
+
     def test_buildings_api_requires_complex(self):
         """The buildings API should return rows only for a selected complex."""
         empty_response = self.client.get('/api/buildings/')
@@ -1,7 +1,6 @@
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 from django import forms
 from django.contrib import messages
@@ -27,6 +26,7 @@ from django.views.generic import (
 )
 
 from core.forms import GroupedDecimalField, format_grouped_decimal_value
+from jobs.queue import enqueue_job
 from location.models import City, District, Metro, MetroLine, Region
 from users.roles import (
     CatalogManagementRequiredMixin,
@@ -59,13 +59,12 @@ from .models import (
     WindowView,
 )
 from .services.developer_registry_file_client import (
-    FileDeveloperRegistryClient,
     SUPPORTED_SOURCE_FILE_EXTENSIONS,
 )
 from .services.developer_registry_importer import (
     DeveloperRegistryImportError,
-    import_dom_rf_developers,
 )
+from .tasks import DEVELOPER_REGISTRY_IMPORT_JOB
 
 
 FORM_DATA_CACHE_TIMEOUT = 600
@@ -1132,40 +1131,34 @@ class DeveloperDeleteView(
 
 
 class DeveloperRegistryImportView(ExternalDataSyncRequiredMixin, View):
-    """Run developer and company group import from DOM.RF registry."""
+    """Queue developer and company group import from DOM.RF registry."""
 
     def post(self, request, *args, **kwargs):
-        """Run the registry import and redirect to the developer list."""
+        """Queue the registry import and redirect to the developer list."""
         try:
-            summary = self.run_import(request)
+            job = self.enqueue_import(request)
         except DeveloperRegistryImportError as exception:
             messages.error(
                 request,
                 f'Не удалось обновить застройщиков из ЕРЗ: {exception}',
             )
         else:
-            messages.success(request, summary.to_message())
+            messages.info(
+                request,
+                f'Импорт ЕРЗ поставлен в очередь: задача №{job.pk}.',
+            )
         return redirect('property:developer_list')
 
-    def run_import(self, request):
-        """Run import from an uploaded file or from the online registry."""
+    def enqueue_import(self, request):
+        """Queue import from an uploaded file or from the online registry."""
         uploaded_file = request.FILES.get(DEVELOPER_REGISTRY_UPLOAD_FIELD_NAME)
         if uploaded_file:
-            return self.import_uploaded_file(uploaded_file)
-        return import_dom_rf_developers()
-
-    def import_uploaded_file(self, uploaded_file):
-        """Import developers from a user-uploaded registry source file."""
-        self.validate_uploaded_file(uploaded_file)
-        source_file_path = self.save_uploaded_file_to_temporary_path(
-            uploaded_file
+            self.validate_uploaded_file(uploaded_file)
+        return enqueue_job(
+            DEVELOPER_REGISTRY_IMPORT_JOB,
+            user=request.user,
+            source_file=uploaded_file or None,
         )
-        try:
-            return import_dom_rf_developers(
-                client=FileDeveloperRegistryClient(source_file_path)
-            )
-        finally:
-            Path(source_file_path).unlink(missing_ok=True)
 
     def validate_uploaded_file(self, uploaded_file):
         """Validate developer registry upload metadata before parsing."""
@@ -1188,15 +1181,6 @@ class DeveloperRegistryImportView(ExternalDataSyncRequiredMixin, View):
                 'Файл импорта не должен превышать 20 МБ.'
             )
 
-    def save_uploaded_file_to_temporary_path(self, uploaded_file):
-        """Persist an uploaded file to a temporary parser-readable path."""
-        uploaded_file_name = getattr(uploaded_file, 'name', '')
-        extension = Path(uploaded_file_name).suffix.casefold()
-        with NamedTemporaryFile(delete=False, suffix=extension) as source_file:
-            for chunk in uploaded_file.chunks():
-                source_file.write(chunk)
-            return source_file.name
-
 
 class RealEstateComplexListView(ListView):
     """Описание класса RealEstateComplexListView.
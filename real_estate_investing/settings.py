@@ -51,6 +51,7 @@ INSTALLED_APPS = [
     'mortgage.apps.CalculatorConfig',
     'trench_mortgage.apps.TrenchMortgageConfig',
     'customer.apps.CustomerConfig',
+    'jobs.apps.JobsConfig',
 ]
 
 MIDDLEWARE = [
@@ -78,6 +79,7 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
                 'users.context_processors.application_roles',
+                'jobs.context_processors.active_background_jobs',
             ],
         },
     },
@@ -141,6 +143,18 @@ PUBLIC_CATALOG_API_MAX_RESULTS = get_env_int(
     'PUBLIC_CATALOG_API_MAX_RESULTS',
     200,
 )
+PUBLIC_CATALOG_API_CACHE_MAX_AGE = get_env_int(
+    'PUBLIC_CATALOG_API_CACHE_MAX_AGE',
+    60,
+)
+DOM_RF_DEVELOPER_DETAIL_CACHE_DIR = Path(
+    os.getenv('DOM_RF_DEVELOPER_DETAIL_CACHE_DIR', '').strip()
+    or BASE_DIR / 'cache' / 'dom_rf'
+)
+DOM_RF_DEVELOPER_DETAIL_CACHE_TTL_SECONDS = get_env_int(
+    'DOM_RF_DEVELOPER_DETAIL_CACHE_TTL_SECONDS',
+    7 * 24 * 60 * 60,
+)
 
 AUTH_USER_MODEL = 'users.User'
 
@@ -19,6 +19,7 @@ urlpatterns = [
     path('api/', include('property.api_urls')),
     path('mortgage/', include('mortgage.urls', namespace='mortgage')),
     path('customers/', include('customer.urls', namespace='customer')),
+    path('jobs/', include('jobs.urls', namespace='jobs')),
 ]
 
 urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
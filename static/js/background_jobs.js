@@ -0,0 +1,66 @@
+(function () {
+    const POLL_INTERVAL_MS = 3000;
+
+    function describeJob(job) {
+        if (job.status === 'succeeded') {
+            return (job.result && job.result.message) || job.label + ': выполнено.';
+        }
+        if (job.status === 'failed') {
+            return job.error || job.label + ': ошибка.';
+        }
+
+        let text = job.label + ': ' + job.status_display.toLowerCase();
+        if (job.progress.total) {
+            text += ' (' + job.progress.current + ' из ' + job.progress.total + ')';
+        }
+        if (job.progress.message) {
+            text += ' - ' + job.progress.message;
+        }
+        return text + '.';
+    }
+
+    function showWarnings(element, warnings) {
+        (warnings || []).forEach(function (warning) {
+            const warningElement = document.createElement('div');
+            warningElement.className = 'alert alert-warning';
+            warningElement.setAttribute('role', 'alert');
+            warningElement.textContent = warning;
+            element.after(warningElement);
+        });
+    }
+
+    function pollJob(element) {
+        const textElement = element.querySelector('[data-background-job-text]');
+
+        fetch(element.dataset.backgroundJobUrl, {
+            headers: {'Accept': 'application/json'},
+            credentials: 'same-origin',
+        })
+            .then(function (response) {
+                if (!response.ok) {
+                    throw new Error(response.statusText);
+                }
+                return response.json();
+            })
+            .then(function (job) {
+                textElement.textContent = describeJob(job);
+                if (!job.is_finished) {
+                    window.setTimeout(pollJob, POLL_INTERVAL_MS, element);
+                    return;
+                }
+
+                element.classList.remove('alert-info');
+                element.classList.add(job.status === 'succeeded' ? 'alert-success' : 'alert-danger');
+                if (job.result) {
+                    showWarnings(element, job.result.warnings);
+                }
+            })
+            .catch(function () {
+                window.setTimeout(pollJob, POLL_INTERVAL_MS * 2, element);
+            });
+    }
+
+    document.addEventListener('DOMContentLoaded', function () {
+        document.querySelectorAll('[data-background-job-url]').forEach(pollJob);
+    });
+})();
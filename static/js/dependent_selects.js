@@ -125,8 +125,146 @@
         });
     }
 
-    function refreshDataSelects(selects, data, selectsByField) {
+    function getSourceUrl(select, selectsByField) {
+        const paramMap = getRelationMap(select, 'cascadeSourceParam');
+        const url = new URL(
+            select.dataset.cascadeSourceUrl,
+            window.location.href
+        );
+        const hasAllParents = Object.keys(paramMap).every(function (field) {
+            const parentSelect = selectsByField[field];
+            const parentValue = parentSelect ? parentSelect.value : '';
+
+            if (parentValue) {
+                url.searchParams.set(paramMap[field], parentValue);
+            }
+            return Boolean(parentValue);
+        });
+
+        return hasAllParents ? url.toString() : '';
+    }
+
+    function getSourceItems(select, payload) {
+        if (Array.isArray(payload)) {
+            return payload;
+        }
+
+        const items = payload ? payload[select.dataset.cascadeDataKey] : null;
+        return Array.isArray(items) ? items : [];
+    }
+
+    function setSourceOptions(select, items, itemByValue) {
+        const valueKey = select.dataset.cascadeValueKey || 'id';
+        const pendingValue = select.dataset.cascadePendingValue;
+
+        delete select.dataset.cascadePendingValue;
+        itemByValue[select.dataset.cascadeField] = new Map(
+            items.map(function (item) {
+                return [String(item[valueKey]), item];
+            })
+        );
+        setOptions(select, items, pendingValue || select.value);
+    }
+
+    function fetchSourcePages(select, url, items) {
+        return fetch(url, {
+            headers: {
+                'X-Requested-With': 'XMLHttpRequest',
+            },
+        })
+            .then(function (response) {
+                if (!response.ok) {
+                    throw new Error('Cascade source request failed');
+                }
+
+                const nextCursor = response.headers.get('X-Next-Cursor');
+                return response.json().then(function (payload) {
+                    const loadedItems = items.concat(
+                        getSourceItems(select, payload)
+                    );
+                    if (!nextCursor) {
+                        return loadedItems;
+                    }
+
+                    const nextUrl = new URL(url);
+                    nextUrl.searchParams.set('cursor', nextCursor);
+                    return fetchSourcePages(
+                        select,
+                        nextUrl.toString(),
+                        loadedItems
+                    );
+                });
+            });
+    }
+
+    function refreshSourceSelect(
+        select,
+        selectsByField,
+        itemByValue,
+        sourceCache
+    ) {
+        const url = getSourceUrl(select, selectsByField);
+
+        select.dataset.cascadeSourceActiveUrl = url;
+        if (!url) {
+            delete select.dataset.cascadePendingValue;
+            setSourceOptions(select, [], itemByValue);
+            return;
+        }
+
+        if (Array.isArray(sourceCache.get(url))) {
+            setSourceOptions(select, sourceCache.get(url), itemByValue);
+            return;
+        }
+
+        if (select.value) {
+            select.dataset.cascadePendingValue = select.value;
+        }
+        if (sourceCache.has(url)) {
+            return;
+        }
+
+        sourceCache.set(url, null);
+        fetchSourcePages(select, url, [])
+            .catch(function () {
+                return null;
+            })
+            .then(function (loadedItems) {
+                const items = loadedItems || [];
+                if (loadedItems === null) {
+                    sourceCache.delete(url);
+                } else {
+                    sourceCache.set(url, items);
+                }
+                if (select.dataset.cascadeSourceActiveUrl !== url) {
+                    return;
+                }
+
+                setSourceOptions(select, items, itemByValue);
+                select.dispatchEvent(new CustomEvent('cascade:loaded', {
+                    bubbles: true,
+                }));
+            });
+    }
+
+    function refreshDataSelects(
+        selects,
+        data,
+        selectsByField,
+        itemByValue,
+        sourceCache
+    ) {
         selects.forEach(function (select) {
+            if (select.dataset.cascadeSourceUrl) {
+                refreshSourceSelect(
+                    select,
+                    selectsByField,
+                    itemByValue,
+                    sourceCache
+                );
+                return;
+            }
+
             if (!select.dataset.cascadeDataKey) {
                 refreshSearchableSelect(select);
                 return;
@@ -210,6 +348,7 @@
         });
 
         const itemByValue = buildItemByValue(selects, data);
+        const sourceCache = new Map();
 
         function sync(changedSelect) {
             if (changedSelect) {
@@ -223,7 +362,13 @@
                 applyAutofill(changedSelect, itemByValue, selectsByField);
             }
 
-            refreshDataSelects(selects, data, selectsByField);
+            refreshDataSelects(
+                selects,
+                data,
+                selectsByField,
+                itemByValue,
+                sourceCache
+            );
         }
 
         selects.forEach(function (select) {
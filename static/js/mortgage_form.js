@@ -5,9 +5,15 @@
     const propertyCostApiTemplate = scriptElement
         ? scriptElement.dataset.propertyCostApiTemplate || ''
         : '';
+    const propertyLookupUrl = scriptElement
+        ? scriptElement.dataset.propertyLookupUrl || ''
+        : '';
+    const propertyLookupCache = new Map();
     let propertyFormData = {
-        properties: [],
+        cities: [],
     };
+    let buildingPropertyItems = [];
+    let buildingPropertyRequestKey = '';
     let mortgageProgramFormData = {
         banks: [],
         programs: [],
@@ -915,25 +921,88 @@
         return buildingSelect ? String(buildingSelect.value || '') : '';
     }
 
-    function getPropertiesForSelectedBuilding() {
-        const buildingId = getSelectedBuildingId();
-        if (!buildingId || !Array.isArray(propertyFormData.properties)) {
-            return [];
-        }
+    function getSelectedComplexId() {
+        const complexSelect = document.getElementById('complex-select');
+        return complexSelect ? String(complexSelect.value || '') : '';
+    }
 
-        return propertyFormData.properties.filter(function (propertyItem) {
-            return String(propertyItem.building_id || '') === buildingId;
-        });
+    function getApartmentNumberQuery() {
+        const input = getApartmentNumberInput();
+        return input ? String(input.value || '').trim() : '';
     }
 
-    function getPropertyById(propertyId) {
-        if (!propertyId || !Array.isArray(propertyFormData.properties)) {
-            return null;
+    function requestBuildingProperties(complexId, buildingId, query) {
+        if (!propertyLookupUrl || !complexId || !buildingId) {
+            return Promise.resolve([]);
         }
 
-        return propertyFormData.properties.find(function (propertyItem) {
-            return String(propertyItem.id || '') === String(propertyId);
-        }) || null;
+        const url = new URL(propertyLookupUrl, window.location.href);
+        url.searchParams.set('complex_id', complexId);
+        url.searchParams.set('building_id', buildingId);
+        if (query) {
+            url.searchParams.set('q', query);
+        }
+
+        const cacheKey = url.toString();
+        if (!propertyLookupCache.has(cacheKey)) {
+            propertyLookupCache.set(
+                cacheKey,
+                fetchPropertyLookupPages(url, 1, []).catch(function () {
+                    propertyLookupCache.delete(cacheKey);
+                    return [];
+                })
+            );
+        }
+
+        return propertyLookupCache.get(cacheKey);
+    }
+
+    function fetchPropertyLookupPages(url, page, items) {
+        const pageUrl = new URL(url.toString());
+        pageUrl.searchParams.set('page', String(page));
+
+        return fetch(pageUrl.toString(), {
+            headers: {
+                'X-Requested-With': 'XMLHttpRequest',
+            },
+        })
+            .then(function (response) {
+                if (!response.ok) {
+                    throw new Error('Property lookup failed');
+                }
+                return response.json();
+            })
+            .then(function (payload) {
+                const pageItems = Array.isArray(payload.results)
+                    ? payload.results
+                    : [];
+                const loadedItems = items.concat(pageItems);
+                if (!payload.has_next || !pageItems.length) {
+                    return loadedItems;
+                }
+                return fetchPropertyLookupPages(url, page + 1, loadedItems);
+            });
+    }
+
+    function loadBuildingProperties() {
+        const complexId = getSelectedComplexId();
+        const buildingId = getSelectedBuildingId();
+        const query = getApartmentNumberQuery();
+        const requestKey = [complexId, buildingId, query].join(':');
+
+        buildingPropertyRequestKey = requestKey;
+        return requestBuildingProperties(complexId, buildingId, query)
+            .then(function (items) {
+                const isCurrent = buildingPropertyRequestKey === requestKey;
+                if (isCurrent) {
+                    buildingPropertyItems = items;
+                }
+                return isCurrent;
+            });
+    }
+
+    function getPropertiesForSelectedBuilding() {
+        return getSelectedBuildingId() ? buildingPropertyItems : [];
     }
 
     function getSelectedBuildingPropertyByApartmentNumber(apartmentNumber) {
@@ -1006,19 +1075,24 @@
     }
 
     function getApartmentMenuMatches() {
-        const input = getApartmentNumberInput();
-        const query = input ? String(input.value || '').trim().toLowerCase() : '';
-        const properties = getPropertiesForSelectedBuilding();
+        const query = getApartmentNumberQuery().toLowerCase();
 
-        if (!query) {
-            return properties;
-        }
+        return getPropertiesForSelectedBuilding().filter(
+            function (propertyItem) {
+                return String(propertyItem.apartment_number || '')
+                    .trim()
+                    .toLowerCase()
+                    .startsWith(query);
+            }
+        );
+    }
 
-        return properties.filter(function (propertyItem) {
-            return String(propertyItem.apartment_number || '')
-                .trim()
-                .toLowerCase()
-                .includes(query);
+    function updateApartmentMenu() {
+        return loadBuildingProperties().then(function (isCurrent) {
+            if (isCurrent) {
+                renderApartmentMenu();
+            }
+            return isCurrent;
         });
     }
 
@@ -1072,10 +1146,10 @@
 
         renderApartmentMenu();
         menu.classList.remove('d-none');
+        updateApartmentMenu();
     }
 
     function syncApartmentSelection() {
-        renderApartmentMenu();
         handleApartmentNumberInput();
     }
 
@@ -1133,7 +1207,7 @@
         setFieldValue('id_OBJECT_LAYOUT', '', true);
         setFieldValue('id_OBJECT_FLOOR', '');
         setFieldValue('id_OBJECT_DECORATION', '', true);
-        window.setTimeout(renderApartmentMenu, 0);
+        window.setTimeout(updateApartmentMenu, 0);
     }
 
     function handleBuildingChange() {
@@ -1142,9 +1216,9 @@
             costInput.value = '';
         }
         window.setTimeout(function () {
-            renderApartmentMenu();
             clearPropertySpecificFields(true);
             handlePropertyCostChange();
+            updateApartmentMenu();
         }, 0);
     }
 
@@ -1159,16 +1233,21 @@
             sourceInput.value = input.value;
         }
 
-        renderApartmentMenu();
-        const propertyItem = getSelectedBuildingPropertyByApartmentNumber(
-            input.value
-        );
-        if (!propertyItem) {
-            setSelectedPropertyId('');
-            return;
-        }
+        updateApartmentMenu().then(function (isCurrent) {
+            if (!isCurrent) {
+                return;
+            }
+
+            const propertyItem = getSelectedBuildingPropertyByApartmentNumber(
+                input.value
+            );
+            if (!propertyItem) {
+                setSelectedPropertyId('');
+                return;
+            }
 
-        applySelectedProperty(propertyItem);
+            applySelectedProperty(propertyItem);
+        });
     }
 
     function handleApartmentNumberFocus() {
@@ -1228,8 +1307,12 @@
         setFieldValue('district-select', data.district_id, true);
         setFieldValue('developer-select', data.developer_id, true);
         setFieldValue('complex-select', data.complex_id, true);
+        const buildingSelect = getBuildingSelect();
+        if (buildingSelect && data.building_id) {
+            // Buildings of the selected complex may still be loading.
+            buildingSelect.dataset.cascadePendingValue = data.building_id;
+        }
         setFieldValue('id_building', data.building_id);
-        renderApartmentMenu();
         fillPropertySpecificFields(data);
     }
 
@@ -1471,7 +1554,7 @@
         const selectedPropertyId = selectedPropertyInput
             ? selectedPropertyInput.value
             : '';
-        if (!getPropertyById(selectedPropertyId)) {
+        if (!selectedPropertyId) {
             handleApartmentNumberInput();
         }
     });
@@ -0,0 +1,32 @@
+# Generated by Django 6.0.4 on 2026-10-18 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trench_mortgage', '0005_alter_trench_options_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrenchMortgageCalculationSchedule',
+            fields=[
+                ('calculation', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stored_schedule', serialize=False, to='trench_mortgage.trenchmortgagecalculation', verbose_name='Расчет траншевой ипотеки')),
+                ('input_hash', models.CharField(max_length=64, verbose_name='Хеш исходных данных')),
+                ('format_version', models.PositiveSmallIntegerField(verbose_name='Версия формата')),
+                ('engine_version', models.PositiveSmallIntegerField(verbose_name='Версия движка расчета')),
+                ('first_payment_date', models.DateField(blank=True, null=True, verbose_name='Дата первого платежа')),
+                ('payment_count', models.PositiveIntegerField(verbose_name='Число платежей')),
+                ('columns', models.BinaryField(verbose_name='Колонки графика')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Дата обновления')),
+            ],
+            options={
+                'verbose_name': 'График платежей траншевого расчета',
+                'verbose_name_plural': 'Графики платежей траншевых расчетов',
+                'db_table': 'trench_mortgage_calculation_schedule',
+            },
+        ),
+    ]
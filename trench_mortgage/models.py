@@ -149,3 +149,54 @@ class Trench(models.Model):
         ordering = ['trench_number']
         verbose_name = 'Транш'
         verbose_name_plural = 'Транши'
+
+
+class TrenchMortgageCalculationSchedule(models.Model):
+    """Сохраненный общий график платежей траншевого расчета.
+
+    Денежные колонки графика хранятся упакованными массивами float64,
+    даты платежей восстанавливаются по дате первого платежа. Версия
+    движка позволяет пересобрать график после изменения алгоритма.
+    """
+
+    calculation = models.OneToOneField(
+        TrenchMortgageCalculation,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stored_schedule',
+        verbose_name='Расчет траншевой ипотеки',
+    )
+    input_hash = models.CharField(
+        max_length=64,
+        verbose_name='Хеш исходных данных',
+    )
+    format_version = models.PositiveSmallIntegerField(
+        verbose_name='Версия формата',
+    )
+    engine_version = models.PositiveSmallIntegerField(
+        verbose_name='Версия движка расчета',
+    )
+    first_payment_date = models.DateField(
+        null=True,
+        blank=True,
+        verbose_name='Дата первого платежа',
+    )
+    payment_count = models.PositiveIntegerField(
+        verbose_name='Число платежей',
+    )
+    columns = models.BinaryField(verbose_name='Колонки графика')
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Дата обновления',
+    )
+
+    class Meta:
+        """Метаданные сохраненных графиков траншевых расчетов."""
+
+        db_table = 'trench_mortgage_calculation_schedule'
+        verbose_name = 'График платежей траншевого расчета'
+        verbose_name_plural = 'Графики платежей траншевых расчетов'
+
+    def __str__(self):
+        """Возвращает строковое представление сохраненного графика."""
+        return f'График платежей траншевого расчета #{self.calculation_id}'
@@ -0,0 +1,180 @@
+import numpy as np
+
+from mortgage.payment_schedule import (
+    PaymentScheduleColumns,
+    month_offset_dates,
+    monthly_payment_dates,
+)
+
+# Увеличивается при любом изменении алгоритма, влияющем на суммы графика:
+# сохраненные графики с другой версией пересчитываются при чтении.
+TRENCH_SCHEDULE_ENGINE_VERSION = 1
+
+
+def calculate_months_remaining(start_date, end_date):
+    """Возвращает число полных месяцев между двумя датами."""
+    months = (end_date.year - start_date.year) * 12 + (
+        end_date.month - start_date.month
+    )
+    if end_date.day < start_date.day:
+        months -= 1
+    return months
+
+
+def _count_payment_dates_before(first_payment_date, boundary_date):
+    """Возвращает число дат платежей строго раньше ``boundary_date``.
+
+    Даты платежей идут с шагом в месяц от ``first_payment_date``;
+    все даты до месяца ``boundary_date`` считаются сразу, а дата
+    в месяце границы сравнивается по таблице смещений.
+    """
+    months = (boundary_date.year - first_payment_date.year) * 12 + (
+        boundary_date.month - first_payment_date.month
+    )
+    if months < 0:
+        return 0
+
+    boundary_month_date = monthly_payment_dates(
+        first_payment_date, months + 1
+    )[months]
+    return months + int(boundary_month_date < np.datetime64(boundary_date))
+
+
+def calculate_payment_count_in_schedule(
+    first_payment_date, start_date, end_date
+):
+    """Возвращает число дат платежей в интервале ``[start, end)``."""
+    if not first_payment_date or end_date <= start_date:
+        return 0
+
+    return _count_payment_dates_before(
+        first_payment_date, end_date
+    ) - _count_payment_dates_before(first_payment_date, start_date)
+
+
+def _trench_amortization(balance, monthly_rate, monthly_payment, months,
+                         is_final_period):
+    """Рассчитывает колонки одного транша в закрытой форме.
+
+    Возвращает массивы процентов, погашения основного долга и остатка
+    долга после каждого из ``months`` платежей. Транш гасится целиком
+    в платеже, где аннуитет покрывает остаток, и в последнем месяце
+    срока, если ``is_final_period``; после погашения платежи нулевые.
+    """
+    rate = monthly_rate if monthly_rate > 0 else 0.0
+    payment_indexes = np.arange(months + 1, dtype=np.float64)
+    if rate > 0 and monthly_payment <= balance * rate:
+        # Аннуитет не покрывает проценты: долг не уменьшается.
+        balances = np.full(months + 1, float(balance))
+    elif rate > 0:
+        factors = np.power(1 + rate, payment_indexes)
+        balances = balance * factors - monthly_payment * (factors - 1) / rate
+    else:
+        balances = balance - monthly_payment * payment_indexes
+
+    opening_balances = balances[:-1]
+    interest = opening_balances * rate
+    principal = np.maximum(monthly_payment - interest, 0.0)
+    closing_balances = opening_balances - principal
+
+    payoff_months = np.flatnonzero(principal >= opening_balances)
+    payoff_index = payoff_months[0] if len(payoff_months) else months
+    if is_final_period:
+        payoff_index = min(payoff_index, months - 1)
+    if payoff_index < months:
+        principal[payoff_index] = opening_balances[payoff_index]
+        closing_balances[payoff_index] = 0.0
+        interest[payoff_index + 1:] = 0.0
+        principal[payoff_index + 1:] = 0.0
+        closing_balances[payoff_index + 1:] = 0.0
+
+    return interest, principal, np.maximum(closing_balances, 0.0)
+
+
+def build_trench_schedule_columns(trenches, mortgage_end_date):
+    """Собирает общий график платежей по всем траншам.
+
+    Каждый транш рассчитывается как срез на общей оси месяцев, а суммы
+    по траншам складываются векторно в порядке траншей. Остаток долга
+    учитывает только транши, выданные к дате платежа.
+
+    Возвращает:
+        PaymentScheduleColumns | None: Колонки графика или None, если
+        ни у одного транша нет месяцев до конца срока.
+    """
+    trench_states = []
+    for trench in trenches:
+        months_to_end = calculate_months_remaining(
+            trench['date'], mortgage_end_date
+        )
+        if months_to_end <= 0:
+            continue
+        trench_states.append(
+            (
+                trench['date'],
+                months_to_end,
+                trench['annual_rate'] / 100 / 12,
+                trench.get(
+                    'trench_monthly_payment', trench['monthly_payment']
+                ),
+                trench['amount'],
+            )
+        )
+
+    if not trench_states:
+        return None
+
+    first_payment_date = min(state[0] for state in trench_states)
+    total_months = calculate_months_remaining(
+        first_payment_date, mortgage_end_date
+    )
+    payment_dates = month_offset_dates(first_payment_date, total_months)
+    payment_amount = np.zeros(total_months)
+    interest_amount = np.zeros(total_months)
+    principal_amount = np.zeros(total_months)
+    remaining_debt = np.zeros(total_months)
+
+    for (
+        start_date,
+        months_to_end,
+        monthly_rate,
+        monthly_payment,
+        balance,
+    ) in trench_states:
+        first_index = int(
+            np.searchsorted(payment_dates, np.datetime64(start_date))
+        )
+        active_months = min(months_to_end, total_months - first_index)
+        if active_months <= 0:
+            continue
+
+        interest, principal, balances = _trench_amortization(
+            balance,
+            monthly_rate,
+            monthly_payment,
+            active_months,
+            is_final_period=active_months == months_to_end,
+        )
+        active_slice = slice(first_index, first_index + active_months)
+        payment_amount[active_slice] += interest + principal
+        interest_amount[active_slice] += interest
+        principal_amount[active_slice] += principal
+        remaining_debt[active_slice] += balances
+        remaining_debt[first_index + active_months:] += balances[-1]
+
+    return PaymentScheduleColumns(
+        payment_numbers=np.arange(1, total_months + 1, dtype=np.int64),
+        payment_dates=payment_dates,
+        payment_amount=payment_amount,
+        interest_amount=interest_amount,
+        principal_amount=principal_amount,
+        remaining_debt=remaining_debt,
+    )
+
+
+def build_trench_payment_schedule(trenches, mortgage_end_date):
+    """Возвращает общий график платежей по траншам по строкам."""
+    columns = build_trench_schedule_columns(trenches, mortgage_end_date)
+    if columns is None:
+        return []
+    return columns.to_rows()
@@ -0,0 +1,116 @@
+# trench_mortgage/schedule_store.py
+import hashlib
+import json
+
+from core.models import get_stored_decimal_value
+from mortgage.payment_schedule import month_offset_dates
+from mortgage.schedule_store import (
+    SCHEDULE_FORMAT_VERSION,
+    pack_schedule_columns,
+    unpack_schedule_columns,
+)
+
+from .models import TrenchMortgageCalculationSchedule
+from .payment_schedule import (
+    TRENCH_SCHEDULE_ENGINE_VERSION,
+    build_trench_schedule_columns,
+)
+
+
+def get_trench_calculation_input_hash(calculation, trenches):
+    """Возвращает хеш исходных данных, от которых зависит график.
+
+    Суммы берутся в том виде, в каком они хранятся в базе данных,
+    поэтому хеш совпадает до и после сохранения расчета.
+    """
+    inputs = {
+        'initial_payment_date': calculation.initial_payment_date.isoformat(),
+        'mortgage_term': int(calculation.mortgage_term),
+        'trenches': [
+            [
+                trench.trench_date.isoformat(),
+                get_stored_decimal_value(trench, 'trench_amount'),
+                get_stored_decimal_value(trench, 'annual_rate'),
+                get_stored_decimal_value(trench, 'monthly_payment'),
+            ]
+            for trench in trenches
+        ],
+    }
+    payload = json.dumps(inputs, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()
+
+
+def store_trench_calculation_schedule(calculation, trenches, columns):
+    """Сохраняет рассчитанный график платежей траншевого расчета.
+
+    Аргументы:
+        calculation: Сохраненный траншевый расчет.
+        trenches: Транши расчета в порядке номеров.
+        columns: Колонки графика или None для пустого графика.
+    """
+    if columns is None:
+        first_payment_date = None
+        payment_count = 0
+        packed_columns = b''
+    else:
+        first_payment_date = columns.payment_dates[0].item()
+        payment_count = len(columns)
+        packed_columns = pack_schedule_columns(columns)
+
+    stored_schedule, _created = (
+        TrenchMortgageCalculationSchedule.objects.update_or_create(
+            calculation_id=calculation.pk,
+            defaults={
+                'input_hash': get_trench_calculation_input_hash(
+                    calculation, trenches
+                ),
+                'format_version': SCHEDULE_FORMAT_VERSION,
+                'engine_version': TRENCH_SCHEDULE_ENGINE_VERSION,
+                'first_payment_date': first_payment_date,
+                'payment_count': payment_count,
+                'columns': packed_columns,
+            },
+        )
+    )
+    calculation.stored_schedule = stored_schedule
+    return stored_schedule
+
+
+def get_trench_calculation_payment_schedule(
+    calculation, trench_data, mortgage_end_date
+):
+    """Возвращает график траншевого расчета из хранилища или пересчитывает.
+
+    Сохраненный график используется, если совпадают версия формата,
+    версия движка и хеш исходных данных. Иначе график строится заново
+    по ``trench_data`` и сохраняется.
+
+    Возвращает:
+        list[dict]: График платежей по строкам.
+    """
+    trenches = list(calculation.trenches.all())
+    try:
+        stored_schedule = calculation.stored_schedule
+    except TrenchMortgageCalculationSchedule.DoesNotExist:
+        stored_schedule = None
+
+    if (
+        stored_schedule is not None
+        and stored_schedule.format_version == SCHEDULE_FORMAT_VERSION
+        and stored_schedule.engine_version == TRENCH_SCHEDULE_ENGINE_VERSION
+        and stored_schedule.input_hash
+        == get_trench_calculation_input_hash(calculation, trenches)
+    ):
+        if not stored_schedule.payment_count:
+            return []
+        return unpack_schedule_columns(
+            stored_schedule.columns,
+            month_offset_dates(
+                stored_schedule.first_payment_date,
+                stored_schedule.payment_count,
+            ),
+        ).to_rows()
+
+    columns = build_trench_schedule_columns(trench_data, mortgage_end_date)
+    store_trench_calculation_schedule(calculation, trenches, columns)
+    return columns.to_rows() if columns is not None else []
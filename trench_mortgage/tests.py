@@ -1,9 +1,15 @@
 from datetime import date
 from decimal import Decimal
 
+import pytest
+from dateutil.relativedelta import relativedelta
 from django.test import SimpleTestCase
 
 from trench_mortgage.models import Trench, TrenchMortgageCalculation
+from trench_mortgage.payment_schedule import (
+    build_trench_payment_schedule,
+    calculate_payment_count_in_schedule,
+)
 from trench_mortgage.views import (
     _calculate_months_remaining,
     _calculate_trench_mortgage,
@@ -33,6 +39,101 @@ def test_trench_mortgage_model_verbose_names():
     )
 
 
+
+def test_payment_count_follows_sequential_month_end_dates():
+    """Payment counts should match month-by-month date stepping."""
+    first_payment_date = date(2026, 1, 31)
+    payment_dates = [first_payment_date]
+    for _ in range(24):
+        payment_dates.append(payment_dates[-1] + relativedelta(months=1))
+    boundaries = [
+        date(2026, 1, 30),
+        date(2026, 2, 28),
+        date(2026, 3, 28),
+        date(2026, 3, 29),
+        date(2026, 8, 31),
+        date(2027, 1, 28),
+        date(2027, 2, 1),
+    ]
+
+    for start_date in boundaries:
+        for end_date in boundaries:
+            expected = sum(
+                start_date <= payment_date < end_date
+                for payment_date in payment_dates
+            )
+            assert calculate_payment_count_in_schedule(
+                first_payment_date, start_date, end_date
+            ) == expected
+
+
+def test_trench_schedule_matches_iterative_amortization():
+    """Vectorized tranche schedule should match month-by-month stepping."""
+    first_date = date(2026, 1, 31)
+    mortgage_end_date = first_date + relativedelta(months=120)
+    trenches = [
+        {
+            'date': first_date,
+            'annual_rate': 12.0,
+            'amount': 1_000_000.0,
+            'trench_monthly_payment': 14_347.09,
+            'monthly_payment': 14_347.09,
+        },
+        {
+            'date': date(2026, 6, 15),
+            'annual_rate': 0.0,
+            'amount': 300_000.0,
+            'trench_monthly_payment': 50_000.0,
+            'monthly_payment': 64_347.09,
+        },
+        {
+            'date': date(2027, 2, 28),
+            'annual_rate': 24.0,
+            'amount': 500_000.0,
+            'trench_monthly_payment': 5_000.0,
+            'monthly_payment': 69_347.09,
+        },
+    ]
+    states = [
+        {
+            'date': trench['date'],
+            'rate': trench['annual_rate'] / 100 / 12,
+            'payment': trench['trench_monthly_payment'],
+            'balance': trench['amount'],
+        }
+        for trench in trenches
+    ]
+
+    schedule = build_trench_payment_schedule(trenches, mortgage_end_date)
+
+    assert len(schedule) == 120
+    for month_index, row in enumerate(schedule):
+        payment_date = first_date + relativedelta(months=month_index)
+        payment_amount = 0.0
+        for state in states:
+            if payment_date < state['date']:
+                continue
+            interest = state['balance'] * state['rate']
+            principal = min(
+                max(state['payment'] - interest, 0.0), state['balance']
+            )
+            if month_index == len(schedule) - 1:
+                principal = state['balance']
+            state['balance'] -= principal
+            payment_amount += interest + principal
+        remaining_debt = sum(
+            state['balance'] for state in states
+            if state['date'] <= payment_date
+        )
+        assert row['payment_date'] == payment_date
+        assert row['payment_amount'] == pytest.approx(
+            payment_amount, abs=0.01
+        )
+        assert row['remaining_debt'] == pytest.approx(
+            remaining_debt, abs=0.01
+        )
+
+
 class TrenchMortgageCalculationTests(SimpleTestCase):
     """Описание класса TrenchMortgageCalculationTests.
 
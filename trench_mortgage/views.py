@@ -11,6 +11,13 @@ from openpyxl.utils import get_column_letter
 
 from mortgage.utils import format_currency
 from .models import Trench, TrenchMortgageCalculation
+from .payment_schedule import (
+    build_trench_schedule_columns,
+    calculate_months_remaining as _calculate_months_remaining,
+    calculate_payment_count_in_schedule as
+    _calculate_payment_count_in_schedule,
+)
+from .schedule_store import store_trench_calculation_schedule
 
 MAX_TRENCH_COUNT = 5
 
@@ -545,34 +552,20 @@ def _calculate_trench_mortgage(mortgage_data, trench_entries):
         'total_loan_amount': mortgage_data['total_loan_amount'],
         'total_overpayment': total_overpayment,
         'trenches': trenches_result,
-        'payment_schedule': _build_trench_payment_schedule(
-            trenches_result, mortgage_end_date
-        ),
     }
+    payment_schedule_columns = build_trench_schedule_columns(
+        trenches_result, mortgage_end_date
+    )
+    calculation['payment_schedule_columns'] = payment_schedule_columns
+    calculation['payment_schedule'] = (
+        payment_schedule_columns.to_rows()
+        if payment_schedule_columns is not None
+        else []
+    )
 
     return calculation, []
 
 
-def _calculate_months_remaining(start_date, end_date):
-    """Описание метода _calculate_months_remaining.
-
-    Выполняет прикладную операцию текущего модуля.
-
-    Аргументы:
-        start_date: Входной параметр, влияющий на работу метода.
-        end_date: Входной параметр, влияющий на работу метода.
-
-    Возвращает:
-        Any: Тип результата определяется вызывающим кодом.
-    """
-    months = (end_date.year - start_date.year) * 12 + (
-        end_date.month - start_date.month
-    )
-    if end_date.day < start_date.day:
-        months -= 1
-    return months
-
-
 def _calculate_trench_overpayment(
     trench_monthly_payment, trench_amount, payments_count
 ):
@@ -580,119 +573,6 @@ def _calculate_trench_overpayment(
     return (trench_monthly_payment * payments_count) - trench_amount
 
 
-def _calculate_payment_count_in_schedule(
-    first_payment_date, start_date, end_date
-):
-    """Return payment dates in the shared schedule interval."""
-    if not first_payment_date or end_date <= start_date:
-        return 0
-
-    payment_count = 0
-    payment_date = first_payment_date
-    while payment_date < end_date:
-        if payment_date >= start_date:
-            payment_count += 1
-        payment_date += relativedelta(months=1)
-
-    return payment_count
-
-
-def _build_trench_payment_schedule(trenches, mortgage_end_date):
-    """Описание метода _build_trench_payment_schedule.
-
-    Выполняет прикладную операцию текущего модуля.
-
-    Аргументы:
-        trenches: Входной параметр, влияющий на работу метода.
-        mortgage_end_date: Входной параметр, влияющий на работу метода.
-
-    Возвращает:
-        Any: Тип результата определяется вызывающим кодом.
-    """
-    if not trenches:
-        return []
-
-    trench_states = []
-    for trench in trenches:
-        months_to_end = _calculate_months_remaining(
-            trench['date'], mortgage_end_date
-        )
-        if months_to_end <= 0:
-            continue
-
-        trench_states.append(
-            {
-                'start_date': trench['date'],
-                'months_left': months_to_end,
-                'monthly_rate': trench['annual_rate'] / 100 / 12,
-                'monthly_payment': trench.get(
-                    'trench_monthly_payment', trench['monthly_payment']
-                ),
-                'balance': trench['amount'],
-            }
-        )
-
-    if not trench_states:
-        return []
-
-    first_payment_date = min(state['start_date'] for state in trench_states)
-    total_schedule_months = _calculate_months_remaining(
-        first_payment_date, mortgage_end_date
-    )
-    payment_schedule = []
-
-    for month_index in range(total_schedule_months):
-        payment_date = first_payment_date + relativedelta(months=month_index)
-        payment_amount = 0.0
-        interest_amount = 0.0
-        principal_amount = 0.0
-
-        for state in trench_states:
-            if payment_date < state['start_date'] or state['months_left'] <= 0:
-                continue
-
-            trench_interest = (
-                state['balance'] * state['monthly_rate']
-                if state['monthly_rate'] > 0
-                else 0.0
-            )
-            trench_principal = max(
-                state['monthly_payment'] - trench_interest, 0.0
-            )
-
-            if (
-                state['months_left'] == 1
-                or trench_principal >= state['balance']
-            ):
-                trench_principal = state['balance']
-
-            trench_payment = trench_interest + trench_principal
-            state['balance'] = max(state['balance'] - trench_principal, 0.0)
-            state['months_left'] -= 1
-
-            payment_amount += trench_payment
-            interest_amount += trench_interest
-            principal_amount += trench_principal
-
-        remaining_debt = sum(
-            max(state['balance'], 0.0)
-            for state in trench_states
-            if state['start_date'] <= payment_date
-        )
-        payment_schedule.append(
-            {
-                'payment_number': month_index + 1,
-                'payment_date': payment_date,
-                'payment_amount': round(payment_amount, 2),
-                'interest_amount': round(interest_amount, 2),
-                'principal_amount': round(principal_amount, 2),
-                'remaining_debt': round(remaining_debt, 2),
-            }
-        )
-
-    return payment_schedule
-
-
 def _format_result(calculation):
     """Описание метода _format_result.
 
@@ -814,6 +694,12 @@ def _save_trench_calculation(calculation, user=None):
     if trench_objects:
         Trench.objects.bulk_create(trench_objects)
 
+    store_trench_calculation_schedule(
+        calc_obj,
+        trench_objects,
+        calculation['payment_schedule_columns'],
+    )
+
     return calc_obj
 
 